@@ -6,7 +6,7 @@ for state-based animation management using Panda3D NodePath transforms.
 """
 
 from enum import Enum, auto
-from panda3d.core import NodePath, LVector3f, GeomNode, CardMaker
+from panda3d.core import NodePath, LVector3f, GeomNode
 from direct.interval.IntervalGlobal import LerpHprInterval, Sequence
 import math
 from typing import Optional, TYPE_CHECKING, Dict
@@ -17,6 +17,18 @@ if TYPE_CHECKING:
     from engine.core.hot_config import HotConfig
 
 
+_unit_cube: Optional[GeomNode] = None
+
+
+def _get_unit_cube() -> GeomNode:
+    """Shared 1x1x1 box geom used by every mannequin body part."""
+    global _unit_cube
+    if _unit_cube is None:
+        from engine.rendering.mesh import MeshBuilder
+        _unit_cube = MeshBuilder.build_box_mesh([((0, 0, 0), (1, 1, 1))], name='mannequin_cube')
+    return _unit_cube
+
+
 class AnimationState(Enum):
     """Player animation states."""
     IDLE = auto()
@@ -63,42 +75,13 @@ class AnimatedMannequin:
         self._build_body()
     
     def _create_cube(self, name: str, parent: NodePath, scale: tuple, pos: tuple = (0, 0, 0)):
-        """Create a simple cube using CardMaker (placeholder for proper models)."""
-        node = parent.attachNewNode(name)
+        """Create a unit cube node scaled/positioned as a body part.
         
-        # Create a unit cube (roughly) using CardMaker for visibility
-        cm = CardMaker('card')
-        cm.setFrame(-0.5, 0.5, -0.5, 0.5)  # 1x1 centered
-        
-        # Create 6 faces
-        # Front
-        f = node.attachNewNode(cm.generate())
-        f.setPos(0, -0.5, 0)
-        
-        # Back
-        b = node.attachNewNode(cm.generate())
-        b.setPos(0, 0.5, 0)
-        b.setH(180)
-        
-        # Left
-        l = node.attachNewNode(cm.generate())
-        l.setPos(-0.5, 0, 0)
-        l.setH(90)
-        
-        # Right
-        r = node.attachNewNode(cm.generate())
-        r.setPos(0.5, 0, 0)
-        r.setH(-90)
-        
-        # Top
-        t = node.attachNewNode(cm.generate())
-        t.setPos(0, 0, 0.5)
-        t.setP(-90)
-        
-        # Bottom
-        bt = node.attachNewNode(cm.generate())
-        bt.setPos(0, 0, -0.5)
-        bt.setP(90)
+        Every part instances one shared single-Geom unit box, so a part costs
+        one node and one draw call instead of six CardMaker cards.
+        """
+        node = parent.attachNewNode(name)
+        node.attachNewNode(_get_unit_cube())
         
         # Apply color
         node.setColorScale(*self.body_color)
@@ -0,0 +1,245 @@
+"""
+SkinnedVoxelAvatar: a single-geom, skeleton-driven voxel character.
+
+VoxelAvatar builds a NodePath per bone plus six cards per bone, which is
+~120 nodes and ~100 draw calls per humanoid. SkinnedVoxelAvatar puts every
+bone's box into one Geom whose vertices carry a joint index, so an avatar
+is one node and one draw call. Posing it is a single joint-array upload:
+
+- GPU path: SKINNED_AVATAR_SHADER reads ``joint_matrices``/``joint_colors``
+  uniform arrays, the vertex data never changes.
+- CPU path (no shader support, headless): engine.animation.skinning
+  transforms the vertices with NumPy and rewrites the vertex array in one copy.
+
+Both paths are fed by the same joint matrices, computed from the skeleton's
+bone local transforms (what LayeredAnimator writes).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from panda3d.core import (
+    NodePath, Geom, GeomNode, GeomTriangles, GeomVertexData, GeomVertexFormat,
+    GeomVertexArrayFormat, InternalName, PTA_LMatrix4f, PTA_LVecBase4f,
+    BoundingSphere, Point3
+)
+
+from engine.animation.skeleton import HumanoidSkeleton, Skeleton
+from engine.animation.skinning import (
+    build_voxel_skin, compose_local_matrices, forward_kinematics, skin_vertices
+)
+from engine.animation.voxel_avatar import VoxelAvatar
+
+
+def _detect_shader_support() -> bool:
+    """Check the running ShowBase's GSG for GLSL support."""
+    try:
+        from direct.showbase import ShowBaseGlobal
+        win = getattr(getattr(ShowBaseGlobal, 'base', None), 'win', None)
+        gsg = win.getGsg() if win is not None else None
+        return bool(gsg and gsg.getSupportsBasicShaders())
+    except Exception:
+        return False
+
+
+class SkinnedVoxelAvatar:
+    """Voxel avatar rendered as one skinned Geom.
+
+    Exposes the same color API as VoxelAvatar. Call update_pose() after the
+    animator has written bone local transforms for the frame.
+    """
+
+    MAX_JOINTS = 32  # Must match SKINNED_AVATAR_SHADER
+    FLOATS_PER_VERTEX = 11  # vertex(3) normal(3) color(4) joint(1)
+
+    def __init__(
+        self,
+        parent_node: NodePath,
+        skeleton: Optional[Skeleton] = None,
+        body_color=(0.2, 0.8, 0.2, 1.0),
+        use_shader: Optional[bool] = None
+    ):
+        """
+        Initialize SkinnedVoxelAvatar.
+
+        Args:
+            parent_node: Parent Panda3D NodePath.
+            skeleton: Optional existing skeleton. If None, creates a new HumanoidSkeleton.
+            body_color: Base color for the avatar.
+            use_shader: Force GPU (True) or CPU (False) skinning; None auto-detects.
+        """
+        self.root = parent_node.attachNewNode("SkinnedVoxelAvatar")
+        self.body_color = tuple(body_color)
+        self.bone_color_overrides: Dict[str, Tuple[float, float, float, float]] = {}
+
+        self.skeleton = skeleton if skeleton else HumanoidSkeleton()
+        self.mesh = build_voxel_skin(self.skeleton, VoxelAvatar.BONE_THICKNESS_MAP)
+        if self.mesh.num_joints > self.MAX_JOINTS:
+            raise ValueError(
+                f"Skeleton has {self.mesh.num_joints} bones, skinned avatars support {self.MAX_JOINTS}"
+            )
+        self._joint_index = {name: i for i, name in enumerate(self.mesh.bone_names)}
+        self._bones = [self.skeleton.bones[name] for name in self.mesh.bone_names]
+
+        self.use_shader = _detect_shader_support() if use_shader is None else use_shader
+
+        # One slot per joint; the padded buffers are what gets uploaded
+        self._joint_buffer = np.tile(np.eye(4, dtype=np.float32), (self.MAX_JOINTS, 1, 1))
+        self._color_buffer = np.ones((self.MAX_JOINTS, 4), dtype=np.float32)
+        self._color_buffer[:self.mesh.num_joints] = self.body_color
+        self._vertex_buffer = np.zeros((self.mesh.num_vertices, self.FLOATS_PER_VERTEX), dtype=np.float32)
+        self._vertex_buffer[:, 10] = self.mesh.joints
+
+        self._build_geom()
+        self.update_pose()
+
+    @property
+    def bone_names(self) -> List[str]:
+        """Bone names in joint-index order."""
+        return list(self.mesh.bone_names)
+
+    @property
+    def joint_matrices(self) -> np.ndarray:
+        """(B, 4, 4) avatar-space joint matrices from the last update_pose()."""
+        return self._joint_buffer[:self.mesh.num_joints]
+
+    # ========== Geometry ==========
+
+    def _build_geom(self):
+        """Create the single Geom (and shader inputs on the GPU path)."""
+        array = GeomVertexArrayFormat()
+        array.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+        array.addColumn(InternalName.getNormal(), 3, Geom.NT_float32, Geom.C_normal)
+        array.addColumn(InternalName.getColor(), 4, Geom.NT_float32, Geom.C_color)
+        array.addColumn(InternalName.make("joint"), 1, Geom.NT_float32, Geom.C_other)
+        vformat = GeomVertexFormat.registerFormat(array)
+
+        usage = Geom.UH_static if self.use_shader else Geom.UH_dynamic
+        self._vdata = GeomVertexData("skinned_avatar", vformat, usage)
+        self._vdata.uncleanSetNumRows(self.mesh.num_vertices)
+
+        tris = GeomTriangles(Geom.UH_static)
+        tris.setIndexType(Geom.NT_uint16)
+        for a, b, c in self.mesh.indices.reshape(-1, 3).tolist():
+            tris.addVertices(a, b, c)
+
+        geom = Geom(self._vdata)
+        geom.addPrimitive(tris)
+        node = GeomNode("skinned_avatar")
+        node.addGeom(geom)
+        self.mesh_np = self.root.attachNewNode(node)
+
+        if self.use_shader:
+            from engine.rendering.shaders import SKINNED_AVATAR_SHADER
+
+            # Rest-pose (bone-local) vertices; the shader applies the joints
+            self._vertex_buffer[:, 0:3] = self.mesh.positions
+            self._vertex_buffer[:, 3:6] = self.mesh.normals
+            self._vertex_buffer[:, 6:10] = 1.0
+            self._write_vertices()
+
+            self._joint_pta = PTA_LMatrix4f.emptyArray(self.MAX_JOINTS)
+            self._color_pta = PTA_LVecBase4f.emptyArray(self.MAX_JOINTS)
+            self.mesh_np.setShader(SKINNED_AVATAR_SHADER)
+            self.mesh_np.setShaderInput("joint_matrices", self._joint_pta)
+            self.mesh_np.setShaderInput("joint_colors", self._color_pta)
+            self._color_pta.setData(self._color_buffer.tobytes())
+
+            # Vertices move on the GPU, so give the culler a pose-independent bound
+            reach = float(sum(b.length for b in self._bones))
+            self.mesh_np.node().setBounds(BoundingSphere(Point3(0, 0, reach / 2.0), reach))
+            self.mesh_np.node().setFinal(True)
+
+    def _write_vertices(self):
+        """Copy the interleaved vertex buffer into the Geom in one go."""
+        handle = self._vdata.modifyArrayHandle(0)
+        handle.copyDataFrom(memoryview(self._vertex_buffer).cast('B'))
+
+    # ========== Posing ==========
+
+    def update_pose(self) -> np.ndarray:
+        """Recompute joint matrices from bone local transforms and upload them.
+
+        Returns:
+            (B, 4, 4) avatar-space joint matrices
+        """
+        positions = np.empty((len(self._bones), 3), dtype=np.float64)
+        rotations = np.empty((len(self._bones), 3), dtype=np.float64)
+        for i, bone in enumerate(self._bones):
+            t = bone.local_transform
+            positions[i] = (t.position.x, t.position.y, t.position.z)
+            rotations[i] = (t.rotation.x, t.rotation.y, t.rotation.z)
+
+        world = forward_kinematics(compose_local_matrices(positions, rotations), self.mesh.parents)
+        self._joint_buffer[:self.mesh.num_joints] = world
+
+        if self.use_shader:
+            self._joint_pta.setData(self._joint_buffer.tobytes())
+        else:
+            self._skin_on_cpu()
+        return self.joint_matrices
+
+    def _skin_on_cpu(self):
+        positions, normals = skin_vertices(
+            self.mesh.positions, self.mesh.joints, self.joint_matrices, self.mesh.normals
+        )
+        self._vertex_buffer[:, 0:3] = positions
+        self._vertex_buffer[:, 3:6] = normals
+        self._vertex_buffer[:, 6:10] = self._color_buffer[self.mesh.joints]
+        self._write_vertices()
+
+    def skinned_positions(self) -> np.ndarray:
+        """Avatar-space vertex positions for the current pose (CPU reference)."""
+        return skin_vertices(self.mesh.positions, self.mesh.joints, self.joint_matrices)
+
+    # ========== Runtime Color Methods ==========
+
+    def _upload_colors(self):
+        if self.use_shader:
+            self._color_pta.setData(self._color_buffer.tobytes())
+        else:
+            self._vertex_buffer[:, 6:10] = self._color_buffer[self.mesh.joints]
+            self._write_vertices()
+
+    def set_body_color(self, rgba: Tuple[float, float, float, float]) -> None:
+        """
+        Update base body color for all bones without a per-bone override.
+
+        Args:
+            rgba: Color tuple (r, g, b, a) with values in [0.0, 1.0]
+        """
+        self.body_color = tuple(rgba)
+        for name, joint in self._joint_index.items():
+            if name not in self.bone_color_overrides:
+                self._color_buffer[joint] = rgba
+        self._upload_colors()
+
+    def set_bone_color(self, bone_name: str, rgba: Tuple[float, float, float, float]) -> None:
+        """
+        Override specific bone color.
+
+        Args:
+            bone_name: Name of the bone to color
+            rgba: Color tuple (r, g, b, a) with values in [0.0, 1.0]
+
+        Raises:
+            ValueError: If bone_name doesn't exist in skeleton
+        """
+        if bone_name not in self._joint_index:
+            raise ValueError(f"Bone '{bone_name}' not found in skeleton. Available bones: {self.bone_names}")
+        self.bone_color_overrides[bone_name] = tuple(rgba)
+        self._color_buffer[self._joint_index[bone_name]] = rgba
+        self._upload_colors()
+
+    def clear_bone_colors(self) -> None:
+        """Reset all bones to body color (remove per-bone overrides)."""
+        self.bone_color_overrides.clear()
+        self._color_buffer[:self.mesh.num_joints] = self.body_color
+        self._upload_colors()
+
+    def get_effective_color(self, bone_name: str) -> Tuple[float, float, float, float]:
+        """Get current display color for bone (override or body color)."""
+        return self.bone_color_overrides.get(bone_name, self.body_color)
+
+    def cleanup(self):
+        self.root.removeNode()
@@ -0,0 +1,202 @@
+"""CPU skinning math for single-geom voxel avatars.
+
+A skinned voxel avatar stores every bone's box in one vertex array. Each
+vertex is authored in its bone's local space and tagged with that bone's
+index, so posing the avatar only needs one (B, 4, 4) joint-matrix array.
+The same array feeds SKINNED_AVATAR_SHADER on the GPU and skin_vertices()
+on the CPU, which keeps the two paths identical and testable headless.
+
+Matrices follow Panda3D's row-vector convention: a point is transformed
+as ``p' = p @ M`` and a child's world matrix is ``local @ parent_world``.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from engine.animation.skeleton import Skeleton, Bone
+
+
+# Unit cube faces centered at the origin: (normal, corners counter-clockwise
+# seen from outside). Same layout as MeshBuilder.build_box_mesh().
+_UNIT_CUBE_FACES = np.array([
+    [(0, 0, 1), (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)],
+    [(0, 0, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1), (-1, -1, -1)],
+    [(0, -1, 0), (-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1)],
+    [(0, 1, 0), (1, 1, -1), (-1, 1, -1), (-1, 1, 1), (1, 1, 1)],
+    [(1, 0, 0), (1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1)],
+    [(-1, 0, 0), (-1, 1, -1), (-1, -1, -1), (-1, -1, 1), (-1, 1, 1)],
+], dtype=np.float32)
+
+_CUBE_NORMALS = np.repeat(_UNIT_CUBE_FACES[:, 0, :], 4, axis=0)  # (24, 3)
+_CUBE_CORNERS = _UNIT_CUBE_FACES[:, 1:, :].reshape(24, 3) * 0.5  # (24, 3)
+_CUBE_INDICES = (np.arange(6)[:, None] * 4 + np.array([0, 1, 2, 0, 2, 3])).reshape(-1)
+
+# Bones shorter than this get no geometry (matches VoxelAvatar)
+MIN_BONE_LENGTH = 0.01
+
+
+@dataclass
+class SkinnedMeshData:
+    """Bone-local vertex data for a skinned avatar.
+
+    Attributes:
+        bone_names: Bone names in joint-index order (parents before children)
+        parents: (B,) parent joint index per bone, -1 for the root
+        positions: (V, 3) vertex positions in their bone's local space
+        normals: (V, 3) vertex normals in their bone's local space
+        joints: (V,) joint index of every vertex
+        indices: (I,) triangle vertex indices
+    """
+    bone_names: List[str]
+    parents: np.ndarray
+    positions: np.ndarray
+    normals: np.ndarray
+    joints: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def num_joints(self) -> int:
+        return len(self.bone_names)
+
+    @property
+    def num_vertices(self) -> int:
+        return self.positions.shape[0]
+
+
+def order_bones(skeleton: Skeleton) -> List[Bone]:
+    """Return skeleton bones depth-first from the root (parents first)."""
+    ordered: List[Bone] = []
+    stack = [skeleton.root] if skeleton.root else []
+    while stack:
+        bone = stack.pop()
+        ordered.append(bone)
+        stack.extend(reversed(bone.children))
+    return ordered
+
+
+def build_voxel_skin(
+    skeleton: Skeleton,
+    thickness_map: Dict[str, float],
+    default_thickness: float = 0.1
+) -> SkinnedMeshData:
+    """Build one box per bone, tagged with the bone's joint index.
+
+    Each box spans the bone along +Y from the joint (0) to its tip (length)
+    with a square cross-section of the bone's thickness, exactly like the
+    per-bone cubes VoxelAvatar creates.
+
+    Args:
+        skeleton: Skeleton to skin
+        thickness_map: Bone name -> box thickness
+        default_thickness: Thickness for bones missing from the map
+
+    Returns:
+        SkinnedMeshData for the whole skeleton
+    """
+    bones = order_bones(skeleton)
+    index_of = {bone.name: i for i, bone in enumerate(bones)}
+    parents = np.array(
+        [index_of[b.parent.name] if b.parent else -1 for b in bones], dtype=np.int32
+    )
+
+    positions, normals, joints, indices = [], [], [], []
+    vertex_count = 0
+    for joint, bone in enumerate(bones):
+        if bone.length <= MIN_BONE_LENGTH:
+            continue
+        thickness = thickness_map.get(bone.name, default_thickness)
+        size = np.array([thickness, bone.length, thickness], dtype=np.float32)
+        center = np.array([0.0, bone.length / 2.0, 0.0], dtype=np.float32)
+
+        positions.append(_CUBE_CORNERS * size + center)
+        normals.append(_CUBE_NORMALS)
+        joints.append(np.full(24, joint, dtype=np.int32))
+        indices.append(_CUBE_INDICES + vertex_count)
+        vertex_count += 24
+
+    if not positions:
+        empty3 = np.zeros((0, 3), dtype=np.float32)
+        return SkinnedMeshData([b.name for b in bones], parents, empty3, empty3.copy(),
+                               np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32))
+
+    return SkinnedMeshData(
+        bone_names=[b.name for b in bones],
+        parents=parents,
+        positions=np.concatenate(positions).astype(np.float32),
+        normals=np.concatenate(normals).astype(np.float32),
+        joints=np.concatenate(joints),
+        indices=np.concatenate(indices).astype(np.int32),
+    )
+
+
+def hpr_to_matrices(hpr: np.ndarray) -> np.ndarray:
+    """Convert (B, 3) heading/pitch/roll degrees to (B, 3, 3) rotations.
+
+    Heading turns about +Z, pitch about +X and roll about +Y; the composed
+    row-vector matrix is ``roll @ pitch @ heading`` as in NodePath.setHpr.
+    """
+    hpr = np.radians(np.asarray(hpr, dtype=np.float64).reshape(-1, 3))
+    ch, sh = np.cos(hpr[:, 0]), np.sin(hpr[:, 0])
+    cp, sp = np.cos(hpr[:, 1]), np.sin(hpr[:, 1])
+    cr, sr = np.cos(hpr[:, 2]), np.sin(hpr[:, 2])
+    zeros, ones = np.zeros_like(ch), np.ones_like(ch)
+
+    heading = np.stack([ch, sh, zeros, -sh, ch, zeros, zeros, zeros, ones], axis=-1).reshape(-1, 3, 3)
+    pitch = np.stack([ones, zeros, zeros, zeros, cp, sp, zeros, -sp, cp], axis=-1).reshape(-1, 3, 3)
+    roll = np.stack([cr, zeros, -sr, zeros, ones, zeros, sr, zeros, cr], axis=-1).reshape(-1, 3, 3)
+    return roll @ pitch @ heading
+
+
+def compose_local_matrices(positions: np.ndarray, hpr: np.ndarray) -> np.ndarray:
+    """Build (B, 4, 4) local joint matrices from translations and HPR angles."""
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    mats = np.zeros((positions.shape[0], 4, 4), dtype=np.float64)
+    mats[:, :3, :3] = hpr_to_matrices(hpr)
+    mats[:, 3, :3] = positions
+    mats[:, 3, 3] = 1.0
+    return mats
+
+
+def forward_kinematics(local: np.ndarray, parents: np.ndarray) -> np.ndarray:
+    """Accumulate local joint matrices into avatar-space matrices.
+
+    Args:
+        local: (B, 4, 4) local matrices
+        parents: (B,) parent index per joint; parents must precede children
+
+    Returns:
+        (B, 4, 4) avatar-space joint matrices
+    """
+    world = np.empty_like(local)
+    for i, parent in enumerate(parents):
+        world[i] = local[i] if parent < 0 else local[i] @ world[parent]
+    return world
+
+
+def skin_vertices(
+    positions: np.ndarray,
+    joints: np.ndarray,
+    joint_matrices: np.ndarray,
+    normals: Optional[np.ndarray] = None
+):
+    """Transform bone-local vertices by their joint matrices.
+
+    CPU reference of SKINNED_AVATAR_SHADER.
+
+    Args:
+        positions: (V, 3) bone-local positions
+        joints: (V,) joint index per vertex
+        joint_matrices: (B, 4, 4) avatar-space joint matrices
+        normals: Optional (V, 3) bone-local normals
+
+    Returns:
+        (V, 3) skinned positions, or (positions, normals) if normals were given
+    """
+    mats = joint_matrices[joints]
+    skinned = np.einsum('vi,vij->vj', positions, mats[:, :3, :3]) + mats[:, 3, :3]
+    if normals is None:
+        return skinned.astype(np.float32)
+    skinned_normals = np.einsum('vi,vij->vj', normals, mats[:, :3, :3])
+    return skinned.astype(np.float32), skinned_normals.astype(np.float32)
@@ -7,9 +7,10 @@ temporary color effects (from projectiles), and unlocked color collection.
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
-from engine.ecs.component import Component
+from engine.ecs.component import Component, register_component
 
 
+@register_component
 @dataclass
 class AvatarColors(Component):
     """
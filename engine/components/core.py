@@ -9,7 +9,7 @@ from engine.physics.kinematic import KinematicState
 from engine.components.camera_state import CameraState, CameraMode
 
 @register_component
-@dataclass
+@dataclass(slots=True)
 class Transform(Component):
     """Spatial representation."""
     position: Vec3 = field(default_factory=lambda: Vec3(0, 0, 0))
@@ -17,7 +17,7 @@ class Transform(Component):
     scale: Vec3 = field(default_factory=lambda: Vec3(1, 1, 1))
 
 @register_component
-@dataclass
+@dataclass(slots=True)
 class Health(Component):
     """Health and damage tracking."""
     current: int = 100
@@ -52,7 +52,7 @@ class Stamina(Component):
     regen_timer: float = 0.0  # countdown to regen start
 
 @register_component
-@dataclass
+@dataclass(slots=True)
 class CombatState(Component):
     """Tracks player's combat state for animation and action constraints.
     
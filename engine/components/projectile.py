@@ -5,11 +5,12 @@ Tracks state for thrown color projectiles.
 """
 
 from dataclasses import dataclass
-from engine.ecs.component import Component, register_component
+from engine.ecs.component import Component, pooled_component, register_component
 from panda3d.core import LVector3f
 
 @register_component
-@dataclass
+@pooled_component(max_size=256)
+@dataclass(slots=True)
 class ColorProjectileComponent(Component):
     """Component for a color projectile."""
     color_name: str = "white"
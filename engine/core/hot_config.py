@@ -35,6 +35,7 @@ class HotConfig:
         
         # Camera
         "debug_overlay": False,
+        "perf_metrics": True,  # Log render stats and system timings periodically even with the debug overlay hidden
         "view_distance": 5,
         "fov": 90,
         "camera_distance": 5.0,
@@ -2,14 +2,20 @@
 Session Recorder for MyCraft Playtesting
 
 Captures player input events with timestamps for replay and debugging.
+Checkpoints (binary ECS world snapshots, see engine.ecs.snapshot) can be
+recorded alongside, so a replay can start from any of them instead of
+from the beginning.
 """
 
+import base64
 import json
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field, asdict
 
+from engine.ecs.snapshot import load_snapshot, save_snapshot
+
 
 @dataclass
 class InputEvent:
@@ -87,6 +93,14 @@ class SessionRecorder:
             "rot_y": rot_y
         })
     
+    def record_checkpoint(self, world: Any) -> None:
+        """Record a snapshot of the ECS world that replays can resume from."""
+        if not self._recording:
+            return
+        
+        data = save_snapshot(world)
+        self._add_event("checkpoint", {"snapshot": base64.b64encode(data).decode("ascii")})
+    
     def _add_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Add an event with current timestamp."""
         t = time.perf_counter() - self._start_time
@@ -173,6 +187,22 @@ class SessionPlayer:
         pos = self.metadata.get("spawn_pos")
         return tuple(pos) if pos else None
     
+    def get_checkpoints(self) -> List[InputEvent]:
+        """Get the recorded world checkpoints, in time order."""
+        return [e for e in self.events if e.type == "checkpoint"]
+    
+    def restore_checkpoint(self, world: Any, checkpoint: InputEvent) -> None:
+        """Load a checkpoint into the world and continue playback from it.
+        
+        Args:
+            world: ECS World to restore
+            checkpoint: One of get_checkpoints()
+        """
+        load_snapshot(world, base64.b64decode(checkpoint.data["snapshot"]))
+        self._event_index = self.events.index(checkpoint) + 1
+        # Shift the clock so the checkpoint's time is "now"
+        self._start_time = time.perf_counter() - checkpoint.t / self._speed
+    
     def update(self) -> List[InputEvent]:
         """Get any events that should fire now. Call each frame."""
         if not self._playing or self.is_finished():
@@ -0,0 +1,77 @@
+"""
+Archetype tables for ECS component storage.
+
+Every entity lives in exactly one Archetype: the table for its exact set of
+component types. A table keeps one column (list) per component type and a
+parallel list of entity IDs, so the components of row ``i`` all belong to
+``entities[i]``. Queries walk the columns of matching tables instead of
+looking entities up one dict at a time.
+
+Adding or removing a component moves the entity's row to the neighbouring
+archetype; the transitions are cached on each table as edges, so a move is
+one dict lookup plus a row copy.
+"""
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
+
+from engine.ecs.component import Component
+
+
+class Archetype:
+    """Columnar table of all entities with one exact component set."""
+
+    def __init__(self, types: FrozenSet[Type[Component]]):
+        self.types = types
+        self.entities: List[int] = []
+        self.columns: Dict[Type[Component], List[Component]] = {t: [] for t in types}
+
+        # Cached transitions: component type -> archetype with it added / removed
+        self.add_edges: Dict[Type[Component], 'Archetype'] = {}
+        self.remove_edges: Dict[Type[Component], 'Archetype'] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def append(self, entity_id: int, components: Dict[Type[Component], Component]) -> int:
+        """Add a row; ``components`` must hold exactly this archetype's types.
+
+        Returns:
+            Row index of the new entity
+        """
+        self.entities.append(entity_id)
+        for component_type, column in self.columns.items():
+            column.append(components[component_type])
+        return len(self.entities) - 1
+
+    def row_components(self, row: int) -> Dict[Type[Component], Component]:
+        """Components of one row, keyed by type."""
+        return {component_type: column[row] for component_type, column in self.columns.items()}
+
+    def swap_remove(self, row: int) -> Optional[int]:
+        """Remove a row by moving the last row into its place.
+
+        Returns:
+            ID of the entity that moved into ``row``, or None if the last row was removed
+        """
+        last = len(self.entities) - 1
+        moved = None
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            for column in self.columns.values():
+                column[row] = column[last]
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+        return moved
+
+    def extend(self, entity_ids: Sequence[int], columns: Dict[Type[Component], List[Component]]):
+        """Append many rows at once; ``columns`` must hold exactly this archetype's types."""
+        self.entities.extend(entity_ids)
+        for component_type, column in self.columns.items():
+            column.extend(columns[component_type])
+
+    def clear(self):
+        """Remove every row (edges are kept)."""
+        self.entities.clear()
+        for column in self.columns.values():
+            column.clear()
@@ -0,0 +1,122 @@
+"""
+Deferred structural changes for the ECS.
+
+Creating or destroying entities and adding or removing components moves
+rows between archetype tables, which breaks iteration over a query that
+is still running. Systems record those changes in the world's
+CommandBuffer instead; World.update applies them at its sync points
+(before the first system and after each system), so every system sees a
+world that does not change under it.
+
+IDs for entities created through the buffer are reserved right away, so
+callers can keep and reference them before the flush. Events about those
+entities can be queued too (publish()), so listeners only hear of an
+entity once it exists.
+"""
+from typing import Any, List, Optional, Tuple, Type
+
+from engine.ecs.component import Component
+
+_CREATE = 0
+_DESTROY = 1
+_ADD = 2
+_REMOVE = 3
+_PUBLISH = 4
+
+
+class CommandBuffer:
+    """Queue of structural changes applied to a World in order.
+
+    Commands that target an entity destroyed before they are applied are
+    dropped. With ``immediate=True`` every command is applied as soon as
+    it is issued, which matches calling the World directly.
+
+    Example:
+        entity_id = world.commands.create_entity(Transform(), tag="chest")
+        world.commands.destroy_entity(old_id)
+        ...
+        world.commands.flush()  # Done by World.update at each sync point
+    """
+
+    def __init__(self, world: Any, immediate: bool = False):
+        self.world = world
+        self.immediate = immediate
+        self._commands: List[Tuple[int, int, Any, Optional[str]]] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def create_entity(self, *components: Component, tag: Optional[str] = None) -> int:
+        """Queue a new entity with the given components.
+
+        The tag is registered after the components are added, so systems
+        waiting on it see a complete entity.
+
+        Returns:
+            ID the entity will have once the buffer is flushed
+        """
+        entity_id = self.world._reserve_entity_id()
+        self._push(_CREATE, entity_id, components, tag)
+        return entity_id
+
+    def destroy_entity(self, entity_id: int):
+        """Queue an entity for destruction."""
+        self._push(_DESTROY, entity_id, None, None)
+
+    def add_component(self, entity_id: int, component: Component):
+        """Queue a component to be added (or replaced) on an entity."""
+        self._push(_ADD, entity_id, component, None)
+
+    def remove_component(self, entity_id: int, component_type: Type[Component]):
+        """Queue a component type to be removed from an entity."""
+        self._push(_REMOVE, entity_id, component_type, None)
+
+    def publish(self, event_type: str, **data: Any):
+        """Queue an event, published when the flush reaches it.
+
+        Use it for events about entities queued before it (e.g. a spawn
+        event after create_entity()), so listeners see them alive.
+        """
+        self._push(_PUBLISH, 0, data, event_type)
+
+    def _push(self, op: int, entity_id: int, payload: Any, tag: Optional[str]):
+        self._commands.append((op, entity_id, payload, tag))
+        if self.immediate:
+            self.flush()
+
+    def flush(self) -> int:
+        """Apply all queued commands in the order they were issued.
+
+        Returns:
+            Number of commands processed
+        """
+        commands, self._commands = self._commands, []
+        world = self.world
+        for op, entity_id, payload, tag in commands:
+            if op == _CREATE:
+                world._spawn_reserved(entity_id)
+                for component in payload:
+                    world.add_component(entity_id, component)
+                if tag:
+                    world.register_tag(entity_id, tag)
+            elif op == _PUBLISH:
+                world.event_bus.publish(tag, **payload)
+            elif not world.is_alive(entity_id):
+                continue  # Destroyed by an earlier command (or never existed)
+            elif op == _DESTROY:
+                world.destroy_entity(entity_id)
+            elif op == _ADD:
+                world.add_component(entity_id, payload)
+            else:
+                world.remove_component(entity_id, payload)
+        return len(commands)
+
+    def clear(self) -> int:
+        """Drop all queued commands without applying them.
+
+        Returns:
+            Number of commands dropped
+        """
+        dropped = len(self._commands)
+        self._commands = []
+        return dropped
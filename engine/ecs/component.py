@@ -1,16 +1,27 @@
 """
 Component base classes for ECS.
+
+Hot components are ``@dataclass(slots=True)``: no per-instance __dict__,
+so they are smaller and faster to read. Types created and destroyed
+constantly can also be pooled with ``@pooled_component``: the system that
+owns them creates instances with acquire_component() and, once it has
+destroyed their entity, hands them back with release_component(). Only
+pool types whose instances never escape their owning system; a released
+instance still referenced elsewhere would be silently shared with the
+next entity.
 """
-from typing import Type, TypeVar, Dict, Any
-from dataclasses import dataclass
+from typing import Type, TypeVar, Dict, Any, List, Optional
+from dataclasses import MISSING, dataclass, fields
+
+T = TypeVar('T', bound='Component')
 
 @dataclass
 class Component:
     """
-    Base class for all ECS components. 
+    Base class for all ECS components.
     Components should be pure data classes.
     """
-    pass
+    __slots__ = ()
 
 # Registry to map string names to Component classes (for config loading)
 _COMPONENT_REGISTRY: Dict[str, Type[Component]] = {}
@@ -23,3 +34,97 @@ def register_component(cls):
 def get_component_class(name: str) -> Type[Component]:
     """Retrieve component class by name."""
     return _COMPONENT_REGISTRY.get(name)
+
+
+class ComponentPool:
+    """Free list of released instances of one component type.
+
+    The pool trusts its callers: release() must only get instances that
+    nothing refers to any more.
+    """
+
+    def __init__(self, component_type: Type[Component], max_size: int = 256):
+        self.component_type = component_type
+        self.max_size = max_size
+        self.free: List[Component] = []
+        # (name, default, default_factory) per field, for resetting reused instances
+        self._defaults = tuple(
+            (f.name, f.default, f.default_factory) for f in fields(component_type)
+        )
+
+    def acquire(self, **values: Any) -> Component:
+        """Get an instance with the given field values (others reset to defaults)."""
+        if not self.free:
+            return self.component_type(**values)
+        component = self.free.pop()
+        for name, default, factory in self._defaults:
+            if name in values:
+                value = values[name]
+            elif default is not MISSING:
+                value = default
+            elif factory is not MISSING:
+                value = factory()
+            else:
+                raise TypeError(f"{self.component_type.__name__} needs a value for '{name}'")
+            setattr(component, name, value)
+        post_init = getattr(component, "__post_init__", None)
+        if post_init is not None:
+            post_init()
+        return component
+
+    def release(self, component: Component):
+        """Take back an instance for reuse (dropped if the pool is full)."""
+        if len(self.free) < self.max_size:
+            self.free.append(component)
+
+
+# Component type -> pool (only for types declared with @pooled_component)
+_COMPONENT_POOLS: Dict[Type[Component], ComponentPool] = {}
+
+
+def pooled_component(max_size: int = 256):
+    """Class decorator enabling instance pooling for a component type.
+
+    Apply it outside ``@dataclass(slots=True)`` (slots creates a new class)
+    and inside ``@register_component``. World.destroy_entity does not pool
+    anything: the owner calls release_component() itself.
+
+    Example:
+        @register_component
+        @pooled_component(max_size=512)
+        @dataclass(slots=True)
+        class Bullet(Component):
+            speed: float = 0.0
+    """
+    def decorator(cls):
+        _COMPONENT_POOLS[cls] = ComponentPool(cls, max_size)
+        return cls
+    return decorator
+
+
+def get_component_pool(component_type: Type[Component]) -> Optional[ComponentPool]:
+    """Get the pool of a component type, if it is pooled."""
+    return _COMPONENT_POOLS.get(component_type)
+
+
+def acquire_component(component_type: Type[T], **values: Any) -> T:
+    """Create a component, reusing a pooled instance when one is free.
+
+    Equivalent to ``component_type(**values)`` for types that are not pooled.
+    """
+    pool = _COMPONENT_POOLS.get(component_type)
+    if pool is None:
+        return component_type(**values)
+    return pool.acquire(**values)
+
+
+def release_component(component: Component):
+    """Hand back an instance made by acquire_component() for reuse.
+
+    Call it after the instance's entity is destroyed (or the component
+    removed), and only if nothing else still refers to the instance. No-op
+    for types that are not pooled.
+    """
+    pool = _COMPONENT_POOLS.get(type(component))
+    if pool is not None:
+        pool.release(component)
@@ -1,66 +1,289 @@
 """
 Event Bus for decoupled game logic interaction.
+
+Handlers are grouped into one channel per event name, built when the
+first handler subscribes, so publishing looks up a single dict entry and
+loops over a tuple. Publishing an event nobody listens to costs only that
+lookup.
+
+Event names can be declared with a slotted Event class (see
+``register_event_type``). publish() builds a declared event as a slotted
+instance, with no per-event dict; undeclared names still work and get a
+plain EventData object. Handlers may keep the events they receive, so the
+bus never reuses them. A publisher that owns a reusable instance can
+emit() it repeatedly if none of its handlers keeps events.
 """
-from typing import Callable, Any, Dict, List
-from dataclasses import dataclass
-from collections import defaultdict
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type
+from dataclasses import MISSING, dataclass, fields
 import logging
 
 logger = logging.getLogger(__name__)
 
 @dataclass
 class Event:
-    """Base class for all game events."""
-    pass
+    """Base class for all game events.
+
+    Subclasses use ``@dataclass(slots=True)`` and set ``name`` to the
+    event name they are published under.
+    """
+    __slots__ = ()
+    name: ClassVar[str] = ""
+
+
+class EventData:
+    """Attribute bag for events published without a declared type."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.__dict__.update(data)
+
+
+# Event name -> declared Event subclass
+_EVENT_TYPES: Dict[str, Type[Event]] = {}
+
+
+def register_event_type(name: str):
+    """Class decorator declaring the Event class published under a name.
+
+    Fields must have defaults; fields left out of publish() get them.
+
+    Example:
+        @register_event_type("on_entity_death")
+        @dataclass(slots=True)
+        class EntityDied(Event):
+            entity_id: int = 0
+            killer: Any = None
+    """
+    def decorator(cls: Type[Event]) -> Type[Event]:
+        cls.name = name
+        cls._defaults = tuple(
+            (f.name, None if f.default is MISSING else f.default) for f in fields(cls)
+        )
+        cls._field_names = frozenset(field_name for field_name, _ in cls._defaults)
+        _EVENT_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+def get_event_type(name: str) -> Optional[Type[Event]]:
+    """Get the Event class declared for an event name, if any."""
+    return _EVENT_TYPES.get(name)
+
+
+class _Channel:
+    """Handlers, event type and queued events for one event name."""
+    __slots__ = ("name", "handlers", "queued_handlers", "event_type", "pending")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.handlers: Tuple[Callable[[Any], None], ...] = ()
+        self.queued_handlers: Tuple[Callable[[List[Any]], None], ...] = ()
+        self.event_type: Optional[Type[Event]] = _EVENT_TYPES.get(name)
+        self.pending: List[Any] = []
+
 
 class EventBus:
     """
     Publish-subscribe event system for decoupling game logic.
     """
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[Any], None]]] = defaultdict(list)
+        self._channels: Dict[str, _Channel] = {}
+        self._pending_channels: List[_Channel] = []  # Channels with queued events since last flush()
         self._history: List[Event] = []
 
-    def subscribe(self, event_type: str, handler: Callable[[Any], None]):
+    def subscribe(self, event_type: str, handler: Callable[[Any], None], queued: bool = False):
         """
         Register a handler for a specific event type.
-        
+
         Args:
             event_type: Name of the event to listen for
             handler: Function to call when event is published
+            queued: Deliver this event type once per frame, from flush(), as
+                a list of the events published since the previous flush
         """
-        self._subscribers[event_type].append(handler)
+        channel = self._channels.get(event_type)
+        if channel is None:
+            channel = self._channels[event_type] = _Channel(event_type)
+        if queued:
+            channel.queued_handlers += (handler,)
+        else:
+            channel.handlers += (handler,)
         logger.debug(f"Subscribed {handler.__name__} to {event_type}")
 
     def unsubscribe(self, event_type: str, handler: Callable[[Any], None]):
         """Unregister a handler."""
-        if handler in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(handler)
+        channel = self._channels.get(event_type)
+        if channel is None:
+            return
+        if handler in channel.handlers:
+            handlers = list(channel.handlers)
+            handlers.remove(handler)
+            channel.handlers = tuple(handlers)
+        elif handler in channel.queued_handlers:
+            handlers = list(channel.queued_handlers)
+            handlers.remove(handler)
+            channel.queued_handlers = tuple(handlers)
 
     def publish(self, event_name: str, **kwargs):
         """
         Trigger an event, calling all subscribers.
-        
+
+        Handlers of a declared event type receive an instance of it (one
+        per publish); other names get an EventData.
+
         Args:
             event_name: Name of the event
             **kwargs: Data to pass to handlers
         """
-        # Create lightweight object if not already an object
-        event_data = type("EventData", (), kwargs)()
-        
-        handlers = self._subscribers[event_name]
+        channel = self._channels.get(event_name)
+        if channel is None:
+            return
+
+        if channel.queued_handlers:
+            if not channel.pending:
+                self._pending_channels.append(channel)
+            channel.pending.append(self._make_event(channel, kwargs))
+
+        handlers = channel.handlers
+        if not handlers:
+            return
+        event = self._make_event(channel, kwargs)
         for handler in handlers:
             try:
-                handler(event_data)
+                handler(event)
             except Exception as e:
                 logger.error(f"Error handling event {event_name}: {e}", exc_info=True)
 
+    def _make_event(self, channel: _Channel, data: Dict[str, Any]) -> Any:
+        """Build the event object handed to a channel's handlers."""
+        event_type = channel.event_type
+        if event_type is None:
+            # Declared after the first subscriber (module imported later)
+            event_type = channel.event_type = _EVENT_TYPES.get(channel.name)
+        if event_type is None or not event_type._field_names.issuperset(data):
+            return EventData(data)
+
+        event = event_type.__new__(event_type)
+        for field_name, default in event_type._defaults:
+            setattr(event, field_name, data.get(field_name, default))
+        return event
+
     def emit(self, event: Event):
         """Emit a typed event object."""
-        event_type = event.__class__.__name__
-        handlers = self._subscribers[event_type]
-        for handler in handlers:
+        event_type = type(event).name or event.__class__.__name__
+        channel = self._channels.get(event_type)
+        if channel is None:
+            return
+        if channel.queued_handlers:
+            if not channel.pending:
+                self._pending_channels.append(channel)
+            channel.pending.append(event)
+        for handler in channel.handlers:
             try:
                 handler(event)
             except Exception as e:
                 logger.error(f"Error handling event {event_type}: {e}", exc_info=True)
+
+    def flush(self):
+        """Deliver events queued for ``queued=True`` subscribers.
+
+        Each such handler is called once per event type with the list of
+        events published since the last flush. World.update calls this
+        once per frame.
+        """
+        channels, self._pending_channels = self._pending_channels, []
+        for channel in channels:
+            events, channel.pending = channel.pending, []
+            for handler in channel.queued_handlers:
+                try:
+                    handler(events)
+                except Exception as e:
+                    logger.error(f"Error handling queued events {channel.name}: {e}", exc_info=True)
+
+
+# ========== Core engine events ==========
+
+@register_event_type("on_entity_damage")
+@dataclass(slots=True)
+class EntityDamaged(Event):
+    """Damage dealt to an entity.
+
+    Engine mechanics send entity_id/amount/source; the voxel_world
+    CombatSystem sends target_id/attacker_id/damage.
+    """
+    entity_id: Any = None
+    amount: float = 0.0
+    source: Any = None
+    target_id: Any = None
+    attacker_id: Any = None
+    damage: float = 0.0
+
+
+@register_event_type("on_entity_death")
+@dataclass(slots=True)
+class EntityDied(Event):
+    entity_id: Any = None
+    killer: Any = None
+
+
+@register_event_type("on_entity_spawn")
+@dataclass(slots=True)
+class EntitySpawned(Event):
+    entity_id: Any = None
+    prefab: str = ""
+
+
+@register_event_type("entity_entered_water")
+@dataclass(slots=True)
+class EntityEnteredWater(Event):
+    entity_id: Any = None
+    submersion: float = 0.0
+
+
+@register_event_type("entity_exited_water")
+@dataclass(slots=True)
+class EntityExitedWater(Event):
+    entity_id: Any = None
+
+
+@register_event_type("entity_unloaded")
+@dataclass(slots=True)
+class EntityUnloaded(Event):
+    entity_id: Any = None
+
+
+@register_event_type("combat_hit_confirm")
+@dataclass(slots=True)
+class CombatHitConfirmed(Event):
+    target_id: Any = None
+    position: Any = None
+
+
+@register_event_type("on_item_spawn")
+@dataclass(slots=True)
+class ItemSpawned(Event):
+    item_type: str = ""
+    count: int = 1
+    position: Any = None
+
+
+@register_event_type("spawn_projectile")
+@dataclass(slots=True)
+class ProjectileRequested(Event):
+    position: Any = None
+    velocity: Any = None
+    color_name: str = ""
+    owner_id: Any = None
+
+
+@register_event_type("on_zone_enter")
+@dataclass(slots=True)
+class ZoneEntered(Event):
+    zone_id: Any = None
+    entity_id: Any = None
+
+
+@register_event_type("world_restored")
+@dataclass(slots=True)
+class WorldRestored(Event):
+    """All entities were replaced from a snapshot (see engine.ecs.snapshot)."""
+    entity_count: int = 0
@@ -0,0 +1,169 @@
+"""
+Per-system frame timing.
+
+Attach a SystemProfiler to ``world.scheduler.profiler`` to time every
+system's frame_update() and update(). Each system keeps a ring buffer of
+its last ``window`` frame times, from which p50/p95/p99 and max are
+computed on demand. Frames whose system time exceeds the budget log a
+warning naming the slowest system, and the statistics are written through
+log_metric every ``metric_interval`` seconds.
+
+With no profiler attached the scheduler does a single None check per
+system, so profiling costs nothing unless it is switched on.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from engine.core.logger import get_logger, log_metric
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SystemTiming:
+    """Rolling frame-time statistics for one system, in milliseconds."""
+    name: str
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    samples: int
+
+
+class _Ring:
+    """Fixed-size ring buffer of frame times (ms)."""
+    __slots__ = ("values", "count", "index")
+
+    def __init__(self, size: int):
+        self.values = np.zeros(size, dtype=np.float32)
+        self.count = 0
+        self.index = 0
+
+    def push(self, value: float):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % len(self.values)
+        self.count = min(self.count + 1, len(self.values))
+
+    def filled(self) -> np.ndarray:
+        return self.values[:self.count]
+
+
+class SystemProfiler:
+    """Times systems per frame and reports rolling percentiles."""
+
+    METRIC_FIELDS = ("p50", "p95", "p99", "max")
+
+    def __init__(
+        self,
+        window: int = 300,
+        frame_budget_ms: float = 1000.0 / 60.0,
+        metric_interval: float = 5.0,
+        warn_interval: float = 1.0
+    ):
+        """Initialize the profiler.
+
+        Args:
+            window: Frames kept per system
+            frame_budget_ms: Total system time per frame before warning
+            metric_interval: Seconds between log_metric emissions
+            warn_interval: Minimum seconds between overrun warnings
+        """
+        self.window = window
+        self.frame_budget_ms = frame_budget_ms
+        self.metric_interval = metric_interval
+        self.warn_interval = warn_interval
+
+        self.last_frame_ms = 0.0
+        self.overruns = 0
+        self._rings: Dict[str, _Ring] = {}
+        self._frame_ms: Dict[str, float] = {}  # System name -> time spent this frame
+        self._metric_timer = 0.0
+        self._warn_timer = warn_interval
+
+    def begin_frame(self):
+        """Start collecting a new frame."""
+        self._frame_ms.clear()
+
+    def record(self, name: str, seconds: float):
+        """Add time spent by a system during the current frame."""
+        self._frame_ms[name] = self._frame_ms.get(name, 0.0) + seconds * 1000.0
+
+    def end_frame(self, dt: float):
+        """Store this frame's timings, check the budget and emit metrics when due.
+
+        Args:
+            dt: Frame delta time in seconds
+        """
+        frame_ms = 0.0
+        for name, ms in self._frame_ms.items():
+            ring = self._rings.get(name)
+            if ring is None:
+                ring = self._rings[name] = _Ring(self.window)
+            ring.push(ms)
+            frame_ms += ms
+        self.last_frame_ms = frame_ms
+
+        self._warn_timer += dt
+        if frame_ms > self.frame_budget_ms and self._frame_ms:
+            self.overruns += 1
+            if self._warn_timer >= self.warn_interval:
+                self._warn_timer = 0.0
+                name, ms = max(self._frame_ms.items(), key=lambda item: item[1])
+                logger.warning(
+                    f"Frame systems took {frame_ms:.1f} ms (budget {self.frame_budget_ms:.1f} ms); "
+                    f"slowest: {name} {ms:.1f} ms"
+                )
+
+        self._metric_timer += dt
+        if self._metric_timer >= self.metric_interval:
+            self._metric_timer = 0.0
+            self.emit_metrics()
+
+    def get_timing(self, name: str) -> Optional[SystemTiming]:
+        """Statistics for one system, or None if it was never timed."""
+        ring = self._rings.get(name)
+        if ring is None or ring.count == 0:
+            return None
+        values = ring.filled()
+        p50, p95, p99 = np.percentile(values, (50, 95, 99))
+        return SystemTiming(name, float(p50), float(p95), float(p99), float(values.max()), ring.count)
+
+    def stats(self) -> List[SystemTiming]:
+        """Statistics for every timed system, slowest (by p95) first."""
+        timings = [self.get_timing(name) for name in self._rings]
+        return sorted((t for t in timings if t is not None), key=lambda t: t.p95, reverse=True)
+
+    def format_table(self, rows: int = 8) -> str:
+        """Compact multi-line table for the debug overlay."""
+        lines = [f"{'System':<22}{'p50':>6}{'p95':>6}{'p99':>6}{'max':>6}"]
+        for timing in self.stats()[:rows]:
+            lines.append(
+                f"{timing.name[:21]:<22}{timing.p50:6.2f}{timing.p95:6.2f}{timing.p99:6.2f}{timing.max:6.2f}"
+            )
+        return "\n".join(lines)
+
+    def emit_metrics(self):
+        """Write one metric row per statistic per system."""
+        for timing in self.stats():
+            labels = {"system": timing.name}
+            for field_name in self.METRIC_FIELDS:
+                log_metric(f"system_ms_{field_name}", getattr(timing, field_name), labels)
+
+    def reset(self):
+        """Drop all collected timings."""
+        self._rings.clear()
+        self._frame_ms.clear()
+        self.overruns = 0
+
+
+def timed_call(profiler: SystemProfiler, name: str, func, dt: float):
+    """Call ``func(dt)`` and record its duration under a system name."""
+    start = time.perf_counter()
+    try:
+        func(dt)
+    finally:
+        profiler.record(name, time.perf_counter() - start)
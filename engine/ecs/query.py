@@ -0,0 +1,60 @@
+"""
+Cached live queries over archetype tables.
+
+World.query(A, B, C) returns the same Query object for the same component
+types. The world adds every newly created archetype that has all of the
+query's types to it, so a query never searches the archetypes again; it
+just reads their columns.
+"""
+from typing import Iterator, List, Tuple, Type
+
+from engine.ecs.archetype import Archetype
+from engine.ecs.component import Component
+
+
+class Query:
+    """Entities with all of a set of component types, kept up to date by the World.
+
+    Iterating yields ``(entity_id, a, b, c)`` tuples with components in the
+    requested order. Each iteration works on a snapshot taken when it
+    starts, so entities may be changed or destroyed inside the loop.
+
+    Example:
+        movers = world.query(Transform, KinematicState)
+        for entity_id, transform, state in movers:
+            ...
+    """
+
+    def __init__(self, component_types: Tuple[Type[Component], ...]):
+        self.component_types = component_types
+        self.archetypes: List[Archetype] = []
+
+    def matches(self, archetype: Archetype) -> bool:
+        """True if an archetype holds all of this query's types."""
+        return archetype.types.issuperset(self.component_types)
+
+    def _add_archetype(self, archetype: Archetype):
+        if self.matches(archetype):
+            self.archetypes.append(archetype)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.rows())
+
+    def __len__(self) -> int:
+        return sum(len(archetype.entities) for archetype in self.archetypes)
+
+    def rows(self) -> List[tuple]:
+        """Snapshot of all matching ``(entity_id, *components)`` tuples."""
+        rows: List[tuple] = []
+        for archetype in self.archetypes:
+            if archetype.entities:
+                columns = archetype.columns
+                rows.extend(zip(archetype.entities, *(columns[t] for t in self.component_types)))
+        return rows
+
+    def entity_ids(self) -> List[int]:
+        """Snapshot of the matching entity IDs."""
+        ids: List[int] = []
+        for archetype in self.archetypes:
+            ids.extend(archetype.entities)
+        return ids
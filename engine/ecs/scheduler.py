@@ -0,0 +1,155 @@
+"""
+System scheduling: tick rates, pause policy and parallel stages.
+
+Systems keep their insertion order. Consecutive systems that are
+``parallel_safe`` and whose declared component sets don't conflict (no
+system writes what another reads or writes) are grouped into one stage;
+every other system is a stage of its own. With ``max_workers`` above zero
+the systems of a stage run on a thread pool, which pays off for stages
+that spend their time in NumPy (it releases the GIL); pure-Python stages
+gain little but stay correct.
+
+Queued ECS commands are flushed after each stage, so structural changes
+are visible to the next one. Setting ``profiler`` to a SystemProfiler
+times every system call (see engine.ecs.profiler).
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from engine.ecs.profiler import SystemProfiler, timed_call
+from engine.ecs.system import PausePolicy, System
+
+# Float slack when comparing accumulated frame time against a tick interval
+_TICK_EPSILON = 1e-6
+# Golden-ratio step used to spread same-rate systems over different frames
+_PHASE_STEP = 0.6180339887
+
+
+def systems_conflict(a: System, b: System) -> bool:
+    """True if two systems may not run at the same time.
+
+    Systems without declared reads/writes conflict with everything.
+    """
+    if a.reads is None or a.writes is None or b.reads is None or b.writes is None:
+        return True
+    return bool(a.writes & (b.reads | b.writes)) or bool(b.writes & a.reads)
+
+
+def build_stages(systems: List[System]) -> List[List[System]]:
+    """Group consecutive non-conflicting parallel_safe systems into stages."""
+    stages: List[List[System]] = []
+    for system in systems:
+        current = stages[-1] if stages else None
+        if (current is not None and system.parallel_safe and current[0].parallel_safe
+                and not any(systems_conflict(system, other) for other in current)):
+            current.append(system)
+        else:
+            stages.append([system])
+    return stages
+
+
+class Scheduler:
+    """Runs a World's systems by stage, honouring tick rates and pause policy.
+
+    A system with a ``tick_rate`` accumulates frame time and updates once
+    the interval has passed, receiving the accumulated time as dt. Time past
+    the interval carries over to the next tick (at most one interval, so a
+    long frame can't queue a burst of catch-up ticks), which keeps the
+    average rate on target at any frame rate. Same-rate systems start at
+    different phases so they don't all land on one frame. Pausable systems
+    neither run nor accumulate time while paused.
+
+    Call shutdown() when the world is torn down to stop the worker threads.
+    """
+
+    def __init__(self, world: Any, max_workers: int = 0):
+        self.world = world
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stages: List[List[System]] = []
+        self._built_for = -1  # len(world._systems) the stages were built for
+        self._elapsed: Dict[System, float] = {}
+        
+        # Opt-in per-system timing; None skips all instrumentation
+        self.profiler: Optional[SystemProfiler] = None
+
+    @property
+    def stages(self) -> List[List[System]]:
+        """Current stages (rebuilt when systems are added)."""
+        systems = self.world._systems
+        if self._built_for != len(systems):
+            self._stages = build_stages(systems)
+            for index, system in enumerate(systems):
+                if system.tick_rate and system not in self._elapsed:
+                    self._elapsed[system] = (index * _PHASE_STEP) % 1.0 / system.tick_rate
+            self._built_for = len(systems)
+        return self._stages
+
+    def run(self, dt: float, paused: bool = False):
+        """Run one frame.
+
+        Args:
+            dt: Frame delta time in seconds
+            paused: Skip systems whose pause_policy is PAUSABLE
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame()
+        
+        for stage in self.stages:
+            due = []
+            for system in stage:
+                if not system.enabled or not system.ready:
+                    continue
+                if paused and system.pause_policy is PausePolicy.PAUSABLE:
+                    continue
+                if profiler is None:
+                    system.frame_update(dt)
+                else:
+                    timed_call(profiler, system.__class__.__name__, system.frame_update, dt)
+                if system.tick_rate is None:
+                    due.append((system, dt))
+                    continue
+                elapsed = self._elapsed.get(system, 0.0) + dt
+                if elapsed * system.tick_rate >= 1.0 - _TICK_EPSILON:
+                    interval = 1.0 / system.tick_rate
+                    carry = min(max(elapsed - interval, 0.0), interval)
+                    due.append((system, elapsed - carry))
+                    elapsed = carry
+                self._elapsed[system] = elapsed
+
+            if len(due) > 1 and self.max_workers > 0:
+                executor = self._get_executor()
+                futures = [executor.submit(self._update, system, system_dt, profiler) for system, system_dt in due]
+                for future in futures:
+                    future.result()  # Re-raise worker exceptions here
+            else:
+                for system, system_dt in due:
+                    if profiler is None:
+                        system.update(system_dt)
+                    else:
+                        timed_call(profiler, system.__class__.__name__, system.update, system_dt)
+
+            if due:
+                self.world.commands.flush()  # Sync point
+        
+        if profiler is not None:
+            profiler.end_frame(dt)
+
+    @staticmethod
+    def _update(system: System, dt: float, profiler: Optional[SystemProfiler]):
+        if profiler is None:
+            system.update(dt)
+        else:
+            timed_call(profiler, system.__class__.__name__, system.update, dt)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ecs-stage")
+        return self._executor
+
+    def shutdown(self):
+        """Stop the worker threads, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,584 @@
+"""
+Binary snapshots of a World's entities and components.
+
+save_snapshot() writes every live entity, its registered components (see
+register_component), the ID generations, free slots and tags;
+load_snapshot() puts a world back into exactly that state, entity IDs
+included. Uses: quick save/load, checkpoints in recorded sessions, and
+handing a running world to another process.
+
+The format is column-wise, following the archetype tables. For each
+component field of each archetype, a column whose values all have the
+field's annotated type (float, int, bool, str or Vec3) is packed with a
+single struct call; anything else falls back to a compact tagged encoding,
+where columns of immutable values (tuples, enums, None...) store each
+distinct value once and an index per row. Only plain data is stored: None,
+bool, int, float, str, Vec3, lists, tuples, dicts, and members of enums
+that a registered component declares in its field annotations. Loading
+never imports modules or unpickles, so a snapshot from another process
+cannot run code.
+Strings are written once, in a string table, and referenced by index.
+Components are described by name and field names, so snapshots survive
+fields being added (restored with their defaults) or removed (skipped).
+
+Layout (little-endian)::
+
+    magic, version
+    string table        u32 count, then (u32 length, utf-8 bytes) each
+    generations         u32 count, u64 each
+    free slots          u32 count, u32 each
+    tags                u32 count, (string, u64 entity ID) each
+    component schemas   u32 count, (name, u16 field count, field names) each
+    archetypes          u32 count, each:
+                            u16 type count, u16 schema index each
+                            u32 row count, u64 entity ID each
+                            per type, per field: u8 codec, column data
+    system state        u32 count, (string system class, generic value) each
+
+System state is what System.snapshot_state() returns, handed back to the
+system of the same class through restore_snapshot_state() on load.
+"""
+import enum
+import struct
+import typing
+from dataclasses import MISSING, fields
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
+
+import panda3d.core as panda_core
+from panda3d.core import LVector3f
+
+from engine.ecs.component import _COMPONENT_REGISTRY, get_component_class
+from engine.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"MCWS"
+VERSION = 2
+
+# Column codecs
+_GENERIC = 0
+_FLOAT = 1
+_INT = 2
+_BOOL = 3
+_STR = 4
+_VEC3 = 5
+_SHARED = 6  # Immutable values: distinct ones once, then a u32 index per row
+
+# struct item per value of the fixed-size codecs (Vec3 packs three "d")
+_FIXED_FORMATS = {_FLOAT: "d", _INT: "q", _BOOL: "?", _STR: "I", _VEC3: "d"}
+
+# Tags of the generic value encoding
+_TAG_NONE = 0
+_TAG_TRUE = 1
+_TAG_FALSE = 2
+_TAG_INT = 3
+_TAG_FLOAT = 4
+_TAG_STR = 5
+_TAG_VEC3 = 6
+_TAG_LIST = 7
+_TAG_TUPLE = 8
+_TAG_DICT = 9
+_TAG_ENUM = 10
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_VEC = struct.Struct("<B3d")
+
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+
+# Vec3 classes written as three doubles; a value's class is restored by index
+_VEC3_TYPES = tuple(dict.fromkeys(
+    cls for cls in (getattr(panda_core, name, None) for name in ("LVector3f", "LPoint3f", "LVecBase3f"))
+    if isinstance(cls, type)
+)) or (LVector3f,)
+_VEC3_INDEX = {cls: index for index, cls in enumerate(_VEC3_TYPES)}
+
+_CODEC_BY_TYPE = {float: _FLOAT, int: _INT, bool: _BOOL, str: _STR}
+_CODEC_BY_TYPE.update((cls, _VEC3) for cls in _VEC3_TYPES)
+
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, str))
+
+# Component type -> ((field name, annotated type, codec), ...)
+_PLANS: Dict[type, Tuple[Tuple[str, Any, int], ...]] = {}
+
+
+def _field_plan(component_type: type) -> Tuple[Tuple[str, Any, int], ...]:
+    """Fields of a component type with the codec their annotation allows."""
+    plan = _PLANS.get(component_type)
+    if plan is None:
+        try:
+            hints = typing.get_type_hints(component_type)
+        except Exception:
+            hints = {}
+        plan = []
+        for f in fields(component_type):
+            annotation = hints.get(f.name)
+            plan.append((f.name, annotation, _CODEC_BY_TYPE.get(annotation, _GENERIC)))
+        plan = _PLANS[component_type] = tuple(plan)
+    return plan
+
+
+def _enum_key(enum_type: type) -> str:
+    return f"{enum_type.__module__}:{enum_type.__qualname__}"
+
+
+def _collect_enums(annotation: Any, found: Dict[str, type]):
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        found[_enum_key(annotation)] = annotation
+    for arg in typing.get_args(annotation):
+        _collect_enums(arg, found)
+
+
+def _declared_enums() -> Dict[str, type]:
+    """Enum types named in the field annotations of registered components."""
+    found: Dict[str, type] = {}
+    for component_type in list(_COMPONENT_REGISTRY.values()):
+        for _, annotation, _ in _field_plan(component_type):
+            _collect_enums(annotation, found)
+    return found
+
+
+class _StringTable:
+    """Strings written once and referenced by index."""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        index = self.index.get(value)
+        if index is None:
+            index = self.index[value] = len(self.index)
+        return index
+
+    def encode(self) -> bytes:
+        parts = [_U32.pack(len(self.index))]
+        for value in self.index:
+            raw = value.encode("utf-8")
+            parts.append(_U32.pack(len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+
+def _encode_value(value: Any, out: bytearray, strings: _StringTable, enums: Dict[str, type]):
+    """Append one value in the generic tagged encoding.
+
+    Raises:
+        TypeError: If the value (or an item of it) is not plain data
+    """
+    kind = type(value)
+    if value is None:
+        out.append(_TAG_NONE)
+    elif kind is bool:
+        out.append(_TAG_TRUE if value else _TAG_FALSE)
+    elif kind is int and _INT_MIN <= value <= _INT_MAX:
+        out.append(_TAG_INT)
+        out += _I64.pack(value)
+    elif kind is float:
+        out.append(_TAG_FLOAT)
+        out += _F64.pack(value)
+    elif kind is str:
+        out.append(_TAG_STR)
+        out += _U32.pack(strings(value))
+    elif kind in _VEC3_INDEX:
+        out.append(_TAG_VEC3)
+        out += _VEC.pack(_VEC3_INDEX[kind], value.x, value.y, value.z)
+    elif kind is list or kind is tuple:
+        out.append(_TAG_LIST if kind is list else _TAG_TUPLE)
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode_value(item, out, strings, enums)
+    elif kind is dict:
+        out.append(_TAG_DICT)
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            _encode_value(key, out, strings, enums)
+            _encode_value(item, out, strings, enums)
+    elif isinstance(value, enum.Enum) and enums.get(_enum_key(kind)) is kind:
+        out.append(_TAG_ENUM)
+        out += _U32.pack(strings(_enum_key(kind)))
+        out += _U32.pack(strings(value.name))
+    elif isinstance(value, enum.Enum):
+        raise TypeError(f"enum {kind.__qualname__} is not declared by a registered component")
+    else:
+        raise TypeError(f"cannot store {kind.__qualname__} values")
+
+
+def _is_immutable(value: Any) -> bool:
+    """True if restored copies of ``value`` may be shared between components."""
+    kind = type(value)
+    if kind in _SCALAR_TYPES or isinstance(value, enum.Enum):
+        return True
+    return kind is tuple and all(map(_is_immutable, value))
+
+
+def _decode_value(data: memoryview, offset: int, strings: List[str],
+                  enums: Dict[str, type]) -> Tuple[Any, int]:
+    """Read one generic value; returns it and the offset after it."""
+    tag = data[offset]
+    offset += 1
+    if tag == _TAG_NONE:
+        return None, offset
+    if tag == _TAG_TRUE:
+        return True, offset
+    if tag == _TAG_FALSE:
+        return False, offset
+    if tag == _TAG_INT:
+        return _I64.unpack_from(data, offset)[0], offset + 8
+    if tag == _TAG_FLOAT:
+        return _F64.unpack_from(data, offset)[0], offset + 8
+    if tag == _TAG_STR:
+        return strings[_U32.unpack_from(data, offset)[0]], offset + 4
+    if tag == _TAG_VEC3:
+        index, x, y, z = _VEC.unpack_from(data, offset)
+        return _VEC3_TYPES[index](x, y, z), offset + _VEC.size
+    if tag == _TAG_LIST or tag == _TAG_TUPLE:
+        count = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _decode_value(data, offset, strings, enums)
+            items.append(item)
+        return (items if tag == _TAG_LIST else tuple(items)), offset
+    if tag == _TAG_DICT:
+        count = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        result = {}
+        for _ in range(count):
+            key, offset = _decode_value(data, offset, strings, enums)
+            result[key], offset = _decode_value(data, offset, strings, enums)
+        return result, offset
+    if tag == _TAG_ENUM:
+        type_index, name_index = struct.unpack_from("<II", data, offset)
+        enum_type = enums.get(strings[type_index])
+        if enum_type is None:
+            raise ValueError(f"Snapshot enum {strings[type_index]} is not declared by a registered component")
+        return enum_type[strings[name_index]], offset + 8
+    raise ValueError(f"Corrupt snapshot: unknown value tag {tag}")
+
+
+def _encode_column(values: List[Any], annotation: Any, codec: int, strings: _StringTable,
+                   enums: Dict[str, type]) -> bytes:
+    """Encode one field of every row, packed if all values have the annotated type."""
+    if codec != _GENERIC and set(map(type, values)) == {annotation}:
+        try:
+            if codec == _STR:
+                packed = struct.pack(f"<{len(values)}I", *map(strings, values))
+            elif codec == _VEC3:
+                flat = [c for value in values for c in (value.x, value.y, value.z)]
+                packed = struct.pack(f"<{len(flat)}d", *flat)
+            else:
+                packed = struct.pack(f"<{len(values)}{_FIXED_FORMATS[codec]}", *values)
+            return _U8.pack(codec) + packed
+        except struct.error:
+            pass  # e.g. an int beyond 64 bits
+    # Keyed by encoding, not value: 1, 1.0 and True compare equal
+    shared: Dict[bytes, int] = {}
+    by_id: Dict[int, int] = {}  # Rows often share one object (e.g. a default tuple)
+    indices = []
+    for value in values:
+        index = by_id.get(id(value))
+        if index is None:
+            if not _is_immutable(value):
+                break
+            encoded = bytearray()
+            _encode_value(value, encoded, strings, enums)
+            index = by_id[id(value)] = shared.setdefault(bytes(encoded), len(shared))
+        indices.append(index)
+    else:
+        blob = b"".join(shared)
+        return b"".join((
+            struct.pack("<BII", _SHARED, len(shared), len(blob)), blob,
+            struct.pack(f"<{len(indices)}I", *indices)
+        ))
+    out = bytearray(_U8.pack(_GENERIC))
+    out += b"\0\0\0\0"  # Byte length, filled in below
+    for value in values:
+        _encode_value(value, out, strings, enums)
+    out[1:5] = _U32.pack(len(out) - 5)
+    return bytes(out)
+
+
+def _decode_column(data: memoryview, offset: int, rows: int, annotation: Any,
+                   strings: List[str], enums: Dict[str, type]) -> Tuple[List[Any], int]:
+    """Read one field column; returns its values and the offset after it."""
+    codec = data[offset]
+    offset += 1
+    if codec == _SHARED:
+        count, size = struct.unpack_from("<II", data, offset)
+        offset += 8
+        end = offset + size
+        shared = []
+        for _ in range(count):
+            value, offset = _decode_value(data, offset, strings, enums)
+            shared.append(value)
+        indices = struct.unpack_from(f"<{rows}I", data, end)
+        return [shared[index] for index in indices], end + 4 * rows
+    if codec == _GENERIC:
+        end = offset + 4 + _U32.unpack_from(data, offset)[0]
+        offset += 4
+        values = []
+        for _ in range(rows):
+            value, offset = _decode_value(data, offset, strings, enums)
+            values.append(value)
+        return values, end
+    count = rows * 3 if codec == _VEC3 else rows
+    fmt = f"<{count}{_FIXED_FORMATS[codec]}"
+    values = struct.unpack_from(fmt, data, offset)
+    offset += struct.calcsize(fmt)
+    if codec == _STR:
+        return [strings[index] for index in values], offset
+    if codec == _VEC3:
+        vec3 = annotation if annotation in _VEC3_INDEX else LVector3f
+        return [vec3(values[i], values[i + 1], values[i + 2]) for i in range(0, count, 3)], offset
+    return list(values), offset
+
+
+def save_snapshot(world: Any) -> bytes:
+    """Serialize a world's entities and registered components.
+
+    Queued commands are flushed first. Components whose type is not
+    registered are left out (with a warning); their entities are kept.
+
+    Args:
+        world: ECS World instance
+
+    Returns:
+        Snapshot bytes for load_snapshot()
+
+    Raises:
+        TypeError: If a component field holds a value that is not plain data
+            (see the module docstring)
+    """
+    world.commands.flush()
+    strings = _StringTable()
+    enums = _declared_enums()
+    body: List[bytes] = []
+
+    generations = world._generations
+    body.append(_U32.pack(len(generations)))
+    body.append(struct.pack(f"<{len(generations)}Q", *generations))
+    free_indices = world._free_indices
+    body.append(_U32.pack(len(free_indices)))
+    body.append(struct.pack(f"<{len(free_indices)}I", *free_indices))
+
+    body.append(_U32.pack(len(world._tags)))
+    for tag, entity_id in world._tags.items():
+        body.append(struct.pack("<IQ", strings(tag), entity_id))
+
+    # Schemas of the registered types present in the world
+    archetypes = [archetype for archetype in world._archetypes.values() if archetype.entities]
+    schema_index: Dict[type, int] = {}
+    skipped = set()
+    for archetype in archetypes:
+        for component_type in archetype.types:
+            if component_type in schema_index or component_type in skipped:
+                continue
+            if get_component_class(component_type.__name__) is not component_type:
+                skipped.add(component_type)
+                continue
+            schema_index[component_type] = len(schema_index)
+    for component_type in skipped:
+        logger.warning(f"Snapshot skips unregistered component {component_type.__name__}")
+
+    body.append(_U32.pack(len(schema_index)))
+    for component_type in schema_index:
+        plan = _field_plan(component_type)
+        body.append(struct.pack(
+            f"<IH{len(plan)}I", strings(component_type.__name__), len(plan),
+            *(strings(name) for name, _, _ in plan)
+        ))
+
+    body.append(_U32.pack(len(archetypes)))
+    for archetype in archetypes:
+        types = [t for t in archetype.types if t in schema_index]
+        rows = len(archetype.entities)
+        body.append(struct.pack(f"<H{len(types)}H", len(types), *(schema_index[t] for t in types)))
+        body.append(_U32.pack(rows))
+        body.append(struct.pack(f"<{rows}Q", *archetype.entities))
+        for component_type in types:
+            column = archetype.columns[component_type]
+            for name, annotation, codec in _field_plan(component_type):
+                values = list(map(attrgetter(name), column))
+                try:
+                    body.append(_encode_column(values, annotation, codec, strings, enums))
+                except TypeError as e:
+                    raise TypeError(f"Snapshot cannot store {component_type.__name__}.{name}: {e}") from None
+
+    states = [(type(system).__name__, system.snapshot_state()) for system in world._systems]
+    states = [(name, state) for name, state in states if state is not None]
+    body.append(_U32.pack(len(states)))
+    for name, state in states:
+        out = bytearray(_U32.pack(strings(name)))
+        try:
+            _encode_value(state, out, strings, enums)
+        except TypeError as e:
+            raise TypeError(f"Snapshot cannot store {name} state: {e}") from None
+        body.append(bytes(out))
+
+    return b"".join([MAGIC, _U16.pack(VERSION), strings.encode(), *body])
+
+
+def _read_snapshot(view: memoryview) -> Tuple[List[int], List[int], Dict[str, int], List[tuple], Dict[str, Any]]:
+    """Decode a whole snapshot without touching any world.
+
+    Returns:
+        (generations, free slots, tags, [(entity IDs, {type: components})]
+        per archetype, {system class name: state})
+    """
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError("Not a world snapshot")
+    version = _U16.unpack_from(view, 4)[0]
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    offset = 6
+    enums = _declared_enums()
+
+    count = _U32.unpack_from(view, offset)[0]
+    offset += 4
+    strings: List[str] = []
+    for _ in range(count):
+        size = _U32.unpack_from(view, offset)[0]
+        offset += 4
+        if offset + size > len(view):
+            raise ValueError("Corrupt snapshot: string table is truncated")
+        strings.append(str(view[offset:offset + size], "utf-8"))
+        offset += size
+
+    count = _U32.unpack_from(view, offset)[0]
+    generations = list(struct.unpack_from(f"<{count}Q", view, offset + 4))
+    offset += 4 + 8 * count
+    count = _U32.unpack_from(view, offset)[0]
+    free_indices = list(struct.unpack_from(f"<{count}I", view, offset + 4))
+    offset += 4 + 4 * count
+
+    count = _U32.unpack_from(view, offset)[0]
+    offset += 4
+    tags = {}
+    for _ in range(count):
+        tag_index, entity_id = struct.unpack_from("<IQ", view, offset)
+        tags[strings[tag_index]] = entity_id
+        offset += 12
+
+    # Per saved schema: component type (None if no longer registered), saved
+    # field names, annotations of the current fields, and fields to default
+    count = _U32.unpack_from(view, offset)[0]
+    offset += 4
+    schemas = []
+    for _ in range(count):
+        name_index, field_count = struct.unpack_from("<IH", view, offset)
+        offset += 6
+        names = [strings[i] for i in struct.unpack_from(f"<{field_count}I", view, offset)]
+        offset += 4 * field_count
+        component_type = get_component_class(strings[name_index])
+        if component_type is None:
+            logger.warning(f"Snapshot component {strings[name_index]} is not registered; dropping it")
+            schemas.append((None, names, {}, ()))
+            continue
+        annotations = {name: annotation for name, annotation, _ in _field_plan(component_type)}
+        missing = tuple(f for f in fields(component_type) if f.name not in names)
+        for f in missing:
+            if f.default is MISSING and f.default_factory is MISSING:
+                raise ValueError(f"Snapshot lacks required field {component_type.__name__}.{f.name}")
+        schemas.append((component_type, names, annotations, missing))
+
+    count = _U32.unpack_from(view, offset)[0]
+    offset += 4
+    tables = []
+    for _ in range(count):
+        type_count = _U16.unpack_from(view, offset)[0]
+        type_indices = struct.unpack_from(f"<{type_count}H", view, offset + 2)
+        offset += 2 + 2 * type_count
+        rows = _U32.unpack_from(view, offset)[0]
+        entity_ids = struct.unpack_from(f"<{rows}Q", view, offset + 4)
+        offset += 4 + 8 * rows
+
+        columns = {}
+        for schema in type_indices:
+            component_type, names, annotations, missing = schemas[schema]
+            components = [component_type.__new__(component_type) for _ in range(rows)] if component_type else None
+            for name in names:
+                values, offset = _decode_column(view, offset, rows, annotations.get(name), strings, enums)
+                if name in annotations:
+                    for component, value in zip(components, values):
+                        setattr(component, name, value)
+            if components is None:
+                continue
+            for f in missing:
+                for component in components:
+                    setattr(component, f.name, f.default if f.default is not MISSING else f.default_factory())
+            columns[component_type] = components
+        tables.append((entity_ids, columns))
+
+    count = _U32.unpack_from(view, offset)[0]
+    offset += 4
+    states = {}
+    for _ in range(count):
+        name = strings[_U32.unpack_from(view, offset)[0]]
+        states[name], offset = _decode_value(view, offset + 4, strings, enums)
+
+    if offset != len(view):
+        raise ValueError(f"Corrupt snapshot: {len(view) - offset} unexpected bytes at the end")
+    return generations, free_indices, tags, tables, states
+
+
+def load_snapshot(world: Any, data: bytes) -> int:
+    """Replace a world's entities with those of a snapshot.
+
+    The whole snapshot is decoded before the world is changed. Existing
+    entities are then dropped (without events) and queued commands
+    discarded. Entity IDs, tags and slot generations come back exactly as
+    saved, so IDs held in components still refer to the same entities.
+    Components are rebuilt without calling __init__/__post_init__; fields
+    missing from the snapshot get their defaults. Each system of the world
+    then gets its saved state through restore_snapshot_state(), and
+    ``world_restored`` is published so systems can drop per-entity caches.
+
+    Args:
+        world: ECS World instance
+        data: Bytes made by save_snapshot()
+
+    Returns:
+        Number of restored entities
+
+    Raises:
+        ValueError: If ``data`` is not a snapshot of a supported version, is
+            truncated or corrupt, names an enum no registered component
+            declares, or lacks a field (without default) of a registered
+            component. The world is left untouched.
+    """
+    try:
+        generations, free_indices, tags, tables, states = _read_snapshot(memoryview(data))
+    except (struct.error, IndexError, KeyError, TypeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupt snapshot: {e!r}") from e
+
+    world.commands.clear()
+    for archetype in world._archetypes.values():
+        archetype.clear()
+    entities = world._entities
+    entities.clear()
+    for entity_ids, columns in tables:
+        archetype = world._get_archetype(frozenset(columns))
+        start = len(archetype.entities)
+        archetype.extend(entity_ids, columns)
+        for row, entity_id in enumerate(entity_ids, start):
+            entities[entity_id] = [archetype, row]
+
+    world.structure_version += 1
+    world._generations[:] = generations
+    world._free_indices[:] = free_indices
+    world._tags.clear()
+    world._entity_tags.clear()
+    for tag, entity_id in tags.items():
+        world._set_tag(entity_id, tag)
+    world._check_pending_systems()
+    for system in list(world._systems):
+        system.restore_snapshot_state(states.get(type(system).__name__))
+    count = len(entities)
+    world.event_bus.publish("world_restored", entity_count=count)
+    return count
@@ -7,13 +7,24 @@ Systems follow a three-phase lifecycle:
 3. READY: on_ready() called when all declared dependencies are satisfied
 
 Systems only receive update() calls when in READY state.
+
+Scheduling is declared with class attributes (see engine.ecs.scheduler):
+tick_rate, pause_policy, and the reads/writes component sets used to run
+non-conflicting systems side by side.
 """
-from typing import TYPE_CHECKING, List
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any, FrozenSet, List, Optional, Type
 from engine.ecs.events import EventBus
 
 if TYPE_CHECKING:
     from engine.ecs.world import World
 
+
+class PausePolicy(Enum):
+    """Whether a system keeps running while the game is paused."""
+    PAUSABLE = auto()  # Gameplay: stops while paused
+    ALWAYS = auto()  # UI, menus, feedback: runs in every state
+
 class System:
     """
     Base class for logic systems.
@@ -23,9 +34,25 @@ class System:
         1. __init__: Construct system, store references
         2. initialize(): Setup resources that don't depend on entities
         3. on_ready(): Called when get_dependencies() are satisfied
-        4. update(): Called every frame (only when ready=True)
+        4. update(): Called every frame, or tick_rate times per second (only when ready=True)
         5. cleanup(): Teardown when system removed
+    
+    Scheduling:
+        tick_rate: Updates per second; None updates every frame. update()
+            receives the time elapsed since its previous call.
+        pause_policy: PausePolicy.PAUSABLE or PausePolicy.ALWAYS
+        reads/writes: Component types the system's update() reads and
+            writes; None means unknown, and the system runs on its own.
+        parallel_safe: update() touches only the declared components (no
+            events, entity creation, or rendering), so it may run on a
+            worker thread alongside non-conflicting systems.
     """
+    tick_rate: Optional[float] = None
+    pause_policy: PausePolicy = PausePolicy.PAUSABLE
+    reads: Optional[FrozenSet[Type]] = None
+    writes: Optional[FrozenSet[Type]] = None
+    parallel_safe: bool = False
+    
     def __init__(self, world: 'World', event_bus: EventBus):
         self.world = world
         self.event_bus = event_bus
@@ -78,11 +105,49 @@ class System:
         - self.enabled = True
         - self.ready = True
         
+        Args:
+            dt: Delta time since last frame in seconds (since the last
+                update for systems with a tick_rate)
+        """
+        pass
+
+    def frame_update(self, dt: float):
+        """
+        Called every frame, before update(), even for systems with a tick_rate.
+        
+        Use it for work that must stay smooth (visual interpolation,
+        animation) in a system whose logic runs at a lower rate.
+        
         Args:
             dt: Delta time since last frame in seconds
         """
         pass
 
+    def snapshot_state(self) -> Any:
+        """
+        State saved with world snapshots (see engine.ecs.snapshot).
+        
+        Only for state that belongs with the entities but is not kept in
+        components (e.g. records of entities streamed out of the world).
+        Must be plain data: None, bool, int, float, str, Vec3, and lists,
+        tuples and dicts of those.
+        
+        Returns:
+            Plain data, or None to save nothing (default)
+        """
+        return None
+
+    def restore_snapshot_state(self, state: Any):
+        """
+        Called by load_snapshot() once the world's entities are replaced,
+        before ``world_restored`` is published.
+        
+        Args:
+            state: What snapshot_state() returned when the snapshot was
+                saved, or None if this system saved nothing
+        """
+        pass
+
     def cleanup(self):
         """
         Called when system is removed or game ends.
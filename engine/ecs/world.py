@@ -1,9 +1,17 @@
 """
 World class managing entities and systems.
+
+Entity IDs are integer handles: the low 32 bits are a slot index, the high
+bits the slot's generation. Destroyed slots go on a free list and are
+reused with the next generation, so an ID held past destroy_entity() never
+refers to the new occupant.
 """
-from typing import Dict, List, Type, TypeVar, Optional, Set, Any
-import uuid
+from typing import Dict, FrozenSet, List, Type, TypeVar, Optional, Set, Any, Tuple
+from engine.ecs.archetype import Archetype
+from engine.ecs.commands import CommandBuffer
 from engine.ecs.component import Component
+from engine.ecs.query import Query
+from engine.ecs.scheduler import Scheduler
 from engine.ecs.system import System
 from engine.ecs.events import EventBus
 from engine.core.logger import get_logger
@@ -12,42 +20,105 @@ logger = get_logger(__name__)
 
 T = TypeVar('T', bound=Component)
 
+# Bits of an entity ID holding the slot index; the generation sits above them
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+def entity_index(entity_id: int) -> int:
+    """Slot index of an entity ID."""
+    return entity_id & INDEX_MASK
+
+
+def entity_generation(entity_id: int) -> int:
+    """Generation of an entity ID."""
+    return entity_id >> INDEX_BITS
+
 class World:
     """
     The main container for the ECS.
     Manages entities, components, strings systems together.
+    
+    Structural changes made while systems run should go through
+    ``world.commands``; update() applies them between systems.
     """
-    def __init__(self):
+    def __init__(self, immediate_commands: bool = False):
         self.event_bus = EventBus()
         self._systems: List[System] = []
         self._pending_systems: List[System] = []  # Systems waiting for dependencies
         
-        # Entity ID -> {ComponentType -> ComponentInstance}
-        self._entities: Dict[str, Dict[Type[Component], Component]] = {}
+        # Component set -> Archetype table (entities without components live in the empty one)
+        self._empty_archetype = Archetype(frozenset())
+        self._archetypes: Dict[FrozenSet[Type[Component]], Archetype] = {frozenset(): self._empty_archetype}
+        
+        # Entity ID -> [Archetype, row]
+        self._entities: Dict[int, List[Any]] = {}
+        
+        # Current generation of every slot ever used, and slots free for reuse.
+        # Slot 0 is reserved so no entity ID is 0 (callers test IDs for truthiness).
+        self._generations: List[int] = [0]
+        self._free_indices: List[int] = []
+        
+        # Bumped by every entity create/destroy and component add/remove, so
+        # caches over entity sets (e.g. the spatial index) can skip frames where
+        # nothing changed. Replacing a component in place does not count.
+        self.structure_version = 0
+        
+        # Component type tuple -> live Query (updated when archetypes are created)
+        self._queries: Dict[Tuple[Type[Component], ...], Query] = {}
+        
+        # Tag -> EntityID (for unique named entities like 'player'), and the reverse
+        self._tags: Dict[str, int] = {}
+        self._entity_tags: Dict[int, Set[str]] = {}
         
-        # ComponentType -> Set[EntityID] (for fast querying)
-        self._component_index: Dict[Type[Component], Set[str]] = {}
+        # Class name -> first system of that class (for get_system_by_type)
+        self._systems_by_type: Dict[str, System] = {}
         
-        # Tag -> EntityID (for unique named entities like 'player')
-        self._tags: Dict[str, str] = {}
+        # Deferred creates/destroys/component changes, flushed at sync points in update()
+        self.commands = CommandBuffer(self, immediate=immediate_commands)
+        
+        # Runs systems by stage with their tick rates and pause policies
+        self.scheduler = Scheduler(self)
 
-    def create_entity(self, tag: Optional[str] = None) -> str:
+    def create_entity(self, tag: Optional[str] = None) -> int:
         """Create a new empty entity and return its ID."""
-        entity_id = str(uuid.uuid4())
-        self._entities[entity_id] = {}
+        entity_id = self._reserve_entity_id()
+        self._spawn_reserved(entity_id)
         
         if tag:
-            self._tags[tag] = entity_id
+            self._set_tag(entity_id, tag)
             # Check if any pending systems are now satisfied
             self._check_pending_systems()
             
         return entity_id
 
-    def get_entity_by_tag(self, tag: str) -> Optional[str]:
+    def _reserve_entity_id(self) -> int:
+        """Allocate an ID without creating the entity (see CommandBuffer)."""
+        if self._free_indices:
+            index = self._free_indices.pop()
+        else:
+            index = len(self._generations)
+            self._generations.append(0)
+        return (self._generations[index] << INDEX_BITS) | index
+
+    def _spawn_reserved(self, entity_id: int):
+        """Create an empty entity under a reserved ID."""
+        self.structure_version += 1
+        self._entities[entity_id] = [self._empty_archetype, self._empty_archetype.append(entity_id, {})]
+
+    def is_alive(self, entity_id: int) -> bool:
+        """Check if an entity ID refers to a live entity."""
+        return entity_id in self._entities
+
+    def get_entity_by_tag(self, tag: str) -> Optional[int]:
         """Get entity ID by tag name."""
         return self._tags.get(tag)
 
-    def register_tag(self, entity_id: str, tag: str):
+    def get_tags(self, entity_id: int) -> Set[str]:
+        """Get the tags registered for an entity."""
+        return set(self._entity_tags.get(entity_id, ()))
+
+    def register_tag(self, entity_id: int, tag: str):
         """Register a tag for an existing entity.
         
         This is useful for delaying tag assignment until after components 
@@ -56,78 +127,148 @@ class World:
         if entity_id not in self._entities:
             raise KeyError(f"Entity {entity_id} does not exist")
             
-        self._tags[tag] = entity_id
+        self._set_tag(entity_id, tag)
         # Check if any pending systems are now satisfied
         self._check_pending_systems()
 
-    def destroy_entity(self, entity_id: str):
+    def _set_tag(self, entity_id: int, tag: str):
+        previous = self._tags.get(tag)
+        if previous is not None and previous != entity_id:
+            self._entity_tags[previous].discard(tag)
+        self._tags[tag] = entity_id
+        self._entity_tags.setdefault(entity_id, set()).add(tag)
+
+    def destroy_entity(self, entity_id: int):
         """Remove an entity and all its components."""
-        if entity_id not in self._entities:
+        location = self._entities.pop(entity_id, None)
+        if location is None:
             return
-            
-        # Clean up indices
-        for component_type in self._entities[entity_id]:
-            if component_type in self._component_index:
-                self._component_index[component_type].discard(entity_id)
-                
+        self.structure_version += 1
+        archetype, row = location
+        moved = archetype.swap_remove(row)
+        if moved is not None:
+            self._entities[moved][1] = row
+        
         # Remove from tags if present
-        tags_to_remove = [k for k, v in self._tags.items() if v == entity_id]
-        for t in tags_to_remove:
-            del self._tags[t]
-            
-        del self._entities[entity_id]
+        for tag in self._entity_tags.pop(entity_id, ()):
+            del self._tags[tag]
+        
+        # Retire the handle; the slot comes back with the next generation
+        index = entity_id & INDEX_MASK
+        self._generations[index] += 1
+        self._free_indices.append(index)
 
-    def add_component(self, entity_id: str, component: Component):
-        """Add a component to an entity."""
-        if entity_id not in self._entities:
+    def add_component(self, entity_id: int, component: Component):
+        """Add a component to an entity (replaces one of the same type)."""
+        location = self._entities.get(entity_id)
+        if location is None:
             raise KeyError(f"Entity {entity_id} does not exist")
             
         component_type = type(component)
-        self._entities[entity_id][component_type] = component
+        archetype, row = location
+        column = archetype.columns.get(component_type)
+        if column is not None:
+            column[row] = component
+            return
         
-        if component_type not in self._component_index:
-            self._component_index[component_type] = set()
-        self._component_index[component_type].add(entity_id)
+        target = archetype.add_edges.get(component_type)
+        if target is None:
+            target = self._get_archetype(archetype.types | {component_type})
+            archetype.add_edges[component_type] = target
+            target.remove_edges[component_type] = archetype
+        components = archetype.row_components(row)
+        components[component_type] = component
+        self._move(entity_id, location, target, components)
 
-    def remove_component(self, entity_id: str, component_type: Type[T]):
+    def remove_component(self, entity_id: int, component_type: Type[T]):
         """Remove a component from an entity."""
-        if entity_id in self._entities and component_type in self._entities[entity_id]:
-            del self._entities[entity_id][component_type]
-            if component_type in self._component_index:
-                self._component_index[component_type].discard(entity_id)
+        location = self._entities.get(entity_id)
+        if location is None or component_type not in location[0].columns:
+            return
+        archetype, row = location
+        target = archetype.remove_edges.get(component_type)
+        if target is None:
+            target = self._get_archetype(archetype.types - {component_type})
+            archetype.remove_edges[component_type] = target
+            target.add_edges[component_type] = archetype
+        components = archetype.row_components(row)
+        del components[component_type]
+        self._move(entity_id, location, target, components)
+
+    def _get_archetype(self, types: FrozenSet[Type[Component]]) -> Archetype:
+        """Find or create the archetype for a component set."""
+        archetype = self._archetypes.get(types)
+        if archetype is None:
+            archetype = Archetype(types)
+            self._archetypes[types] = archetype
+            for query in self._queries.values():
+                query._add_archetype(archetype)
+        return archetype
 
-    def get_component(self, entity_id: str, component_type: Type[T]) -> Optional[T]:
+    def _move(self, entity_id: int, location: List[Any], target: Archetype,
+              components: Dict[Type[Component], Component]):
+        """Move an entity's row to another archetype."""
+        self.structure_version += 1
+        source, row = location
+        moved = source.swap_remove(row)
+        if moved is not None:
+            self._entities[moved][1] = row
+        location[0] = target
+        location[1] = target.append(entity_id, components)
+
+    def get_component(self, entity_id: int, component_type: Type[T]) -> Optional[T]:
         """Get a specific component for an entity."""
-        if entity_id not in self._entities:
+        location = self._entities.get(entity_id)
+        if location is None:
             return None
-        return self._entities[entity_id].get(component_type)
+        column = location[0].columns.get(component_type)
+        return column[location[1]] if column is not None else None
 
-    def has_component(self, entity_id: str, component_type: Type[Component]) -> bool:
+    def has_component(self, entity_id: int, component_type: Type[Component]) -> bool:
         """Check if entity has a component."""
-        return entity_id in self._entities and component_type in self._entities[entity_id]
+        location = self._entities.get(entity_id)
+        return location is not None and component_type in location[0].columns
 
-    def get_entities_with(self, *component_types: Type[Component]) -> Set[str]:
-        """Get set of entity IDs that possess ALL specified component types."""
+    def get_entities_with(self, *component_types: Type[Component]) -> Set[int]:
+        """Get set of entity IDs that possess ALL specified component types.
+        
+        Returns a new set the caller may modify. Prefer query() in per-frame code.
+        """
         if not component_types:
             return set(self._entities.keys())
-            
-        result = None
-        for ct in component_types:
-            entities = self._component_index.get(ct, set())
-            if result is None:
-                result = entities.copy()
-            else:
-                result &= entities
-                
-        return result or set()
+        return set(self.query(*component_types).entity_ids())
 
-    def get_components(self, entity_id: str) -> Dict[Type[Component], Component]:
-        """Get all components for an entity."""
-        return self._entities.get(entity_id, {})
+    def query(self, *component_types: Type[Component]) -> Query:
+        """Get the live Query for entities with ALL specified component types.
+        
+        The Query is created once per distinct type tuple and kept up to
+        date as archetypes appear, so systems can call this every frame (or
+        keep the result). Iterating it yields (entity_id, a, b, ...) tuples
+        read straight from the archetype columns.
+        
+        Example:
+            for entity_id, transform, state in world.query(Transform, KinematicState):
+                ...
+        """
+        query = self._queries.get(component_types)
+        if query is None:
+            query = Query(component_types)
+            for archetype in self._archetypes.values():
+                query._add_archetype(archetype)
+            self._queries[component_types] = query
+        return query
+
+    def get_components(self, entity_id: int) -> Dict[Type[Component], Component]:
+        """Get all components for an entity (a new dict; empty if it doesn't exist)."""
+        location = self._entities.get(entity_id)
+        if location is None:
+            return {}
+        return location[0].row_components(location[1])
 
     def add_system(self, system: System):
         """Add a logic system to the world."""
         self._systems.append(system)
+        self._systems_by_type.setdefault(system.__class__.__name__, system)
         system.initialize()
         logger.info(f"Initialized ECS System: {system.__class__.__name__}")
         
@@ -154,23 +295,37 @@ class World:
             system_name: Name of the system class (e.g., "TerrainSystem")
             
         Returns:
-            System instance or None if not found
+            System instance (the first added, if several share the name) or None if not found
         """
-        for system in self._systems:
-            if system.__class__.__name__ == system_name:
-                return system
-        return None
+        return self._systems_by_type.get(system_name)
 
-    def update(self, dt: float):
-        """Update all systems."""
+    def update(self, dt: float, paused: bool = False):
+        """Update all systems.
+        
+        Systems run through the scheduler (see engine.ecs.scheduler), which
+        applies tick rates and pause policies and flushes queued commands
+        after each stage. Queued event subscribers and commands left from
+        outside update() are handled first.
+        
+        Args:
+            dt: Frame delta time in seconds
+            paused: True while the game is paused; only systems with
+                PausePolicy.ALWAYS run
+        """
         # Check pending systems periodically (in case dependencies appear)
         self._check_pending_systems()
+        self.event_bus.flush()
+        self.commands.flush()
         
-        # Update only ready systems
-        for system in self._systems:
-            if system.enabled and system.ready:
-                system.update(dt)
+        self.scheduler.run(dt, paused)
     
+    def shutdown(self):
+        """Release resources held outside the ECS (the scheduler's worker threads).
+
+        Call once when the world is discarded.
+        """
+        self.scheduler.shutdown()
+
     def _dependencies_satisfied(self, system: System) -> bool:
         """Check if all dependencies for a system are satisfied.
         
@@ -3,12 +3,14 @@ VoxelGame entry point.
 """
 from typing import Optional, Dict, Any, Type
 from enum import Enum, auto
+from pathlib import Path
 import sys
 
 # Engine imports
 from engine.ecs.world import World
 from engine.ecs.component import Component
 from engine.ecs.system import System
+from engine.ecs.snapshot import load_snapshot, save_snapshot
 from engine.core.logger import get_logger
 
 # Systems
@@ -78,6 +80,8 @@ class VoxelGame(ShowBase):
         self.input_manager.lock_mouse()
         
         # Core key bindings
+        self.accept('f5', self.quick_save)
+        self.accept('f8', self.quick_load)
         self.accept('f9', self.take_screenshot)
         
         # Note: Editors moved to standalone suite - run 'python run_editor.py'
@@ -95,23 +99,17 @@ class VoxelGame(ShowBase):
         # Start game loop
         self.taskMgr.add(self.update_loop, "game_loop")
         
+        # Stop the scheduler's worker threads on exit
+        self.finalExitCallbacks.append(self.world.shutdown)
+        
     def update_loop(self, task):
         """Main game loop."""
         # print(f"DEBUG: update_loop called, game_state={self._game_state.name}")  # Too spammy
         dt = globalClock.getDt()
         
-        # Always update UI systems (they need to handle pause menu, etc)
-        # Only update gameplay systems when PLAYING
-        for system in self.world._systems:
-            if not system.enabled or not system.ready:
-                continue
-                
-            # UI systems always update
-            if system.__class__.__name__ in ['UISystem', 'FeedbackSystem']:
-                system.update(dt)
-            # Gameplay systems only update when PLAYING
-            elif self._game_state == GameState.PLAYING:
-                system.update(dt)
+        # UI systems run in every state (pause menu, etc); gameplay systems
+        # only while PLAYING (see System.pause_policy)
+        self.world.update(dt, paused=self._game_state != GameState.PLAYING)
         
         return task.cont
     
@@ -164,6 +162,31 @@ class VoxelGame(ShowBase):
         else:
             print("❌ Screenshot failed - check console for errors")
 
+    def quick_save(self, path: Path = Path("saves/quicksave.snap")) -> bool:
+        """Write a snapshot of the ECS world (see engine.ecs.snapshot)."""
+        try:
+            data = save_snapshot(self.world)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        except Exception as e:
+            logger.error(f"Quick save failed: {e}", exc_info=True)
+            return False
+        logger.info(f"Quick saved {len(self.world._entities)} entities ({len(data)} bytes) to {path}")
+        return True
+
+    def quick_load(self, path: Path = Path("saves/quicksave.snap")) -> bool:
+        """Replace the ECS world's entities with the last quick save."""
+        if not path.exists():
+            logger.warning(f"No quick save at {path}")
+            return False
+        try:
+            count = load_snapshot(self.world, path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.error(f"Quick load failed: {e}")
+            return False
+        logger.info(f"Quick loaded {count} entities from {path}")
+        return True
+
     def _setup_default_systems(self):
         """Add core systems to the world."""
         # Lifecycle
@@ -188,6 +211,14 @@ class VoxelGame(ShowBase):
         from engine.systems.water_physics import WaterPhysicsSystem
         self.world.add_system(WaterPhysicsSystem(self.world, self.world.event_bus))
         
+        # Distance-based simulation tiers, read by physics and AI
+        from engine.systems.simulation_lod import SimulationLODSystem
+        self.world.add_system(SimulationLODSystem(self.world, self.world.event_bus))
+        
+        # Fixed-step physics for non-player kinematic entities (enemies, NPCs)
+        from engine.systems.physics import PhysicsSystem
+        self.world.add_system(PhysicsSystem(self.world, self.world.event_bus))
+        
         # UI & HUD (Added Phase 2)
         from engine.systems.ui_system import UISystem
         self.world.add_system(UISystem(self.world, self.world.event_bus, self, self.config_manager))
@@ -200,6 +231,11 @@ class VoxelGame(ShowBase):
         from engine.systems.remote_players import RemotePlayerManager
         self.world.add_system(RemotePlayerManager(self.world, self.world.event_bus, self))
         
+        # Proximity queries for combat, projectiles, pickups and triggers;
+        # added after the systems that move entities so it sees this frame's positions
+        from engine.systems.spatial_index import SpatialIndexSystem
+        self.world.add_system(SpatialIndexSystem(self.world, self.world.event_bus))
+        
         # Tools & Feedback (Added Phase 6)
         from engine.systems.feedback import FeedbackSystem
         self.world.add_system(FeedbackSystem(self.world, self.world.event_bus, self))
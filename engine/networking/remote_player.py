@@ -8,7 +8,9 @@ Handles visual representation (animated mannequin) and position smoothing (inter
 from panda3d.core import NodePath, LVector3f
 from engine.animation.mannequin import AnimatedMannequin, AnimationController
 from engine.ui.name_tag import NameTag
+from engine.rendering.avatar_lod import AvatarLOD, LODTier
 from typing import Optional
+import math
 
 
 class RemotePlayer:
@@ -29,13 +31,17 @@ class RemotePlayer:
         self.root = parent_node.attachNewNode(f"remote_player_{player_id}")
         
         # Create animated mannequin (Azure/blue to distinguish from local player)
-        self.mannequin = AnimatedMannequin(self.root, body_color=(0.2, 0.5, 1.0, 1.0))
+        body_color = (0.2, 0.5, 1.0, 1.0)
+        self.mannequin = AnimatedMannequin(self.root, body_color=body_color)
         self.animation_controller = AnimationController(self.mannequin)
         
         # Create 3D billboarded name tag
         self.name = name
         self.name_tag = NameTag(self.root, name)
         
+        # Distance-based LOD (full rig -> merged proxy -> impostor card)
+        self.lod = AvatarLOD(self.root, self.mannequin.root, body_color, name_tag=self.name_tag)
+        
         # Interpolation state
         self.target_position = LVector3f(0, 0, 0)
         self.target_rotation_y = 0.0
@@ -74,11 +80,12 @@ class RemotePlayer:
             self._last_position = LVector3f(self.target_position)
             self._estimated_velocity = LVector3f(0, 0, 0)
     
-    def update(self, dt: float):
+    def update(self, dt: float, camera_pos: Optional[LVector3f] = None):
         """Update interpolation and animations.
         
         Args:
             dt: Delta time since last frame
+            camera_pos: Camera world position for LOD selection (full detail if None)
         """
         # Estimate velocity from position change (for animations)
         if dt > 0:
@@ -105,6 +112,13 @@ class RemotePlayer:
         new_h = current_h + angle_diff * (dt * self.lerp_speed)
         self.root.setH(new_h)
         
+        # Pick detail tier; merged/impostor tiers skip the full animation rig
+        if camera_pos is not None:
+            speed = math.sqrt(self._estimated_velocity.x ** 2 + self._estimated_velocity.y ** 2)
+            tier = self.lod.update((new_pos - camera_pos).length(), dt, speed)
+            if tier != LODTier.FULL:
+                return
+        
         # Update animations based on estimated velocity
         # Assume grounded since we don't have physics state for remote players
         grounded = abs(self._estimated_velocity.z) < 0.5  # Z is up in Panda3D
@@ -112,6 +126,7 @@ class RemotePlayer:
     
     def cleanup(self):
         """Remove player from scene."""
+        self.lod.destroy()
         self.name_tag.cleanup()
         self.mannequin.cleanup()
         self.root.removeNode()
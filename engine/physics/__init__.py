@@ -29,6 +29,24 @@ from .collision import (
     get_hitbox
 )
 
+from .voxel_collision import (
+    VoxelCollider,
+    VoxelHit,
+    voxel_ground_height,
+    voxel_wall_check
+)
+
+from .character_controller import (
+    VoxelCharacterController,
+    MoveResult
+)
+
+from .raycast_service import (
+    RaycastService,
+    RayHit,
+    chunks_along_segment
+)
+
 from .debug import (
     CollisionDebugRenderer
 )
@@ -49,5 +67,14 @@ __all__ = [
     'SupportsY',
     'PlayerHitbox',
     'get_hitbox',
+    'VoxelCollider',
+    'VoxelHit',
+    'voxel_ground_height',
+    'voxel_wall_check',
+    'VoxelCharacterController',
+    'MoveResult',
+    'RaycastService',
+    'RayHit',
+    'chunks_along_segment',
     'CollisionDebugRenderer'
 ]
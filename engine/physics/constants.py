@@ -21,6 +21,10 @@ MAX_WALKABLE_SLOPE = 45.0   # degrees - slopes steeper than this cause sliding
 SLIDE_FRICTION = 5.0        # friction coefficient when sliding down slopes
 SLIDE_ACCELERATION = 15.0   # units/s² - downslope acceleration when sliding
 SLIDE_CONTROL = 0.3         # 0.0-1.0 - player control multiplier while sliding
+
+# Voxel character controller
+STEP_HEIGHT = 1.0    # units - highest ledge climbed without jumping
+
 # Jump Physics
 JUMP_VELOCITY = 6.32  # units/s - explicit jump velocity (tuned for ~1.0 unit height with -20g)
 GRAVITY = -20.0      # units/s² - snappy downward acceleration
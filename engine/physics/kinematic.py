@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Callable, Optional, Protocol, Any, Tuple
 from panda3d.core import LVector3f, CollisionRay, CollisionNode, CollisionTraverser, CollisionHandlerQueue, BitMask32
-from engine.ecs.component import Component
+from engine.ecs.component import Component, register_component
 
 
 class SupportsY(Protocol):
@@ -14,7 +14,8 @@ class SupportsY(Protocol):
     y: float
 
 
-@dataclass
+@register_component
+@dataclass(slots=True)
 class KinematicState(Component):
     """Shared physics state for kinematic entities.
 
@@ -0,0 +1,252 @@
+"""Persistent raycast service with chunk-local traversal.
+
+raycast_ground_height() and raycast_wall_check() build a CollisionRay,
+CollisionNode and CollisionHandlerQueue per call, attach them to render,
+traverse the whole scene and tear everything down again. RaycastService
+keeps a pool of segment colliders and handlers alive instead, and only
+traverses the collision nodes of chunks the queued segments pass through.
+Several rays can be queued and resolved with a single traverse().
+
+Uses Panda3D coordinate system: X-right, Y-forward, Z-up.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from panda3d.core import (
+    BitMask32, CollisionHandlerQueue, CollisionNode, CollisionSegment,
+    CollisionTraverser, NodePath
+)
+
+Vec3 = Tuple[float, float, float]
+
+
+@dataclass
+class RayHit:
+    """Closest hit of one ray."""
+    point: Vec3
+    normal: Vec3
+    distance: float
+
+
+def chunks_along_segment(start: Sequence[float], end: Sequence[float], chunk_size: int) -> Set[Tuple[int, int]]:
+    """Return the chunk columns a segment passes through (2D DDA over X/Y).
+
+    Args:
+        start: Segment start (x, y, z)
+        end: Segment end (x, y, z)
+        chunk_size: Chunk edge length in world units
+
+    Returns:
+        Set of (chunk_x, chunk_z) keys, where chunk_z indexes Panda3D Y
+    """
+    x0, y0 = start[0] / chunk_size, start[1] / chunk_size
+    x1, y1 = end[0] / chunk_size, end[1] / chunk_size
+    cx, cy = math.floor(x0), math.floor(y0)
+    end_cx, end_cy = math.floor(x1), math.floor(y1)
+    chunks = {(cx, cy)}
+
+    dx, dy = x1 - x0, y1 - y0
+    step_x = 1 if dx > 0 else -1
+    step_y = 1 if dy > 0 else -1
+    t_max_x = ((cx + (step_x > 0)) - x0) / dx if dx else math.inf
+    t_max_y = ((cy + (step_y > 0)) - y0) / dy if dy else math.inf
+    t_delta_x = abs(1.0 / dx) if dx else math.inf
+    t_delta_y = abs(1.0 / dy) if dy else math.inf
+
+    while (cx, cy) != (end_cx, end_cy):
+        if t_max_x < t_max_y:
+            if t_max_x > 1.0:
+                break
+            cx += step_x
+            t_max_x += t_delta_x
+        else:
+            if t_max_y > 1.0:
+                break
+            cy += step_y
+            t_max_y += t_delta_y
+        chunks.add((cx, cy))
+    return chunks
+
+
+class RaycastService:
+    """Reusable terrain raycasts against chunk collision geometry.
+
+    Without a ChunkManager (or one that tracks no collision nodes) the
+    service traverses the whole render graph, still without per-ray
+    allocations.
+    """
+
+    def __init__(self, render_node: NodePath, chunk_manager: Any = None,
+                 collide_mask: Optional[BitMask32] = None):
+        """Initialize the service.
+
+        Args:
+            render_node: Scene root the ray colliders are attached to
+            chunk_manager: Optional ChunkManager whose collision_nodes limit traversal
+            collide_mask: From-mask of the rays (terrain layer by default)
+        """
+        self.render_node = render_node
+        self.chunk_manager = chunk_manager
+        self.collide_mask = collide_mask if collide_mask is not None else BitMask32.bit(1)
+        self.traverser = CollisionTraverser('raycast_service')
+
+        # Pool of (NodePath, CollisionSegment, CollisionHandlerQueue), grown on demand
+        self._rays: List[Tuple[NodePath, CollisionSegment, CollisionHandlerQueue]] = []
+        self._queued: List[Tuple[Vec3, Vec3, float]] = []
+        self.last_results: List[Optional[RayHit]] = []
+
+        # Stashed root holding instances of the chunk collision nodes in range.
+        # Stashing keeps render traversals from seeing the instances twice.
+        self._scope = render_node.attachNewNode('raycast_scope')
+        self._scope.stash()
+        self._scoped: Dict[Tuple[int, int], Tuple[NodePath, NodePath]] = {}  # key -> (source, instance)
+
+    # ========== Queries ==========
+
+    def queue(self, origin: Sequence[float], direction: Sequence[float], max_distance: float) -> int:
+        """Queue a ray for the next traverse().
+
+        Args:
+            origin: Ray start (x, y, z)
+            direction: Ray direction (need not be normalized)
+            max_distance: Ray length
+
+        Returns:
+            Index of this ray in the list returned by traverse()
+        """
+        dx, dy, dz = float(direction[0]), float(direction[1]), float(direction[2])
+        length = math.sqrt(dx * dx + dy * dy + dz * dz) or 1.0
+        scale = max_distance / length
+        start = (float(origin[0]), float(origin[1]), float(origin[2]))
+        end = (start[0] + dx * scale, start[1] + dy * scale, start[2] + dz * scale)
+        self._queued.append((start, end, max_distance))
+        return len(self._queued) - 1
+
+    def traverse(self) -> List[Optional[RayHit]]:
+        """Resolve every queued ray with one collision traversal.
+
+        Returns:
+            One RayHit (closest hit) or None per queued ray, in queue order
+        """
+        queued = self._queued
+        self._queued = []
+        if not queued:
+            self.last_results = []
+            return self.last_results
+
+        while len(self._rays) < len(queued):
+            self._rays.append(self._make_ray(len(self._rays)))
+
+        self.traverser.clearColliders()
+        for (ray_np, segment, handler), (start, end, _length) in zip(self._rays, queued):
+            segment.setPointA(*start)
+            segment.setPointB(*end)
+            self.traverser.addCollider(ray_np, handler)
+
+        self.traverser.traverse(self._prepare_scope(queued))
+
+        results: List[Optional[RayHit]] = []
+        for (_ray_np, _segment, handler), (start, _end, _length) in zip(self._rays, queued):
+            if handler.getNumEntries() == 0:
+                results.append(None)
+                continue
+            handler.sortEntries()
+            entry = handler.getEntry(0)
+            p = entry.getSurfacePoint(self.render_node)
+            n = entry.getSurfaceNormal(self.render_node)
+            distance = math.sqrt((p.x - start[0]) ** 2 + (p.y - start[1]) ** 2 + (p.z - start[2]) ** 2)
+            results.append(RayHit((p.x, p.y, p.z), (n.x, n.y, n.z), distance))
+
+        self.last_results = results
+        return results
+
+    def cast(self, origin: Sequence[float], direction: Sequence[float], max_distance: float) -> Optional[RayHit]:
+        """Cast a single ray immediately (also resolves anything already queued)."""
+        index = self.queue(origin, direction, max_distance)
+        return self.traverse()[index]
+
+    def ground_height(
+        self,
+        entity: Any,
+        max_distance: float = 5.0,
+        foot_offset: float = 0.2,
+        ray_origin_offset: float = 2.0,
+        return_normal: bool = False
+    ) -> Optional[float] | Optional[Tuple[float, Tuple[float, float, float]]]:
+        """Drop-in replacement for raycast_ground_height().
+
+        Args:
+            entity: The entity to raycast from (must have x, y, z attributes)
+            max_distance: Maximum distance below the entity to search
+            foot_offset: Offset for feet placement
+            ray_origin_offset: Height above entity to start ray
+            return_normal: If True, return (height, normal) tuple
+
+        Returns:
+            Ground Z position, or (height, normal) if return_normal=True, or None if no hit
+        """
+        hit = self.cast(
+            (entity.x, entity.y, entity.z + ray_origin_offset),
+            (0.0, 0.0, -1.0),
+            max_distance + ray_origin_offset
+        )
+        if hit is None:
+            return None
+        if return_normal:
+            return (hit.point[2] + foot_offset, hit.normal)
+        return hit.point[2] + foot_offset
+
+    def wall_check(self, entity: Any, movement: tuple[float, float, float],
+                   distance_buffer: float = 0.5) -> bool:
+        """Drop-in replacement for raycast_wall_check()."""
+        dx, dy, _dz = movement
+        if abs(dx) < 0.001 and abs(dy) < 0.001:
+            return False
+        length = math.sqrt(dx * dx + dy * dy)
+        hit = self.cast((entity.x, entity.y, entity.z + 0.9), (dx, dy, 0.0), length + distance_buffer)
+        return hit is not None
+
+    # ========== Internals ==========
+
+    def _make_ray(self, index: int) -> Tuple[NodePath, CollisionSegment, CollisionHandlerQueue]:
+        segment = CollisionSegment()
+        node = CollisionNode(f'raycast_service_{index}')
+        node.addSolid(segment)
+        node.setFromCollideMask(self.collide_mask)
+        node.setIntoCollideMask(BitMask32.allOff())
+        return self.render_node.attachNewNode(node), segment, CollisionHandlerQueue()
+
+    def _prepare_scope(self, queued: List[Tuple[Vec3, Vec3, float]]) -> NodePath:
+        """Instance the collision nodes of the chunks the rays cross under the scope root."""
+        collision_nodes = getattr(self.chunk_manager, 'collision_nodes', None)
+        if not collision_nodes:
+            return self.render_node
+
+        chunk_size = self.chunk_manager.chunk_size
+        wanted: Set[Tuple[int, int]] = set()
+        for start, end, _length in queued:
+            wanted |= chunks_along_segment(start, end, chunk_size)
+
+        # Drop instances that are out of range or whose chunk was unloaded/rebuilt
+        for key, (source, instance) in list(self._scoped.items()):
+            if key not in wanted or collision_nodes.get(key) is not source:
+                instance.removeNode()
+                del self._scoped[key]
+
+        for key in wanted:
+            source = collision_nodes.get(key)
+            if source is not None and key not in self._scoped:
+                self._scoped[key] = (source, self._scope.attachNewNode(source.node()))
+
+        return self._scope
+
+    def cleanup(self):
+        """Remove the ray colliders and the traversal scope."""
+        self.traverser.clearColliders()
+        for ray_np, _segment, _handler in self._rays:
+            ray_np.removeNode()
+        self._rays.clear()
+        self._scoped.clear()
+        self._scope.removeNode()
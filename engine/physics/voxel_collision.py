@@ -0,0 +1,291 @@
+"""Voxel-native collision queries.
+
+Answers ray, swept-box and box-overlap queries directly against block data
+instead of going through CollisionPolygons and a CollisionTraverser:
+
+- Nothing is built per chunk; queries read the same block dicts that the
+  mesher consumes.
+- Query cost scales with the number of cells visited, not with the number
+  of solids in the scene.
+
+Uses Panda3D coordinate system: X-right, Y-forward, Z-up. Cell (ix, iy, iz)
+occupies [ix, ix+1) x [iy, iy+1) x [iz, iz+1). Solidity comes from the game's
+block registry (``block.solid``), cached per block name.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+Vec3 = Tuple[float, float, float]
+Cell = Tuple[int, int, int]
+
+# Shrinks box extents so boxes resting exactly on a face don't count as overlapping
+_EPSILON = 1e-4
+
+
+@dataclass
+class VoxelHit:
+    """Result of a voxel ray or sweep query."""
+    distance: float  # Along the ray (raycast) or fraction of movement (sweep)
+    point: Vec3  # Contact point in world space
+    normal: Tuple[int, int, int]  # Outward normal of the face that was hit
+    cell: Cell  # Solid cell that was hit
+    block: Optional[str] = None  # Block name of that cell
+
+
+class VoxelCollider:
+    """Collision queries against a voxel block lookup.
+
+    Args:
+        get_block: Callable (ix, iy, iz) -> block name or None, in Panda3D cells
+        block_registry: Registry with get_block(name) returning objects with ``solid``
+    """
+
+    def __init__(self, get_block: Callable[[int, int, int], Optional[str]], block_registry: Any = None):
+        self._get_block = get_block
+        self._registry = block_registry
+        self._solidity: Dict[str, bool] = {}
+
+    # ========== Solidity ==========
+
+    def is_solid_block(self, block_name: Optional[str]) -> bool:
+        """Look up (and cache) whether a block type is solid."""
+        if block_name is None:
+            return False
+        solid = self._solidity.get(block_name)
+        if solid is None:
+            solid = True
+            if self._registry is not None:
+                try:
+                    solid = bool(self._registry.get_block(block_name).solid)
+                except KeyError:
+                    solid = False  # Unknown blocks never collide (matches chunk collision)
+            self._solidity[block_name] = solid
+        return solid
+
+    def is_solid(self, ix: int, iy: int, iz: int) -> bool:
+        """Return True if the cell holds a solid block."""
+        return self.is_solid_block(self._get_block(ix, iy, iz))
+
+    # ========== Ray queries ==========
+
+    def raycast(self, origin: Sequence[float], direction: Sequence[float],
+                max_distance: float) -> Optional[VoxelHit]:
+        """Cast a ray through the grid with a 3D DDA.
+
+        Like one-sided collision faces, a hit is only reported when the ray
+        crosses from a non-solid cell into a solid one; a ray that starts
+        inside terrain passes through until it has left it.
+
+        Args:
+            origin: Ray start (x, y, z)
+            direction: Ray direction (need not be normalized)
+            max_distance: Maximum distance along the normalized direction
+
+        Returns:
+            VoxelHit, or None if nothing solid was entered within range
+        """
+        ox, oy, oz = float(origin[0]), float(origin[1]), float(origin[2])
+        dx, dy, dz = float(direction[0]), float(direction[1]), float(direction[2])
+        length = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if length < 1e-9:
+            return None
+        dx, dy, dz = dx / length, dy / length, dz / length
+
+        cell = [math.floor(ox), math.floor(oy), math.floor(oz)]
+        d = (dx, dy, dz)
+        o = (ox, oy, oz)
+        step = [0, 0, 0]
+        t_max = [math.inf, math.inf, math.inf]
+        t_delta = [math.inf, math.inf, math.inf]
+        for axis in range(3):
+            if d[axis] > 0:
+                step[axis] = 1
+                t_max[axis] = (cell[axis] + 1 - o[axis]) / d[axis]
+                t_delta[axis] = 1.0 / d[axis]
+            elif d[axis] < 0:
+                step[axis] = -1
+                t_max[axis] = (cell[axis] - o[axis]) / d[axis]
+                t_delta[axis] = -1.0 / d[axis]
+
+        inside_solid = self.is_solid(cell[0], cell[1], cell[2])
+        while True:
+            # Advance along the axis whose boundary is nearest
+            if t_max[0] < t_max[1]:
+                axis = 0 if t_max[0] < t_max[2] else 2
+            else:
+                axis = 1 if t_max[1] < t_max[2] else 2
+
+            t = t_max[axis]
+            if t > max_distance:
+                return None
+            cell[axis] += step[axis]
+            t_max[axis] += t_delta[axis]
+
+            block = self._get_block(cell[0], cell[1], cell[2])
+            solid = self.is_solid_block(block)
+            if solid and not inside_solid:
+                normal = [0, 0, 0]
+                normal[axis] = -step[axis]
+                return VoxelHit(
+                    distance=t,
+                    point=(ox + dx * t, oy + dy * t, oz + dz * t),
+                    normal=(normal[0], normal[1], normal[2]),
+                    cell=(cell[0], cell[1], cell[2]),
+                    block=block,
+                )
+            inside_solid = solid
+
+    # ========== Box queries ==========
+
+    def iter_solid_cells(self, box_min: Sequence[float], box_max: Sequence[float]) -> Iterator[Cell]:
+        """Yield solid cells overlapping an axis-aligned box (faces touching don't count)."""
+        x0, x1 = math.floor(box_min[0] + _EPSILON), math.floor(box_max[0] - _EPSILON)
+        y0, y1 = math.floor(box_min[1] + _EPSILON), math.floor(box_max[1] - _EPSILON)
+        z0, z1 = math.floor(box_min[2] + _EPSILON), math.floor(box_max[2] - _EPSILON)
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                for iz in range(z0, z1 + 1):
+                    if self.is_solid(ix, iy, iz):
+                        yield (ix, iy, iz)
+
+    def overlaps_aabb(self, box_min: Sequence[float], box_max: Sequence[float]) -> bool:
+        """Return True if any solid cell overlaps the box."""
+        return next(self.iter_solid_cells(box_min, box_max), None) is not None
+
+    def sweep_aabb(self, box_min: Sequence[float], box_max: Sequence[float],
+                   movement: Sequence[float]) -> Optional[VoxelHit]:
+        """Sweep a box along a movement vector and find the first solid cell hit.
+
+        Only cells inside the swept volume are tested, each with a
+        box-vs-box slab test. Cells the box already overlaps are ignored so
+        a box that starts embedded can still move out.
+
+        Args:
+            box_min: Box minimum corner at the start of the move
+            box_max: Box maximum corner at the start of the move
+            movement: Movement vector (dx, dy, dz)
+
+        Returns:
+            VoxelHit with ``distance`` as the fraction of movement [0, 1]
+            travelled before contact, or None if the move is clear
+        """
+        move = (float(movement[0]), float(movement[1]), float(movement[2]))
+        lo = [min(box_min[a], box_min[a] + move[a]) for a in range(3)]
+        hi = [max(box_max[a], box_max[a] + move[a]) for a in range(3)]
+
+        best: Optional[VoxelHit] = None
+        for cell in self.iter_solid_cells(lo, hi):
+            hit = self._sweep_against_cell(box_min, box_max, move, cell)
+            if hit is not None and (best is None or hit.distance < best.distance):
+                best = hit
+        return best
+
+    @staticmethod
+    def _sweep_against_cell(box_min, box_max, move, cell) -> Optional[VoxelHit]:
+        t_enter, t_exit = -math.inf, math.inf
+        enter_axis = -1
+        for axis in range(3):
+            c0, c1 = cell[axis], cell[axis] + 1
+            if abs(move[axis]) < 1e-12:
+                # Not moving on this axis: must already overlap on it
+                if box_max[axis] <= c0 + _EPSILON or box_min[axis] >= c1 - _EPSILON:
+                    return None
+                continue
+            if move[axis] > 0:
+                t0 = (c0 - box_max[axis]) / move[axis]
+                t1 = (c1 - box_min[axis]) / move[axis]
+            else:
+                t0 = (c1 - box_min[axis]) / move[axis]
+                t1 = (c0 - box_max[axis]) / move[axis]
+            if t0 > t_enter:
+                t_enter, enter_axis = t0, axis
+            t_exit = min(t_exit, t1)
+
+        if enter_axis < 0 or t_enter > t_exit or t_enter > 1.0 or t_enter < -_EPSILON:
+            return None
+
+        t = max(t_enter, 0.0)
+        normal = [0, 0, 0]
+        normal[enter_axis] = -1 if move[enter_axis] > 0 else 1
+        center = [(box_min[a] + box_max[a]) / 2.0 + move[a] * t for a in range(3)]
+        center[enter_axis] = cell[enter_axis] + (0 if move[enter_axis] > 0 else 1)
+        return VoxelHit(
+            distance=t,
+            point=(center[0], center[1], center[2]),
+            normal=(normal[0], normal[1], normal[2]),
+            cell=tuple(cell),
+        )
+
+
+def voxel_ground_height(
+    entity: Any,
+    collider: VoxelCollider,
+    max_distance: float = 5.0,
+    foot_offset: float = 0.2,
+    ray_origin_offset: float = 2.0,
+    ignore: Optional[list] = None,
+    return_normal: bool = False
+) -> Optional[float] | Optional[Tuple[float, Tuple[float, float, float]]]:
+    """Drop-in replacement for raycast_ground_height() using voxel data.
+
+    Casts straight down from ``ray_origin_offset`` above the entity and
+    looks up to ``max_distance`` below its feet.
+
+    Args:
+        entity: The entity to raycast from (must have x, y, z attributes)
+        collider: VoxelCollider for the loaded world
+        max_distance: Maximum distance below the entity to search
+        foot_offset: Offset for feet placement
+        ray_origin_offset: Height above entity to start ray
+        ignore: Unused, kept for signature compatibility
+        return_normal: If True, return (height, normal) tuple
+
+    Returns:
+        Ground Z position, or (height, normal) if return_normal=True, or None if no hit
+    """
+    hit = collider.raycast(
+        (entity.x, entity.y, entity.z + ray_origin_offset),
+        (0.0, 0.0, -1.0),
+        max_distance + ray_origin_offset
+    )
+    if hit is None:
+        return None
+    height = hit.point[2] + foot_offset
+    if return_normal:
+        return (height, (float(hit.normal[0]), float(hit.normal[1]), float(hit.normal[2])))
+    return height
+
+
+def voxel_wall_check(
+    entity: Any,
+    movement: tuple[float, float, float],
+    collider: VoxelCollider,
+    distance_buffer: float = 0.5,
+    ignore: Optional[list] = None
+) -> bool:
+    """Drop-in replacement for raycast_wall_check() using voxel data.
+
+    Casts a horizontal ray at mid-height along the movement direction.
+
+    Args:
+        entity: The entity to check from
+        movement: Movement vector (dx, dy, dz)
+        collider: VoxelCollider for the loaded world
+        distance_buffer: Extra distance to check beyond movement
+        ignore: Unused, kept for signature compatibility
+
+    Returns:
+        True if wall hit, False otherwise
+    """
+    dx, dy, _dz = movement
+    if abs(dx) < 0.001 and abs(dy) < 0.001:
+        return False
+    length = math.sqrt(dx * dx + dy * dy)
+    hit = collider.raycast(
+        (entity.x, entity.y, entity.z + 0.9),
+        (dx, dy, 0.0),
+        length + distance_buffer
+    )
+    return hit is not None
@@ -184,15 +184,32 @@ class AnimationMechanic(PlayerMechanic):
                         self.x, self.y, self.z = pos.x, pos.y, pos.z
                 
                 entity = RayOrigin(origin)
-                # Use world collision traverser
-                result = raycast_ground_height(
-                    entity,
-                    world.collision_traverser,
-                    world.base.render,
-                    max_distance=5.0,
-                    ray_origin_offset=0.0, # Origin is already set at foot + 2.0
-                    return_normal=False
-                )
+                chunk_manager = world.get_system_by_type("ChunkManager")
+                raycast_service = getattr(world, 'raycast_service', None)
+                if hasattr(chunk_manager, 'ground_height'):
+                    # Heightmap lookup (voxel ray only under overhangs)
+                    result = chunk_manager.ground_height(
+                        entity,
+                        max_distance=5.0,
+                        ray_origin_offset=0.0  # Origin is already set at foot + 2.0
+                    )
+                elif raycast_service is not None:
+                    # Shared pooled rays, traversing only the chunk under the foot
+                    result = raycast_service.ground_height(
+                        entity,
+                        max_distance=5.0,
+                        ray_origin_offset=0.0  # Origin is already set at foot + 2.0
+                    )
+                else:
+                    # Use world collision traverser
+                    result = raycast_ground_height(
+                        entity,
+                        world.collision_traverser,
+                        world.base.render,
+                        max_distance=5.0,
+                        ray_origin_offset=0.0, # Origin is already set at foot + 2.0
+                        return_normal=False
+                    )
                 
                 if result is not None:
                     # raycast_ground_height returns Z value
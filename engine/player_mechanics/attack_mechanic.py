@@ -66,13 +66,14 @@ class AttackMechanic(PlayerMechanic):
             
     def _process_hitbox(self, ctx: PlayerContext):
         """Check for entities within attack cone."""
+        import math
         from engine.components.core import Health, Transform
         from panda3d.core import LVector3f
         
-        render = ctx.world.base.render
         player_pos = ctx.transform.position
-        player_fwd = render.getRelativeVector(ctx.transform.node, LVector3f(0, 1, 0))
-        player_fwd.normalize()
+        # Forward from heading (rotation.x, degrees; Panda3D +Y forward at heading 0)
+        heading = math.radians(ctx.transform.rotation.x)
+        player_fwd = LVector3f(-math.sin(heading), math.cos(heading), 0)
         
         # Attack range and angle
         attack_range = 2.5
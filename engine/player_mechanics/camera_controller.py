@@ -31,6 +31,7 @@ class CameraMechanic(PlayerMechanic):
         
         # Get collision system from world (set by PlayerControlSystem)
         collision_traverser = getattr(world, 'collision_traverser', None)
+        raycast_service = getattr(world, 'raycast_service', None)
         render_node = self.base.render
         
         # Get camera configuration
@@ -49,14 +50,16 @@ class CameraMechanic(PlayerMechanic):
                 sensitivity=40.0,
                 collision_traverser=collision_traverser,
                 render_node=render_node,
-                side_offset=side_offset
+                side_offset=side_offset,
+                raycast_service=raycast_service
             ),
             CameraMode.COMBAT: CombatCamera(
                 self.base.cam,
                 sensitivity=40.0,
                 collision_traverser=collision_traverser,
                 render_node=render_node,
-                side_offset=0.5  # Reduced for better combat framing
+                side_offset=0.5,  # Reduced for better combat framing
+                raycast_service=raycast_service
             ),
         }
         
@@ -5,7 +5,8 @@ from engine.player_mechanics.context import PlayerContext
 from engine.physics import (
     apply_gravity, perform_jump, register_jump_press,
     can_consume_jump, apply_horizontal_acceleration,
-    apply_slope_forces, integrate_movement
+    apply_slope_forces, integrate_movement, get_hitbox,
+    VoxelCharacterController
 )
 from engine.physics.constants import MOVE_SPEED, GRAVITY, JUMP_VELOCITY
 from panda3d.core import LVector3f
@@ -52,6 +53,10 @@ class GroundMovementMechanic(PlayerMechanic):
     priority = 50  # Middle priority
     exclusive = False
     
+    def __init__(self):
+        super().__init__()
+        self._controller = None  # VoxelCharacterController, built once chunks exist
+    
     def can_handle(self, ctx: PlayerContext) -> bool:
         # Don't run if climbing/gliding/etc (checked via state flags)
         if hasattr(ctx.state, 'climbing') and ctx.state.climbing:
@@ -125,23 +130,36 @@ class GroundMovementMechanic(PlayerMechanic):
         # Create wrapper for physics integration (reuses module-level class)
         entity_wrapper = PhysicsEntityWrapper(ctx.transform)
         
-        # Ground and wall check functions for physics integration
-        def ground_check(e):
-            from engine.physics import raycast_ground_height
-            return raycast_ground_height(e, ctx.world.collision_traverser, ctx.world.base.render)
+        # Prefer the swept-AABB voxel controller; otherwise integrate with ground/wall
+        # checks from the shared raycast service or one-off traverser raycasts.
+        chunk_manager = ctx.world.get_system_by_type("ChunkManager")
+        collider = getattr(chunk_manager, 'collider', None)
+        raycast_service = getattr(ctx.world, 'raycast_service', None)
+        
+        if raycast_service is not None:
+            ground_check = raycast_service.ground_height
+            wall_check = raycast_service.wall_check
+        else:
+            def ground_check(e):
+                from engine.physics import raycast_ground_height
+                return raycast_ground_height(e, ctx.world.collision_traverser, ctx.world.base.render)
 
-        def wall_check(e, move):
-            from engine.physics import raycast_wall_check
-            return raycast_wall_check(
-                e, 
-                move, 
-                ctx.world.collision_traverser, 
-                ctx.world.base.render
-            )
+            def wall_check(e, move):
+                from engine.physics import raycast_wall_check
+                return raycast_wall_check(
+                    e, 
+                    move, 
+                    ctx.world.collision_traverser, 
+                    ctx.world.base.render
+                )
             
         if god_mode:
             # Direct position update (noclip)
             ctx.transform.position += ctx.state.velocity * ctx.dt
+        elif collider is not None:
+            if self._controller is None or self._controller.collider is not collider:
+                self._controller = VoxelCharacterController(collider, get_hitbox())
+            self._controller.move(entity_wrapper, ctx.state, ctx.dt)
         else:
             integrate_movement(
                 entity_wrapper, 
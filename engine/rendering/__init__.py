@@ -17,6 +17,9 @@ from .mesh import (
     MeshBuilder
 )
 
+from .mesh_cache import MeshCache
+from .render_stats import RenderStats, RenderStatsCollector
+
 from .base_camera import BaseCamera, CameraUpdateContext
 from .first_person_camera import FirstPersonCamera
 from .exploration_camera import ExplorationCamera
@@ -26,6 +29,9 @@ __all__ = [
     'TextureAtlas',
     'TileRegistry',
     'MeshBuilder',
+    'MeshCache',
+    'RenderStats',
+    'RenderStatsCollector',
     'BaseCamera',
     'CameraUpdateContext',
     'FirstPersonCamera',
@@ -0,0 +1,255 @@
+"""
+Distance-based level of detail for avatars.
+
+Remote players and enemies cost the same at 3 m as at 100 m when they are
+always drawn with the full rig. AvatarLOD swaps between three tiers:
+
+- FULL: the original rig (AnimatedMannequin / VoxelAvatar), fully animated
+- MERGED: one shared geom for head+torso plus four swinging limb pivots
+- IMPOSTOR: a single flat, axis-billboarded card
+
+Tier changes use hysteresis so avatars standing near a threshold don't
+flicker, and name tags hide beyond their own cutoff.
+"""
+
+import math
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Optional, Tuple
+
+from panda3d.core import NodePath, CardMaker, GeomNode
+
+from engine.rendering.mesh import MeshBuilder
+
+
+class LODTier(IntEnum):
+    """Avatar detail tiers, ordered from nearest to farthest."""
+    FULL = 0
+    MERGED = 1
+    IMPOSTOR = 2
+
+
+@dataclass
+class LODSettings:
+    """Distance thresholds (world units) for avatar LOD."""
+    full_distance: float = 15.0  # Beyond this: merged body
+    merged_distance: float = 45.0  # Beyond this: impostor card
+    name_tag_distance: float = 30.0  # Beyond this: name tag hidden
+    hysteresis: float = 2.0  # Distance band that must be crossed to switch back
+
+
+class LODSelector:
+    """Pure tier selection with hysteresis (no scene-graph access)."""
+
+    def __init__(self, settings: Optional[LODSettings] = None):
+        self.settings = settings or LODSettings()
+        self.tier = LODTier.FULL
+        self.name_tag_visible = True
+
+    def update(self, distance: float) -> bool:
+        """Pick the tier for a distance.
+
+        A switch to a farther tier requires crossing threshold + hysteresis,
+        a switch back requires threshold - hysteresis.
+
+        Args:
+            distance: Distance from the camera to the avatar
+
+        Returns:
+            True if the tier changed
+        """
+        s = self.settings
+        bounds = (s.full_distance, s.merged_distance)
+        tier = self.tier
+
+        while tier < LODTier.IMPOSTOR and distance > bounds[tier] + s.hysteresis:
+            tier = LODTier(tier + 1)
+        while tier > LODTier.FULL and distance < bounds[tier - 1] - s.hysteresis:
+            tier = LODTier(tier - 1)
+
+        if self.name_tag_visible and distance > s.name_tag_distance + s.hysteresis:
+            self.name_tag_visible = False
+        elif not self.name_tag_visible and distance < s.name_tag_distance - s.hysteresis:
+            self.name_tag_visible = True
+
+        changed = tier != self.tier
+        self.tier = tier
+        return changed
+
+
+# Proxy proportions match AnimatedMannequin's layout (Z-up, feet at origin)
+_BODY_BOXES = [
+    ((0.0, 0.0, 1.1), (0.4, 0.25, 0.6)),  # Torso
+    ((0.0, 0.0, 1.6), (0.3, 0.3, 0.3)),  # Head
+]
+_ARM_BOX = ((0.0, 0.0, -0.25), (0.12, 0.12, 0.5))
+_LEG_BOX = ((0.0, 0.0, -0.25), (0.15, 0.15, 0.5))
+_LIMB_PIVOTS: Dict[str, Tuple[Tuple[float, float, float], tuple]] = {
+    "arm_right": ((0.28, 0.0, 1.35), _ARM_BOX),
+    "arm_left": ((-0.28, 0.0, 1.35), _ARM_BOX),
+    "leg_right": ((0.1, 0.0, 0.8), _LEG_BOX),
+    "leg_left": ((-0.1, 0.0, 0.8), _LEG_BOX),
+}
+
+# Proxy geometry is white and shared by every avatar; tint comes from setColorScale
+_shared_geoms: Dict[str, GeomNode] = {}
+
+
+def _get_shared_geom(name: str) -> GeomNode:
+    if name not in _shared_geoms:
+        if name == "body":
+            _shared_geoms[name] = MeshBuilder.build_box_mesh(_BODY_BOXES, name="lod_body")
+        else:
+            _shared_geoms[name] = MeshBuilder.build_box_mesh([_LIMB_PIVOTS[name][1]], name=f"lod_{name}")
+    return _shared_geoms[name]
+
+
+class MergedAvatarProxy:
+    """Mid-distance avatar: one body geom and four limb pivots."""
+
+    def __init__(self, parent: NodePath, color: Tuple[float, float, float, float]):
+        self.root = parent.attachNewNode("lod_merged")
+        self.root.attachNewNode(_get_shared_geom("body"))
+        self.limbs: Dict[str, NodePath] = {}
+        for name, (pivot_pos, _box) in _LIMB_PIVOTS.items():
+            pivot = self.root.attachNewNode(f"lod_{name}_pivot")
+            pivot.setPos(*pivot_pos)
+            pivot.attachNewNode(_get_shared_geom(name))
+            self.limbs[name] = pivot
+        self.root.setColorScale(*color)
+
+    def swing(self, arm_angle: float, leg_angle: float):
+        """Apply a walk-cycle swing (degrees) to the limb pivots."""
+        self.limbs["arm_right"].setP(arm_angle)
+        self.limbs["arm_left"].setP(-arm_angle)
+        self.limbs["leg_right"].setP(-leg_angle)
+        self.limbs["leg_left"].setP(leg_angle)
+
+
+class ImpostorCard:
+    """Far-distance avatar: a flat card that turns about Z to face the camera."""
+
+    def __init__(self, parent: NodePath, color: Tuple[float, float, float, float],
+                 width: float = 0.6, height: float = 1.8):
+        cm = CardMaker("lod_impostor")
+        cm.setFrame(-width / 2.0, width / 2.0, 0.0, height)
+        self.root = parent.attachNewNode(cm.generate())
+        self.root.setColor(*color)
+        self.root.setTwoSided(True)
+        self.root.setBillboardAxis()
+
+
+class AvatarLOD:
+    """Switches an avatar between full rig, merged proxy and impostor.
+
+    Inactive representations are stashed, so the culler skips them entirely
+    instead of walking hidden subtrees. Proxies are created on first use.
+    """
+
+    WALK_FREQUENCY = 10.0
+    ARM_AMPLITUDE = 35.0
+    LEG_AMPLITUDE = 30.0
+
+    def __init__(
+        self,
+        root: NodePath,
+        full_node: NodePath,
+        color: Tuple[float, float, float, float],
+        name_tag=None,
+        settings: Optional[LODSettings] = None
+    ):
+        """Initialize avatar LOD.
+
+        Args:
+            root: Avatar root NodePath (proxies are attached here)
+            full_node: Root of the full-detail rig
+            color: Body color used for the proxies
+            name_tag: Optional NameTag to hide beyond the name tag cutoff
+            settings: Distance thresholds
+        """
+        self.root = root
+        self.full_node = full_node
+        self.color = color
+        self.name_tag = name_tag
+        self.selector = LODSelector(settings)
+
+        self._merged: Optional[MergedAvatarProxy] = None
+        self._impostor: Optional[ImpostorCard] = None
+        self._walk_phase = 0.0
+
+    @property
+    def tier(self) -> LODTier:
+        return self.selector.tier
+
+    def update(self, distance: float, dt: float = 0.0, speed: float = 0.0) -> LODTier:
+        """Update tier for the current camera distance and animate the proxy.
+
+        Args:
+            distance: Distance from the camera
+            dt: Frame delta time (drives merged-tier limb swing)
+            speed: Horizontal speed of the avatar
+
+        Returns:
+            Active tier after the update
+        """
+        tag_was_visible = self.selector.name_tag_visible
+        if self.selector.update(distance):
+            self._apply_tier()
+
+        if self.name_tag and tag_was_visible != self.selector.name_tag_visible:
+            if self.selector.name_tag_visible:
+                self.name_tag.show()
+            else:
+                self.name_tag.hide()
+
+        if self.selector.tier == LODTier.MERGED:
+            self._animate_merged(dt, speed)
+
+        return self.selector.tier
+
+    def set_color(self, color: Tuple[float, float, float, float]):
+        """Update proxy tint (full rig colors are owned by the rig)."""
+        self.color = color
+        if self._merged:
+            self._merged.root.setColorScale(*color)
+        if self._impostor:
+            self._impostor.root.setColor(*color)
+
+    def _apply_tier(self):
+        tier = self.selector.tier
+
+        if tier == LODTier.FULL:
+            self.full_node.unstash()
+        else:
+            self.full_node.stash()
+
+        if tier == LODTier.MERGED:
+            if self._merged is None:
+                self._merged = MergedAvatarProxy(self.root, self.color)
+            self._merged.root.unstash()
+        elif self._merged is not None:
+            self._merged.root.stash()
+
+        if tier == LODTier.IMPOSTOR:
+            if self._impostor is None:
+                self._impostor = ImpostorCard(self.root, self.color)
+            self._impostor.root.unstash()
+        elif self._impostor is not None:
+            self._impostor.root.stash()
+
+    def _animate_merged(self, dt: float, speed: float):
+        if speed > 0.5:
+            self._walk_phase += dt * self.WALK_FREQUENCY * min(speed / 6.0, 1.5)
+        else:
+            self._walk_phase = 0.0
+        s = math.sin(self._walk_phase)
+        self._merged.swing(s * self.ARM_AMPLITUDE, s * self.LEG_AMPLITUDE)
+
+    def destroy(self):
+        """Remove proxies (the full rig and name tag are owned by the caller)."""
+        if self._merged:
+            self._merged.root.removeNode()
+            self._merged = None
+        if self._impostor:
+            self._impostor.root.removeNode()
+            self._impostor = None
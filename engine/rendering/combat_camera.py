@@ -21,7 +21,8 @@ class CombatCamera(ExplorationCamera):
     def __init__(self, camera_node: Any, sensitivity: float = 40.0,
                  collision_traverser: Optional[Any] = None, 
                  render_node: Optional[Any] = None,
-                 side_offset: float = 0.5):
+                 side_offset: float = 0.5,
+                 raycast_service: Optional[Any] = None):
         """Initialize combat camera.
         
         Args:
@@ -30,9 +31,10 @@ class CombatCamera(ExplorationCamera):
             collision_traverser: Optional CollisionTraverser for terrain collision
             render_node: Optional render root node for raycasting
             side_offset: Lateral offset (reduced from exploration for better framing)
+            raycast_service: Optional RaycastService; preferred over per-call rays
         """
         super().__init__(camera_node, sensitivity, collision_traverser, 
-                        render_node, side_offset)
+                        render_node, side_offset, raycast_service)
         
         # Combat-specific parameters
         self.fov_multiplier = 1.2  # Widen FOV for situational awareness
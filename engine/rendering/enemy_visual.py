@@ -2,7 +2,7 @@
 Enemy Visual system.
 
 Handles the visual representation of enemies, including:
-- Avatar creation (reusing VoxelAvatar)
+- Avatar creation (single-geom SkinnedVoxelAvatar)
 - Color tinting based on loot drops
 - Visual updates based on state
 """
@@ -10,13 +10,14 @@ Handles the visual representation of enemies, including:
 from typing import Optional, Tuple
 from panda3d.core import NodePath, LColor
 from engine.color.palette import ColorPalette
-from engine.animation.voxel_avatar import VoxelAvatar
+from engine.animation.skinned_avatar import SkinnedVoxelAvatar
+from engine.rendering.avatar_lod import AvatarLOD, LODTier
 
 class EnemyVisual:
     """
     Visual wrapper for an enemy entity.
     
-    Composes a VoxelAvatar and applies enemy-specific visual effects
+    Composes a SkinnedVoxelAvatar and applies enemy-specific visual effects
     like color tinting.
     """
     
@@ -33,13 +34,16 @@ class EnemyVisual:
         self.enemy_type = enemy_type
         
         # Create avatar
-        # We reuse VoxelAvatar for the humanoid shape
-        self.avatar = VoxelAvatar(self.root)
+        # One skinned geom per enemy keeps crowds at one draw call each
+        self.avatar = SkinnedVoxelAvatar(self.root)
         
         # Base colors
         self.base_color = self._get_base_color(enemy_type)
         self.tint_strength = self._get_tint_strength(enemy_type)
         
+        # Distance-based LOD (proxies are tinted like the rig)
+        self.lod = AvatarLOD(self.root, self.avatar.root, self.base_color)
+        
         # Apply visual customization
         self._apply_appearance(tint_color_name)
         
@@ -72,13 +76,30 @@ class EnemyVisual:
         
         # Apply to all bones
         self.avatar.set_body_color(final_color)
+        self.lod.set_color(final_color)
         
         # Determine head geometry style based on type
         # For now VoxelAvatar is generic, but we could toggle visibility of parts
         # e.g. self.avatar.set_feature_visibility('ears', False)
         
+    def update_lod(self, distance: float, dt: float = 0.0, speed: float = 0.0) -> LODTier:
+        """Select detail tier for the current camera distance.
+        
+        Args:
+            distance: Distance from camera to this enemy
+            dt: Frame delta time
+            speed: Horizontal movement speed (drives proxy limb swing)
+            
+        Returns:
+            Active LOD tier
+        """
+        return self.lod.update(distance, dt, speed)
+        
     def destroy(self):
         """Clean up visual resources."""
+        if self.lod:
+            self.lod.destroy()
+            self.lod = None
         if self.avatar:
-            self.avatar.destroy()
+            self.avatar.cleanup()
             self.avatar = None
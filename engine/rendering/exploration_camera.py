@@ -22,7 +22,8 @@ class ExplorationCamera(BaseCamera):
     def __init__(self, camera_node: Any, sensitivity: float = 40.0,
                  collision_traverser: Optional[Any] = None, 
                  render_node: Optional[Any] = None,
-                 side_offset: float = 1.0):
+                 side_offset: float = 1.0,
+                 raycast_service: Optional[Any] = None):
         """Initialize exploration camera.
         
         Args:
@@ -31,6 +32,7 @@ class ExplorationCamera(BaseCamera):
             collision_traverser: Optional CollisionTraverser for terrain collision
             render_node: Optional render root node for raycasting
             side_offset: Lateral offset for over-the-shoulder view (positive = right)
+            raycast_service: Optional RaycastService; preferred over per-call rays
         """
         self.camera = camera_node
         self.sensitivity = sensitivity
@@ -38,6 +40,7 @@ class ExplorationCamera(BaseCamera):
         # Collision detection
         self.collision_traverser = collision_traverser
         self.render_node = render_node
+        self.raycast_service = raycast_service
         self.collision_offset = 0.3  # Safety margin to prevent clipping
         
         # Camera orbit parameters (constants)
@@ -129,7 +132,7 @@ class ExplorationCamera(BaseCamera):
         )
         
         # Constrain camera to stay above ground
-        if self.collision_traverser and self.render_node:
+        if self.raycast_service or (self.collision_traverser and self.render_node):
             terrain_height = self._get_terrain_height_at(desired_pos.x, desired_pos.y)
             if terrain_height is not None:
                 min_z = terrain_height + self.min_camera_height_above_ground
@@ -206,15 +209,25 @@ class ExplorationCamera(BaseCamera):
         Returns:
             Safe distance (clamped between min_distance and desired_distance)
         """
-        # If no collision system available, use desired distance
-        if self.collision_traverser is None or self.render_node is None:
-            return desired_distance
-        
         # Calculate direction from player to desired camera position
         dir_x = math.sin(yaw_rad) * math.cos(pitch_rad)
         dir_y = -math.cos(yaw_rad) * math.cos(pitch_rad)
         dir_z = math.sin(pitch_rad)
         
+        if self.raycast_service is not None:
+            hit = self.raycast_service.cast(
+                (target_pos.x, target_pos.y, target_pos.z + self.height_offset),
+                (dir_x, dir_y, dir_z),
+                desired_distance
+            )
+            if hit is None:
+                return desired_distance
+            return max(self.min_distance, hit.distance - self.collision_offset)
+        
+        # If no collision system available, use desired distance
+        if self.collision_traverser is None or self.render_node is None:
+            return desired_distance
+        
         # Start ray from player position (with height offset for better results)
         ray_origin = LPoint3f(target_pos.x, target_pos.y, target_pos.z + self.height_offset)
         ray_direction = LVector3f(dir_x, dir_y, dir_z)
@@ -270,6 +283,10 @@ class ExplorationCamera(BaseCamera):
         Returns:
             Terrain Z coordinate, or None if no terrain found
         """
+        if self.raycast_service is not None:
+            hit = self.raycast_service.cast((x, y, 100.0), (0.0, 0.0, -1.0), 200.0)
+            return hit.point[2] if hit is not None else None
+        
         if self.collision_traverser is None or self.render_node is None:
             return None
         
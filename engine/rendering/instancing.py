@@ -1,44 +1,208 @@
 """Hardware instancing for repetitive world decorations."""
 
+import math
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
 from panda3d.core import (
     NodePath, GeomNode, Geom, GeomVertexData, GeomVertexFormat,
     GeomVertexWriter, GeomTriangles, LVector3f, Texture,
-    GeomEnums, Shader
+    GeomEnums, Shader, BoundingBox, Point3
 )
 
+
+def compute_instance_transforms(positions: Iterable[Sequence[float]]) -> np.ndarray:
+    """Pack decoration placements into an (N, 4) float32 array.
+
+    Each row is (x, y, z, heading_radians). Heading is derived from the
+    position so placement is deterministic; both the hardware and the
+    software path consume this array, which keeps them identical.
+
+    Args:
+        positions: Iterable of (x, y, z) positions in Panda3D space
+
+    Returns:
+        float32 array of shape (N, 4)
+    """
+    rows = []
+    for pos in positions:
+        x, y, z = float(pos[0]), float(pos[1]), float(pos[2])
+        heading_deg = hash((x, y, z)) % 360
+        rows.append((x, y, z, math.radians(heading_deg)))
+    if not rows:
+        return np.zeros((0, 4), dtype=np.float32)
+    return np.asarray(rows, dtype=np.float32)
+
+
+def apply_instance_transforms(local_points: np.ndarray, transforms: np.ndarray) -> np.ndarray:
+    """CPU reference of the instancing vertex shader.
+
+    Rotates prototype-local points about Z by each instance's heading and
+    translates them to the instance position, exactly as
+    INSTANCED_DECORATION_SHADER does per vertex.
+
+    Args:
+        local_points: (V, 3) prototype-space vertex positions
+        transforms: (N, 4) array from compute_instance_transforms()
+
+    Returns:
+        (N, V, 3) world-space vertex positions
+    """
+    local_points = np.asarray(local_points, dtype=np.float32).reshape(-1, 3)
+    c = np.cos(transforms[:, 3])[:, None]
+    s = np.sin(transforms[:, 3])[:, None]
+    lx = local_points[None, :, 0]
+    ly = local_points[None, :, 1]
+    lz = local_points[None, :, 2]
+    out = np.empty((transforms.shape[0], local_points.shape[0], 3), dtype=np.float32)
+    out[:, :, 0] = lx * c - ly * s + transforms[:, 0:1]
+    out[:, :, 1] = lx * s + ly * c + transforms[:, 1:2]
+    out[:, :, 2] = lz + transforms[:, 2:3]
+    return out
+
+
+def partition_by_region(transforms: np.ndarray, region_size: float) -> Dict[Tuple[int, int], np.ndarray]:
+    """Split instance transforms into square XY regions.
+
+    One region becomes one draw call, so regions keep frustum culling
+    effective without going back to one node per instance.
+
+    Args:
+        transforms: (N, 4) instance transform array
+        region_size: Region edge length in world units
+
+    Returns:
+        Dict mapping (region_x, region_y) -> (M, 4) transform array
+    """
+    if transforms.shape[0] == 0:
+        return {}
+    keys = np.floor(transforms[:, :2] / region_size).astype(np.int64)
+    regions: Dict[Tuple[int, int], np.ndarray] = {}
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    for i, (rx, ry) in enumerate(unique):
+        regions[(int(rx), int(ry))] = transforms[inverse == i]
+    return regions
+
+
 class InstancedManager:
-    """Manages hardware instancing for decorations like grass and rocks."""
-    
-    def __init__(self, base):
+    """Manages hardware instancing for decorations like grass and rocks.
+
+    With hardware support each prototype is drawn once per region using
+    setInstanceCount; instance transforms live in a buffer texture read by
+    INSTANCED_DECORATION_SHADER. Without it (or headless) the manager falls
+    back to one instanceTo per position, fed from the same transform array.
+    """
+
+    def __init__(self, base, region_size: float = 32.0, use_hardware: Optional[bool] = None):
+        """Initialize instancing manager.
+
+        Args:
+            base: Panda3D ShowBase instance
+            region_size: Edge length (world units) of one instanced draw region
+            use_hardware: Force hardware (True) or software (False) path;
+                None auto-detects from the graphics state guardian
+        """
         self.base = base
+        self.region_size = region_size
         self.prototypes = {} # mesh_name -> NodePath
-        
-    def create_prototype(self, name, mesh_node):
-        """Register a base mesh to be instanced."""
+        self._meshes = {}  # mesh_name -> GeomNode
+        self._radii = {}  # mesh_name -> bounding radius for region bounds
+        self.use_hardware = self._detect_hardware() if use_hardware is None else use_hardware
+
+    def _detect_hardware(self) -> bool:
+        """Check whether the GSG supports instancing and buffer textures."""
+        win = getattr(self.base, 'win', None)
+        if win is None:
+            return False
+        try:
+            gsg = win.getGsg()
+            return bool(
+                gsg
+                and gsg.getSupportsGeometryInstancing()
+                and gsg.getSupportsBufferTexture()
+                and gsg.getSupportsBasicShaders()
+            )
+        except Exception:
+            return False
+
+    def create_prototype(self, name, mesh_node, radius: float = 1.0):
+        """Register a base mesh to be instanced.
+
+        Args:
+            name: Prototype name
+            mesh_node: GeomNode with the decoration mesh (prototype-local space)
+            radius: Horizontal extent of the mesh, used to pad region bounds
+        """
         placeholder = self.base.render.attachNewNode(f"proto_{name}")
         placeholder.attachNewNode(mesh_node)
         placeholder.hide()
         self.prototypes[name] = placeholder
-        
+        self._meshes[name] = mesh_node
+        self._radii[name] = radius
+
     def spawn_instances(self, name, positions, parent=None):
-        """Spawn multiple instances using hardware instancing.
-        
-        This implementation uses NodePath.instanceTo as a base,
-        but for true HW instancing we would use setInstanceCount.
-        
-        For initial Phase 6, we'll use Panda3D's built-in instancing
-        which is highly efficient for identical objects.
+        """Spawn multiple instances of a prototype.
+
+        Hardware path: one node and one draw call per prototype per region.
+        Software path: one instanceTo node per position.
+
+        Args:
+            name: Prototype name from create_prototype()
+            positions: Iterable of (x, y, z) positions
+            parent: Parent NodePath (defaults to render)
+
+        Returns:
+            Root NodePath of the spawned instances, or None for unknown prototypes
         """
         if name not in self.prototypes:
             return None
-            
+
         root = (parent or self.base.render).attachNewNode(f"instanced_{name}")
+        transforms = compute_instance_transforms(positions)
+
+        if self.use_hardware:
+            self._spawn_hardware(name, transforms, root)
+        else:
+            self._spawn_software(name, transforms, root)
+
+        return root
+
+    def _spawn_software(self, name: str, transforms: np.ndarray, root: NodePath):
+        """One scene-graph instance per row of the transform array."""
         proto = self.prototypes[name]
-        
-        for pos in positions:
+        for x, y, z, heading in transforms.tolist():
             instance = proto.instanceTo(root)
-            instance.setPos(pos)
-            # Add some random rotation for variety
-            instance.setH(hash(pos) % 360)
-            
-        return root
+            instance.setPos(x, y, z)
+            instance.setH(math.degrees(heading))
+
+    def _spawn_hardware(self, name: str, transforms: np.ndarray, root: NodePath):
+        """One instanced draw per region, transforms supplied via buffer texture."""
+        from engine.rendering.shaders import INSTANCED_DECORATION_SHADER
+
+        mesh = NodePath(self._meshes[name])
+        pad = self._radii[name]
+
+        for (rx, ry), region in partition_by_region(transforms, self.region_size).items():
+            region_np = root.attachNewNode(f"region_{rx}_{ry}")
+            batch = mesh.copyTo(region_np)
+
+            batch.setShader(INSTANCED_DECORATION_SHADER)
+            batch.setShaderInput("instance_data", self._make_instance_texture(name, region))
+            batch.setInstanceCount(len(region))
+
+            # The GPU moves the vertices, so the culler must be told where they end up
+            lo = region[:, :3].min(axis=0) - pad
+            hi = region[:, :3].max(axis=0) + pad
+            batch.node().setBounds(BoundingBox(Point3(*lo.tolist()), Point3(*hi.tolist())))
+            batch.node().setFinal(True)
+
+    @staticmethod
+    def _make_instance_texture(name: str, transforms: np.ndarray) -> Texture:
+        """Upload an (N, 4) transform array as an RGBA32F buffer texture."""
+        tex = Texture(f"instances_{name}")
+        tex.setupBufferTexture(len(transforms), Texture.T_float, Texture.F_rgba32, GeomEnums.UH_static)
+        # Panda3D RAM images are stored in BGRA order
+        bgra = np.ascontiguousarray(transforms[:, [2, 1, 0, 3]], dtype=np.float32)
+        tex.setRamImage(bgra.tobytes())
+        return tex
@@ -612,3 +612,63 @@ class MeshBuilder:
         node.addGeom(geom)
         
         return node
+
+    @staticmethod
+    def build_box_mesh(
+        boxes: List[Tuple[Tuple[float, float, float], Tuple[float, float, float]]],
+        name: str = 'box_mesh',
+        color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
+    ) -> GeomNode:
+        """Generate a single Geom containing several axis-aligned boxes.
+        
+        Used for low-detail proxies where many cubes should cost one draw call.
+        
+        Args:
+            boxes: List of (center, size) tuples in node-local coordinates
+            name: Name for the resulting GeomNode
+            color: Vertex color (tint per instance with setColorScale)
+            
+        Returns:
+            GeomNode with one Geom holding all boxes
+        """
+        vformat = GeomVertexFormat.getV3n3c4()
+        vdata = GeomVertexData(name, vformat, Geom.UHStatic)
+        vdata.setNumRows(len(boxes) * 24)
+        
+        vertex = GeomVertexWriter(vdata, 'vertex')
+        normal = GeomVertexWriter(vdata, 'normal')
+        color_writer = GeomVertexWriter(vdata, 'color')
+        
+        tris = GeomTriangles(Geom.UHStatic)
+        index = 0
+        
+        for (cx, cy, cz), (sx, sy, sz) in boxes:
+            hx, hy, hz = sx / 2.0, sy / 2.0, sz / 2.0
+            x0, x1 = cx - hx, cx + hx
+            y0, y1 = cy - hy, cy + hy
+            z0, z1 = cz - hz, cz + hz
+            
+            # (normal, four corners counter-clockwise seen from outside)
+            faces = [
+                ((0, 0, 1), [(x0, y0, z1), (x1, y0, z1), (x1, y1, z1), (x0, y1, z1)]),
+                ((0, 0, -1), [(x0, y1, z0), (x1, y1, z0), (x1, y0, z0), (x0, y0, z0)]),
+                ((0, -1, 0), [(x0, y0, z0), (x1, y0, z0), (x1, y0, z1), (x0, y0, z1)]),
+                ((0, 1, 0), [(x1, y1, z0), (x0, y1, z0), (x0, y1, z1), (x1, y1, z1)]),
+                ((1, 0, 0), [(x1, y0, z0), (x1, y1, z0), (x1, y1, z1), (x1, y0, z1)]),
+                ((-1, 0, 0), [(x0, y1, z0), (x0, y0, z0), (x0, y0, z1), (x0, y1, z1)]),
+            ]
+            
+            for n, corners in faces:
+                for c in corners:
+                    vertex.addData3(*c)
+                    normal.addData3(*n)
+                    color_writer.addData4(*color)
+                tris.addVertices(index, index + 1, index + 2)
+                tris.addVertices(index, index + 2, index + 3)
+                index += 4
+        
+        geom = Geom(vdata)
+        geom.addPrimitive(tris)
+        node = GeomNode(name)
+        node.addGeom(geom)
+        return node
@@ -0,0 +1,236 @@
+"""Content-hashed cache of compiled chunk meshes.
+
+Chunks with identical block contents (flat desert, ocean floor, every
+revisit of an already-seen chunk) produce identical meshes. MeshCache keys
+each mesh by a hash of the chunk's block grid plus its border slices and
+stores the compiled GeomNode as a BAM stream, so a hit skips MeshBuilder
+entirely.
+
+Meshes must be built in chunk-local coordinates for the cache to be useful;
+the caller positions the decoded node at the chunk origin.
+"""
+
+import hashlib
+import struct
+from collections import OrderedDict
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+from panda3d.core import GeomNode, PandaNode
+
+from engine.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+VoxelGrid = Dict[Tuple[int, int, int], str]
+
+# Part of every key. Bump when MeshBuilder's output, the block data it reads
+# or the key layout changes, so meshes cached on disk by older code stop
+# matching instead of being served stale.
+MESH_CACHE_VERSION = 1
+
+
+def _hash_grid(h, grid: VoxelGrid):
+    """Feed a voxel grid to a hash as a packed dense array.
+
+    Block names become indices into the grid's sorted name table and are
+    scattered into an array spanning the grid's bounding box (0 = no
+    block), so the bytes depend only on content, with no per-voxel string
+    formatting or sorting.
+    """
+    if not grid:
+        h.update(b"\0")
+        return
+    names = sorted(set(grid.values()))
+    index = {name: i + 1 for i, name in enumerate(names)}
+    count = len(grid)
+    coords = np.fromiter(chain.from_iterable(grid), dtype=np.int32, count=3 * count).reshape(count, 3)
+    ids = np.fromiter(map(index.__getitem__, grid.values()), dtype=np.uint32, count=count)
+
+    low = coords.min(axis=0)
+    shape = coords.max(axis=0) - low + 1
+    dense = np.zeros(tuple(shape), dtype=np.uint16 if len(names) < 0xFFFF else np.uint32)
+    dense[tuple((coords - low).T)] = ids
+
+    table = "\0".join(names).encode()
+    h.update(struct.pack("<6qI", *low, *shape, len(table)))
+    h.update(table)
+    h.update(dense.tobytes())
+
+
+class MeshCache:
+    """Two-tier (memory + optional disk) cache of chunk meshes.
+
+    The memory tier is an LRU of BAM byte strings bounded by entry count.
+    The disk tier, when a directory is given, keeps one ``<key>.bam`` file
+    per mesh and survives restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize mesh cache.
+
+        Args:
+            max_entries: Maximum meshes kept in memory before LRU eviction
+            cache_dir: Optional directory for the persistent disk tier
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        if self.cache_dir:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Mesh cache disk tier disabled ({self.cache_dir}): {e}")
+                self.cache_dir = None
+
+    @staticmethod
+    def make_key(
+        voxel_grid: VoxelGrid,
+        chunk_size: int,
+        border: Optional[Dict[str, VoxelGrid]] = None,
+        salt: str = "",
+    ) -> str:
+        """Hash a chunk's block grid and border slices into a cache key.
+
+        Keys depend only on content (and MESH_CACHE_VERSION), never on
+        chunk coordinates or dict insertion order.
+
+        Args:
+            voxel_grid: Dict mapping chunk-local (x, y, z) -> block_name
+            chunk_size: Size of chunk in blocks
+            border: Optional neighbour slices keyed by side name, each a dict
+                of (x, y, z) -> block_name that the mesher consults for culling
+            salt: Extra state the mesh depends on (e.g. atlas identity)
+
+        Returns:
+            Hex digest string
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"v{MESH_CACHE_VERSION}|{chunk_size}|{salt}|".encode())
+        _hash_grid(h, voxel_grid)
+        if border:
+            for side in sorted(border):
+                h.update(f"#{side}:".encode())
+                _hash_grid(h, border[side])
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[GeomNode]:
+        """Return a fresh copy of the cached mesh, or None on a miss."""
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        else:
+            data = self._read_disk(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store_memory(key, data)
+
+        node = self._decode(data)
+        if node is None:
+            # Corrupt entry - drop it from both tiers so it gets rebuilt
+            self._memory.pop(key, None)
+            self._delete_disk(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return node
+
+    def put(self, key: str, node: GeomNode):
+        """Serialize a compiled mesh and store it in both tiers."""
+        data = self._encode(node)
+        if not data:
+            return
+        self._store_memory(key, data)
+        self._write_disk(key, data)
+
+    def get_or_build(self, key: str, build: Callable[[], GeomNode]) -> GeomNode:
+        """Return the cached mesh for key, building and storing it on a miss.
+
+        Args:
+            key: Key from make_key()
+            build: Zero-argument callable producing the GeomNode
+
+        Returns:
+            GeomNode ready to attach to the scene
+        """
+        node = self.get(key)
+        if node is not None:
+            return node
+        node = build()
+        self.put(key, node)
+        return node
+
+    def clear(self):
+        """Drop the memory tier (disk files are kept)."""
+        self._memory.clear()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory
+
+    # --- Internals ---
+
+    def _store_memory(self, key: str, data: bytes):
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{key}.bam"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to read cached mesh {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        path = self._disk_path(key)
+        if path is None or path.exists():
+            return
+        try:
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write cached mesh {path}: {e}")
+
+    def _delete_disk(self, key: str):
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to delete cached mesh {path}: {e}")
+
+    @staticmethod
+    def _encode(node: GeomNode) -> bytes:
+        return bytes(node.encodeToBamStream())
+
+    @staticmethod
+    def _decode(data: bytes) -> Optional[GeomNode]:
+        return PandaNode.decodeFromBamStream(data)
@@ -0,0 +1,200 @@
+"""Render statistics for the debug overlay and metrics log.
+
+RenderStatsCollector samples the scene graph at a low fixed rate instead of
+every frame, and spreads each sample's SceneGraphAnalyzer walk over several
+frames: one child of ``render`` (in practice one chunk) per frame, so no
+single frame pays for the whole graph. When disabled, update() returns after
+a single attribute check and nothing is traversed.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from panda3d.core import SceneGraphAnalyzer
+
+from engine.core.logger import log_metric
+
+
+@dataclass
+class RenderStats:
+    """One render-stats sample."""
+    nodes: int = 0
+    geoms: int = 0
+    vertices: int = 0
+    triangles: int = 0
+    draw_calls: int = 0  # Geoms not under a culled (hidden) chunk
+    texture_bytes: int = 0
+    visible_chunks: int = 0
+    loaded_chunks: int = 0
+    sample_ms: float = 0.0  # Cost of taking this sample, summed over its frames
+
+    def format_text(self) -> str:
+        """Multi-line text for the debug overlay."""
+        return (
+            f"Nodes: {self.nodes}  Geoms: {self.geoms}  Draws~: {self.draw_calls}\n"
+            f"Verts: {self.vertices:,}  Tris: {self.triangles:,}\n"
+            f"Tex: {self.texture_bytes / (1024 * 1024):.1f} MB  "
+            f"Chunks: {self.visible_chunks}/{self.loaded_chunks}"
+        )
+
+
+class RenderStatsCollector:
+    """Samples render statistics at a fixed low rate.
+
+    Draw calls are estimated as scene geoms minus geoms under hidden
+    children of ``render`` (chunks culled by ChunkManager), since Panda3D
+    doesn't expose the real per-frame draw count without PStats.
+
+    update() walks one child of ``render`` per frame; a sample is complete
+    once every child present when it started has been visited. Metrics are
+    emitted with completed samples, at most every ``metric_interval``.
+    """
+
+    METRIC_FIELDS = (
+        "nodes", "geoms", "vertices", "triangles", "draw_calls",
+        "texture_bytes", "visible_chunks", "loaded_chunks", "sample_ms",
+    )
+
+    def __init__(
+        self,
+        base,
+        world=None,
+        sample_interval: float = 1.0,
+        metric_interval: float = 5.0,
+        enabled: bool = False
+    ):
+        """Initialize the collector.
+
+        Args:
+            base: ShowBase instance (its render graph is analyzed)
+            world: Optional ECS World used to find the ChunkManager
+            sample_interval: Seconds between scene-graph samples
+            metric_interval: Seconds between log_metric emissions
+            enabled: Start enabled
+        """
+        self.base = base
+        self.world = world
+        self.sample_interval = sample_interval
+        self.metric_interval = metric_interval
+        self.enabled = enabled
+
+        self.latest: Optional[RenderStats] = None
+        # Start a sample and emit on the first enabled frame
+        self._sample_timer = sample_interval
+        self._metric_timer = metric_interval
+
+        # Sample in progress: children still to visit and analyzers so far
+        self._pending: Optional[List[Any]] = None
+        self._analyzer = None
+        self._hidden = None
+        self._any_hidden = False
+        self._work_ms = 0.0
+
+    def set_enabled(self, enabled: bool):
+        """Enable or disable sampling (re-enabling starts a sample immediately)."""
+        if enabled and not self.enabled:
+            self._sample_timer = self.sample_interval
+            self._metric_timer = self.metric_interval
+        if not enabled:
+            self._reset_walk()
+        self.enabled = enabled
+
+    def update(self, dt: float) -> Optional[RenderStats]:
+        """Advance timers; sample and emit metrics when due.
+
+        Args:
+            dt: Frame delta time
+
+        Returns:
+            The sample completed this frame, else None
+        """
+        if not self.enabled:
+            return None
+
+        self._sample_timer += dt
+        self._metric_timer += dt
+        if self._pending is None:
+            if self._sample_timer < self.sample_interval:
+                return None
+            self._sample_timer = 0.0
+            self._begin_walk()
+
+        stats = self._step()
+        if stats is not None and self._metric_timer >= self.metric_interval:
+            self._metric_timer = 0.0
+            self.emit_metrics(stats)
+        return stats
+
+    def sample(self) -> RenderStats:
+        """Walk the whole scene graph now and return fresh statistics."""
+        self._begin_walk()
+        stats = None
+        while stats is None:
+            stats = self._step()
+        return stats
+
+    def _begin_walk(self):
+        self._pending = list(self.base.render.getChildren())
+        self._pending.reverse()  # Visit in scene order by popping from the end
+        self._analyzer = SceneGraphAnalyzer()
+        self._hidden = SceneGraphAnalyzer()
+        self._any_hidden = False
+        self._work_ms = 0.0
+
+    def _reset_walk(self):
+        self._pending = None
+        self._analyzer = None
+        self._hidden = None
+
+    def _step(self) -> Optional[RenderStats]:
+        """Visit one child of render; finish the sample once none are left."""
+        start = time.perf_counter()
+        pending = self._pending
+        while pending:
+            child = pending.pop()
+            if child.isEmpty():
+                continue  # Removed since the walk started
+            self._analyzer.addNode(child.node())
+            if child.isHidden():
+                self._hidden.addNode(child.node())
+                self._any_hidden = True
+            break
+        if pending:
+            self._work_ms += (time.perf_counter() - start) * 1000.0
+            return None
+
+        analyzer = self._analyzer
+        stats = RenderStats()
+        stats.nodes = analyzer.getNumNodes() + 1  # Plus render itself
+        stats.geoms = analyzer.getNumGeoms()
+        stats.vertices = analyzer.getNumVertices()
+        stats.triangles = analyzer.getNumTris()
+        stats.texture_bytes = analyzer.getTextureBytes()
+        hidden_geoms = self._hidden.getNumGeoms() if self._any_hidden else 0
+        stats.draw_calls = max(stats.geoms - hidden_geoms, 0)
+
+        # ChunkManager already tracks its chunks; counting them is cheap
+        chunk_manager = self._get_chunk_manager()
+        if chunk_manager is not None:
+            for chunk_np in chunk_manager.chunks.values():
+                if chunk_np.isEmpty():
+                    continue
+                stats.loaded_chunks += 1
+                if not chunk_np.isHidden():
+                    stats.visible_chunks += 1
+
+        stats.sample_ms = self._work_ms + (time.perf_counter() - start) * 1000.0
+        self._reset_walk()
+        self.latest = stats
+        return stats
+
+    def emit_metrics(self, stats: RenderStats):
+        """Write one metric row per statistic."""
+        for field_name in self.METRIC_FIELDS:
+            log_metric(f"render_{field_name}", float(getattr(stats, field_name)))
+
+    def _get_chunk_manager(self) -> Optional[Any]:
+        if self.world is None:
+            return None
+        return self.world.get_system_by_type("ChunkManager")
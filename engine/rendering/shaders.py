@@ -92,3 +92,86 @@ WATER_WOBBLE_SHADER = Shader.make(Shader.SL_GLSL,
     }
     """
 )
+
+INSTANCED_DECORATION_SHADER = Shader.make(Shader.SL_GLSL,
+    vertex="""
+    #version 150
+    uniform mat4 p3d_ModelViewProjectionMatrix;
+    uniform samplerBuffer instance_data;  // One texel per instance: (x, y, z, heading_rad)
+    
+    in vec4 p3d_Vertex;
+    in vec4 p3d_Color;
+    in vec2 p3d_MultiTexCoord0;
+    
+    out vec4 v_color;
+    out vec2 v_texcoord;
+    
+    void main() {
+        vec4 inst = texelFetch(instance_data, gl_InstanceID);
+        float c = cos(inst.w);
+        float s = sin(inst.w);
+        
+        // Rotate about Z (heading) then translate - matches NodePath.setH/setPos
+        vec3 local = p3d_Vertex.xyz;
+        vec3 world = vec3(local.x * c - local.y * s,
+                          local.x * s + local.y * c,
+                          local.z) + inst.xyz;
+        
+        gl_Position = p3d_ModelViewProjectionMatrix * vec4(world, 1.0);
+        v_color = p3d_Color;
+        v_texcoord = p3d_MultiTexCoord0;
+    }
+    """,
+    fragment="""
+    #version 150
+    uniform sampler2D p3d_Texture0;
+    in vec4 v_color;
+    in vec2 v_texcoord;
+    out vec4 fragColor;
+    
+    void main() {
+        vec4 color = texture(p3d_Texture0, v_texcoord) * v_color;
+        if (color.a < 0.1) discard;  // Alpha-tested foliage
+        fragColor = color;
+    }
+    """
+)
+
+# Must match SkinnedVoxelAvatar.MAX_JOINTS
+SKINNED_AVATAR_SHADER = Shader.make(Shader.SL_GLSL,
+    vertex="""
+    #version 150
+    uniform mat4 p3d_ModelViewProjectionMatrix;
+    uniform mat3 p3d_NormalMatrix;
+    uniform mat4 joint_matrices[32];  // Avatar-space joint transforms (row-vector Panda layout)
+    uniform vec4 joint_colors[32];
+    
+    in vec4 p3d_Vertex;
+    in vec3 p3d_Normal;
+    in float joint;
+    
+    out vec4 v_color;
+    out vec3 v_normal;
+    
+    void main() {
+        int j = int(joint + 0.5);
+        // Row-major Panda matrices read column-major: M * v == v * M_panda
+        vec4 skinned = joint_matrices[j] * p3d_Vertex;
+        gl_Position = p3d_ModelViewProjectionMatrix * skinned;
+        v_normal = normalize(p3d_NormalMatrix * (mat3(joint_matrices[j]) * p3d_Normal));
+        v_color = joint_colors[j];
+    }
+    """,
+    fragment="""
+    #version 150
+    in vec4 v_color;
+    in vec3 v_normal;
+    out vec4 fragColor;
+    
+    void main() {
+        // Cheap fixed key light so the flat voxel boxes read as 3D
+        float light = 0.6 + 0.4 * max(dot(normalize(v_normal), normalize(vec3(0.3, -0.5, 0.8))), 0.0);
+        fragColor = vec4(v_color.rgb * light, v_color.a);
+    }
+    """
+)
@@ -135,7 +135,7 @@ class SpawnManager:
                 spawn_x, spawn_z, terrain_system, biome_registry
             ):
                 # Get terrain height
-                terrain_height = terrain_system.get_height(spawn_x, spawn_z)
+                terrain_height = self._terrain_height(terrain_system, spawn_x, spawn_z)
                 spawn_height = max(
                     self.min_absolute_height,
                     terrain_height + self.height_buffer
@@ -174,7 +174,7 @@ class SpawnManager:
             # Check if biome is safe
             biome = biome_registry.get_biome_at(spawn_x, spawn_z)
             if biome.name in self.SAFE_BIOMES:
-                terrain_height = terrain_system.get_height(spawn_x, spawn_z)
+                terrain_height = self._terrain_height(terrain_system, spawn_x, spawn_z)
                 spawn_height = max(
                     self.min_absolute_height,
                     terrain_height + self.height_buffer
@@ -210,7 +210,7 @@ class SpawnManager:
         spawn_z = zone_y + offset_z  # Note: zone_y maps to spawn_z in Panda3D
         
         # Get accurate height
-        terrain_height = terrain_system.get_height(spawn_x, spawn_z)
+        terrain_height = self._terrain_height(terrain_system, spawn_x, spawn_z)
         spawn_height = max(
             self.min_absolute_height,
             terrain_height + self.height_buffer
@@ -218,6 +218,28 @@ class SpawnManager:
         
         return (spawn_x, spawn_z, spawn_height)
     
+    @staticmethod
+    def _terrain_height(terrain_system, x: float, z: float) -> float:
+        """Get terrain height, preferring loaded chunk heightmaps over the generator.
+        
+        Both sources are reported as the top face of the surface block: the
+        generator's height is the surface block's own Z, one below its top.
+        
+        Args:
+            terrain_system: For height queries
+            x: World X coordinate
+            z: World Z coordinate (Panda3D depth)
+            
+        Returns:
+            Terrain surface height at this position
+        """
+        get_surface_height = getattr(terrain_system, 'get_surface_height', None)
+        if get_surface_height is not None:
+            height = get_surface_height(x, z)
+            if height is not None:
+                return height
+        return terrain_system.get_height(x, z) + 1
+    
     def _is_valid_spawn(
         self,
         x: float,
@@ -243,7 +265,7 @@ class SpawnManager:
                 return False
         
         # Check terrain height (avoid extreme heights)
-        terrain_height = terrain_system.get_height(x, z)
+        terrain_height = self._terrain_height(terrain_system, x, z)
         if terrain_height < -10 or terrain_height > 20:
             return False
         
@@ -5,7 +5,7 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from engine.ecs.system import System
+from engine.ecs.system import PausePolicy, System
 from engine.ui.feedback_overlay import FeedbackOverlay
 from engine.core.logger import get_logger
 from panda3d.core import WindowProperties
@@ -13,6 +13,8 @@ from panda3d.core import WindowProperties
 logger = get_logger("systems.feedback")
 
 class FeedbackSystem(System):
+    pause_policy = PausePolicy.ALWAYS
+    
     def __init__(self, world, event_bus, game):
         super().__init__(world, event_bus)
         self.game = game
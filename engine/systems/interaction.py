@@ -120,9 +120,14 @@ class TriggerSystem(System):
     Fires on_enter and on_exit events.
     """
     
+    tick_rate = 10.0
+    
     def update(self, dt: float):
         trigger_entities = self.world.get_entities_with(Trigger, Transform)
-        moving_entities = self.world.get_entities_with(Transform) # Check all moving things
+        
+        # Spatial index: only entities near each zone are tested
+        spatial = self.world.get_system_by_type("SpatialIndexSystem")
+        moving_entities = self.world.get_entities_with(Transform) if spatial is None else None # Check all moving things
         
         for tid in trigger_entities:
             trigger = self.world.get_component(tid, Trigger)
@@ -137,7 +142,10 @@ class TriggerSystem(System):
             min_bound = t_pos + trigger.bounds_min
             max_bound = t_pos + trigger.bounds_max
             
-            for eid in moving_entities:
+            # Indexed positions may be a frame old; the exact check below uses current ones
+            candidates = moving_entities if spatial is None else spatial.query_aabb(min_bound, max_bound, Transform)
+            
+            for eid in candidates:
                 if eid == tid: continue # Don't trigger self
                 
                 e_transform = self.world.get_component(eid, Transform)
@@ -10,13 +10,17 @@ logger = get_logger(__name__)
 class DamageSystem(System):
     """Handles health reduction and death."""
     
+    # update() only ticks invulnerability timers
+    reads = frozenset({Health})
+    writes = frozenset({Health})
+    parallel_safe = True
+    
     def initialize(self):
         self.event_bus.subscribe("on_entity_damage", self.on_damage)
 
     def update(self, dt: float):
         # Handle invulnerability timers
-        for entity_id in self.world.get_entities_with(Health):
-            health = self.world.get_component(entity_id, Health)
+        for entity_id, health in self.world.query(Health):
             if health.invulnerable and health.invuln_timer > 0:
                 health.invuln_timer -= dt
                 if health.invuln_timer <= 0:
@@ -34,6 +38,10 @@ class DamageSystem(System):
 
         if health.invulnerable:
             return
+        
+        # Already dead: destruction is deferred, so later hits this frame still land here
+        if health.current <= 0:
+            return
 
         health.current -= amount
         logger.info(f"Entity {entity_id} took {amount} damage. Health: {health.current}/{health.max_hp}")
@@ -43,11 +51,14 @@ class DamageSystem(System):
             self.event_bus.publish("on_entity_death", entity_id=entity_id, killer=source)
             # Default behavior: destroy entity on death
             # In a real game, this might be overridden (ragdoll, respawn timer, etc)
-            self.world.destroy_entity(entity_id)
+            # Deferred: damage usually arrives while another system is iterating
+            self.world.commands.destroy_entity(entity_id)
 
 class SpawnSystem(System):
     """Handles entity spawning from Spawner components."""
     
+    tick_rate = 4.0  # Spawner intervals are seconds long
+    
     def update(self, dt: float):
         for entity_id in self.world.get_entities_with(Spawner, Transform):
             spawner = self.world.get_component(entity_id, Spawner)
@@ -55,7 +66,7 @@ class SpawnSystem(System):
             
             # Clean up dead spawned entities
             spawner.spawned_ids = [eid for eid in spawner.spawned_ids 
-                                 if self.world.get_components(eid)]
+                                 if self.world.is_alive(eid)]
             
             if len(spawner.spawned_ids) >= spawner.max_active:
                 continue
@@ -68,14 +79,16 @@ class SpawnSystem(System):
     def _spawn_entity(self, spawner: Spawner, transform: Transform):
         # In a real implementation, this would look up a prefab from a factory
         # For now, we just create a placeholder
-        new_id = self.world.create_entity(tag=f"{spawner.entity_prefab}_{len(spawner.spawned_ids)}")
-        
-        # Add basic components
-        self.world.add_component(new_id, Transform(
-            position=transform.position, # Spawn at spawner location
-            rotation=transform.rotation,
-            scale=transform.scale
-        ))
+        # Queued: the entity appears at the next sync point, after this system
+        new_id = self.world.commands.create_entity(
+            Transform(
+                position=transform.position, # Spawn at spawner location
+                rotation=transform.rotation,
+                scale=transform.scale
+            ),
+            tag=f"{spawner.entity_prefab}_{len(spawner.spawned_ids)}"
+        )
         
         spawner.spawned_ids.append(new_id)
-        self.event_bus.publish("on_entity_spawn", entity_id=new_id, prefab=spawner.entity_prefab)
+        # Published with the create, so listeners find the entity alive
+        self.world.commands.publish("on_entity_spawn", entity_id=new_id, prefab=spawner.entity_prefab)
@@ -7,6 +7,7 @@ from engine.components.core import Transform, Health
 from engine.components.avatar_colors import AvatarColors
 from engine.core.logger import get_logger
 from typing import Dict, Any, List
+from dataclasses import fields
 import json
 
 logger = get_logger(__name__)
@@ -33,6 +34,9 @@ class SyncSystem(System):
         # Track dirty components (changed since last sync)
         self.dirty_entities: set = set()
         
+        # Sender entity ID -> local entity ID for received updates
+        self.remote_entities: Dict[int, int] = {}
+        
         # Sync rate limiting
         self.sync_interval = 0.05  # Sync every 50ms (20Hz)
         self.time_since_sync = 0.0
@@ -42,7 +46,7 @@ class SyncSystem(System):
         # For now, we'll sync all entities periodically
         pass
 
-    def mark_dirty(self, entity_id: str):
+    def mark_dirty(self, entity_id: int):
         """Mark an entity as having changed components."""
         self.dirty_entities.add(entity_id)
 
@@ -123,13 +127,12 @@ class SyncSystem(System):
                 "max_hp": component.max_hp
             }
         else:
-            # Generic serialization for other components
-            for attr in dir(component):
-                if not attr.startswith('_') and not callable(getattr(component, attr)):
-                    value = getattr(component, attr)
-                    # Only serialize basic types
-                    if isinstance(value, (int, float, str, bool, list, dict)):
-                        data[attr] = value
+            # Generic serialization for other components: their dataclass fields
+            for f in fields(component):
+                value = getattr(component, f.name)
+                # Only serialize basic types
+                if isinstance(value, (int, float, str, bool, list, dict)):
+                    data[f.name] = value
         
         return data
 
@@ -157,18 +160,27 @@ class SyncSystem(System):
              # So Server -> Client sync is the main one.
              pass
 
-    def apply_remote_update(self, entity_id: str, component_name: str, data: Dict[str, Any]):
-        """Apply an update received from the network."""
+    def apply_remote_update(self, entity_id: int, component_name: str, data: Dict[str, Any]):
+        """Apply an update received from the network.
+        
+        Entity IDs are handles local to each World, so the sender's ID is
+        mapped to a local entity, created the first time it is seen.
+        """
         comp_class = get_component_class(component_name)
         if not comp_class:
             logger.warning(f"Unknown component class: {component_name}")
             return
+        
+        local_id = self.remote_entities.get(entity_id)
+        if local_id is None or not self.world.is_alive(local_id):
+            local_id = self.world.create_entity()
+            self.remote_entities[entity_id] = local_id
             
-        component = self.world.get_component(entity_id, comp_class)
+        component = self.world.get_component(local_id, comp_class)
         if not component:
             # Create component if missing
             component = comp_class()
-            self.world.add_component(entity_id, component)
+            self.world.add_component(local_id, component)
             
         # Update fields based on component type
         if isinstance(component, Transform):
@@ -176,6 +188,9 @@ class SyncSystem(System):
             if "position" in data:
                 pos = data["position"]
                 component.position = LVector3f(pos[0], pos[1], pos[2])
+                spatial = self.world.get_system_by_type("SpatialIndexSystem")
+                if spatial is not None:
+                    spatial.mark_moved(local_id)
         elif isinstance(component, Health):
             if "current" in data:
                 component.current = data["current"]
@@ -0,0 +1,260 @@
+"""Fixed-timestep batch physics for kinematic entities."""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engine.ecs.system import System
+from engine.components.core import Transform
+from engine.physics.character_controller import VoxelCharacterController
+from engine.physics.collision import PlayerHitbox
+from engine.physics.constants import FRICTION, GRAVITY
+from engine.physics.kinematic import KinematicState
+from engine.systems.simulation_lod import SimTier, tick_phase
+
+# Slack for comparisons against integer block faces
+_EPSILON = 1e-4
+
+
+class PhysicsSystem(System):
+    """Steps every non-player KinematicState entity at a fixed rate.
+
+    Each frame's dt goes into an accumulator that is drained in steps of
+    ``fixed_dt``, so results don't depend on frame rate. All entities are
+    gathered into structure-of-arrays NumPy buffers once per frame; gravity,
+    friction and integration run on the whole batch per step.
+
+    Collision is batched the same way. A vectorized broadphase reads the
+    chunk heightmaps under each swept footprint: entities whose box stays
+    above every column top can't hit anything, and they are integrated and
+    landed directly on the arrays. Only the rest (walking into walls, near
+    ledges, fast movers) go through VoxelCharacterController one by one.
+
+    The player is skipped: its mechanics integrate it. Entities outside
+    loaded chunks are held still until their terrain exists. With a
+    SimulationLODSystem, frozen entities are left out of the batch and
+    reduced-tier ones take one step of ``stride * fixed_dt`` every
+    ``stride`` steps, staggered so they don't all land on the same step.
+    """
+
+    def __init__(
+        self,
+        world,
+        event_bus,
+        fixed_dt: float = 1.0 / 60.0,
+        max_steps: int = 5,
+        gravity: float = GRAVITY,
+        friction: float = FRICTION,
+        max_fall_speed: float = -50.0,
+        hitbox: Optional[PlayerHitbox] = None
+    ):
+        """Initialize the physics system.
+
+        Args:
+            world: ECS World instance
+            event_bus: Event bus
+            fixed_dt: Simulation step in seconds
+            max_steps: Step cap per frame; older backlog is dropped (avoids a death spiral)
+            gravity: Vertical acceleration (units/s²)
+            friction: Horizontal deceleration for grounded entities (units/s²)
+            max_fall_speed: Terminal vertical velocity (negative)
+            hitbox: Collision box for all entities (origin at the feet by default)
+        """
+        super().__init__(world, event_bus)
+        self.fixed_dt = fixed_dt
+        self.max_steps = max_steps
+        self.gravity = gravity
+        self.friction = friction
+        self.max_fall_speed = max_fall_speed
+        self.hitbox = hitbox if hitbox is not None else PlayerHitbox(foot_offset=0.0)
+
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Interpolation factor between the last two steps
+        self.steps_taken = 0  # Steps run by the last update()
+        self.step_count = 0  # Steps run since creation (drives reduced-tier slicing)
+
+        self._controller: Optional[VoxelCharacterController] = None
+
+        # SoA state of the simulated entities, rows in self._ids order
+        self._ids: List[int] = []
+        self._index: Dict[int, int] = {}
+        self._pos = np.zeros((0, 3))
+        self._prev_pos = np.zeros((0, 3))
+        self._vel = np.zeros((0, 3))
+        self._grounded = np.zeros(0, dtype=bool)
+        self._stride = np.ones(0, dtype=int)  # Steps between updates of each row
+        self._offset = np.zeros(0, dtype=int)  # Step phase of each row
+
+    # ========== Frame update ==========
+
+    def update(self, dt: float):
+        """Run as many fixed steps as the accumulated time allows."""
+        self.accumulator += dt
+        self.steps_taken = 0
+        if self.accumulator < self.fixed_dt:
+            self.alpha = self.accumulator / self.fixed_dt
+            return
+
+        transforms, states = self._gather()
+        while self.accumulator >= self.fixed_dt and self.steps_taken < self.max_steps:
+            self._prev_pos = self._pos.copy()
+            self.step(transforms, states)
+            self.accumulator -= self.fixed_dt
+            self.steps_taken += 1
+        if self.steps_taken == self.max_steps:
+            self.accumulator = min(self.accumulator, self.fixed_dt)
+        self.alpha = self.accumulator / self.fixed_dt
+        self._scatter(transforms, states)
+
+    def get_render_position(self, entity_id: int) -> Optional[Tuple[float, float, float]]:
+        """Position interpolated between the last two steps, for visuals.
+
+        Returns:
+            (x, y, z), or None if the entity isn't simulated
+        """
+        row = self._index.get(entity_id)
+        if row is None:
+            return None
+        p = self._prev_pos[row] + (self._pos[row] - self._prev_pos[row]) * self.alpha
+        return (float(p[0]), float(p[1]), float(p[2]))
+
+    def _gather(self) -> Tuple[List[Transform], List[KinematicState]]:
+        """Copy component state into the SoA buffers."""
+        player_id = self.world.get_entity_by_tag("player")
+        lod = self.world.get_system_by_type("SimulationLODSystem")
+        frozen = lod.frozen if lod is not None else ()
+        rows = sorted((
+            row for row in self.world.query(Transform, KinematicState)
+            if row[0] != player_id and row[0] not in frozen
+        ), key=lambda row: row[0])
+        ids = [eid for eid, _transform, _state in rows]
+        transforms = [transform for _eid, transform, _state in rows]
+        states = [state for _eid, _transform, state in rows]
+
+        count = len(ids)
+        self._ids = ids
+        self._index = {eid: row for row, eid in enumerate(ids)}
+        self._pos = np.empty((count, 3))
+        self._vel = np.empty((count, 3))
+        self._grounded = np.empty(count, dtype=bool)
+        self._stride = np.ones(count, dtype=int)
+        self._offset = np.zeros(count, dtype=int)
+        if lod is not None:
+            stride = max(1, round(lod.reduced_interval / self.fixed_dt))
+            for row, eid in enumerate(ids):
+                if lod.get_tier(eid) == SimTier.REDUCED:
+                    self._stride[row] = stride
+                    self._offset[row] = int(tick_phase(eid) * stride)
+        for row, (transform, state) in enumerate(zip(transforms, states)):
+            p = transform.position
+            self._pos[row] = (p.x, p.y, p.z)
+            self._vel[row] = (state.velocity_x, state.velocity_y, state.velocity_z)
+            self._grounded[row] = state.grounded
+        self._prev_pos = self._pos.copy()
+        return transforms, states
+
+    def _scatter(self, transforms: List[Transform], states: List[KinematicState]):
+        """Write the SoA buffers back into the components."""
+        for row, (transform, state) in enumerate(zip(transforms, states)):
+            transform.position.x, transform.position.y, transform.position.z = self._pos[row].tolist()
+            state.velocity_x, state.velocity_y, state.velocity_z = self._vel[row].tolist()
+            state.grounded = bool(self._grounded[row])
+            if state.grounded:
+                state.time_since_grounded = 0.0
+
+    # ========== Simulation step ==========
+
+    def step(self, transforms: List[Transform], states: List[KinematicState]):
+        """Advance the gathered entities by one fixed step."""
+        step_index = self.step_count
+        self.step_count += 1
+        if not self._ids:
+            return
+        chunk_manager = self.world.get_system_by_type("ChunkManager")
+        if chunk_manager is None:
+            return
+        # Rows due this step; reduced-tier rows cover their whole stride at once
+        due = np.flatnonzero((step_index + self._offset) % self._stride == 0)
+        loaded = [chunk_manager.is_loaded_at(x, y) for x, y in self._pos[due, :2].tolist()]
+        active = np.zeros(len(self._ids), dtype=bool)
+        active[due[np.array(loaded, dtype=bool)]] = True
+        if not active.any():
+            return
+        dt = self._stride * self.fixed_dt
+
+        # Gravity with terminal velocity
+        vel = self._vel
+        vel[active, 2] = np.maximum(vel[active, 2] + self.gravity * dt[active], self.max_fall_speed)
+
+        # Friction: grounded entities lose horizontal speed at a constant rate
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        braking = active & self._grounded & (speed > 0.0)
+        scale = np.maximum(speed[braking] - self.friction * dt[braking], 0.0) / speed[braking]
+        vel[braking, :2] *= scale[:, None]
+
+        free = active & self._broadphase_free(chunk_manager, dt)
+        self._integrate_free(chunk_manager, free, dt)
+        for row in np.flatnonzero(active & ~free).tolist():
+            self._resolve(chunk_manager, row, transforms[row], states[row], float(dt[row]))
+
+    def _broadphase_free(self, chunk_manager, dt: np.ndarray) -> np.ndarray:
+        """Mask of entities whose swept box stays above every column top under it."""
+        half_w, _half_h, half_d = self.hitbox.get_half_extents()
+        pos, vel = self._pos, self._vel
+        x_lo = np.minimum(pos[:, 0], pos[:, 0] + vel[:, 0] * dt) - half_w
+        x_hi = np.maximum(pos[:, 0], pos[:, 0] + vel[:, 0] * dt) + half_w
+        y_lo = np.minimum(pos[:, 1], pos[:, 1] + vel[:, 1] * dt) - half_d
+        y_hi = np.maximum(pos[:, 1], pos[:, 1] + vel[:, 1] * dt) + half_d
+
+        # Corner samples only cover the footprint if it spans at most 2x2 columns
+        small = (x_hi - x_lo < 1.0) & (y_hi - y_lo < 1.0)
+        tops = self._max_column_top(chunk_manager, x_lo, x_hi, y_lo, y_hi)
+        feet = pos[:, 2] - self.hitbox.foot_offset
+        return small & (tops <= feet + _EPSILON)
+
+    def _max_column_top(self, chunk_manager, x_lo, x_hi, y_lo, y_hi) -> np.ndarray:
+        """Highest column top under each footprint (-inf for empty columns)."""
+        xs = (x_lo + _EPSILON, x_hi - _EPSILON)
+        ys = (y_lo + _EPSILON, y_hi - _EPSILON)
+        corners = np.concatenate([np.stack([x, y], axis=1) for x in xs for y in ys])
+        heights = chunk_manager.get_surface_heights(corners).reshape(4, -1)
+        return np.nan_to_num(heights, nan=-np.inf).max(axis=0)
+
+    def _integrate_free(self, chunk_manager, free: np.ndarray, dt: np.ndarray):
+        """Move unobstructed entities and land them on the column tops below."""
+        if not free.any():
+            return
+        half_w, _half_h, half_d = self.hitbox.get_half_extents()
+        pos, vel = self._pos, self._vel
+        pos[free] += vel[free] * dt[free, None]
+
+        x, y = pos[free, 0], pos[free, 1]
+        floor = self._max_column_top(chunk_manager, x - half_w, x + half_w, y - half_d, y + half_d)
+        feet = pos[free, 2] - self.hitbox.foot_offset
+        landed = feet <= floor
+
+        rows = np.flatnonzero(free)
+        pos[rows[landed], 2] = floor[landed] + self.hitbox.foot_offset
+        vel[rows[landed], 2] = 0.0
+        self._grounded[rows] = landed
+
+    def _resolve(self, chunk_manager, row: int, transform: Transform, state: KinematicState, dt: float):
+        """Narrow phase: swept-AABB move of one entity through the voxel grid."""
+        if self._controller is None or self._controller.collider is not chunk_manager.collider:
+            self._controller = VoxelCharacterController(chunk_manager.collider, self.hitbox)
+
+        p = transform.position
+        p.x, p.y, p.z = self._pos[row].tolist()
+        state.velocity_x, state.velocity_y, state.velocity_z = self._vel[row].tolist()
+        state.grounded = bool(self._grounded[row])
+
+        if self._controller.is_embedded(p):
+            # Spawned inside terrain: lift onto the column top
+            surface = chunk_manager.get_surface_height(p.x, p.y)
+            if surface is not None:
+                p.z = surface + self.hitbox.foot_offset
+
+        self._controller.move(p, state, dt)
+        self._pos[row] = (p.x, p.y, p.z)
+        self._vel[row] = (state.velocity_x, state.velocity_y, state.velocity_z)
+        self._grounded[row] = state.grounded
@@ -46,6 +46,7 @@ class PlayerControlSystem(System):
         
         # Reusable context (created in on_ready, updated each frame)
         self.player_context = None
+        self.raycast_service = None
         
         # Projectile State
         self.projectile_cooldown = 0.0
@@ -68,6 +69,14 @@ class PlayerControlSystem(System):
         # Share collision system with the world so mechanics can find it
         self.world.collision_traverser = self.collision_traverser
         
+        # Reusable terrain rays that only traverse chunks along each ray
+        from engine.physics.raycast_service import RaycastService
+        self.raycast_service = RaycastService(
+            self.base.render,
+            chunk_manager=self.world.get_system_by_type("ChunkManager")
+        )
+        self.world.raycast_service = self.raycast_service
+        
         # Initialize mechanics
         for mech in self.mechanics:
             if hasattr(mech, 'initialize'):
@@ -143,6 +152,13 @@ class PlayerControlSystem(System):
         cooldown_ratio = 1.0 - (self.projectile_cooldown / self.projectile_max_cooldown) if self.projectile_max_cooldown > 0 else 1.0
         cooldown_ratio = max(0.0, min(1.0, cooldown_ratio))
         self.world._projectile_cooldown_ratio = cooldown_ratio
+    
+    def cleanup(self):
+        """Release the pooled terrain rays."""
+        if self.raycast_service is not None:
+            self.raycast_service.cleanup()
+            self.raycast_service = None
+            self.world.raycast_service = None
             
     def throw_projectile(self):
         """Throw a color projectile."""
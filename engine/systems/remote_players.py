@@ -21,6 +21,7 @@ class RemotePlayerManager(System):
         # Track RemotePlayer instances for each remote player
         # player_id -> RemotePlayer instance
         self.remote_players: Dict[str, RemotePlayer] = {}
+        self._camera_pos = None
     
     def get_dependencies(self) -> list:
         """RemotePlayerManager has no hard dependencies.
@@ -39,6 +40,9 @@ class RemotePlayerManager(System):
         # Get current remote players from network client
         remote_players_data = client.get_remote_players()
         
+        # Camera position drives avatar LOD
+        self._camera_pos = self._get_camera_position()
+        
         # Remove players who left
         for player_id in list(self.remote_players.keys()):
             if player_id not in remote_players_data:
@@ -97,7 +101,14 @@ class RemotePlayerManager(System):
         remote_player.set_target(tuple(pos), rot_y)
         
         # Update animations and interpolation
-        remote_player.update(dt)
+        remote_player.update(dt, self._camera_pos)
+    
+    def _get_camera_position(self):
+        """Get camera world position, or None when there is no camera."""
+        camera = getattr(self.base, 'camera', None)
+        if camera is None:
+            return None
+        return camera.getPos(self.base.render)
     
     def _remove_player(self, player_id: str):
         """Remove a remote player when they disconnect.
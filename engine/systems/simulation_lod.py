@@ -0,0 +1,160 @@
+"""
+Distance-based simulation level of detail.
+
+Enemies are spawned per chunk, so their number grows with the explored
+area, yet only the ones near the player affect play. SimulationLODSystem
+sorts every non-player KinematicState entity into a tier by its distance
+to the player:
+
+- FULL: simulated every frame
+- REDUCED: ticked at ``reduced_rate`` Hz, staggered across frames
+- FROZEN: not simulated; elapsed time is caught up (capped) on wake
+
+AI (EnemySystem), physics (PhysicsSystem) and animation consult the tiers,
+so per-frame simulation cost follows the number of nearby entities rather
+than the total. Tiers are refreshed in round-robin slices and use
+hysteresis like AvatarLOD, so entities near a boundary don't flicker.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Deque, Dict, Optional, Set
+
+from engine.ecs.system import System
+from engine.components.core import Transform
+from engine.physics.kinematic import KinematicState
+
+
+class SimTier(IntEnum):
+    """Simulation tiers, ordered from nearest to farthest."""
+    FULL = 0
+    REDUCED = 1
+    FROZEN = 2
+
+
+@dataclass
+class SimLODSettings:
+    """Distance thresholds (world units) and rates for simulation LOD."""
+    full_distance: float = 32.0  # Beyond this: reduced tick rate
+    reduced_distance: float = 96.0  # Beyond this: frozen
+    reduced_rate: float = 5.0  # Ticks per second in the reduced tier
+    hysteresis: float = 4.0  # Distance band that must be crossed to switch back
+    reclassify_interval: float = 0.25  # Every entity's tier is refreshed this often
+    max_catch_up: float = 1.0  # Longest time step handed out on wake
+
+
+def select_tier(tier: SimTier, distance: float, settings: SimLODSettings) -> SimTier:
+    """Pick the tier for a distance, with hysteresis around each threshold."""
+    bounds = (settings.full_distance, settings.reduced_distance)
+    while tier < SimTier.FROZEN and distance > bounds[tier] + settings.hysteresis:
+        tier = SimTier(tier + 1)
+    while tier > SimTier.FULL and distance < bounds[tier - 1] - settings.hysteresis:
+        tier = SimTier(tier - 1)
+    return tier
+
+
+def tick_phase(entity_id: int) -> float:
+    """Stable offset in [0, 1) that staggers an entity's reduced-rate ticks."""
+    # Multiplicative hash: consecutive IDs land far apart
+    return ((entity_id * 2654435761) & 0xFFFF_FFFF) / 0x1_0000_0000
+
+
+class SimulationLODSystem(System):
+    """Assigns simulation tiers and hands out per-entity time steps.
+
+    Consumers call tick() once per frame for each entity they simulate and
+    skip the entity when it returns None. Batch consumers can instead
+    subtract ``frozen`` from their entity set and use get_tier().
+    """
+
+    def __init__(self, world, event_bus, settings: Optional[SimLODSettings] = None):
+        super().__init__(world, event_bus)
+        self.settings = settings or SimLODSettings()
+        self.time = 0.0
+
+        self.tiers: Dict[int, SimTier] = {}
+        self.frozen: Set[int] = set()
+        self._queue: Deque[int] = deque()  # Round-robin reclassification order
+        self._last_tick: Dict[int, float] = {}
+
+    @property
+    def reduced_interval(self) -> float:
+        """Seconds between ticks in the reduced tier."""
+        return 1.0 / self.settings.reduced_rate
+
+    def update(self, dt: float):
+        """Advance the clock and refresh a slice of the tiers."""
+        self.time += dt
+
+        player_id = self.world.get_entity_by_tag("player")
+        player = self.world.get_component(player_id, Transform) if player_id else None
+        if player is None:
+            return  # Keep current tiers; unknown entities count as FULL
+        origin = player.position
+
+        ids = self.world.get_entities_with(KinematicState, Transform)
+        ids.discard(player_id)
+        for entity_id in self.tiers.keys() - ids:
+            del self.tiers[entity_id]
+            self.frozen.discard(entity_id)
+            self._last_tick.pop(entity_id, None)
+
+        # New entities are placed right away; their first tick is this frame
+        for entity_id in ids - self.tiers.keys():
+            self._classify(entity_id, SimTier.FULL, origin)
+            self._last_tick[entity_id] = self.time - dt
+            self._queue.append(entity_id)
+
+        # Refresh a slice so every tier is revisited once per reclassify_interval
+        count = min(len(self._queue), math.ceil(len(self._queue) * dt / self.settings.reclassify_interval))
+        for _ in range(count):
+            entity_id = self._queue.popleft()
+            tier = self.tiers.get(entity_id)
+            if tier is None:
+                continue  # Destroyed; drop from the rotation
+            self._classify(entity_id, tier, origin)
+            self._queue.append(entity_id)
+
+    def _classify(self, entity_id: int, tier: SimTier, origin):
+        position = self.world.get_component(entity_id, Transform).position
+        distance = math.sqrt(
+            (position.x - origin.x) ** 2 + (position.y - origin.y) ** 2 + (position.z - origin.z) ** 2
+        )
+        tier = select_tier(tier, distance, self.settings)
+        self.tiers[entity_id] = tier
+        if tier == SimTier.FROZEN:
+            self.frozen.add(entity_id)
+        else:
+            self.frozen.discard(entity_id)
+
+    def get_tier(self, entity_id: int) -> SimTier:
+        """Tier of an entity (FULL if not classified yet)."""
+        return self.tiers.get(entity_id, SimTier.FULL)
+
+    def tick(self, entity_id: int, dt: float) -> Optional[float]:
+        """Time step to simulate an entity with this frame.
+
+        Args:
+            entity_id: Entity to tick
+            dt: Frame delta time (used for entities seen for the first time)
+
+        Returns:
+            Seconds since the entity's last tick (capped at max_catch_up),
+            or None if it should not be simulated this frame
+        """
+        tier = self.get_tier(entity_id)
+        if tier == SimTier.FROZEN:
+            return None
+        last = self._last_tick.get(entity_id)
+        if last is None:
+            self._last_tick[entity_id] = self.time
+            return dt
+        if tier == SimTier.REDUCED:
+            interval = self.reduced_interval
+            phase = tick_phase(entity_id) * interval
+            if math.floor((self.time + phase) / interval) <= math.floor((last + phase) / interval):
+                return None
+        self._last_tick[entity_id] = self.time
+        return min(self.time - last, self.settings.max_catch_up)
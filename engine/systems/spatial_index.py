@@ -0,0 +1,308 @@
+"""
+Uniform-grid spatial index over entity positions.
+
+SpatialHash buckets points by cell on the XY (ground) plane; height is
+only used in the exact distance and box tests, since entities in a voxel
+world spread out horizontally. A query visits the cells its area overlaps,
+so its cost follows the number of entities nearby, not the world total.
+
+SpatialIndexSystem keeps one SpatialHash of every Transform entity.
+Entities are inserted once, when the world's entity set changes; after
+that only movers are re-read each frame: entities with one of the
+``movers`` component types (KinematicState and Pathfinder by default) and
+those reported with mark_moved(). Code that moves any other entity must
+report it, or call move() to update it right away (e.g. to query in the
+same frame). Systems that run before the index in a frame see the
+previous frame's positions.
+
+Consumers find it with ``world.get_system_by_type("SpatialIndexSystem")``
+and keep their full scan as the fallback when it is not installed.
+"""
+
+import heapq
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from engine.ecs.component import Component
+from engine.ecs.system import System
+from engine.components.core import Transform
+from engine.components.gameplay import Pathfinder
+from engine.physics.kinematic import KinematicState
+
+Cell = Tuple[int, int]
+Accept = Optional[Callable[[int], bool]]
+
+
+class SpatialHash:
+    """Entity positions bucketed into square XY cells of ``cell_size`` units."""
+
+    def __init__(self, cell_size: float = 4.0):
+        self.cell_size = cell_size
+        self._inv_cell = 1.0 / cell_size
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._entity_cells: Dict[int, Cell] = {}
+        self._positions: Dict[int, Tuple[float, float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._positions
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        """Cell containing a point."""
+        return (math.floor(x * self._inv_cell), math.floor(y * self._inv_cell))
+
+    def update(self, entity_id: int, x: float, y: float, z: float) -> bool:
+        """Insert an entity or move it to a new position.
+
+        Returns:
+            True if the entity was inserted or changed cell
+        """
+        self._positions[entity_id] = (x, y, z)
+        cell = (math.floor(x * self._inv_cell), math.floor(y * self._inv_cell))
+        old = self._entity_cells.get(entity_id)
+        if old == cell:
+            return False
+        if old is not None:
+            self._discard(entity_id, old)
+        self._entity_cells[entity_id] = cell
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = set()
+        bucket.add(entity_id)
+        return True
+
+    def remove(self, entity_id: int):
+        """Drop an entity (no-op if it isn't indexed)."""
+        cell = self._entity_cells.pop(entity_id, None)
+        if cell is not None:
+            del self._positions[entity_id]
+            self._discard(entity_id, cell)
+
+    def _discard(self, entity_id: int, cell: Cell):
+        bucket = self._cells[cell]
+        bucket.discard(entity_id)
+        if not bucket:
+            del self._cells[cell]
+
+    def clear(self):
+        """Drop every entity."""
+        self._cells.clear()
+        self._entity_cells.clear()
+        self._positions.clear()
+
+    def entity_ids(self) -> List[int]:
+        """IDs of all indexed entities."""
+        return list(self._positions)
+
+    def missing_from(self, entity_ids: Iterable[int]) -> Tuple[Set[int], Set[int]]:
+        """Compare the index with a set of entity IDs.
+
+        Returns:
+            (IDs not indexed yet, indexed IDs not in ``entity_ids``)
+        """
+        live = set(entity_ids)
+        return live.difference(self._positions), self._positions.keys() - live
+
+    def position(self, entity_id: int) -> Optional[Tuple[float, float, float]]:
+        """Indexed position of an entity, or None."""
+        return self._positions.get(entity_id)
+
+    def _buckets(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterable[Set[int]]:
+        """Occupied cells overlapping an XY rectangle."""
+        lo_x, lo_y = self.cell_of(min_x, min_y)
+        hi_x, hi_y = self.cell_of(max_x, max_y)
+        cells = self._cells
+        if (hi_x - lo_x + 1) * (hi_y - lo_y + 1) > len(cells):
+            # Area covers more cells than are occupied: walk the occupied ones
+            return [bucket for (cx, cy), bucket in cells.items() if lo_x <= cx <= hi_x and lo_y <= cy <= hi_y]
+        return [
+            cells[(cx, cy)]
+            for cx in range(lo_x, hi_x + 1)
+            for cy in range(lo_y, hi_y + 1)
+            if (cx, cy) in cells
+        ]
+
+    def query_radius(self, x: float, y: float, z: float, radius: float, accept: Accept = None) -> List[int]:
+        """Entities within ``radius`` of a point (3D distance, inclusive).
+
+        Args:
+            accept: Optional predicate an entity ID must pass
+        """
+        positions = self._positions
+        radius_sq = radius * radius
+        found = []
+        for bucket in self._buckets(x - radius, y - radius, x + radius, y + radius):
+            for entity_id in bucket:
+                px, py, pz = positions[entity_id]
+                if (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2 <= radius_sq:
+                    if accept is None or accept(entity_id):
+                        found.append(entity_id)
+        return found
+
+    def query_aabb(self, min_x: float, min_y: float, min_z: float,
+                   max_x: float, max_y: float, max_z: float, accept: Accept = None) -> List[int]:
+        """Entities inside an axis-aligned box (bounds inclusive)."""
+        positions = self._positions
+        found = []
+        for bucket in self._buckets(min_x, min_y, max_x, max_y):
+            for entity_id in bucket:
+                px, py, pz = positions[entity_id]
+                if min_x <= px <= max_x and min_y <= py <= max_y and min_z <= pz <= max_z:
+                    if accept is None or accept(entity_id):
+                        found.append(entity_id)
+        return found
+
+    def nearest(self, x: float, y: float, z: float, k: int = 1,
+                max_distance: float = math.inf, accept: Accept = None) -> List[int]:
+        """Up to ``k`` entities closest to a point, nearest first.
+
+        Searches rings of cells outward from the point's cell and stops once
+        no unvisited cell can hold anything closer than the k-th match.
+        """
+        positions = self._positions
+        cells = self._cells
+        center_x, center_y = self.cell_of(x, y)
+        max_sq = max_distance * max_distance
+        matches: List[Tuple[float, int]] = []  # (distance², id)
+
+        def consider(bucket: Set[int]):
+            for entity_id in bucket:
+                px, py, pz = positions[entity_id]
+                dist_sq = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+                if dist_sq <= max_sq and (accept is None or accept(entity_id)):
+                    matches.append((dist_sq, entity_id))
+
+        ring = 0
+        while cells:
+            # Unvisited cells are at least this far away (the point may sit anywhere in its cell)
+            reach = max(ring - 1, 0) * self.cell_size
+            if reach > max_distance:
+                break
+            if len(matches) >= k and heapq.nsmallest(k, matches)[-1][0] <= reach * reach:
+                break
+            if (2 * ring + 1) ** 2 > len(cells):
+                # Ring search would visit more cells than are occupied: finish with the rest
+                for (cx, cy), bucket in cells.items():
+                    if max(abs(cx - center_x), abs(cy - center_y)) >= ring:
+                        consider(bucket)
+                break
+            if ring == 0:
+                ring_cells = [(center_x, center_y)]
+            else:
+                low_x, high_x = center_x - ring, center_x + ring
+                low_y, high_y = center_y - ring, center_y + ring
+                ring_cells = [(cx, low_y) for cx in range(low_x, high_x + 1)]
+                ring_cells += [(cx, high_y) for cx in range(low_x, high_x + 1)]
+                ring_cells += [(low_x, cy) for cy in range(low_y + 1, high_y)]
+                ring_cells += [(high_x, cy) for cy in range(low_y + 1, high_y)]
+            for cell in ring_cells:
+                bucket = cells.get(cell)
+                if bucket:
+                    consider(bucket)
+            ring += 1
+
+        return [entity_id for _, entity_id in heapq.nsmallest(k, matches)]
+
+
+class SpatialIndexSystem(System):
+    """Keeps a SpatialHash of all Transform entities and answers proximity queries.
+
+    Queries take positions as anything with x/y/z and can be limited to
+    entities having all of the given component types.
+    """
+
+    # Entities with any of these are re-read every frame
+    DEFAULT_MOVERS = (KinematicState, Pathfinder)
+
+    def __init__(self, world, event_bus, cell_size: float = 4.0,
+                 movers: Sequence[Type[Component]] = DEFAULT_MOVERS):
+        super().__init__(world, event_bus)
+        self.grid = SpatialHash(cell_size)
+        self.movers = tuple(movers)
+        self._dirty: Set[int] = set()
+        self._seen_version: Optional[int] = None
+
+    def initialize(self):
+        self.event_bus.subscribe("world_restored", self.on_world_restored)
+
+    def on_world_restored(self, event):
+        """Every position may have changed: rebuild on the next sync."""
+        self.grid.clear()
+        self._dirty.clear()
+        self._seen_version = None
+
+    def update(self, dt: float):
+        self.sync()
+
+    def sync(self) -> int:
+        """Insert new entities, drop removed ones and re-read movers.
+
+        The full entity set is only compared when the world's structure
+        changed since the last sync.
+
+        Returns:
+            Number of entities that were inserted or changed cell
+        """
+        world = self.world
+        grid = self.grid
+        update = grid.update
+        moved = 0
+        if world.structure_version != self._seen_version:
+            self._seen_version = world.structure_version
+            added, removed = grid.missing_from(world.query(Transform).entity_ids())
+            for entity_id in removed:
+                grid.remove(entity_id)
+            self._dirty |= added
+        for mover in self.movers:
+            for entity_id, transform, _ in world.query(Transform, mover):
+                position = transform.position
+                moved += update(entity_id, position.x, position.y, position.z)
+        if self._dirty:
+            for entity_id in self._dirty:
+                transform = world.get_component(entity_id, Transform)
+                if transform is not None:
+                    position = transform.position
+                    moved += update(entity_id, position.x, position.y, position.z)
+            self._dirty.clear()
+        return moved
+
+    def mark_moved(self, entity_id: int):
+        """Re-read an entity's position at the next sync (for non-movers)."""
+        self._dirty.add(entity_id)
+
+    def move(self, entity_id: int, position):
+        """Update one entity right away (e.g. after moving it mid-frame)."""
+        self.grid.update(entity_id, position.x, position.y, position.z)
+
+    def query_radius(self, center, radius: float, *component_types: Type[Component],
+                     exclude: Optional[int] = None) -> List[int]:
+        """Entities within ``radius`` of ``center`` having all ``component_types``."""
+        return self.grid.query_radius(
+            center.x, center.y, center.z, radius, self._accept(component_types, exclude)
+        )
+
+    def query_aabb(self, min_corner, max_corner, *component_types: Type[Component],
+                   exclude: Optional[int] = None) -> List[int]:
+        """Entities inside the box between two corners having all ``component_types``."""
+        return self.grid.query_aabb(
+            min_corner.x, min_corner.y, min_corner.z, max_corner.x, max_corner.y, max_corner.z,
+            self._accept(component_types, exclude)
+        )
+
+    def nearest(self, center, k: int = 1, *component_types: Type[Component],
+                max_distance: float = math.inf, exclude: Optional[int] = None) -> List[int]:
+        """Up to ``k`` entities having all ``component_types``, nearest first."""
+        return self.grid.nearest(
+            center.x, center.y, center.z, k, max_distance, self._accept(component_types, exclude)
+        )
+
+    def _accept(self, component_types: Tuple[Type[Component], ...], exclude: Optional[int]) -> Callable[[int], bool]:
+        # Also drops entities destroyed since the last sync
+        world = self.world
+        if not component_types:
+            return lambda entity_id: entity_id != exclude and world.is_alive(entity_id)
+        return lambda entity_id: entity_id != exclude and all(
+            world.has_component(entity_id, component_type) for component_type in component_types
+        )
@@ -1,4 +1,4 @@
-from engine.ecs.system import System
+from engine.ecs.system import PausePolicy, System
 from engine.ui.hud import HUD
 from engine.ui.pause_overlay import PauseOverlay
 from engine.ui.chat_overlay import ChatOverlay
@@ -10,6 +10,8 @@ logger = get_logger("systems.ui")
 class UISystem(System):
     """Manages the In-Game HUD and UI interactions."""
     
+    pause_policy = PausePolicy.ALWAYS  # Drives the pause menu itself
+    
     def __init__(self, world, event_bus, game, hot_config=None):
         super().__init__(world, event_bus)
         self.game = game
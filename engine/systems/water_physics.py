@@ -3,7 +3,8 @@
 from engine.ecs.system import System
 from engine.components.core import Transform
 from panda3d.core import LVector3f
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+import math
 
 
 from engine.physics.kinematic import KinematicState
@@ -19,69 +20,200 @@ class WaterPhysicsSystem(System):
     SWIM_UP_FORCE = 8.0          
     SWIM_DOWN_FORCE = 6.0        
     
-    def __init__(self, world, event_bus):
+    def __init__(self, world, event_bus, chunk_size: int = 16):
         super().__init__(world, event_bus)
-        self.water_blocks = {}  # (x, y, z) -> water_level mapping
+        self.chunk_size = chunk_size
+        # (chunk_x, chunk_z) -> {(local_x, local_z): [(bottom, top), ...]}
+        # Spans are half-open block heights [bottom, top), sorted and non-touching.
+        # Registered and freed together with their chunk.
+        self.water_chunks: Dict[Tuple[int, int], Dict[Tuple[int, int], List[Tuple[int, int]]]] = {}
+        # entity_id -> (block column, that column's water spans) from the last lookup.
+        # Cleared whenever the water store changes.
+        self._water_cache: Dict[int, Tuple[Tuple[int, int], List[Tuple[int, int]]]] = {}
+    
+    # ========== Water store ==========
+    
+    def register_chunk_water(
+        self,
+        chunk_x: int,
+        chunk_z: int,
+        water_blocks: Iterable[Tuple[int, int, int]],
+        chunk_size: Optional[int] = None
+    ):
+        """Register all water of a chunk as column spans, replacing any previous data.
+        
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_z: Chunk Z coordinate
+            water_blocks: Chunk-local (x, y, z) water positions (y = height)
+            chunk_size: Chunk size the local coordinates refer to (defaults to self.chunk_size)
+        """
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+        
+        heights: Dict[Tuple[int, int], List[int]] = {}
+        for (x, y, z) in water_blocks:
+            heights.setdefault((x, z), []).append(y)
         
+        columns = {}
+        for column, ys in heights.items():
+            ys.sort()
+            spans = []
+            bottom = prev = ys[0]
+            for y in ys[1:]:
+                if y != prev + 1:
+                    spans.append((bottom, prev + 1))
+                    bottom = y
+                prev = y
+            spans.append((bottom, prev + 1))
+            columns[column] = spans
+        
+        self._water_cache.clear()
+        if columns:
+            self.water_chunks[(chunk_x, chunk_z)] = columns
+        else:
+            self.water_chunks.pop((chunk_x, chunk_z), None)
+    
+    def unregister_chunk_water(self, chunk_x: int, chunk_z: int):
+        """Free all water data of a chunk."""
+        if self.water_chunks.pop((chunk_x, chunk_z), None) is not None:
+            self._water_cache.clear()
+    
     def register_water_block(self, x: int, y: int, z: int, level: int = 8):
-        """Register a water block in the world.
+        """Register a single water block in the world.
         
         Args:
-            x, y, z: Block position
-            level: Water level (1-8, where 8 is full)
+            x, y, z: Block position (y = height, z = Panda3D depth)
+            level: Water level (1-8, where 8 is full); currently unused
         """
-        self.water_blocks[(x, y, z)] = level
+        chunk_key, column = self._locate(x, z)
+        spans = self.water_chunks.setdefault(chunk_key, {}).setdefault(column, [])
+        if self._span_at(spans, y) is not None:
+            return
+        self._water_cache.clear()
+        spans.append((y, y + 1))
+        spans.sort()
+        # Merge touching spans
+        merged = [spans[0]]
+        for bottom, top in spans[1:]:
+            if bottom <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], top))
+            else:
+                merged.append((bottom, top))
+        spans[:] = merged
     
     def unregister_water_block(self, x: int, y: int, z: int):
-        """Remove a water block from tracking."""
-        self.water_blocks.pop((x, y, z), None)
+        """Remove a single water block from tracking."""
+        chunk_key, column = self._locate(x, z)
+        columns = self.water_chunks.get(chunk_key)
+        spans = columns.get(column) if columns else None
+        index = self._span_at(spans, y) if spans else None
+        if index is None:
+            return
+        self._water_cache.clear()
+        bottom, top = spans.pop(index)
+        spans.extend(span for span in ((bottom, y), (y + 1, top)) if span[0] < span[1])
+        spans.sort()
+        if not spans:
+            del columns[column]
+            if not columns:
+                del self.water_chunks[chunk_key]
+    
+    def _locate(self, x: int, z: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Map a world block column to (chunk key, chunk-local column)."""
+        return (x // self.chunk_size, z // self.chunk_size), (x % self.chunk_size, z % self.chunk_size)
+    
+    @staticmethod
+    def _span_at(spans: List[Tuple[int, int]], y: float) -> Optional[int]:
+        for index, (bottom, top) in enumerate(spans):
+            if bottom <= y < top:
+                return index
+        return None
+    
+    def get_water_spans(self, pos: LVector3f) -> List[Tuple[int, int]]:
+        """Get the water spans (bottom, top) of the block column containing a position."""
+        chunk_key, column = self._locate(math.floor(pos.x), math.floor(pos.y))  # Panda3D Y is depth
+        columns = self.water_chunks.get(chunk_key)
+        if not columns:
+            return []
+        return columns.get(column, [])
+    
+    # ========== Queries ==========
     
     def is_position_in_water(self, pos: LVector3f) -> bool:
         """Check if a position is inside a water block."""
-        block_x = int(pos.x)
-        block_y = int(pos.z)  # Note: Panda3D uses Z-up
-        block_z = int(pos.y)
-        
-        return (block_x, block_y, block_z) in self.water_blocks
+        return self._span_at(self.get_water_spans(pos), pos.z) is not None  # Panda3D Z is height
     
     def get_submersion_level(self, position: LVector3f, entity_height: float = 1.8) -> float:
         """Calculate how submerged an entity is.
         
+        One column lookup, then the overlap of [feet, feet + height] with
+        that column's water spans.
+        
         Args:
             position: Entity position (feet)
             entity_height: Height of entity
             
         Returns:
-            Submersion level from 0.0 (not in water) to 1.0 (fully submerged)
+            Fraction of the entity's height under water, from 0.0 to 1.0
         """
-        feet_in_water = self.is_position_in_water(position)
-        head_pos = LVector3f(position.x, position.y, position.z + entity_height)
-        head_in_water = self.is_position_in_water(head_pos)
+        return self._span_overlap(self.get_water_spans(position), position.z, entity_height)
+    
+    @staticmethod
+    def _span_overlap(spans: List[Tuple[int, int]], feet: float, entity_height: float = 1.8) -> float:
+        """Fraction of [feet, feet + height] covered by water spans."""
+        if not spans or entity_height <= 0:
+            return 0.0
         
-        if head_in_water:
-            return 1.0  # Fully submerged
-        elif feet_in_water:
-            # Partial submersion (simplified - could be more accurate)
-            return 0.5
-        return 0.0
+        head = feet + entity_height
+        depth = 0.0
+        for bottom, top in spans:
+            depth += max(0.0, min(top, head) - max(bottom, feet))
+        if depth >= entity_height - 1e-9:
+            return 1.0  # Fully submerged (guards against head = feet + height rounding)
+        return depth / entity_height
     
     def update(self, dt: float):
-        """Apply water physics to entities."""
-        # Get all entities with Transform
-        entities = self.world.get_entities_with(Transform)
+        """Apply water physics to entities with a KinematicState.
+        
+        The column's water spans are only looked up again when an entity
+        enters a new block column (or the water changed); the overlap with
+        them is recomputed every frame, so buoyancy follows the entity's
+        exact height. Enter and exit events are published on transitions only.
+        """
+        rows = self.world.query(Transform, KinematicState).rows()
         
-        for entity_id in entities:
-            transform = self.world.get_component(entity_id, Transform)
-            if not transform:
-                continue
+        if len(self._water_cache) > len(rows):
+            # Drop destroyed entities and ones that lost their components
+            live = {row[0] for row in rows}
+            for entity_id in [eid for eid in self._water_cache if eid not in live]:
+                del self._water_cache[entity_id]
+        
+        for entity_id, transform, state in rows:
+            position = transform.position
+            column = (math.floor(position.x), math.floor(position.y))
             
-            # Check submersion
-            submersion = self.get_submersion_level(transform.position)
+            cached = self._water_cache.get(entity_id)
+            if cached is not None and cached[0] == column:
+                spans = cached[1]
+            else:
+                spans = self.get_water_spans(position)
+                self._water_cache[entity_id] = (column, spans)
+            submersion = self._span_overlap(spans, position.z)
             
             if submersion > 0:
+                if not state.in_water:
+                    self.event_bus.publish("entity_entered_water",
+                        entity_id=entity_id,
+                        submersion=submersion
+                    )
                 self.apply_water_physics(entity_id, transform, submersion, dt)
+            elif state.in_water:
+                state.in_water = False
+                state.submersion_level = 0.0
+                self.event_bus.publish("entity_exited_water", entity_id=entity_id)
     
-    def apply_water_physics(self, entity_id: str, transform: Transform, submersion: float, dt: float):
+    def apply_water_physics(self, entity_id: int, transform: Transform, submersion: float, dt: float):
         """Apply buoyancy and resistance to an entity in water.
         
         Args:
@@ -90,11 +222,8 @@ class WaterPhysicsSystem(System):
             submersion: Submersion level (0-1)
             dt: Delta time
         """
-        # Try to get velocity from entity
         state = self.world.get_component(entity_id, KinematicState)
         if not state:
-            # If no physics state, we fall back to position manipulation or skip
-            # For this engine, we prefer entities have KinematicState for physics
             return
         
         # Update water state flags
@@ -112,11 +241,4 @@ class WaterPhysicsSystem(System):
         state.velocity_y *= drag_factor  # Horizontal Y
         state.velocity_z *= drag_factor  # Vertical Z
         
-        # TODO: Apply water resistance to horizontal velocity
         # TODO: Hook into input system for swim controls
-        
-        # Emit event for other systems to react
-        self.event_bus.publish("entity_in_water", 
-            entity_id=entity_id,
-            submersion=submersion
-        )
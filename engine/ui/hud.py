@@ -4,6 +4,7 @@ MyCraft HUD (Heads-Up Display) - Panda3D Native
 Displays useful information to the player:
 - FPS counter
 - Position (for debugging)
+- Render statistics (debug overlay)
 - Control hints
 - Connection status (multiplayer)
 - Player count (multiplayer)
@@ -15,6 +16,8 @@ from panda3d.core import TextNode, LVector3f
 from typing import Optional
 from engine.ui.settings_overlay import SettingsOverlay
 from engine.core.hot_config import HotConfig
+from engine.rendering.render_stats import RenderStatsCollector
+from engine.ecs.profiler import SystemProfiler
 
 class HUD:
     """Heads-up display showing game information and controls using Panda3D DirectGUI."""
@@ -74,6 +77,34 @@ class HUD:
         )
         self.pos_text.hide()
         
+        # Render statistics (below position, debug overlay only; sampling and
+        # metrics also run with the overlay hidden unless perf_metrics is off)
+        self.render_stats = RenderStatsCollector(base, world=world)
+        self.stats_text = OnscreenText(
+            text='',
+            pos=(-1.3, 0.84),
+            scale=0.035,
+            fg=(0.7, 0.7, 0.7, 1),
+            align=TextNode.ALeft,
+            mayChange=True
+        )
+        self.stats_text.hide()
+        
+        # Per-system timings (below FPS, debug overlay only; the profiler is
+        # attached to the world's scheduler whenever render stats are collected)
+        self.system_profiler = SystemProfiler()
+        self.profile_text = OnscreenText(
+            text='',
+            pos=(1.3, 0.84),
+            scale=0.035,
+            fg=(0.7, 0.7, 0.7, 1),
+            align=TextNode.ARight,
+            mayChange=True
+        )
+        self.profile_text.hide()
+        self._profile_timer = 0.0
+        self._overlay_shown = False
+        
         # Control hints (bottom-left)
         controls = [
             "Controls:",
@@ -235,6 +266,32 @@ class HUD:
                     biome_name = "Unknown"
                 self.pos_text.setText(f'Pos: ({x}, {y}, {z}) | Biome: {biome_name}')
         
+        # Render stats are sampled at a low rate for the overlay and the metrics log
+        # (system timings likewise: the profiler logs them itself while attached)
+        collect_stats = self.debug_visible or self._perf_metrics_enabled()
+        if collect_stats != self.render_stats.enabled:
+            self.render_stats.set_enabled(collect_stats)
+            if self.world is not None:
+                self.world.scheduler.profiler = self.system_profiler if collect_stats else None
+        if self.debug_visible != self._overlay_shown:
+            self._overlay_shown = self.debug_visible
+            if self.debug_visible:
+                if self.render_stats.latest:
+                    self.stats_text.setText(self.render_stats.latest.format_text())
+                self.stats_text.show()
+                self.profile_text.show()
+            else:
+                self.stats_text.hide()
+                self.profile_text.hide()
+        stats = self.render_stats.update(dt)
+        if self.debug_visible:
+            if stats:
+                self.stats_text.setText(stats.format_text())
+            self._profile_timer += dt
+            if self._profile_timer >= self.fps_update_interval:
+                self._profile_timer = 0.0
+                self.profile_text.setText(self.system_profiler.format_table())
+        
         # Update welcome message fade timer
         if not self.welcome_message.isHidden():
             self.welcome_timer += dt
@@ -293,6 +350,12 @@ class HUD:
         else:
             self.loading_text.hide()
     
+    def _perf_metrics_enabled(self) -> bool:
+        """Whether to collect stats and timings for the metrics log with the overlay hidden."""
+        if self.hot_config is None:
+            return HotConfig.DEFAULTS["perf_metrics"]
+        return bool(self.hot_config.get("perf_metrics", True))
+
     def toggle_settings(self):
         """Toggle settings overlay visibility."""
         if self.settings:
@@ -350,6 +413,10 @@ class HUD:
         self.crosshair.destroy()
         self.fps_text.destroy()
         self.pos_text.destroy()
+        self.stats_text.destroy()
+        self.profile_text.destroy()
+        if self.world is not None and self.world.scheduler.profiler is self.system_profiler:
+            self.world.scheduler.profiler = None
         self.controls_text.destroy()
         self.welcome_message.destroy()
         self.connection_text.destroy()
@@ -8,6 +8,7 @@ that games can leverage without reimplementing.
 # Noise utilities - no heavy dependencies
 from engine.world.noise import get_noise, set_noise_seed, PerlinNoise2D
 from engine.world.generator import ChunkGenerator
+from engine.world.dormant import DormantEntity, freeze_entity, thaw_entity
 
 # ChunkManager requires panda3d - import on demand
 def get_chunk_manager():
@@ -21,5 +22,8 @@ __all__ = [
     'PerlinNoise2D',
     'ChunkGenerator',
     'get_chunk_manager',
+    'DormantEntity',
+    'freeze_entity',
+    'thaw_entity',
 ]
 
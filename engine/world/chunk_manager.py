@@ -5,7 +5,10 @@ Handles distance-based loading/unloading, collision generation,
 water handling, and mesh creation for voxel worlds.
 """
 
-from typing import Dict, Tuple, Optional, Any
+import math
+from typing import Dict, List, Tuple, Optional, Any, Sequence
+
+import numpy as np
 from panda3d.core import (
     NodePath, CollisionNode, CollisionPolygon, LVector3f,
     BitMask32, TransparencyAttrib, BoundingSphere, Point3
@@ -13,6 +16,45 @@ from panda3d.core import (
 
 from engine.ecs.system import System
 from engine.rendering.mesh import MeshBuilder
+from engine.rendering.mesh_cache import MeshCache
+from engine.physics.voxel_collision import VoxelCollider
+from engine.world.dormant import (
+    DormantEntity, dormant_from_data, dormant_to_data, freeze_entity, thaw_entity
+)
+
+
+# Chunk sides as (voxel axis, direction) -> offset of the chunk on that side
+CHUNK_SIDES: Dict[Tuple[int, int], Tuple[int, int]] = {
+    (0, -1): (-1, 0), (0, 1): (1, 0), (2, -1): (0, -1), (2, 1): (0, 1),
+}
+
+
+def greedy_merge_faces(cells: set) -> List[Tuple[int, int, int, int]]:
+    """Merge a layer of unit faces into maximal rectangles.
+    
+    Args:
+        cells: Set of (u, v) face coordinates in one plane
+        
+    Returns:
+        List of inclusive (u0, v0, u1, v1) rectangles covering every cell once
+    """
+    remaining = set(cells)
+    rects = []
+    for u, v in sorted(cells, key=lambda c: (c[1], c[0])):
+        if (u, v) not in remaining:
+            continue
+        # Grow along u, then add rows along v while the full span is present
+        u1 = u
+        while (u1 + 1, v) in remaining:
+            u1 += 1
+        v1 = v
+        while all((uu, v1 + 1) in remaining for uu in range(u, u1 + 1)):
+            v1 += 1
+        for vv in range(v, v1 + 1):
+            for uu in range(u, u1 + 1):
+                remaining.discard((uu, vv))
+        rects.append((u, v, u1, v1))
+    return rects
 
 
 class ChunkManager(System):
@@ -40,7 +82,9 @@ class ChunkManager(System):
         unload_radius: int = 8,
         max_chunks_per_frame: int = 3,
         sea_level: int = 0,
-        complex_water: bool = False
+        complex_water: bool = False,
+        mesh_cache: Optional[MeshCache] = None,
+        collision_polygons: bool = True
     ):
         """Initialize chunk manager.
         
@@ -56,6 +100,9 @@ class ChunkManager(System):
             max_chunks_per_frame: Throttle chunk loading per frame
             sea_level: Y level for water generation (blocks below get water)
             complex_water: If True, uses shaders and physics for water. If False, renders as simple blocks.
+            mesh_cache: Optional MeshCache for compiled chunk meshes (in-memory cache created if None)
+            collision_polygons: Also build CollisionPolygons for CollisionTraverser users
+                (camera, legacy raycasts). Voxel queries via self.collider never need them.
         """
         super().__init__(world, event_bus)
         
@@ -68,10 +115,40 @@ class ChunkManager(System):
         self.max_chunks_per_frame = max_chunks_per_frame
         self.sea_level = sea_level
         self.complex_water = complex_water
+        self.collision_polygons = collision_polygons
+        
+        # Content-hashed cache of compiled terrain meshes
+        self.mesh_cache = mesh_cache if mesh_cache is not None else MeshCache()
         
         # Loaded chunks: (chunk_x, chunk_z) -> NodePath
         self.chunks: Dict[Tuple[int, int], NodePath] = {}
         
+        # Collision NodePaths per chunk (lets RaycastService traverse only chunks in range)
+        self.collision_nodes: Dict[Tuple[int, int], NodePath] = {}
+        
+        # Border faces per chunk side, children of the chunk's collision node, rebuilt
+        # when the neighbour on that side loads or unloads: (chunk, side) -> NodePath
+        self.collision_borders: Dict[Tuple[Tuple[int, int], Tuple[int, int]], NodePath] = {}
+        
+        # Block data of loaded chunks: (chunk_x, chunk_z) -> {(local_x, y, local_z): block_name}
+        self.chunk_blocks: Dict[Tuple[int, int], Dict[Tuple[int, int, int], str]] = {}
+        
+        # Ray/sweep/overlap queries straight against chunk_blocks (nothing to build per chunk)
+        self.collider = VoxelCollider(self.get_block, generator.get_block_registry())
+        
+        # Column-top heightmaps: (chunk_x, chunk_z) -> (chunk_size, chunk_size) array indexed
+        # [local_x, local_z] holding the Z of the highest solid block's top face (NaN = no solid block)
+        self.chunk_heightmaps: Dict[Tuple[int, int], np.ndarray] = {}
+        
+        # Live entities owned by each loaded chunk (spawned there or restored there)
+        self.chunk_entities: Dict[Tuple[int, int], set] = {}
+        
+        # Entities of unloaded chunks, restored instead of respawned on reload
+        self.dormant_entities: Dict[Tuple[int, int], List[DormantEntity]] = {}
+        
+        # Chunks whose generated entities have spawned once (never spawned again)
+        self.populated_chunks: set = set()
+        
         # Track water meshes separately for animation
         self.water_nodes: Dict[Tuple[int, int], NodePath] = {}
         
@@ -99,6 +176,197 @@ class ChunkManager(System):
         """
         return self.generator.get_height(x, z)
     
+    def get_block(self, x: int, y: int, z: int) -> Optional[str]:
+        """Get the block in a loaded chunk at a world cell.
+        
+        Args:
+            x: World cell X (Panda3D X)
+            y: World cell Y (Panda3D Y, depth)
+            z: World cell Z (Panda3D Z, height)
+            
+        Returns:
+            Block name, or None for air and unloaded chunks
+        """
+        blocks = self.chunk_blocks.get((x // self.chunk_size, y // self.chunk_size))
+        if blocks is None:
+            return None
+        return blocks.get((x % self.chunk_size, z, y % self.chunk_size))
+    
+    def is_loaded_at(self, x: float, y: float) -> bool:
+        """Return True if block data is loaded for the chunk containing world (x, y)."""
+        return (math.floor(x) // self.chunk_size, math.floor(y) // self.chunk_size) in self.chunk_blocks
+    
+    def set_block(self, x: int, y: int, z: int, block_name: Optional[str]) -> bool:
+        """Place or remove a block in a loaded chunk.
+        
+        Updates the block data (and so voxel collision queries) and the
+        column heightmap. The render mesh and CollisionPolygons are not
+        rebuilt here; listeners of "block_changed" own that.
+        
+        Args:
+            x: World cell X (Panda3D X)
+            y: World cell Y (Panda3D Y, depth)
+            z: World cell Z (Panda3D Z, height)
+            block_name: Block to place, or None to remove
+            
+        Returns:
+            False if the cell's chunk isn't loaded
+        """
+        chunk_key = (x // self.chunk_size, y // self.chunk_size)
+        blocks = self.chunk_blocks.get(chunk_key)
+        if blocks is None:
+            return False
+        
+        lx, lz = x % self.chunk_size, y % self.chunk_size
+        if block_name is None:
+            blocks.pop((lx, z, lz), None)
+        else:
+            blocks[(lx, z, lz)] = block_name
+        
+        heightmap = self.chunk_heightmaps.get(chunk_key)
+        if heightmap is not None:
+            top = heightmap[lx, lz]
+            if self.collider.is_solid_block(block_name):
+                if math.isnan(top) or z + 1 > top:
+                    heightmap[lx, lz] = z + 1
+            elif not math.isnan(top) and z + 1 == top:
+                # Removed the column top: rescan the column
+                heightmap[lx, lz] = self._column_top(blocks, lx, lz)
+        
+        self.event_bus.publish("block_changed", position=(x, y, z), block_name=block_name, chunk=chunk_key)
+        return True
+    
+    # ========== Surface height queries ==========
+    
+    def _build_heightmap(self, blocks: Dict[Tuple[int, int, int], str]) -> np.ndarray:
+        """Column-top heights for one chunk's block data."""
+        heightmap = np.full((self.chunk_size, self.chunk_size), np.nan, dtype=np.float32)
+        is_solid_block = self.collider.is_solid_block
+        for (lx, y, lz), block_name in blocks.items():
+            if is_solid_block(block_name):
+                top = heightmap[lx, lz]
+                if math.isnan(top) or y + 1 > top:
+                    heightmap[lx, lz] = y + 1
+        return heightmap
+    
+    def _column_top(self, blocks: Dict[Tuple[int, int, int], str], lx: int, lz: int) -> float:
+        is_solid_block = self.collider.is_solid_block
+        heights = [y + 1 for (bx, y, bz), name in blocks.items()
+                   if bx == lx and bz == lz and is_solid_block(name)]
+        return float(max(heights)) if heights else np.nan
+    
+    def _surface_at_cell(self, ix: int, iy: int) -> Optional[float]:
+        heightmap = self.chunk_heightmaps.get((ix // self.chunk_size, iy // self.chunk_size))
+        if heightmap is None:
+            return None
+        top = heightmap[ix % self.chunk_size, iy % self.chunk_size]
+        return None if math.isnan(top) else float(top)
+    
+    def get_surface_height(
+        self,
+        x: float,
+        y: float,
+        return_normal: bool = False
+    ) -> Optional[float] | Optional[Tuple[float, Tuple[float, float, float]]]:
+        """Get the top of the highest solid block in a column.
+        
+        Reads the chunk heightmap, so overhangs are ignored: the result is
+        the column top even if there is open space below it.
+        
+        Args:
+            x: World X coordinate
+            y: World Y coordinate (Panda3D depth)
+            return_normal: If True, also return a surface normal estimated
+                from the neighbouring columns (central differences)
+            
+        Returns:
+            Surface Z, or (height, normal) if return_normal=True, or None if
+            the chunk isn't loaded or the column is empty
+        """
+        ix, iy = math.floor(x), math.floor(y)
+        height = self._surface_at_cell(ix, iy)
+        if height is None or not return_normal:
+            return height
+        
+        def neighbour(dx: int, dy: int) -> float:
+            h = self._surface_at_cell(ix + dx, iy + dy)
+            return height if h is None else h
+        
+        nx = (neighbour(-1, 0) - neighbour(1, 0)) / 2.0
+        ny = (neighbour(0, -1) - neighbour(0, 1)) / 2.0
+        length = math.sqrt(nx * nx + ny * ny + 1.0)
+        return (height, (nx / length, ny / length, 1.0 / length))
+    
+    def get_surface_heights(self, points: Sequence[Sequence[float]]) -> np.ndarray:
+        """Batched get_surface_height() for many (x, y) points.
+        
+        Points are grouped by chunk so each heightmap is looked up once and
+        indexed with one vectorized gather.
+        
+        Args:
+            points: (N, 2) array-like of world (x, y)
+            
+        Returns:
+            (N,) float array of surface Z, NaN where the chunk isn't loaded or the column is empty
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        heights = np.full(pts.shape[0], np.nan, dtype=np.float64)
+        if pts.shape[0] == 0:
+            return heights
+        
+        cells = np.floor(pts).astype(np.int64)
+        chunks = cells // self.chunk_size
+        local = cells - chunks * self.chunk_size
+        keys, inverse = np.unique(chunks, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        for index, (chunk_x, chunk_z) in enumerate(keys.tolist()):
+            heightmap = self.chunk_heightmaps.get((chunk_x, chunk_z))
+            if heightmap is None:
+                continue
+            mask = inverse == index
+            heights[mask] = heightmap[local[mask, 0], local[mask, 1]]
+        return heights
+    
+    def ground_height(
+        self,
+        entity: Any,
+        max_distance: float = 5.0,
+        foot_offset: float = 0.2,
+        ray_origin_offset: float = 2.0,
+        return_normal: bool = False
+    ) -> Optional[float] | Optional[Tuple[float, Tuple[float, float, float]]]:
+        """Drop-in replacement for raycast_ground_height() using the heightmap.
+        
+        When the column top is below the ray origin, a downward ray would hit
+        exactly that face, so the heightmap answers directly. Under an
+        overhang it falls back to a voxel raycast.
+        
+        Args:
+            entity: The entity to query for (must have x, y, z attributes)
+            max_distance: Maximum distance below the entity to search
+            foot_offset: Offset for feet placement
+            ray_origin_offset: Height above entity the equivalent ray starts at
+            return_normal: If True, return (height, normal) tuple
+            
+        Returns:
+            Ground Z position, or (height, normal) if return_normal=True, or None if no hit
+        """
+        origin_z = entity.z + ray_origin_offset
+        surface = self.get_surface_height(entity.x, entity.y, return_normal=True)
+        if surface is not None and surface[0] > origin_z:
+            from engine.physics.voxel_collision import voxel_ground_height
+            return voxel_ground_height(
+                entity, self.collider, max_distance, foot_offset, ray_origin_offset,
+                return_normal=return_normal
+            )
+        if surface is None or surface[0] < entity.z - max_distance:
+            return None
+        
+        height, normal = surface
+        if return_normal:
+            return (height + foot_offset, normal)
+        return height + foot_offset
+    
     def create_chunk(self, chunk_x: int, chunk_z: int) -> NodePath:
         """Generate and attach a chunk to the scene.
         
@@ -112,7 +380,15 @@ class ChunkManager(System):
         # 1. Generate voxel grid and entities from game-specific generator
         voxel_grid, entities = self.generator.generate_chunk(chunk_x, chunk_z, self.chunk_size)
         
-        # 1b. Spawn entities
+        # 1b. Spawn generated entities on first load, restore dormant ones after that
+        chunk_key = (chunk_x, chunk_z)
+        owned = self.chunk_entities.setdefault(chunk_key, set())
+        if chunk_key in self.populated_chunks:
+            entities = None
+        self.populated_chunks.add(chunk_key)
+        for record in self.dormant_entities.pop(chunk_key, ()):
+            owned.add(thaw_entity(self.world, record))
+        
         if entities:
             # Lazy import to avoid circular dependency
             from games.voxel_world.entity.factory import EntityFactory
@@ -128,13 +404,14 @@ class ChunkManager(System):
                 # Use chunk coordinates to create a stable seed for the entity
                 entity_seed = hash((ex, ey, ez))
                 
-                EntityFactory.create_enemy(
+                # Generator tuples are (x, height, depth) like the voxel grid; Panda3D is Z-up
+                owned.add(EntityFactory.create_enemy(
                     self.world, 
                     entity_type, 
-                    (float(ex), float(ey), float(ez)), 
+                    (float(ex), float(ez), float(ey)), 
                     entity_seed,
                     color_name=color_name
-                )
+                ))
         
         # 2. Add water blocks below sea level
         self._add_water_to_grid(voxel_grid, chunk_x, chunk_z)
@@ -151,19 +428,15 @@ class ChunkManager(System):
                 # If complex water is off, treat water as a normal solid block (it will use fallback color/texture)
                 solid_grid[pos] = block_name
         
-        # 4. Build solid terrain mesh
-        block_registry = self.generator.get_block_registry()
-        geom_node = MeshBuilder.build_chunk_mesh_from_grid(
-            solid_grid, 
-            chunk_x, 
-            chunk_z, 
-            self.chunk_size,
-            self.texture_atlas,
-            block_registry
-        )
+        # 4. Build solid terrain mesh (or reuse a cached one with identical content)
+        geom_node = self._get_chunk_mesh(solid_grid)
         
         # 5. Create NodePath and attach to scene
-        chunk_np = self.base.render.attachNewNode(geom_node)
+        # Mesh is in chunk-local coordinates so identical chunks can share it;
+        # the chunk root stays at the origin because collision/water are in world space.
+        chunk_np = self.base.render.attachNewNode(f'chunk_{chunk_x}_{chunk_z}')
+        mesh_np = chunk_np.attachNewNode(geom_node)
+        mesh_np.setPos(chunk_x * self.chunk_size, chunk_z * self.chunk_size, 0)
         
         # 6. Apply texture if available
         if self.texture_atlas and self.texture_atlas.is_loaded():
@@ -199,21 +472,50 @@ class ChunkManager(System):
             from engine.systems.water_physics import WaterPhysicsSystem
             water_system = self.world.get_system_by_type("WaterPhysicsSystem")
             if water_system:
-                base_x = chunk_x * self.chunk_size
-                base_z = chunk_z * self.chunk_size
-                for (x, y, z) in water_blocks:
-                    world_x = base_x + x
-                    world_z = base_z + z
-                    water_system.register_water_block(world_x, y, world_z)
+                water_system.register_chunk_water(chunk_x, chunk_z, water_blocks, self.chunk_size)
         
-        # 9. Add collision geometry
-        self._add_collision_to_chunk(chunk_np, solid_grid, chunk_x, chunk_z)
+        # 9. Add collision geometry (only for traverser-based queries)
+        if self.collision_polygons:
+            self._add_collision_to_chunk(chunk_np, solid_grid, chunk_x, chunk_z)
         
-        # 10. Store reference
+        # 10. Store reference (block data backs voxel collision queries)
         self.chunks[(chunk_x, chunk_z)] = chunk_np
+        self.chunk_blocks[(chunk_x, chunk_z)] = solid_grid
+        self.chunk_heightmaps[(chunk_x, chunk_z)] = self._build_heightmap(solid_grid)
+        if self.collision_polygons:
+            self._refresh_neighbor_borders(chunk_x, chunk_z)
         
         return chunk_np
     
+    def _get_chunk_mesh(self, solid_grid: Dict[Tuple[int, int, int], str]) -> Any:
+        """Return the chunk-local terrain mesh for a grid, meshing only on a cache miss.
+        
+        The mesher treats cells outside the chunk as air, so no neighbour
+        border slices take part in the key.
+        
+        Args:
+            solid_grid: Chunk-local voxel grid without complex water
+            
+        Returns:
+            GeomNode with the terrain mesh in chunk-local coordinates
+        """
+        block_registry = self.generator.get_block_registry()
+        atlas_loaded = bool(self.texture_atlas and self.texture_atlas.is_loaded())
+        salt = getattr(self.texture_atlas, 'image_path', '') if atlas_loaded else 'untextured'
+        key = MeshCache.make_key(solid_grid, self.chunk_size, salt=salt)
+        
+        return self.mesh_cache.get_or_build(
+            key,
+            lambda: MeshBuilder.build_chunk_mesh_from_grid(
+                solid_grid,
+                0,
+                0,
+                self.chunk_size,
+                self.texture_atlas,
+                block_registry
+            )
+        )
+    
     def _add_water_to_grid(
         self, 
         voxel_grid: Dict[Tuple[int, int, int], str],
@@ -255,7 +557,15 @@ class ChunkManager(System):
         chunk_x: int,
         chunk_z: int
     ):
-        """Add collision geometry for solid blocks.
+        """Add greedy-merged collision geometry for solid blocks.
+        
+        Exposed faces are grouped per direction and layer, then merged into
+        maximal rectangles (as greedy meshing does), so a flat layer becomes
+        a handful of quads instead of two triangles per block face. Faces on
+        the chunk border that are covered by a solid block in a loaded
+        neighbour chunk are left out; each side's border faces live in their
+        own child node, rebuilt when the neighbour on that side loads or
+        unloads (see _refresh_neighbor_borders).
         
         Args:
             chunk_np: NodePath to attach collision to
@@ -263,111 +573,180 @@ class ChunkManager(System):
             chunk_x: Chunk X coordinate
             chunk_z: Chunk Z coordinate
         """
-        block_registry = self.generator.get_block_registry()
-        
-        cnode = CollisionNode(f'chunk_collision_{chunk_x}_{chunk_z}')
-        cnode.setFromCollideMask(BitMask32.bit(1))
-        cnode.setIntoCollideMask(BitMask32.bit(1))
-        
-        base_x = chunk_x * self.chunk_size
-        base_z = chunk_z * self.chunk_size
+        chunk_key = (chunk_x, chunk_z)
+        faces = self._collect_collision_faces(voxel_grid, chunk_x, chunk_z)
+        border_faces = {}
+        for side in CHUNK_SIDES:
+            layer = self._border_layer(side)
+            layers = faces.get(side)
+            border_faces[side] = {side: {layer: layers.pop(layer)}} if layers and layer in layers else {}
+        
+        cnode = self._build_collision_node(f'chunk_collision_{chunk_x}_{chunk_z}', faces, chunk_x, chunk_z)
+        collision_np = chunk_np.attachNewNode(cnode)
+        self.collision_nodes[chunk_key] = collision_np
+        for side, side_faces in border_faces.items():
+            self._attach_border_collision(collision_np, chunk_key, side, side_faces)
+    
+    def _refresh_neighbor_borders(self, chunk_x: int, chunk_z: int):
+        """Rebuild the border collision that loaded neighbours turn towards a chunk.
         
-        # Face directions: (dx, dy, dz, name)
-        directions = [
-            (0, 1, 0, 'top'),
-            (0, -1, 0, 'bottom'),
-            (1, 0, 0, 'east'),
-            (-1, 0, 0, 'west'),
-            (0, 0, 1, 'south'),
-            (0, 0, -1, 'north')
-        ]
+        Called after the chunk's block data is added or removed, so faces it
+        now covers are dropped and faces it no longer covers come back.
+        """
+        for (axis, direction), (dx, dz) in CHUNK_SIDES.items():
+            neighbor = (chunk_x + dx, chunk_z + dz)
+            collision_np = self.collision_nodes.get(neighbor)
+            voxel_grid = self.chunk_blocks.get(neighbor)
+            if collision_np is None or voxel_grid is None:
+                continue
+            side = (axis, -direction)  # The neighbour's side facing this chunk
+            old = self.collision_borders.pop((neighbor, side), None)
+            if old is not None:
+                old.removeNode()
+            side_faces = self._collect_collision_faces(voxel_grid, *neighbor, side=side)
+            self._attach_border_collision(collision_np, neighbor, side, side_faces)
+    
+    def _attach_border_collision(
+        self,
+        collision_np: NodePath,
+        chunk_key: Tuple[int, int],
+        side: Tuple[int, int],
+        faces: Dict[Tuple[int, int], Dict[int, set]]
+    ):
+        if not faces:
+            return
+        name = f'chunk_collision_{chunk_key[0]}_{chunk_key[1]}_side_{side[0]}_{side[1]}'
+        cnode = self._build_collision_node(name, faces, *chunk_key)
+        self.collision_borders[(chunk_key, side)] = collision_np.attachNewNode(cnode)
+    
+    def _border_layer(self, side: Tuple[int, int]) -> int:
+        """Block coordinate of a chunk side's outermost layer."""
+        return 0 if side[1] < 0 else self.chunk_size - 1
+    
+    def _collect_collision_faces(
+        self,
+        voxel_grid: Dict[Tuple[int, int, int], str],
+        chunk_x: int,
+        chunk_z: int,
+        side: Optional[Tuple[int, int]] = None
+    ) -> Dict[Tuple[int, int], Dict[int, set]]:
+        """Collect exposed solid block faces.
         
+        Args:
+            voxel_grid: Voxel grid with block data
+            chunk_x: Chunk X coordinate
+            chunk_z: Chunk Z coordinate
+            side: Only collect the border faces on this chunk side
+            
+        Returns:
+            (axis, direction) -> layer -> {(u, v)}. Axes are voxel-local
+            (0=x, 1=y height, 2=z); u/v are the other two axes in order.
+        """
+        is_solid_block = self.collider.is_solid_block
+        size = self.chunk_size
+        base_x = chunk_x * size
+        base_z = chunk_z * size
+        
+        def neighbor_is_solid(nx: int, ny: int, nz: int) -> bool:
+            if 0 <= nx < size and 0 <= nz < size:
+                return is_solid_block(voxel_grid.get((nx, ny, nz)))
+            # Outside this chunk: covered only if the neighbour chunk is loaded and solid there
+            return is_solid_block(self.get_block(base_x + nx, base_z + nz, ny))
+        
+        if side is None:
+            directions = [(axis, direction) for axis in range(3) for direction in (1, -1)]
+        else:
+            directions = [side]
+            border_axis, border_layer = side[0], self._border_layer(side)
+        
+        faces: Dict[Tuple[int, int], Dict[int, set]] = {}
         for pos, block_name in voxel_grid.items():
-            # Skip non-solid blocks
-            try:
-                block_def = block_registry.get_block(block_name)
-            except KeyError:
+            if side is not None and pos[border_axis] != border_layer:
                 continue
-                
-            if not block_def.solid:
+            if not is_solid_block(block_name):
                 continue
-            
-            x, y, z = pos
-            world_x = base_x + x
-            world_z = base_z + z
-            
-            # Check each face for exposure
-            for dx, dy, dz, face in directions:
-                neighbor = (x + dx, y + dy, z + dz)
-                
-                # Face is exposed if neighbor is empty or non-solid
-                exposed = True
-                if neighbor in voxel_grid:
-                    neighbor_name = voxel_grid[neighbor]
-                    try:
-                        neighbor_def = block_registry.get_block(neighbor_name)
-                        if neighbor_def.solid:
-                            exposed = False
-                    except KeyError:
-                        pass
-                
-                if exposed:
-                    # Create collision quad for this face
-                    self._add_collision_face(cnode, world_x, y, world_z, face)
+            for axis, direction in directions:
+                neighbor = list(pos)
+                neighbor[axis] += direction
+                if neighbor_is_solid(*neighbor):
+                    continue
+                u_axis, v_axis = [a for a in range(3) if a != axis]
+                faces.setdefault((axis, direction), {}).setdefault(pos[axis], set()).add(
+                    (pos[u_axis], pos[v_axis])
+                )
+        return faces
+    
+    def _build_collision_node(
+        self,
+        name: str,
+        faces: Dict[Tuple[int, int], Dict[int, set]],
+        chunk_x: int,
+        chunk_z: int
+    ) -> CollisionNode:
+        """Merge each layer of faces into rectangles, one quad per rectangle."""
+        cnode = CollisionNode(name)
+        cnode.setFromCollideMask(BitMask32.bit(1))
+        cnode.setIntoCollideMask(BitMask32.bit(1))
         
-        chunk_np.attachNewNode(cnode)
+        base_x = chunk_x * self.chunk_size
+        base_z = chunk_z * self.chunk_size
+        for (axis, direction), layers in faces.items():
+            for layer, cells in layers.items():
+                for u0, v0, u1, v1 in greedy_merge_faces(cells):
+                    self._add_collision_rect(cnode, axis, direction, layer, u0, v0, u1, v1, base_x, base_z)
+        return cnode
     
-    def _add_collision_face(
+    def _add_collision_rect(
         self,
         cnode: CollisionNode,
-        world_x: int,
-        y: int,
-        world_z: int,
-        face: str
+        axis: int,
+        direction: int,
+        layer: int,
+        u0: int,
+        v0: int,
+        u1: int,
+        v1: int,
+        base_x: int,
+        base_z: int
     ):
-        """Add a collision quad for a block face.
+        """Add one collision quad covering merged block faces.
         
         Args:
             cnode: CollisionNode to add to
-            world_x: World X coordinate
-            y: Height (Y in voxel space, Z in Panda3D)
-            world_z: World Z coordinate (Y in Panda3D)
-            face: Face name ('top', 'bottom', 'east', 'west', 'north', 'south')
+            axis: Voxel-local face axis (0=x, 1=y height, 2=z)
+            direction: +1 or -1 along the axis
+            layer: Block coordinate along the axis
+            u0, v0, u1, v1: Inclusive block range on the two other axes
+            base_x: World X of the chunk origin
+            base_z: World Z (Panda3D Y) of the chunk origin
         """
-        if face == 'top':
-            v0 = LVector3f(world_x, world_z, y + 1)
-            v1 = LVector3f(world_x + 1, world_z, y + 1)
-            v2 = LVector3f(world_x + 1, world_z + 1, y + 1)
-            v3 = LVector3f(world_x, world_z + 1, y + 1)
-        elif face == 'bottom':
-            v0 = LVector3f(world_x, world_z + 1, y)
-            v1 = LVector3f(world_x + 1, world_z + 1, y)
-            v2 = LVector3f(world_x + 1, world_z, y)
-            v3 = LVector3f(world_x, world_z, y)
-        elif face == 'east':
-            v0 = LVector3f(world_x + 1, world_z, y)
-            v1 = LVector3f(world_x + 1, world_z + 1, y)
-            v2 = LVector3f(world_x + 1, world_z + 1, y + 1)
-            v3 = LVector3f(world_x + 1, world_z, y + 1)
-        elif face == 'west':
-            v0 = LVector3f(world_x, world_z + 1, y)
-            v1 = LVector3f(world_x, world_z, y)
-            v2 = LVector3f(world_x, world_z, y + 1)
-            v3 = LVector3f(world_x, world_z + 1, y + 1)
-        elif face == 'south':
-            v0 = LVector3f(world_x + 1, world_z + 1, y)
-            v1 = LVector3f(world_x, world_z + 1, y)
-            v2 = LVector3f(world_x, world_z + 1, y + 1)
-            v3 = LVector3f(world_x + 1, world_z + 1, y + 1)
-        else:  # north
-            v0 = LVector3f(world_x, world_z, y)
-            v1 = LVector3f(world_x + 1, world_z, y)
-            v2 = LVector3f(world_x + 1, world_z, y + 1)
-            v3 = LVector3f(world_x, world_z, y + 1)
-        
-        # Two triangles per quad
-        cnode.addSolid(CollisionPolygon(v0, v1, v2))
-        cnode.addSolid(CollisionPolygon(v0, v2, v3))
+        u_axis, v_axis = [a for a in range(3) if a != axis]
+        plane = layer + (1 if direction > 0 else 0)
+        
+        corners = []
+        for u, v in ((u0, v0), (u1 + 1, v0), (u1 + 1, v1 + 1), (u0, v1 + 1)):
+            voxel = [0, 0, 0]
+            voxel[axis] = plane
+            voxel[u_axis] = u
+            voxel[v_axis] = v
+            # Voxel (x, y, z) -> Panda3D (x, z, y)
+            corners.append((base_x + voxel[0], base_z + voxel[2], voxel[1]))
+        
+        # Wind counter-clockwise seen from outside (Panda3D normal of the face)
+        normal = [0, 0, 0]
+        normal[(0, 2, 1)[axis]] = direction
+        (ax, ay, az), (bx, by, bz), (cx, cy, cz) = corners[0], corners[1], corners[2]
+        e1 = (bx - ax, by - ay, bz - az)
+        e2 = (cx - ax, cy - ay, cz - az)
+        cross = (
+            e1[1] * e2[2] - e1[2] * e2[1],
+            e1[2] * e2[0] - e1[0] * e2[2],
+            e1[0] * e2[1] - e1[1] * e2[0],
+        )
+        if cross[0] * normal[0] + cross[1] * normal[1] + cross[2] * normal[2] < 0:
+            corners.reverse()
+        
+        cnode.addSolid(CollisionPolygon(*(LVector3f(*c) for c in corners)))
     
     def _update_frustum_culling(self, player_chunk_x: int, player_chunk_z: int):
         """Update chunk visibility based on camera frustum.
@@ -459,24 +838,85 @@ class ChunkManager(System):
         """
         chunk_key = (chunk_x, chunk_z)
         
-        # Unregister water blocks from physics system
-        if chunk_key in self.water_nodes:
-            from engine.systems.water_physics import WaterPhysicsSystem
-            water_system = self.world.get_system_by_type("WaterPhysicsSystem")
-            if water_system:
-                base_x = chunk_x * self.chunk_size
-                base_z = chunk_z * self.chunk_size
-                # Note: We don't track individual water block positions for unloading
-                # In a full implementation, we'd track them or iterate the grid again
-                # For now, the water system can handle dangling registrations
-            
-            # Clean up water node
-            del self.water_nodes[chunk_key]
+        self._unload_entities(chunk_key)
+        
+        # Free the chunk's water in the physics system
+        water_system = self.world.get_system_by_type("WaterPhysicsSystem")
+        if water_system:
+            water_system.unregister_chunk_water(chunk_x, chunk_z)
+        
+        # Clean up water node
+        self.water_nodes.pop(chunk_key, None)
         
         # Remove chunk
         if chunk_key in self.chunks:
             self.chunks[chunk_key].removeNode()
             del self.chunks[chunk_key]
+        self.chunk_blocks.pop(chunk_key, None)
+        self.chunk_heightmaps.pop(chunk_key, None)
+        if self.collision_nodes.pop(chunk_key, None) is not None:
+            for side in CHUNK_SIDES:
+                self.collision_borders.pop((chunk_key, side), None)
+        if self.collision_polygons:
+            self._refresh_neighbor_borders(chunk_x, chunk_z)
+    
+    def _unload_entities(self, chunk_key: Tuple[int, int]):
+        """Freeze and destroy the live entities owned by an unloading chunk.
+        
+        Ownership follows the entity: one that walked into another loaded
+        chunk is handed to it, and a dormant record is filed under the chunk
+        the entity stands in, so it comes back where it was left.
+        """
+        self._rehome_entities(self.chunk_entities.pop(chunk_key, ()))
+    
+    def _rehome_entities(self, entity_ids):
+        """Give entities to the loaded chunk they stand in, or freeze them into it."""
+        from engine.components.core import Transform
+        
+        for entity_id in entity_ids:
+            transform = self.world.get_component(entity_id, Transform)
+            if transform is None:
+                continue  # Destroyed while loaded (killed, despawned)
+            position = transform.position
+            home = (math.floor(position.x) // self.chunk_size, math.floor(position.y) // self.chunk_size)
+            if home in self.chunk_entities:
+                self.chunk_entities[home].add(entity_id)
+                continue
+            self.dormant_entities.setdefault(home, []).append(freeze_entity(self.world, entity_id))
+            self.world.destroy_entity(entity_id)
+            self.event_bus.publish("entity_unloaded", entity_id=entity_id)
+    
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Chunk ownership, dormant records and populated chunks, for world snapshots."""
+        return {
+            "owned": [entity_id for owned in self.chunk_entities.values() for entity_id in owned],
+            "dormant": {
+                chunk_key: [dormant_to_data(record) for record in records]
+                for chunk_key, records in self.dormant_entities.items()
+            },
+            "populated": sorted(self.populated_chunks),
+        }
+    
+    def restore_snapshot_state(self, state: Optional[Dict[str, Any]]):
+        """Take over the saved streaming state after a snapshot load.
+        
+        Restored entities that were chunk-owned go to the loaded chunk they
+        stand in, or are frozen into their (unloaded) chunk right away. The
+        saved dormant records replace the current ones, so nothing frozen
+        since the save is thawed twice. A snapshot without ChunkManager
+        state drops all dormant records and owns nothing.
+        """
+        self.chunk_entities = {chunk_key: set() for chunk_key in self.chunks}
+        if state is None:
+            self.dormant_entities = {}
+            self.populated_chunks = set(self.chunks)
+            return
+        self.dormant_entities = {
+            tuple(chunk_key): [dormant_from_data(data) for data in records]
+            for chunk_key, records in state["dormant"].items()
+        }
+        self.populated_chunks = {tuple(chunk_key) for chunk_key in state["populated"]}
+        self._rehome_entities(state["owned"])
     
     def update(self, dt: float):
         """Update chunk streaming based on player position.
@@ -0,0 +1,108 @@
+"""
+Dormant entity records for chunk streaming.
+
+When a chunk unloads, the entities it owns are frozen into DormantEntity
+records and destroyed; when it loads again they are thawed back into live
+entities instead of being spawned a second time by the generator.
+
+A record holds each component's class and its field values in declaration
+order, so it costs one tuple per component instead of a live dict entry,
+index entries and per-system state.
+
+dormant_to_data()/dormant_from_data() convert records to and from plain
+data for world snapshots, matching fields by name like the snapshot does.
+"""
+
+from dataclasses import MISSING, fields
+from typing import Any, Dict, List, NamedTuple, Tuple, Type
+
+from engine.ecs.component import Component, get_component_class
+from engine.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DormantEntity(NamedTuple):
+    """Frozen components of an unloaded entity."""
+    components: Tuple[Tuple[Type[Component], Tuple[Any, ...]], ...]
+
+
+def freeze_entity(world: Any, entity_id: int) -> DormantEntity:
+    """Capture an entity's components as a dormant record.
+
+    Field values are captured by reference: the entity is expected to be
+    destroyed right after, so nothing else keeps mutating them.
+
+    Args:
+        world: ECS World instance
+        entity_id: Entity to capture
+
+    Returns:
+        DormantEntity record
+    """
+    return DormantEntity(tuple(
+        (type(component), tuple(getattr(component, f.name) for f in fields(component)))
+        for component in world.get_components(entity_id).values()
+    ))
+
+
+def thaw_entity(world: Any, record: DormantEntity) -> int:
+    """Recreate a live entity from a dormant record.
+
+    Components are rebuilt without calling __init__/__post_init__, so
+    restored values are not reset to defaults.
+
+    Args:
+        world: ECS World instance
+        record: Record made by freeze_entity()
+
+    Returns:
+        ID of the new entity
+    """
+    entity_id = world.create_entity()
+    for component_type, values in record.components:
+        component = component_type.__new__(component_type)
+        for f, value in zip(fields(component_type), values):
+            setattr(component, f.name, value)
+        world.add_component(entity_id, component)
+    return entity_id
+
+
+def dormant_to_data(record: DormantEntity) -> List[Tuple[str, Dict[str, Any]]]:
+    """Plain-data form of a record: (component name, {field: value}) pairs.
+
+    Components whose type is not registered are left out.
+    """
+    return [
+        (component_type.__name__, {f.name: value for f, value in zip(fields(component_type), values)})
+        for component_type, values in record.components
+        if get_component_class(component_type.__name__) is component_type
+    ]
+
+
+def dormant_from_data(data: List[Tuple[str, Dict[str, Any]]]) -> DormantEntity:
+    """Rebuild a record from dormant_to_data() output.
+
+    Fields missing from the data get their defaults; components that are
+    no longer registered, or lack a field without default, are dropped.
+    """
+    components = []
+    for name, values in data:
+        component_type = get_component_class(name)
+        if component_type is None:
+            logger.warning(f"Dormant component {name} is not registered; dropping it")
+            continue
+        row = []
+        for f in fields(component_type):
+            if f.name in values:
+                row.append(values[f.name])
+            elif f.default is not MISSING:
+                row.append(f.default)
+            elif f.default_factory is not MISSING:
+                row.append(f.default_factory())
+            else:
+                logger.warning(f"Dormant {name} lacks required field {f.name}; dropping it")
+                break
+        else:
+            components.append((component_type, tuple(row)))
+    return DormantEntity(tuple(components))
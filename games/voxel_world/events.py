@@ -0,0 +1,39 @@
+"""
+Event types published by voxel_world systems.
+
+Declaring them gives these names typed, slotted payloads with declared
+defaults, so a publish builds no per-event dict and a handler reading a
+field the publisher left out gets its default (see engine.ecs.events).
+Imported by the systems that publish them.
+"""
+from dataclasses import dataclass
+from typing import Any
+
+from engine.ecs.events import Event, register_event_type
+
+
+@register_event_type("attack_started")
+@dataclass(slots=True)
+class AttackStarted(Event):
+    entity_id: Any = None
+
+
+@register_event_type("attack_hit")
+@dataclass(slots=True)
+class AttackHit(Event):
+    attacker_id: Any = None
+    target_id: Any = None
+    damage: float = 0.0
+
+
+@register_event_type("on_attack_input")
+@dataclass(slots=True)
+class AttackInput(Event):
+    entity_id: Any = None
+
+
+@register_event_type("entity_death")
+@dataclass(slots=True)
+class EntityDeath(Event):
+    entity_id: Any = None
+    position: Any = None
@@ -1,6 +1,7 @@
 """Combat system with attack execution, hit detection, and momentum damage."""
 
 from engine.ecs.system import System
+from games.voxel_world import events  # Declares the event types published here
 from engine.components.core import Transform, Health, CombatState
 from engine.physics import KinematicState
 from engine.input.keybindings import InputAction
@@ -190,19 +191,19 @@ class CombatSystem(System):
         Returns:
             Set of entity IDs in range
         """
+        # Spatial index: only entities in nearby cells are tested
+        spatial = self.world.get_system_by_type("SpatialIndexSystem")
+        if spatial is not None:
+            return set(spatial.query_radius(attacker_pos, range, Transform, exclude=attacker_id))
+        
         entities_in_range = set()
         
         # Check all entities with Transform
-        for entity_id in self.world.get_entities_with(Transform):
+        for entity_id, transform in self.world.query(Transform):
             # Skip self
             if entity_id == attacker_id:
                 continue
             
-            # Get entity position
-            transform = self.world.get_component(entity_id, Transform)
-            if not transform:
-                continue
-            
             # Calculate distance
             distance = (transform.position - attacker_pos).length()
             
@@ -127,7 +127,7 @@ class DodgeSystem(System):
                               entity_id=entity_id,
                               timing_quality=timing_quality)
     
-    def _calculate_timing_quality(self, entity_id: str) -> str:
+    def _calculate_timing_quality(self, entity_id: int) -> str:
         """Calculate timing quality based on incoming attacks.
         
         TODO: Implement actual timing detection based on enemy attack windups.
@@ -157,7 +157,7 @@ class DodgeSystem(System):
             "failed": self.FAILED_COST
         }.get(quality, self.FAILED_COST)
     
-    def _apply_dodge_movement(self, entity_id: str):
+    def _apply_dodge_movement(self, entity_id: int):
         """Apply directional dodge roll movement using direct position impulse.
         
         Instead of setting velocity (which gets overridden), we apply
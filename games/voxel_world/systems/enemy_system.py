@@ -5,9 +5,11 @@ Handles enemy AI behavior and visual representation management.
 """
 
 from engine.ecs.system import System
+from games.voxel_world import events  # Declares the event types published here
 from engine.components.core import Transform, Health, CombatState
 from engine.components.enemy import EnemyComponent
 from engine.physics import KinematicState
+from engine.systems.simulation_lod import SimTier
 from engine.rendering.enemy_visual import EnemyVisual
 from engine.core.logger import get_logger
 from panda3d.core import LVector3f
@@ -19,59 +21,90 @@ logger = get_logger(__name__)
 class EnemySystem(System):
     """
     Manages enemies:
-    1. AI Logic (State Machine)
-    2. Visual Representation (VoxelAvatar)
+    1. AI Logic (State Machine), at tick_rate
+    2. Visual Representation (VoxelAvatar), every frame for nearby enemies
+       and on AI ticks for reduced-tier ones
     """
     
+    tick_rate = 10.0
+    
     def __init__(self, world, event_bus, game):
         super().__init__(world, event_bus)
         self.game = game
         self.visuals = {}  # entity_id -> EnemyVisual
         
-        # Subscribe to death to clean up visuals
+        # Subscribe to death and chunk unloads to clean up visuals
         self.event_bus.subscribe("entity_death", self.on_entity_death)
+        self.event_bus.subscribe("entity_unloaded", self.on_entity_death)
+        self.event_bus.subscribe("world_restored", self.on_world_restored)
         
     def on_entity_death(self, event):
-        """Clean up visual when enemy dies."""
+        """Clean up visual when enemy dies or its chunk unloads."""
         entity_id = event.entity_id
         if entity_id in self.visuals:
             self.visuals[entity_id].destroy()
             del self.visuals[entity_id]
             
-    def update(self, dt: float):
-        """Update AI and Visuals."""
+    def on_world_restored(self, event):
+        """Drop visuals of enemies missing from a loaded snapshot (the rest are recreated lazily)."""
+        for entity_id in [e for e in self.visuals if not self.world.is_alive(e)]:
+            self.visuals.pop(entity_id).destroy()
+            
+    def frame_update(self, dt: float):
+        """Sync and animate nearby visuals every frame; AI runs at tick_rate in update()."""
+        player_pos = self._get_player_position()
         
-        # 1. Get player position for AI
-        player_pos = None
-        player_id = self.world.get_entity_by_tag("player")
-        if player_id:
-            pt = self.world.get_component(player_id, Transform)
-            if pt:
-                player_pos = pt.position
+        # Camera position drives visual LOD
+        camera_pos = self._get_camera_position()
+        
+        # PhysicsSystem moves enemies; visuals follow its interpolated positions
+        physics = self.world.get_system_by_type("PhysicsSystem")
+        
+        # Distance tiers: frozen enemies are skipped, reduced ones sync on AI ticks
+        lod = self.world.get_system_by_type("SimulationLODSystem")
+        frozen = lod.frozen if lod is not None else ()
+        
+        for entity_id, enemy, transform, health in self.world.query(EnemyComponent, Transform, Health):
+            if entity_id in frozen:
+                continue
+            
+            visual = self.visuals.get(entity_id)
+            if visual is None:
+                visual = self._create_visual(entity_id, enemy, transform)
+            elif lod is not None and lod.get_tier(entity_id) != SimTier.FULL:
+                continue
+            
+            self._sync_visual(entity_id, enemy, transform, visual, player_pos, physics)
+            if camera_pos is not None:
+                self._animate(entity_id, visual, transform, camera_pos, dt)
+    
+    def update(self, dt: float):
+        """Update AI (tick_rate times per second)."""
+        player_pos = self._get_player_position()
+        camera_pos = self._get_camera_position()
+        physics = self.world.get_system_by_type("PhysicsSystem")
         
-        # 2. Process all enemies
-        enemies = self.world.get_entities_with(EnemyComponent, Transform, Health)
+        # Distance tiers: far enemies tick at a reduced rate or not at all
+        lod = self.world.get_system_by_type("SimulationLODSystem")
+        frozen = lod.frozen if lod is not None else ()
         
-        for entity_id in enemies:
-            enemy = self.world.get_component(entity_id, EnemyComponent)
-            transform = self.world.get_component(entity_id, Transform)
-            health = self.world.get_component(entity_id, Health)
+        for entity_id, enemy, transform, health in self.world.query(EnemyComponent, Transform, Health):
+            if entity_id in frozen:
+                continue
+            # Time since this enemy's last tick (catches up timers after a skip)
+            step_dt = lod.tick(entity_id, dt) if lod is not None else dt
+            if step_dt is None:
+                continue
+            
             kinematic = self.world.get_component(entity_id, KinematicState) # Optional?
             combat = self.world.get_component(entity_id, CombatState)
             
-            # --- Visual Management ---
-            if entity_id not in self.visuals:
-                # Create visual
-                self._create_visual(entity_id, enemy, transform)
-            
-            # Sync visual transform
-            if entity_id in self.visuals:
-                visual = self.visuals[entity_id]
-                visual.root.setPos(transform.position)
-                # Sync rotation? For now, look at target or just simple rotation
-                if enemy.ai_state != "idle" and player_pos:
-                    visual.root.lookAt(player_pos)
-                    # Constrain pitch needed? VoxelAvatar might handle it
+            # Reduced-tier visuals sync and animate on these ticks rather than every frame
+            visual = self.visuals.get(entity_id)
+            if visual is not None and lod is not None and lod.get_tier(entity_id) == SimTier.REDUCED:
+                self._sync_visual(entity_id, enemy, transform, visual, player_pos, physics)
+                if camera_pos is not None:
+                    self._animate(entity_id, visual, transform, camera_pos, step_dt)
             
             # --- AI Logic ---
             if not player_pos or health.current <= 0:
@@ -79,8 +112,45 @@ class EnemySystem(System):
                 
             dist_sq = (transform.position - player_pos).length_squared()
             
-            self._update_ai(dt, entity_id, enemy, transform, player_pos, dist_sq, combat)
+            self._update_ai(step_dt, entity_id, enemy, transform, player_pos, dist_sq, combat, kinematic)
+    
+    def _sync_visual(self, entity_id, enemy, transform, visual, player_pos, physics):
+        """Move a visual to its enemy and face the player while engaged."""
+        render_pos = physics.get_render_position(entity_id) if physics else None
+        if render_pos is not None:
+            visual.root.setPos(*render_pos)
+        else:
+            visual.root.setPos(transform.position)
+        # Sync rotation? For now, look at target or just simple rotation
+        if enemy.ai_state != "idle" and player_pos:
+            visual.root.lookAt(player_pos)
+            # Constrain pitch needed? VoxelAvatar might handle it
+    
+    def _animate(self, entity_id, visual, transform, camera_pos, dt):
+        """Advance a visual's animation and LOD."""
+        kinematic = self.world.get_component(entity_id, KinematicState)
+        speed = 0.0
+        if kinematic:
+            speed = (kinematic.velocity_x ** 2 + kinematic.velocity_y ** 2) ** 0.5
+        visual.update_lod((transform.position - camera_pos).length(), dt, speed)
+    
+    def _get_player_position(self):
+        """Get the player's position, or None when there is no player."""
+        player_id = self.world.get_entity_by_tag("player")
+        if player_id:
+            pt = self.world.get_component(player_id, Transform)
+            if pt:
+                return pt.position
+        return None
             
+    def _get_camera_position(self):
+        """Get camera world position, or None when there is no camera."""
+        base = self.game.base
+        camera = getattr(base, 'camera', None)
+        if camera is None:
+            return None
+        return camera.getPos(base.render)
+        
     def _create_visual(self, entity_id, enemy_comp, transform):
         """Instantiate EnemyVisual."""
         # Attach to render via Game instance or similar
@@ -94,8 +164,9 @@ class EnemySystem(System):
         visual = EnemyVisual(node, enemy_comp.enemy_type, enemy_comp.tint_color)
         self.visuals[entity_id] = visual
         logger.debug(f"Created visual for enemy {entity_id} ({enemy_comp.enemy_type})")
+        return visual
         
-    def _update_ai(self, dt, entity_id, enemy, transform, player_pos, dist_sq, combat):
+    def _update_ai(self, dt, entity_id, enemy, transform, player_pos, dist_sq, combat, kinematic=None):
         """Simple State Machine."""
         
         # State transitions
@@ -126,16 +197,13 @@ class EnemySystem(System):
                 # Ideally use Physics system. For now, manual/transform update
                 # But Collision system handles physics.
                 # So we should set velocity on KinematicState
-                kinematic = self.world.get_component(entity_id, KinematicState)
                 if kinematic:
                     # Update velocity in component; PhysicsSystem will move it
                     # Note: PhysicsSystem runs separately.
                     from engine.physics.kinematic import KinematicState
                     # We can't edit component in place if it's a dataclass frozen? No they aren't frozen
+                    # Planar velocity only; velocity_z belongs to gravity (Z is up)
                     kinematic.velocity_x = direction.x * speed
-                    kinematic.velocity_z = direction.y * speed # Z is Y in panda logic for 2D velocity?
-                                                        # Pandas Z is Up. Input usually X/Y.
-                                                        # KinematicState uses x, y, z.
                     kinematic.velocity_y = direction.y * speed
                     
                     # Update transform to face movement
@@ -143,7 +211,6 @@ class EnemySystem(System):
                 
         elif enemy.ai_state == "windup":
             # Stop moving
-            kinematic = self.world.get_component(entity_id, KinematicState)
             if kinematic:
                 kinematic.velocity_x = 0
                 kinematic.velocity_y = 0
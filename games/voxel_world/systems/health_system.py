@@ -5,6 +5,7 @@ Handles damage application and death events.
 """
 
 from engine.ecs.system import System
+from games.voxel_world import events  # Declares the event types published here
 from engine.components.core import Health, Transform
 from engine.core.logger import get_logger
 
@@ -34,7 +35,7 @@ class HealthSystem(System):
         if health.current <= 0:
             self.die(target_id)
             
-    def die(self, entity_id: str):
+    def die(self, entity_id: int):
         """Handle entity death."""
         logger.info(f"💀 Entity {entity_id} died.")
         
@@ -17,6 +17,8 @@ from direct.showbase.ShowBase import ShowBase
 class LootSystem(System):
     """Manages loot drops and pickups."""
     
+    tick_rate = 5.0  # Pickup checks; visuals animate every frame in frame_update()
+    
     def __init__(self, world, event_bus):
         super().__init__(world, event_bus)
         self.visuals = {}  # entity_id -> PickupVisual
@@ -24,6 +26,7 @@ class LootSystem(System):
         
     def initialize(self):
         self.event_bus.subscribe("entity_death", self.on_entity_death)
+        self.event_bus.subscribe("world_restored", self.on_world_restored)
         
         # Try to find base for rendering
         try:
@@ -51,6 +54,13 @@ class LootSystem(System):
         # Convert position to LVector3f if it isn't already (event might pass tuple or Vec3)
         pos_vec = LVector3f(position[0], position[1], position[2]) if hasattr(position, '__getitem__') else position
         
+        # Drop onto the terrain surface if the death happened in mid-air
+        chunk_manager = self.world.get_system_by_type("ChunkManager")
+        if chunk_manager is not None:
+            surface = chunk_manager.get_surface_height(pos_vec.x, pos_vec.y)
+            if surface is not None and surface < pos_vec.z:
+                pos_vec = LVector3f(pos_vec.x, pos_vec.y, surface)
+        
         self.world.add_component(entity, Transform(position=pos_vec))
         
         # Loot metadata
@@ -66,44 +76,59 @@ class LootSystem(System):
              self.world.add_component(entity, AvatarColors(body_color=color_def.rgba))
              
         # Create Visual (if rendering is available)
-        if self.base:
-            try:
-                visual = PickupVisual(self.base.render, color_name)
-                visual.root.setPos(pos_vec)
-                self.visuals[entity] = visual
-            except Exception as e:
-                print(f"Failed to create pickup visual: {e}")
+        self._create_visual(entity, color_name, pos_vec)
              
         # print(f"🎁 Spawned {color_name} swatch at {position}")
 
-    def update(self, dt: float):
-        """Check for pickups and animate."""
-        # Animate visuals
+    def _create_visual(self, entity_id, color_name, position):
+        """Create the swatch visual of a pickup (if rendering is available)."""
+        if not self.base:
+            return
+        try:
+            visual = PickupVisual(self.base.render, color_name)
+            visual.root.setPos(position)
+            self.visuals[entity_id] = visual
+        except Exception as e:
+            print(f"Failed to create pickup visual: {e}")
+
+    def on_world_restored(self, event):
+        """Match pickup visuals to the entities of a loaded snapshot."""
+        for entity_id in [e for e in self.visuals if not self.world.is_alive(e)]:
+            self.visuals.pop(entity_id).destroy()
+        for entity_id, pickup, transform in self.world.query(PickupComponent, Transform):
+            if entity_id not in self.visuals and pickup.color_name:
+                self._create_visual(entity_id, pickup.color_name, transform.position)
+
+    def frame_update(self, dt: float):
+        """Animate pickup visuals."""
         for visual in self.visuals.values():
             visual.update(dt)
+    
+    def update(self, dt: float):
+        """Check for pickups within reach of the player."""
+        player_id = self.world.get_entity_by_tag("player")
+        p_colors = self.world.get_component(player_id, AvatarColors) if player_id else None
+        p_transform = self.world.get_component(player_id, Transform) if player_id else None
+        if p_colors is None or p_transform is None:
+            return
         
-        # Naive O(N^2) pickup check (Player vs All Pickups)
-        # In production, use spatial partition or physics events
-        
-        players = self.world.get_entities_with(AvatarColors, Transform) # Assume players have these
-        pickups = self.world.get_entities_with(PickupComponent, Transform)
+        # Spatial index: only pickups within the largest pickup radius are tested.
+        # Without it: every pickup.
+        spatial = self.world.get_system_by_type("SpatialIndexSystem")
+        if spatial is not None:
+            reach = max((pickup.pickup_radius for _, pickup in self.world.query(PickupComponent)), default=0.0)
+            candidates = [
+                (pickup_id, self.world.get_component(pickup_id, PickupComponent),
+                 self.world.get_component(pickup_id, Transform))
+                for pickup_id in spatial.query_radius(p_transform.position, reach, PickupComponent, Transform)
+            ]
+        else:
+            candidates = self.world.query(PickupComponent, Transform).rows()
         
-        for p_id in players:
-            # Check tag to be sure it's a player?
-            # Ideally we'd have a PlayerComponent, but checking against main player tag works for now
-            if self.world.get_entity_by_tag("player") != p_id:
-                continue
-                
-            p_transform = self.world.get_component(p_id, Transform)
-            p_colors = self.world.get_component(p_id, AvatarColors)
-            
-            for pickup_id in pickups:
-                pickup = self.world.get_component(pickup_id, PickupComponent)
-                t_transform = self.world.get_component(pickup_id, Transform)
-                
-                dist = (p_transform.position - t_transform.position).length()
-                if dist <= pickup.pickup_radius:
-                    self.collect_pickup(p_id, p_colors, pickup_id, pickup)
+        for pickup_id, pickup, t_transform in candidates:
+            dist = (p_transform.position - t_transform.position).length()
+            if dist <= pickup.pickup_radius:
+                self.collect_pickup(player_id, p_colors, pickup_id, pickup)
 
     def collect_pickup(self, player_id, player_colors, pickup_id, pickup):
         """Process collection."""
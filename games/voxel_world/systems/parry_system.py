@@ -202,7 +202,7 @@ class ParrySystem(System):
             LVector3f(transform.position)
         )
     
-    def _calculate_timing_quality(self, entity_id: str) -> str:
+    def _calculate_timing_quality(self, entity_id: int) -> str:
         """Calculate timing quality based on incoming attacks.
         
         Checks for nearby incoming attacks and calculates timing quality
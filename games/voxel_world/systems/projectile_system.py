@@ -4,6 +4,7 @@ Projectile System.
 Handles movement, collision, and impact of color projectiles.
 """
 
+from engine.ecs.component import acquire_component, release_component
 from engine.ecs.system import System
 from engine.components.core import Transform, Health
 from engine.components.projectile import ColorProjectileComponent
@@ -17,6 +18,9 @@ from direct.showbase.ShowBase import ShowBase
 class ProjectileSystem(System):
     """Manages moving projectiles."""
     
+    # Target radius 0.5 (player width) + projectile radius 0.2
+    HIT_RADIUS = 0.7
+    
     def __init__(self, world, event_bus, game):
         super().__init__(world, event_bus)
         self.game = game
@@ -28,6 +32,7 @@ class ProjectileSystem(System):
         self.particle_system = VoxelParticleSystem(game.render, max_particles=200) if game else None
             
         self.event_bus.subscribe("spawn_projectile", self.on_spawn_projectile)
+        self.event_bus.subscribe("world_restored", self.on_world_restored)
             
     def on_spawn_projectile(self, event):
         """Handle request to spawn projectile."""
@@ -36,8 +41,10 @@ class ProjectileSystem(System):
         
         start_pos = event.position
         
+        # Pooled: reuses instances this system released (see update())
         self.world.add_component(entity, Transform(position=start_pos))
-        self.world.add_component(entity, ColorProjectileComponent(
+        self.world.add_component(entity, acquire_component(
+            ColorProjectileComponent,
             color_name=event.color_name,
             owner_id=event.owner_id,
             velocity=event.velocity
@@ -56,20 +63,29 @@ class ProjectileSystem(System):
         self.visuals[entity_id] = visual
         print(f"Created visual for projectile at {pos}")
             
+    def on_world_restored(self, event):
+        """Match projectile visuals to the entities of a loaded snapshot."""
+        for entity_id in [e for e in self.visuals if not self.world.is_alive(e)]:
+            self.visuals.pop(entity_id).destroy()
+        if self.base:
+            for entity_id, proj, transform in self.world.query(ColorProjectileComponent, Transform):
+                if entity_id not in self.visuals:
+                    self._create_visual(entity_id, proj.color_name, transform.position)
+            
     def update(self, dt: float):
         """Update physics and collision."""
         
-        projectiles = self.world.get_entities_with(ColorProjectileComponent, Transform)
+        projectiles = self.world.query(ColorProjectileComponent, Transform)
         
         entities_to_destroy = []
         
-        # For collision check
-        potential_targets = self.world.get_entities_with(Transform, AvatarColors)
+        # For collision check: nearby targets from the spatial index, or every
+        # target (transforms fetched once, not per projectile) without it
+        spatial = self.world.get_system_by_type("SpatialIndexSystem")
+        potential_targets = self.world.query(Transform, AvatarColors).rows() if spatial is None else None
+        chunk_manager = self.world.get_system_by_type("ChunkManager")
         
-        for p_id in projectiles:
-            proj = self.world.get_component(p_id, ColorProjectileComponent)
-            transform = self.world.get_component(p_id, Transform)
-            
+        for p_id, proj, transform in projectiles:
             # Update Lifetime
             proj.lifetime -= dt
             if proj.lifetime <= 0:
@@ -82,20 +98,14 @@ class ProjectileSystem(System):
             step = proj.velocity * dt
             new_pos = transform.position + step
             
-            # Simple ground collision
-            # Terrain check? Query terrain system?
-            # For now, floor is at Y=0 (Panda Z=0?) actually camp floor is Y+1.
-            # Terrain height can be queried if we have access.
+            # Ground collision against the column-top heightmap of loaded chunks.
+            # Only crossing the surface from above counts, so projectiles under
+            # an overhang keep flying. Floor is Z=0 when no chunk data is available.
             terrain_height = 0 # Default floor
-            
-            # Using LootSystem's approach, Y is up? No, in standard MyCraft code:
-            # VoxelWorldGenerator: grid[(x, h, z)] = block. 
-            # Panda defaults: Z is up, Y is depth.
-            # My Code: Transform(position=Vector3).
-            # Usually we treat Y as Up in voxel worlds (Minecraft style), but Panda renders Z-up.
-            # Codebase check: `blocks[(x, y, z)]` in generator.
-            # `MeshBuilder`: `v0 = LVector3f(world_x, world_z, y + 1)` (Z is Panda Up)
-            # So Y in voxel grid = Z in world.
+            if chunk_manager is not None:
+                surface = chunk_manager.get_surface_height(new_pos.x, new_pos.y)
+                if surface is not None and transform.position.z >= surface:
+                    terrain_height = surface
             
             if new_pos.z < terrain_height:
                  # Hit ground - emit splat particles
@@ -109,6 +119,8 @@ class ProjectileSystem(System):
                  
             # Update Transform
             transform.position = new_pos
+            if spatial is not None:
+                spatial.move(p_id, new_pos)
             
             # Update Visual
             if p_id in self.visuals:
@@ -120,25 +132,24 @@ class ProjectileSystem(System):
                     vis.setPos(new_pos)
             
             # Collision Check vs Players/Enemies
-            for t_id in potential_targets:
+            if spatial is not None:
+                hit = spatial.nearest(new_pos, 1, AvatarColors, max_distance=self.HIT_RADIUS, exclude=proj.owner_id)
+                if hit:
+                    self._hit(hit[0], proj.color_name, new_pos)
+                    entities_to_destroy.append(p_id)
+                continue
+            for t_id, target_transform, _colors in potential_targets:
                 if t_id == proj.owner_id:
                     continue
                     
-                target_pos = self.world.get_component(t_id, Transform).position
+                target_pos = target_transform.position
                 dist_sq = (target_pos - new_pos).length_squared()
                 
                 # print(f"DEBUG: PPos: {new_pos}, TPos: {target_pos}, DistSq: {dist_sq}")
                 
                 # Simple sphere-sphere (radius + radius)
-                # Assume target radius 0.5 (player width) + proj radius 0.2
-                if dist_sq < (0.7 * 0.7):
-                    # Hit! Emit splat particles
-                    if self.particle_system:
-                        color_def = ColorPalette.get_color(proj.color_name)
-                        if color_def:
-                            r, g, b, a = color_def.rgba
-                            create_color_splat(self.particle_system, new_pos, LVector4f(r, g, b, 1.0))
-                    self._on_hit(t_id, proj.color_name)
+                if dist_sq < self.HIT_RADIUS * self.HIT_RADIUS:
+                    self._hit(t_id, proj.color_name, new_pos)
                     entities_to_destroy.append(p_id)
                     break
                     
@@ -150,12 +161,25 @@ class ProjectileSystem(System):
                 else:
                     vis.removeNode()
                 del self.visuals[p_id]
+            proj = self.world.get_component(p_id, ColorProjectileComponent)
             self.world.destroy_entity(p_id)
+            # Only this system keeps projectile components, so the instance is free
+            if proj is not None:
+                release_component(proj)
         
         # Update particle system
         if self.particle_system:
             self.particle_system.update(dt)
             
+    def _hit(self, target_id, color_name, position):
+        """Emit splat particles at the impact and paint the target."""
+        if self.particle_system:
+            color_def = ColorPalette.get_color(color_name)
+            if color_def:
+                r, g, b, a = color_def.rgba
+                create_color_splat(self.particle_system, position, LVector4f(r, g, b, 1.0))
+        self._on_hit(target_id, color_name)
+        
     def _on_hit(self, target_id, color_name):
         """Apply paint effect."""
         colors = self.world.get_component(target_id, AvatarColors)
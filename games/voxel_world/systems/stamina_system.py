@@ -12,14 +12,17 @@ class StaminaSystem(System):
     mechanics (sprint, climb, swim, vault).
     """
     
+    reads = frozenset({Stamina})
+    writes = frozenset({Stamina})
+    parallel_safe = True
+    
     def update(self, dt: float):
         """Update stamina regeneration for all entities with Stamina component.
         
         Args:
             dt: Delta time in seconds
         """
-        for entity_id in self.world.get_entities_with(Stamina):
-            stamina = self.world.get_component(entity_id, Stamina)
+        for entity_id, stamina in self.world.query(Stamina):
             
             # Only regenerate if below max
             if stamina.current < stamina.max_stamina:
@@ -269,13 +269,16 @@ def create_terrain_system(world, event_bus, base, texture_atlas=None, seed=0):
         ChunkManager configured for voxel_world
     """
     from engine.world.chunk_manager import ChunkManager
+    from engine.rendering.mesh_cache import MeshCache
     
     generator = VoxelWorldGenerator(seed=seed)
     
     # Get config if available
     complex_water = False
+    mesh_cache_dir = None
     if hasattr(base, 'config_manager'):
         complex_water = base.config_manager.get('complex_water', False)
+        mesh_cache_dir = base.config_manager.get('mesh_cache_dir', None)
     
     return ChunkManager(
         world=world,
@@ -288,7 +291,8 @@ def create_terrain_system(world, event_bus, base, texture_atlas=None, seed=0):
         unload_radius=8,
         max_chunks_per_frame=3,
         sea_level=0,
-        complex_water=complex_water
+        complex_water=complex_water,
+        mesh_cache=MeshCache(cache_dir=mesh_cache_dir)
     )
 
 
@@ -0,0 +1,44 @@
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from panda3d.core import LVector3f
+
+from engine.components.core import CombatState, Health, Transform
+from engine.components.enemy import EnemyComponent
+from engine.ecs.snapshot import load_snapshot, save_snapshot
+from engine.ecs.world import World
+from engine.physics.kinematic import KinematicState
+
+ENTITY_COUNT = 10_000
+
+def make_world():
+    """World with 10k entities: half players-like, half enemies."""
+    world = World()
+    for i in range(ENTITY_COUNT):
+        entity = world.create_entity()
+        world.add_component(entity, Transform(position=LVector3f(i * 0.5, 2.0, 64.0)))
+        world.add_component(entity, Health(current=i % 100))
+        world.add_component(entity, KinematicState(velocity_x=float(i % 7)))
+        if i % 2:
+            world.add_component(entity, EnemyComponent(enemy_type="zombie", tint_color="red"))
+            world.add_component(entity, CombatState())
+    return world
+
+def test_snapshot_save_benchmark(benchmark):
+    """Benchmark writing a 10k entity world."""
+    world = make_world()
+
+    data = benchmark(save_snapshot, world)
+
+    assert data
+
+def test_snapshot_load_benchmark(benchmark):
+    """Benchmark restoring a 10k entity world."""
+    data = save_snapshot(make_world())
+    world = World()
+
+    count = benchmark(load_snapshot, world, data)
+
+    assert count == ENTITY_COUNT
@@ -0,0 +1,85 @@
+import unittest
+from dataclasses import dataclass
+
+from engine.ecs.component import Component
+from engine.ecs.world import World
+
+
+@dataclass
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass
+class Velocity(Component):
+    dx: float = 0.0
+
+
+@dataclass
+class Tag(Component):
+    pass
+
+
+class TestArchetypeStorage(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+
+    def spawn(self, *components):
+        entity = self.world.create_entity()
+        for component in components:
+            self.world.add_component(entity, component)
+        return entity
+
+    def test_entities_with_same_components_share_a_table(self):
+        a = self.spawn(Position(1.0), Velocity(2.0))
+        b = self.spawn(Velocity(3.0), Position(4.0))
+        c = self.spawn(Position(5.0))
+
+        self.assertIs(self.world._entities[a][0], self.world._entities[b][0])
+        self.assertIsNot(self.world._entities[a][0], self.world._entities[c][0])
+        self.assertEqual(self.world.get_entities_with(Position), {a, b, c})
+        self.assertEqual(self.world.get_entities_with(Position, Velocity), {a, b})
+        self.assertEqual(self.world.get_entities_with(Tag), set())
+
+    def test_query_returns_components_in_requested_order(self):
+        a = self.spawn(Position(1.0), Velocity(2.0))
+        self.spawn(Position(5.0))
+
+        query = self.world.query(Velocity, Position)
+
+        self.assertEqual(len(query), 1)
+        entity, velocity, position = query.rows()[0]
+        self.assertEqual((entity, velocity.dx, position.x), (a, 2.0, 1.0))
+
+    def test_moves_and_removals_keep_rows_consistent(self):
+        a = self.spawn(Position(1.0))
+        b = self.spawn(Position(2.0))
+        c = self.spawn(Position(3.0))
+
+        self.world.add_component(a, Velocity(9.0))  # a leaves the middle of the table
+        self.world.destroy_entity(b)
+        self.world.remove_component(a, Velocity)
+        self.world.add_component(c, Position(30.0))  # Same type: replaced in place
+
+        self.assertEqual(self.world.get_component(a, Position).x, 1.0)
+        self.assertIsNone(self.world.get_component(a, Velocity))
+        self.assertEqual(self.world.get_component(c, Position).x, 30.0)
+        self.assertIsNone(self.world.get_component(b, Position))
+        self.assertEqual({e: p.x for e, p in self.world.query(Position)}, {a: 1.0, c: 30.0})
+        self.assertEqual(self.world.get_components(a), {Position: Position(1.0)})
+
+    def test_query_snapshot_survives_destruction_during_iteration(self):
+        entities = [self.spawn(Position(float(i))) for i in range(5)]
+
+        seen = []
+        for entity, position in self.world.query(Position):
+            seen.append(entity)
+            for other in entities:
+                self.world.destroy_entity(other)
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(self.world.get_entities_with(Position), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
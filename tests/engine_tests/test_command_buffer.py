@@ -0,0 +1,108 @@
+import unittest
+from dataclasses import dataclass
+
+from engine.ecs.component import Component
+from engine.ecs.system import System
+from engine.ecs.world import World
+
+
+@dataclass
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass
+class Lifetime(Component):
+    frames: int = 1
+
+
+class ChurnSystem(System):
+    """Destroys expired entities and creates replacements while iterating."""
+
+    def __init__(self, world, event_bus, per_frame):
+        super().__init__(world, event_bus)
+        self.per_frame = per_frame
+
+    def update(self, dt):
+        for entity_id, lifetime in self.world.query(Lifetime):
+            lifetime.frames -= 1
+            if lifetime.frames <= 0:
+                self.world.commands.destroy_entity(entity_id)
+        for i in range(self.per_frame):
+            self.world.commands.create_entity(Position(float(i)), Lifetime(1))
+
+
+class CountingSystem(System):
+    """Records how many entities it sees when it runs."""
+
+    def __init__(self, world, event_bus):
+        super().__init__(world, event_bus)
+        self.seen = []
+
+    def update(self, dt):
+        self.seen.append(len(self.world.query(Lifetime)))
+
+
+class TestCommandBuffer(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+
+    def test_commands_are_deferred_until_flush(self):
+        entity = self.world.create_entity()
+        new_id = self.world.commands.create_entity(Position(1.0), tag="chest")
+        self.world.commands.add_component(entity, Position(2.0))
+        self.world.commands.destroy_entity(entity)
+
+        self.assertFalse(self.world.is_alive(new_id))
+        self.assertTrue(self.world.is_alive(entity))
+        self.assertEqual(len(self.world.commands), 3)
+
+        self.assertEqual(self.world.commands.flush(), 3)
+
+        self.assertEqual(self.world.get_entity_by_tag("chest"), new_id)
+        self.assertEqual(self.world.get_component(new_id, Position).x, 1.0)
+        self.assertFalse(self.world.is_alive(entity))
+        self.assertEqual(len(self.world.commands), 0)
+
+    def test_commands_on_destroyed_entities_are_dropped(self):
+        entity = self.world.create_entity()
+        self.world.commands.destroy_entity(entity)
+        self.world.commands.destroy_entity(entity)
+        self.world.commands.add_component(entity, Position())
+        self.world.commands.flush()
+
+        replacement = self.world.create_entity()  # Reuses the slot
+        self.assertFalse(self.world.is_alive(entity))
+        self.assertTrue(self.world.is_alive(replacement))
+        self.assertFalse(self.world.has_component(replacement, Position))
+
+    def test_immediate_mode_applies_commands_at_once(self):
+        world = World(immediate_commands=True)
+        entity = world.commands.create_entity(Position(3.0))
+
+        self.assertEqual(world.get_component(entity, Position).x, 3.0)
+        world.commands.remove_component(entity, Position)
+        self.assertFalse(world.has_component(entity, Position))
+        world.commands.destroy_entity(entity)
+        self.assertFalse(world.is_alive(entity))
+
+    def test_thousands_of_creates_and_destroys_per_frame(self):
+        per_frame = 5000
+        churn = ChurnSystem(self.world, self.world.event_bus, per_frame)
+        counter = CountingSystem(self.world, self.world.event_bus)
+        self.world.add_system(churn)
+        self.world.add_system(counter)
+
+        for _ in range(10):
+            self.world.update(0.016)
+
+        # Each frame's creates are flushed before the next system runs,
+        # and the previous frame's entities are gone
+        self.assertEqual(counter.seen, [per_frame] * 10)
+        self.assertEqual(len(self.world._entities), per_frame)
+        # Destroyed slots are recycled: only two frames' worth were ever allocated
+        self.assertLessEqual(len(self.world._generations), 2 * per_frame + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from dataclasses import dataclass, field
+from typing import List
+
+from engine.components.core import CombatState, Health, Transform
+from engine.components.projectile import ColorProjectileComponent
+from engine.ecs.component import (
+    Component, acquire_component, get_component_class, get_component_pool, pooled_component, register_component,
+    release_component
+)
+from engine.ecs.world import World
+from engine.physics.kinematic import KinematicState
+
+
+@register_component
+@pooled_component(max_size=2)
+@dataclass(slots=True)
+class Shard(Component):
+    speed: float = 1.0
+    hits: List[int] = field(default_factory=list)
+
+
+class TestComponentPools(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+        get_component_pool(Shard).free.clear()
+
+    def spawn_shard(self, **values):
+        entity = self.world.create_entity()
+        self.world.add_component(entity, acquire_component(Shard, **values))
+        return entity
+
+    def destroy_shard(self, entity):
+        shard = self.world.get_component(entity, Shard)
+        self.world.destroy_entity(entity)
+        release_component(shard)
+
+    def test_hot_components_are_slotted(self):
+        for component in (Transform(), Health(), CombatState(), KinematicState(), ColorProjectileComponent()):
+            self.assertFalse(hasattr(component, "__dict__"), type(component).__name__)
+        self.assertIs(get_component_class("Transform"), Transform)
+        self.assertIs(get_component_class("Shard"), Shard)
+
+    def test_released_components_are_reused_with_fresh_defaults(self):
+        first = self.spawn_shard(speed=5.0)
+        shard = self.world.get_component(first, Shard)
+        shard.hits.append(3)
+        self.destroy_shard(first)
+
+        second = self.spawn_shard()
+        reused = self.world.get_component(second, Shard)
+
+        self.assertIs(reused, shard)
+        self.assertEqual(reused.speed, 1.0)
+        self.assertEqual(reused.hits, [])
+
+    def test_only_explicit_releases_are_pooled(self):
+        entity = self.spawn_shard()
+        kept = self.world.get_component(entity, Shard)
+        self.world.destroy_entity(entity)
+
+        self.assertEqual(get_component_pool(Shard).free, [])
+        self.assertIsNot(acquire_component(Shard), kept)
+        self.assertIsNone(get_component_pool(Transform))
+        release_component(Health())  # Not pooled: ignored
+
+    def test_pool_size_is_capped(self):
+        entities = [self.spawn_shard() for _ in range(4)]
+        for entity in entities:
+            self.destroy_shard(entity)
+
+        self.assertEqual(len(get_component_pool(Shard).free), 2)
+        self.assertIsNone(get_component_pool(Health))
+
+
+if __name__ == '__main__':
+    unittest.main()
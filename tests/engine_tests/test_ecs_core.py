@@ -22,8 +22,8 @@ class TestECSCore(unittest.TestCase):
 
     def test_entity_creation(self):
         entity = self.world.create_entity()
-        self.assertIsInstance(entity, str)
-        self.assertTrue(len(entity) > 0)
+        self.assertIsInstance(entity, int)
+        self.assertTrue(entity)  # Never 0, so truthiness checks stay valid
         
     def test_component_assignment(self):
         entity = self.world.create_entity()
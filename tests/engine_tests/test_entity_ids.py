@@ -0,0 +1,66 @@
+import unittest
+from dataclasses import dataclass
+
+from engine.ecs.component import Component
+from engine.ecs.system import System
+from engine.ecs.world import World, entity_generation, entity_index
+
+
+@dataclass
+class Marker(Component):
+    value: int = 0
+
+
+class MovementSystem(System):
+    pass
+
+
+class TestEntityIds(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+
+    def test_destroyed_slots_are_reused_with_a_new_generation(self):
+        first = self.world.create_entity()
+        self.world.add_component(first, Marker(1))
+        self.world.destroy_entity(first)
+
+        second = self.world.create_entity()
+
+        self.assertEqual(entity_index(second), entity_index(first))
+        self.assertEqual(entity_generation(second), entity_generation(first) + 1)
+        self.assertFalse(self.world.is_alive(first))
+        self.assertIsNone(self.world.get_component(first, Marker))
+        self.world.destroy_entity(first)  # Stale handle: no effect on the new occupant
+        self.assertTrue(self.world.is_alive(second))
+
+    def test_ids_are_small_nonzero_ints(self):
+        ids = [self.world.create_entity() for _ in range(3)]
+
+        self.assertTrue(all(isinstance(e, int) and e > 0 for e in ids))
+        self.assertEqual(len(set(ids)), 3)
+
+    def test_tags_are_indexed_both_ways(self):
+        player = self.world.create_entity(tag="player")
+        self.world.register_tag(player, "hero")
+        other = self.world.create_entity()
+        self.world.register_tag(other, "hero")  # Moves the tag
+
+        self.assertEqual(self.world.get_tags(player), {"player"})
+        self.assertEqual(self.world.get_entity_by_tag("hero"), other)
+
+        self.world.destroy_entity(other)
+        self.assertIsNone(self.world.get_entity_by_tag("hero"))
+        self.assertEqual(self.world.get_entity_by_tag("player"), player)
+
+    def test_systems_are_indexed_by_class_name(self):
+        first = MovementSystem(self.world, self.world.event_bus)
+        second = MovementSystem(self.world, self.world.event_bus)
+        self.world.add_system(first)
+        self.world.add_system(second)
+
+        self.assertIs(self.world.get_system_by_type("MovementSystem"), first)
+        self.assertIsNone(self.world.get_system_by_type("MissingSystem"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from dataclasses import dataclass
+
+from engine.ecs.events import Event, EventBus, EventData, get_event_type, register_event_type
+
+
+@register_event_type("test_hit")
+@dataclass(slots=True)
+class Hit(Event):
+    target_id: int = 0
+    damage: float = 1.0
+
+
+class TestEventBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+
+    def test_declared_events_are_slotted(self):
+        seen = []
+        self.bus.subscribe("test_hit", lambda event: seen.append((type(event), event.target_id, event.damage)))
+
+        self.bus.publish("test_hit", target_id=7)
+        self.bus.publish("test_hit", target_id=8, damage=3.0)
+
+        self.assertIs(get_event_type("test_hit"), Hit)
+        self.assertEqual(seen, [(Hit, 7, 1.0), (Hit, 8, 3.0)])
+        self.assertFalse(hasattr(Hit(), "__dict__"))
+
+    def test_kept_events_keep_their_values(self):
+        kept = []
+        self.bus.subscribe("test_hit", kept.append)
+        self.bus.subscribe("test_hit", lambda event: None)
+
+        for target_id in range(1, 4):
+            self.bus.publish("test_hit", target_id=target_id)
+
+        self.assertEqual([event.target_id for event in kept], [1, 2, 3])
+        self.assertEqual(len({id(event) for event in kept}), 3)
+
+    def test_undeclared_names_and_extra_fields_use_event_data(self):
+        seen = []
+        self.bus.subscribe("custom", seen.append)
+        self.bus.subscribe("test_hit", seen.append)
+
+        self.bus.publish("custom", value=5)
+        self.bus.publish("test_hit", target_id=1, critical=True)
+        self.bus.publish("nobody_listens", value=1)
+
+        self.assertIsInstance(seen[0], EventData)
+        self.assertEqual(seen[0].value, 5)
+        self.assertTrue(seen[1].critical)
+        self.assertNotIn("nobody_listens", self.bus._channels)
+
+    def test_queued_handlers_get_one_batch_per_flush(self):
+        batches = []
+        immediate = []
+        self.bus.subscribe("test_hit", lambda events: batches.append([e.target_id for e in events]), queued=True)
+        self.bus.subscribe("test_hit", lambda event: immediate.append(event.target_id))
+
+        for target_id in (1, 2, 3):
+            self.bus.publish("test_hit", target_id=target_id)
+        self.assertEqual(batches, [])
+
+        self.bus.flush()
+        self.bus.flush()
+
+        self.assertEqual(immediate, [1, 2, 3])
+        self.assertEqual(batches, [[1, 2, 3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 from engine.ecs.world import World
 from engine.components.core import Health, Transform, Inventory
-from engine.components.gameplay import Trigger
-from engine.systems.lifecycle import DamageSystem
+from engine.components.gameplay import Spawner, Trigger
+from engine.systems.lifecycle import DamageSystem, SpawnSystem
 from engine.systems.interaction import InventorySystem, TriggerSystem
 from panda3d.core import LVector3f as Vec3
 
@@ -28,6 +28,35 @@ class TestGameplaySystems(unittest.TestCase):
         health = self.world.get_component(entity, Health)
         self.assertEqual(health.current, 90)
 
+    def test_damage_after_death_is_ignored_until_destroyed(self):
+        self.world.add_system(DamageSystem(self.world, self.event_bus))
+        entity = self.world.create_entity()
+        self.world.add_component(entity, Health(current=10, max_hp=100))
+        deaths = []
+        self.event_bus.subscribe("on_entity_death", lambda e: deaths.append(e.entity_id))
+
+        # Both hits land before the deferred destroy is flushed
+        self.event_bus.publish("on_entity_damage", entity_id=entity, amount=20)
+        self.event_bus.publish("on_entity_damage", entity_id=entity, amount=20)
+        self.assertEqual(deaths, [entity])
+        self.assertEqual(self.world.get_component(entity, Health).current, 0)
+
+        self.world.update(0.016)
+        self.assertFalse(self.world.is_alive(entity))
+
+    def test_spawn_event_fires_once_the_entity_exists(self):
+        system = SpawnSystem(self.world, self.event_bus)
+        spawner = self.world.create_entity()
+        self.world.add_component(spawner, Transform(position=Vec3(1, 2, 3)))
+        self.world.add_component(spawner, Spawner(entity_prefab="slime", interval=1.0, max_active=3))
+        alive = []
+        self.event_bus.subscribe("on_entity_spawn", lambda e: alive.append(self.world.is_alive(e.entity_id)))
+
+        system.update(1.5)
+        self.assertEqual(alive, [])
+        self.world.commands.flush()
+        self.assertEqual(alive, [True])
+
     def test_inventory_pickup(self):
         system = InventorySystem(self.world, self.event_bus)
         system.initialize() # Subscribe
@@ -0,0 +1,62 @@
+import unittest
+from dataclasses import dataclass
+
+from engine.ecs.component import Component
+from engine.ecs.world import World
+
+
+@dataclass
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass
+class Velocity(Component):
+    dx: float = 0.0
+
+
+@dataclass
+class Marker(Component):
+    pass
+
+
+class TestQueries(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+
+    def spawn(self, *components):
+        entity = self.world.create_entity()
+        for component in components:
+            self.world.add_component(entity, component)
+        return entity
+
+    def test_query_is_cached_per_type_tuple(self):
+        query = self.world.query(Position, Velocity)
+
+        self.assertIs(self.world.query(Position, Velocity), query)
+        self.assertIsNot(self.world.query(Velocity, Position), query)
+
+    def test_query_tracks_archetypes_created_later(self):
+        query = self.world.query(Position, Velocity)
+        self.assertEqual(list(query), [])
+
+        a = self.spawn(Position(1.0), Velocity(2.0))
+        b = self.spawn(Position(3.0), Velocity(4.0), Marker())
+        self.spawn(Position(5.0))
+
+        self.assertEqual(len(query.archetypes), 2)
+        self.assertEqual(sorted(query.entity_ids()), sorted([a, b]))
+
+        self.world.remove_component(b, Velocity)
+        self.assertEqual(query.entity_ids(), [a])
+
+    def test_iteration_yields_flat_tuples(self):
+        a = self.spawn(Velocity(2.0), Position(1.0))
+
+        rows = [(entity, position.x, velocity.dx) for entity, position, velocity in self.world.query(Position, Velocity)]
+
+        self.assertEqual(rows, [(a, 1.0, 2.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import threading
+import unittest
+from dataclasses import dataclass
+
+from engine.ecs.component import Component
+from engine.ecs.scheduler import Scheduler, build_stages
+from engine.ecs.system import PausePolicy, System
+from engine.ecs.world import World
+
+
+@dataclass
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass
+class Velocity(Component):
+    dx: float = 0.0
+
+
+@dataclass
+class Health(Component):
+    hp: int = 0
+
+
+class RecordingSystem(System):
+    def __init__(self, world, event_bus, **schedule):
+        super().__init__(world, event_bus)
+        self.__dict__.update(schedule)
+        self.calls = []
+        self.frames = 0
+        self.threads = set()
+
+    def update(self, dt):
+        self.calls.append(dt)
+        self.threads.add(threading.get_ident())
+
+    def frame_update(self, dt):
+        self.frames += 1
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+
+    def add(self, **schedule):
+        system = RecordingSystem(self.world, self.world.event_bus, **schedule)
+        self.world.add_system(system)
+        return system
+
+    def test_tick_rate_accumulates_frame_time(self):
+        every_frame = self.add()
+        ai = self.add(tick_rate=10.0)
+
+        for _ in range(60):
+            self.world.update(1 / 60)
+
+        self.assertEqual(len(every_frame.calls), 60)
+        self.assertEqual(ai.frames, 60)
+        self.assertIn(len(ai.calls), (10, 11))
+        self.assertAlmostEqual(sum(ai.calls), 1.0, delta=0.1 + 1e-6)
+
+    def test_tick_time_past_the_interval_carries_over(self):
+        ai = self.add(tick_rate=10.0)
+
+        for _ in range(1440):  # 10 s at 144 fps: 14.4 frames per tick
+            self.world.update(1 / 144)
+
+        self.assertIn(len(ai.calls), (99, 100))
+        self.assertAlmostEqual(sum(ai.calls), 10.0, delta=0.1 + 1e-6)
+
+        # A long frame carries at most one interval into the next tick
+        ai.calls.clear()
+        self.world.update(1.0)
+        self.world.update(1 / 144)
+        self.assertEqual(len(ai.calls), 2)
+        self.world.update(1 / 144)
+        self.assertEqual(len(ai.calls), 2)
+
+    def test_pause_policy(self):
+        gameplay = self.add(tick_rate=5.0)
+        ui = self.add(pause_policy=PausePolicy.ALWAYS)
+
+        for _ in range(30):
+            self.world.update(1 / 60, paused=True)
+        self.assertEqual(gameplay.calls, [])
+        self.assertEqual(len(ui.calls), 30)
+
+        for _ in range(12):
+            self.world.update(1 / 60)
+        # Time spent paused was not accumulated
+        self.assertLessEqual(sum(gameplay.calls), 12 / 60 + 1e-6)
+
+    def test_stages_group_non_conflicting_parallel_systems(self):
+        movement = self.add(reads=frozenset({Velocity}), writes=frozenset({Position}), parallel_safe=True)
+        regen = self.add(reads=frozenset(), writes=frozenset({Health}), parallel_safe=True)
+        reader = self.add(reads=frozenset({Position}), writes=frozenset(), parallel_safe=True)
+        unknown = self.add()
+        after = self.add(reads=frozenset(), writes=frozenset({Health}), parallel_safe=True)
+
+        stages = build_stages(self.world._systems)
+
+        self.assertEqual(stages, [[movement, regen], [reader], [unknown], [after]])
+
+    def test_parallel_stage_runs_on_worker_threads(self):
+        first = self.add(reads=frozenset(), writes=frozenset({Position}), parallel_safe=True)
+        second = self.add(reads=frozenset(), writes=frozenset({Health}), parallel_safe=True)
+        self.world.scheduler = Scheduler(self.world, max_workers=2)
+
+        for _ in range(3):
+            self.world.update(1 / 60)
+        self.world.shutdown()
+        self.assertIsNone(self.world.scheduler._executor)
+
+        self.assertEqual(len(first.calls), 3)
+        self.assertEqual(len(second.calls), 3)
+        self.assertNotIn(threading.get_ident(), first.threads | second.threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
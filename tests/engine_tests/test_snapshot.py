@@ -0,0 +1,169 @@
+import unittest
+import enum
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, Dict, List
+
+from panda3d.core import LVector3f
+
+from engine.components.camera_state import CameraMode, CameraState
+from engine.components.core import Health, Inventory, Transform
+from engine.components.enemy import EnemyComponent
+from engine.ecs import component as component_module
+from engine.ecs.component import Component, register_component
+from engine.ecs.snapshot import load_snapshot, save_snapshot
+from engine.ecs.world import World
+from engine.physics.kinematic import KinematicState
+
+
+@register_component
+@dataclass
+class Beacon(Component):
+    label: str = "beacon"
+    level: int = 1
+
+
+@dataclass
+class Unregistered(Component):
+    value: int = 0
+
+
+class Mood(enum.Enum):
+    CALM = 1
+
+
+@register_component
+@dataclass
+class Payload(Component):
+    value: Any = None
+
+
+def xyz(vector):
+    return (vector.x, vector.y, vector.z)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+
+    def restore(self, data):
+        world = World()
+        load_snapshot(world, data)
+        return world
+
+    def test_round_trip_keeps_ids_tags_and_values(self):
+        player = self.world.create_entity(tag="player")
+        self.world.add_component(player, Transform(position=LVector3f(1.5, -2.0, 3.25)))
+        self.world.add_component(player, Health(current=42, invulnerable=True))
+        self.world.add_component(player, KinematicState(velocity_z=-4.5, grounded=False))
+        self.world.add_component(player, CameraState(mode=CameraMode.COMBAT, target_entity=7))
+        gone = self.world.create_entity()
+        self.world.destroy_entity(gone)
+        enemy = self.world.create_entity()
+        self.world.add_component(enemy, EnemyComponent(enemy_type="zombie", target_id=str(player)))
+        self.world.add_component(enemy, Inventory(slots=[("stone", 3), None]))
+
+        restored = self.restore(save_snapshot(self.world))
+
+        self.assertEqual(restored.get_entity_by_tag("player"), player)
+        self.assertFalse(restored.is_alive(gone))
+        self.assertEqual(restored._generations, self.world._generations)
+        self.assertEqual(xyz(restored.get_component(player, Transform).position), (1.5, -2.0, 3.25))
+        self.assertEqual(restored.get_component(player, Health), Health(current=42, invulnerable=True))
+        self.assertEqual(restored.get_component(player, KinematicState).velocity_z, -4.5)
+        self.assertIs(restored.get_component(player, CameraState).mode, CameraMode.COMBAT)
+        self.assertEqual(restored.get_component(enemy, EnemyComponent).target_id, str(player))
+        self.assertEqual(restored.get_component(enemy, Inventory).slots, [("stone", 3), None])
+        self.assertEqual(restored.query(EnemyComponent).entity_ids(), [enemy])
+
+        # New entities continue after the restored slots
+        self.assertEqual(restored.create_entity(), self.world.create_entity())
+
+    def test_values_not_matching_the_annotation_round_trip_exactly(self):
+        values = [1.5, 2, None, "x", True]  # Health.invuln_timer is annotated float
+        entities = []
+        for value in values:
+            entity = self.world.create_entity()
+            self.world.add_component(entity, Health(invuln_timer=value))
+            entities.append(entity)
+        shared = (0, 0, 1)
+        for entity in entities:
+            self.world.add_component(entity, KinematicState(surface_normal=shared))
+
+        restored = self.restore(save_snapshot(self.world))
+
+        for entity, value in zip(entities, values):
+            timer = restored.get_component(entity, Health).invuln_timer
+            self.assertEqual((type(timer), timer), (type(value), value))
+            self.assertEqual(restored.get_component(entity, KinematicState).surface_normal, (0, 0, 1))
+
+    def test_schema_changes_and_unregistered_components(self):
+        entity = self.world.create_entity()
+        self.world.add_component(entity, Beacon(label="north", level=3))
+        self.world.add_component(entity, Unregistered(value=5))
+        with self.assertLogs("mycraft.engine.ecs.snapshot", level="WARNING"):
+            data = save_snapshot(self.world)
+
+        # Beacon loses 'level' and gains 'colors' / 'hits' since the save
+        evolved = make_dataclass("Beacon", [
+            ("label", str, field(default="beacon")),
+            ("colors", Dict[str, int], field(default_factory=dict)),
+            ("hits", List[int], field(default_factory=list)),
+        ], bases=(Component,))
+        previous = component_module._COMPONENT_REGISTRY["Beacon"]
+        component_module._COMPONENT_REGISTRY["Beacon"] = evolved
+        try:
+            restored = self.restore(data)
+        finally:
+            component_module._COMPONENT_REGISTRY["Beacon"] = previous
+
+        beacon = restored.get_component(entity, evolved)
+        self.assertEqual((beacon.label, beacon.colors, beacon.hits), ("north", {}, []))
+        self.assertFalse(hasattr(beacon, "level"))
+        self.assertIsNone(restored.get_component(entity, Unregistered))
+
+    def test_load_replaces_entities_and_rejects_bad_data(self):
+        kept = self.world.create_entity(tag="player")
+        self.world.add_component(kept, Beacon())
+        data = save_snapshot(self.world)
+        extra = self.world.create_entity()
+        self.world.add_component(extra, Beacon())
+        self.world.commands.create_entity(Beacon())
+        restored = []
+        self.world.event_bus.subscribe("world_restored", lambda event: restored.append(event.entity_count))
+
+        self.assertEqual(load_snapshot(self.world, data), 1)
+
+        self.assertEqual(self.world.query(Beacon).entity_ids(), [kept])
+        self.assertFalse(self.world.is_alive(extra))
+        self.assertEqual(len(self.world.commands), 0)
+        self.assertEqual(restored, [1])
+        for bad in (b"not a snapshot", data[:-10], data + b"\0"):
+            with self.assertRaises(ValueError):
+                load_snapshot(self.world, bad)
+            self.assertTrue(self.world.is_alive(kept))
+        self.assertEqual(restored, [1])
+
+    def test_only_plain_data_is_stored(self):
+        entity = self.world.create_entity()
+        self.world.add_component(entity, Payload(value=[1, {"a": (2.5, None)}]))
+        data = save_snapshot(self.world)
+        self.assertEqual(self.restore(data).get_component(entity, Payload).value, [1, {"a": (2.5, None)}])
+
+        # No pickle fallback, and only enums some registered component declares
+        for value in ({1, 2}, object(), Mood.CALM):
+            self.world.get_component(entity, Payload).value = value
+            with self.assertRaises(TypeError):
+                save_snapshot(self.world)
+
+        # A snapshot naming another enum is refused instead of importing it
+        key = b"engine.components.camera_state:CameraMode"
+        camera = self.world.create_entity()
+        self.world.remove_component(entity, Payload)
+        self.world.add_component(camera, CameraState(mode=CameraMode.COMBAT))
+        forged = save_snapshot(self.world).replace(key, b"os:" + b"x" * (len(key) - 3))
+        with self.assertRaises(ValueError):
+            self.restore(forged)
+
+
+if __name__ == '__main__':
+    unittest.main()
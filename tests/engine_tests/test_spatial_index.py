@@ -0,0 +1,112 @@
+import math
+import random
+import unittest
+
+from panda3d.core import LVector3f as Vec3
+
+from engine.components.core import Health, Transform
+from engine.components.gameplay import Trigger
+from engine.ecs.world import World
+from engine.physics.kinematic import KinematicState
+from engine.systems.interaction import TriggerSystem
+from engine.systems.spatial_index import SpatialHash, SpatialIndexSystem
+
+
+def distance(a, b):
+    return math.sqrt(sum((p - q) ** 2 for p, q in zip(a, b)))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+        self.index = SpatialIndexSystem(self.world, self.world.event_bus, cell_size=4.0)
+        self.world.add_system(self.index)
+
+    def spawn(self, x, y, z=0.0, health=True):
+        entity = self.world.create_entity()
+        self.world.add_component(entity, Transform(position=Vec3(x, y, z)))
+        if health:
+            self.world.add_component(entity, Health())
+        return entity
+
+    def test_queries_match_brute_force(self):
+        rng = random.Random(7)
+        grid = SpatialHash(cell_size=3.0)
+        points = {}
+        for entity_id in range(1, 400):
+            points[entity_id] = (rng.uniform(-60, 60), rng.uniform(-60, 60), rng.uniform(0, 10))
+            grid.update(entity_id, *points[entity_id])
+
+        for _ in range(20):
+            center = (rng.uniform(-70, 70), rng.uniform(-70, 70), 5.0)
+            radius = rng.uniform(0.5, 20)
+            expected = {e for e, p in points.items() if distance(p, center) <= radius}
+            self.assertEqual(set(grid.query_radius(*center, radius)), expected)
+
+            low = (center[0] - 8, center[1] - 5, 2.0)
+            high = (center[0] + 3, center[1] + 9, 8.0)
+            expected = {e for e, p in points.items() if all(lo <= v <= hi for lo, v, hi in zip(low, p, high))}
+            self.assertEqual(set(grid.query_aabb(*low, *high)), expected)
+
+            expected = sorted(points, key=lambda e: distance(points[e], center))[:5]
+            self.assertEqual(grid.nearest(*center, k=5), expected)
+
+    def test_component_filter_exclude_and_max_distance(self):
+        player = self.spawn(0, 0)
+        enemy = self.spawn(1, 0)
+        prop = self.spawn(0.5, 0, health=False)
+        far = self.spawn(30, 0)
+        self.index.sync()
+
+        origin = Vec3(0, 0, 0)
+        self.assertEqual(set(self.index.query_radius(origin, 2.0, Health, exclude=player)), {enemy})
+        self.assertEqual(set(self.index.query_radius(origin, 2.0)), {player, enemy, prop})
+        self.assertEqual(self.index.nearest(origin, 2, Health, exclude=player), [enemy, far])
+        self.assertEqual(self.index.nearest(origin, 2, Health, max_distance=5.0, exclude=player), [enemy])
+        self.assertEqual(self.index.query_aabb(Vec3(25, -1, -1), Vec3(35, 1, 1), Health), [far])
+
+    def test_sync_tracks_movers_new_and_destroyed_entities(self):
+        mover = self.spawn(0, 0)
+        self.world.add_component(mover, KinematicState())
+        still = self.spawn(1, 1)
+        doomed = self.spawn(2, 2)
+        self.assertEqual(self.index.sync(), 3)
+
+        self.world.get_component(mover, Transform).position = Vec3(50, 50, 0)
+        self.world.destroy_entity(doomed)
+        self.assertEqual(self.index.query_radius(Vec3(2, 2, 0), 1.0), [])  # Destroyed, not yet pruned
+        self.assertEqual(self.index.sync(), 1)
+        self.assertNotIn(doomed, self.index.grid)
+        self.assertEqual(self.index.nearest(Vec3(49, 49, 0)), [mover])
+
+        # Non-movers are only re-read when reported
+        self.world.get_component(still, Transform).position = Vec3(30, 1, 0)
+        self.assertEqual(self.index.sync(), 0)
+        self.assertEqual(self.index.grid.position(still), (1.0, 1.0, 0.0))
+        self.index.mark_moved(still)
+        self.assertEqual(self.index.sync(), 1)
+        self.assertEqual(self.index.grid.position(still), (30.0, 1.0, 0.0))
+
+        # New entities are picked up without being reported
+        late = self.spawn(-20, 5)
+        self.index.sync()
+        self.assertEqual(self.index.nearest(Vec3(-20, 5, 0)), [late])
+
+    def test_trigger_system_uses_the_index(self):
+        self.world.add_system(TriggerSystem(self.world, self.world.event_bus))
+        zone = self.world.create_entity()
+        self.world.add_component(zone, Transform(position=Vec3(10, 10, 0)))
+        self.world.add_component(zone, Trigger(bounds_min=Vec3(-1, -1, -1), bounds_max=Vec3(1, 1, 1)))
+        inside = self.spawn(10.5, 9.5)
+        self.spawn(20, 20)
+        entered = []
+        self.world.event_bus.subscribe("on_zone_enter", lambda event: entered.append((event.zone_id, event.entity_id)))
+        self.index.sync()
+
+        self.world.get_system_by_type("TriggerSystem").update(0.1)
+
+        self.assertEqual(entered, [(zone, inside)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+from engine.ecs import profiler as profiler_module
+from engine.ecs.profiler import SystemProfiler
+from engine.ecs.system import System
+from engine.ecs.world import World
+
+
+class SlowSystem(System):
+    pass
+
+
+class TestSystemProfiler(unittest.TestCase):
+    def frame(self, profiler, dt=1 / 60, **timings_ms):
+        profiler.begin_frame()
+        for name, ms in timings_ms.items():
+            profiler.record(name, ms / 1000.0)
+        profiler.end_frame(dt)
+
+    def test_rolling_percentiles_over_window(self):
+        profiler = SystemProfiler(window=100)
+        for value in range(200):  # Only the last 100 (100..199) are kept
+            self.frame(profiler, Physics=float(value))
+
+        timing = profiler.get_timing("Physics")
+
+        self.assertEqual(timing.samples, 100)
+        self.assertAlmostEqual(timing.p50, 149.5, places=3)
+        self.assertAlmostEqual(timing.p99, 198.01, places=2)
+        self.assertAlmostEqual(timing.max, 199.0, places=3)
+        self.assertIsNone(profiler.get_timing("Missing"))
+
+    def test_budget_overrun_names_slowest_system(self):
+        profiler = SystemProfiler(frame_budget_ms=10.0, warn_interval=1.0)
+        with mock.patch.object(profiler_module, "logger") as logger:
+            self.frame(profiler, Physics=3.0, Enemy=9.0)
+            self.frame(profiler, Physics=3.0, Enemy=9.0)  # Rate-limited
+            self.frame(profiler, Physics=1.0)
+
+        self.assertEqual(profiler.overruns, 2)
+        logger.warning.assert_called_once()
+        self.assertIn("Enemy 9.0 ms", logger.warning.call_args[0][0])
+        self.assertEqual(profiler.stats()[0].name, "Enemy")
+
+    def test_metrics_are_emitted_periodically(self):
+        profiler = SystemProfiler(metric_interval=1.0)
+        with mock.patch.object(profiler_module, "log_metric") as log_metric:
+            for _ in range(3):
+                self.frame(profiler, dt=0.4, Physics=2.0)
+
+        names = [call.args[0] for call in log_metric.call_args_list]
+        self.assertEqual(names, ["system_ms_p50", "system_ms_p95", "system_ms_p99", "system_ms_max"])
+        self.assertEqual(log_metric.call_args.args[2], {"system": "Physics"})
+
+    def test_scheduler_times_systems_only_when_attached(self):
+        world = World()
+        world.add_system(SlowSystem(world, world.event_bus))
+        profiler = SystemProfiler()
+
+        world.update(1 / 60)
+        self.assertEqual(profiler.stats(), [])
+
+        world.scheduler.profiler = profiler
+        world.update(1 / 60)
+        world.update(1 / 60)
+
+        self.assertEqual(profiler.get_timing("SlowSystem").samples, 2)
+        self.assertIn("SlowSystem", profiler.format_table())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -114,7 +114,37 @@ class TestCombatSystem(unittest.TestCase):
         # Should only hit close target
         self.assertEqual(len(damage_events), 1)
         self.assertEqual(damage_events[0].target_id, close_target)
-    
+
+    def test_hit_detection_uses_spatial_index(self):
+        """Test that range queries go through SpatialIndexSystem when installed."""
+        from engine.systems.spatial_index import SpatialIndexSystem
+        index = SpatialIndexSystem(self.world, self.world.event_bus)
+        self.world.add_system(index)
+
+        attacker = self.world.create_entity()
+        self.world.add_component(attacker, Transform(position=LVector3f(100, 100, 0)))
+        self.world.add_component(attacker, CombatState())
+        target = self.world.create_entity()
+        self.world.add_component(target, Transform(position=LVector3f(101, 100.5, 0)))
+        self.world.add_component(target, Health(current=100, max_hp=100))
+        for i in range(50):  # Crowd far away
+            bystander = self.world.create_entity()
+            self.world.add_component(bystander, Transform(position=LVector3f(i * 3.0, -40, 0)))
+            self.world.add_component(bystander, Health(current=100, max_hp=100))
+        index.sync()
+
+        hit_ids = []
+        self.world.event_bus.subscribe("on_entity_damage", lambda e: hit_ids.append(e.target_id))
+        self.system.on_attack_input(MockEvent(entity_id=attacker))
+        self.system.active_attacks[attacker].elapsed_time = 0.15
+        self.system.update(0.0)
+
+        self.assertEqual(hit_ids, [target])
+        self.assertEqual(
+            self.system._find_entities_in_range(attacker, LVector3f(100, 100, 0), self.system.HIT_RANGE),
+            {target}
+        )
+
     def test_momentum_damage_calculation(self):
         """Test that damage = base_damage + velocity_magnitude."""
         attacker = self.world.create_entity()
@@ -1,10 +1,12 @@
 
 import pytest
+from types import SimpleNamespace
 from engine.ecs.world import World
 from engine.ecs.events import EventBus
 from engine.components.core import Transform, Health
 from engine.components.enemy import EnemyComponent
 from engine.physics import KinematicState
+from engine.systems.simulation_lod import SimTier, SimulationLODSystem
 from games.voxel_world.systems.enemy_system import EnemySystem
 from panda3d.core import LVector3f
 
@@ -50,8 +52,8 @@ def test_enemy_initialization(enemy_world):
     world.add_component(e, Health(current=100, max_hp=100))
     world.add_component(e, EnemyComponent(enemy_type="skeleton", tint_color="red"))
     
-    # Update system -> should create visual
-    system.update(0.1)
+    # Per-frame update -> should create visual
+    system.frame_update(0.1)
     
     assert e in system.visuals
     assert system.visuals[e].enemy_type == "skeleton"
@@ -97,3 +99,34 @@ def test_ai_state_machine(enemy_world):
     timer = comp.state_timer + 0.1
     system.update(timer)
     assert comp.ai_state == "attack" # Or recovery depending on logic flow in one frame
+
+def test_reduced_tier_visuals_sync_on_ai_ticks_only(enemy_world):
+    world, system = enemy_world
+    lod = SimulationLODSystem(world, world.event_bus)
+    world.add_system(lod)
+
+    player = world.create_entity()
+    world.register_tag(player, "player")
+    world.add_component(player, Transform(position=LVector3f(0, 0, 0)))
+    enemy = world.create_entity()
+    world.add_component(enemy, Transform(position=LVector3f(50, 0, 0)))
+    world.add_component(enemy, Health(current=0, max_hp=100))  # Dead: AI skips it, visuals still sync
+    world.add_component(enemy, EnemyComponent(ai_state="aggro"))
+
+    moves = []
+    root = MockNode("enemy")
+    root.setPos = lambda *pos: moves.append("pos")
+    root.lookAt = lambda pos: moves.append("look")
+    system.visuals[enemy] = SimpleNamespace(root=root)
+
+    lod.tiers[enemy] = SimTier.REDUCED
+    for _ in range(5):
+        system.frame_update(1 / 60)
+    assert moves == []
+
+    system.update(0.1)  # A reduced-tier tick
+    assert moves == ["pos", "look"]
+
+    lod.tiers[enemy] = SimTier.FULL
+    system.frame_update(1 / 60)
+    assert moves == ["pos", "look", "pos", "look"]
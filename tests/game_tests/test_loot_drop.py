@@ -71,5 +71,29 @@ class TestLootDrop(unittest.TestCase):
         self.assertIn("red", colors.unlocked_colors, "Player should unlock red")
         self.assertFalse(pickup in self.world._entities, "Pickup should be destroyed")
 
+    def test_pickup_with_spatial_index_matches_full_scan(self):
+        """Verify the spatial index path collects what the full scan would."""
+        from engine.systems.spatial_index import SpatialIndexSystem
+        player = self.world.create_entity()
+        self.world.register_tag(player, "player")
+        self.world.add_component(player, Transform(position=LVector3f(0, 0, 0)))
+        colors = AvatarColors()
+        self.world.add_component(player, colors)
+        magnet = self.world.create_entity()  # Radius larger than any fixed search radius
+        self.world.add_component(magnet, Transform(position=LVector3f(9, 0, 0)))
+        self.world.add_component(magnet, PickupComponent(color_name="red", pickup_radius=10.0))
+        far = self.world.create_entity()
+        self.world.add_component(far, Transform(position=LVector3f(3, 0, 0)))
+        self.world.add_component(far, PickupComponent(color_name="green", pickup_radius=1.0))
+        index = SpatialIndexSystem(self.world, self.event_bus)
+        self.world.add_system(index)
+        index.sync()
+
+        self.loot_sys.update(0.1)
+
+        self.assertIn("red", colors.unlocked_colors)
+        self.assertFalse(self.world.is_alive(magnet))
+        self.assertTrue(self.world.is_alive(far))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for distance-based avatar LOD."""
+from unittest.mock import MagicMock
+
+from engine.rendering.avatar_lod import AvatarLOD, LODSelector, LODSettings, LODTier
+
+
+def make_node(name="node"):
+    """MagicMock NodePath whose children are distinct nodes."""
+    node = MagicMock(name=name)
+    node.attachNewNode.side_effect = lambda child=None: make_node(str(child))
+    return node
+
+
+SETTINGS = LODSettings(full_distance=10.0, merged_distance=40.0, name_tag_distance=25.0, hysteresis=2.0)
+
+
+def test_selector_tiers_by_distance():
+    selector = LODSelector(SETTINGS)
+
+    selector.update(5.0)
+    assert selector.tier == LODTier.FULL
+    selector.update(20.0)
+    assert selector.tier == LODTier.MERGED
+    selector.update(100.0)
+    assert selector.tier == LODTier.IMPOSTOR
+
+
+def test_selector_can_jump_multiple_tiers():
+    selector = LODSelector(SETTINGS)
+    assert selector.update(100.0) is True
+    assert selector.tier == LODTier.IMPOSTOR
+    selector.update(1.0)
+    assert selector.tier == LODTier.FULL
+
+
+def test_selector_hysteresis_prevents_flicker():
+    selector = LODSelector(SETTINGS)
+
+    # Inside the hysteresis band: stays FULL
+    assert selector.update(11.0) is False
+    assert selector.tier == LODTier.FULL
+
+    selector.update(12.5)
+    assert selector.tier == LODTier.MERGED
+
+    # Back just below the threshold: stays MERGED until threshold - hysteresis
+    assert selector.update(9.0) is False
+    assert selector.tier == LODTier.MERGED
+    assert selector.update(7.5) is True
+    assert selector.tier == LODTier.FULL
+
+
+def test_selector_name_tag_cutoff():
+    selector = LODSelector(SETTINGS)
+    selector.update(26.0)
+    assert selector.name_tag_visible
+    selector.update(28.0)
+    assert not selector.name_tag_visible
+    selector.update(24.0)
+    assert not selector.name_tag_visible
+    selector.update(22.0)
+    assert selector.name_tag_visible
+
+
+def test_avatar_lod_stashes_inactive_tiers():
+    root = make_node()
+    full = MagicMock()
+    tag = MagicMock()
+    lod = AvatarLOD(root, full, (1, 0, 0, 1), name_tag=tag, settings=SETTINGS)
+
+    # Proxies are built lazily
+    assert lod._merged is None and lod._impostor is None
+
+    lod.update(20.0, dt=0.016, speed=4.0)
+    assert lod.tier == LODTier.MERGED
+    full.stash.assert_called()
+    assert lod._merged is not None
+    assert lod._impostor is None
+
+    lod.update(100.0)
+    assert lod.tier == LODTier.IMPOSTOR
+    assert lod._impostor is not None
+    lod._merged.root.stash.assert_called()
+    tag.hide.assert_called_once()
+
+    lod.update(1.0)
+    assert lod.tier == LODTier.FULL
+    full.unstash.assert_called()
+    lod._impostor.root.stash.assert_called()
+    tag.show.assert_called_once()
+
+
+def test_merged_tier_swings_limbs():
+    lod = AvatarLOD(make_node(), MagicMock(), (1, 1, 1, 1), settings=SETTINGS)
+    lod.update(20.0, dt=0.1, speed=6.0)
+
+    arm = lod._merged.limbs["arm_right"]
+    angle = arm.setP.call_args[0][0]
+    assert angle != 0.0
+    lod._merged.limbs["arm_left"].setP.assert_called_with(-angle)
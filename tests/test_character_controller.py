@@ -0,0 +1,73 @@
+"""Tests for the swept-AABB voxel character controller."""
+from types import SimpleNamespace
+
+import pytest
+
+from engine.physics import KinematicState, PlayerHitbox, VoxelCharacterController, VoxelCollider
+
+
+def make_controller(cells, step_height=1.0):
+    collider = VoxelCollider(lambda x, y, z: "stone" if (x, y, z) in cells else None)
+    return VoxelCharacterController(collider, PlayerHitbox(foot_offset=0.0), step_height=step_height)
+
+
+def floor(size=8, height=0):
+    return {(x, y, height) for x in range(-size, size) for y in range(-size, size)}
+
+
+def test_lands_on_floor_without_tunnelling():
+    controller = make_controller(floor())
+    entity = SimpleNamespace(x=0.5, y=0.5, z=5.0)
+    state = KinematicState(velocity_z=-200.0, grounded=False)
+
+    result = controller.move(entity, state, 0.1)  # 20 units in one step
+
+    assert entity.z == pytest.approx(1.0)
+    assert result.grounded and state.grounded
+    assert state.velocity_z == 0.0
+    assert result.contacts[0].normal == (0, 0, 1)
+
+
+def test_wall_stops_one_axis_and_slides_on_the_other():
+    cells = floor() | {(2, y, z) for y in range(-8, 8) for z in (1, 2, 3)}
+    controller = make_controller(cells)
+    entity = SimpleNamespace(x=0.5, y=0.5, z=1.0)
+    state = KinematicState(velocity_x=50.0, velocity_y=2.0)
+
+    result = controller.move(entity, state, 0.1)
+
+    assert entity.x == pytest.approx(2.0 - 0.3)  # Hitbox face against the wall
+    assert entity.y == pytest.approx(0.7)
+    assert state.velocity_x == 0.0 and state.velocity_y == 2.0
+    assert any(hit.normal == (-1, 0, 0) for hit in result.contacts)
+
+
+def test_low_obstacle_below_mid_height_blocks():
+    # A half-height wall the old mid-height ray (z + 0.9) would miss entirely
+    cells = floor() | {(2, y, 1) for y in range(-8, 8)}
+    controller = make_controller(cells, step_height=0.0)
+    entity = SimpleNamespace(x=0.5, y=0.5, z=1.0)
+
+    controller.move(entity, KinematicState(velocity_x=10.0), 0.5)
+
+    assert entity.x == pytest.approx(1.7)
+
+
+def test_steps_up_ledges_but_not_walls():
+    ledge = floor() | {(2, y, 1) for y in range(-8, 8)}
+    controller = make_controller(ledge)
+    entity = SimpleNamespace(x=0.5, y=0.5, z=1.0)
+
+    result = controller.move(entity, KinematicState(velocity_x=4.0), 0.5)
+
+    assert result.stepped
+    assert entity.x == pytest.approx(2.5)
+    assert entity.z == pytest.approx(2.0)
+
+    wall = ledge | {(2, y, 2) for y in range(-8, 8)}
+    controller = make_controller(wall)
+    entity = SimpleNamespace(x=0.5, y=0.5, z=1.0)
+    result = controller.move(entity, KinematicState(velocity_x=4.0), 0.5)
+
+    assert not result.stepped
+    assert entity.x == pytest.approx(1.7)
@@ -0,0 +1,130 @@
+"""Tests for greedy-merged chunk collision geometry."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from engine.world import chunk_manager as chunk_manager_module
+from engine.world.chunk_manager import ChunkManager, greedy_merge_faces
+
+
+class Registry:
+    @staticmethod
+    def get_block(name):
+        return SimpleNamespace(solid=name != "water")
+
+
+class FakeCollisionNode:
+    def __init__(self, name):
+        self.name = name
+        self.solids = []
+
+    def addSolid(self, solid):
+        self.solids.append(solid)
+
+    def setFromCollideMask(self, mask): pass
+    def setIntoCollideMask(self, mask): pass
+
+
+class FakeNodePath:
+    def __init__(self, node=None, parent=None):
+        self._node = node
+        self.parent = parent
+        self.children = []
+
+    def attachNewNode(self, node):
+        child = FakeNodePath(node, self)
+        self.children.append(child)
+        return child
+
+    def removeNode(self):
+        self.parent.children.remove(self)
+
+    def node(self):
+        return self._node
+
+    def solids(self):
+        own = self._node.solids if self._node is not None else []
+        return own + [solid for child in self.children for solid in child.solids()]
+
+
+def make_manager(monkeypatch):
+    monkeypatch.setattr(chunk_manager_module, "CollisionNode", FakeCollisionNode)
+    monkeypatch.setattr(chunk_manager_module, "CollisionPolygon", lambda *corners: corners)
+    monkeypatch.setattr(chunk_manager_module, "LVector3f", lambda *xyz: tuple(xyz))
+    generator = MagicMock()
+    generator.get_block_registry.return_value = Registry
+    return ChunkManager(MagicMock(), MagicMock(), MagicMock(), generator, chunk_size=16)
+
+
+def build(manager, grid, chunk=(0, 0)):
+    manager._add_collision_to_chunk(FakeNodePath(), grid, *chunk)
+    return manager.collision_nodes[chunk].solids()
+
+
+def east_wall(solids, x=16):
+    return [c for c in solids if all(p[0] == x for p in c)]
+
+
+def slab(block="stone", height=0):
+    return {(x, height, z): block for x in range(16) for z in range(16)}
+
+
+def normal_of(corners):
+    (ax, ay, az), (bx, by, bz), (cx, cy, cz) = corners[:3]
+    e1, e2 = (bx - ax, by - ay, bz - az), (cx - ax, cy - ay, cz - az)
+    return (e1[1] * e2[2] - e1[2] * e2[1], e1[2] * e2[0] - e1[0] * e2[2], e1[0] * e2[1] - e1[1] * e2[0])
+
+
+def test_greedy_merge_covers_every_face_once():
+    cells = {(u, v) for u in range(5) for v in range(3)} | {(0, 3), (0, 4), (7, 7)}
+    rects = greedy_merge_faces(cells)
+
+    covered = [(u, v) for u0, v0, u1, v1 in rects for u in range(u0, u1 + 1) for v in range(v0, v1 + 1)]
+    assert sorted(covered) == sorted(cells)
+    assert len(rects) <= 3
+
+
+def test_flat_slab_collapses_to_one_quad_per_side(monkeypatch):
+    solids = build(make_manager(monkeypatch), slab())
+
+    assert len(solids) == 6  # Top, bottom and four sides
+    tops = [c for c in solids if all(p[2] == 1 for p in c)]
+    assert len(tops) == 1
+    assert normal_of(tops[0])[2] > 0  # Wound to face up, like the per-face quads
+
+
+def test_water_is_not_collidable(monkeypatch):
+    grid = slab()
+    grid.update({(x, 1, z): "water" for x in range(16) for z in range(16)})
+    assert len(build(make_manager(monkeypatch), grid)) == 6
+
+
+def test_border_faces_covered_by_loaded_neighbour_are_skipped(monkeypatch):
+    manager = make_manager(monkeypatch)
+    manager.chunk_blocks[(1, 0)] = slab()  # East neighbour, same layer
+
+    solids = build(manager, slab())
+
+    assert len(solids) == 5
+    assert not any(all(p[0] == 16 for p in c) for c in solids)  # No east wall at x=16
+
+
+def test_neighbour_borders_follow_chunk_loads_and_unloads(monkeypatch):
+    manager = make_manager(monkeypatch)
+    manager.collision_polygons = True
+    manager.chunk_blocks[(0, 0)] = slab()
+    assert len(east_wall(build(manager, slab()))) == 1
+
+    # East neighbour loads: its blocks now cover the wall
+    manager.chunk_blocks[(1, 0)] = slab()
+    build(manager, slab(), chunk=(1, 0))
+    manager._refresh_neighbor_borders(1, 0)
+    assert len(manager.collision_nodes[(0, 0)].solids()) == 5
+    assert east_wall(manager.collision_nodes[(0, 0)].solids()) == []
+    assert east_wall(manager.collision_nodes[(1, 0)].solids()) == []  # Its west wall at x=16
+
+    # ...and unloads: the wall comes back instead of leaving a hole
+    manager.chunks[(1, 0)] = MagicMock()
+    manager.unload_chunk(1, 0)
+    assert len(manager.collision_nodes[(0, 0)].solids()) == 6
+    assert len(east_wall(manager.collision_nodes[(0, 0)].solids())) == 1
+    assert not any(chunk == (1, 0) for chunk, _ in manager.collision_borders)
@@ -0,0 +1,143 @@
+"""Tests for chunk-owned entity streaming and dormant records."""
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from engine.components.core import Health, Transform
+from engine.components.enemy import EnemyComponent
+from engine.ecs.world import World
+from engine.physics import KinematicState
+from engine.world.chunk_manager import ChunkManager
+from engine.world.dormant import freeze_entity, thaw_entity
+
+
+class Generator:
+    """Flat chunks with one skeleton in chunk (0, 0)."""
+
+    def get_block_registry(self):
+        return SimpleNamespace(get_block=lambda name: SimpleNamespace(solid=True))
+
+    def generate_chunk(self, chunk_x, chunk_z, chunk_size):
+        grid = {(x, 0, z): "stone" for x in range(chunk_size) for z in range(chunk_size)}
+        entities = [("skeleton", chunk_x * chunk_size + 4, 1, chunk_z * chunk_size + 6, "red")]
+        return grid, entities if (chunk_x, chunk_z) == (0, 0) else []
+
+
+class EntityFactory:
+    """Minimal stand-in for the game's factory (only what streaming touches)."""
+
+    @staticmethod
+    def create_enemy(world, enemy_type, position, seed, color_name=None):
+        entity = world.create_entity()
+        world.add_component(entity, Transform(position=SimpleNamespace(x=position[0], y=position[1], z=position[2])))
+        world.add_component(entity, Health(current=50, max_hp=50))
+        world.add_component(entity, KinematicState())
+        world.add_component(entity, EnemyComponent(enemy_type=enemy_type, tint_color=color_name))
+        return entity
+
+
+@pytest.fixture(autouse=True)
+def factory(monkeypatch):
+    monkeypatch.setitem(sys.modules, "games.voxel_world.entity.factory", SimpleNamespace(EntityFactory=EntityFactory))
+
+
+def make_manager():
+    world = World()
+    manager = ChunkManager(world, world.event_bus, MagicMock(), Generator(), chunk_size=16,
+                           collision_polygons=False)
+    manager._get_chunk_mesh = MagicMock()
+    return world, manager
+
+
+def enemies(world):
+    return world.get_entities_with(EnemyComponent)
+
+
+def test_freeze_and_thaw_round_trip():
+    world = World()
+    entity = world.create_entity()
+    world.add_component(entity, Transform(position=SimpleNamespace(x=1.0, y=2.0, z=3.0)))
+    world.add_component(entity, Health(current=7, max_hp=50))
+
+    record = freeze_entity(world, entity)
+    world.destroy_entity(entity)
+    restored = thaw_entity(world, record)
+
+    assert world.get_component(restored, Health) == Health(current=7, max_hp=50)
+    assert world.get_component(restored, Transform).position.y == 2.0
+
+
+def test_unload_makes_entities_dormant_and_reload_restores_them():
+    world, manager = make_manager()
+    unloaded = []
+    world.event_bus.subscribe("entity_unloaded", lambda event: unloaded.append(event.entity_id))
+
+    manager.create_chunk(0, 0)
+    (enemy,) = enemies(world)
+    assert manager.chunk_entities[(0, 0)] == {enemy}
+    position = world.get_component(enemy, Transform).position
+    assert (position.x, position.y, position.z) == (4.0, 6.0, 1.0)  # Generator height becomes Panda Z
+    world.get_component(enemy, Health).current = 12
+
+    manager.unload_chunk(0, 0)
+    assert enemies(world) == set()
+    assert unloaded == [enemy]
+    assert len(manager.dormant_entities[(0, 0)]) == 1
+
+    manager.create_chunk(0, 0)
+    (restored,) = enemies(world)  # Restored, not spawned a second time
+    assert world.get_component(restored, Health).current == 12
+    assert manager.dormant_entities == {}
+
+
+def test_killed_entities_stay_dead_and_walkers_change_owner():
+    world, manager = make_manager()
+    manager.create_chunk(0, 0)
+    manager.create_chunk(1, 0)
+    (enemy,) = enemies(world)
+
+    # Walked into the loaded neighbour: handed over instead of frozen
+    world.get_component(enemy, Transform).position.x = 20.0
+    manager.unload_chunk(0, 0)
+    assert manager.chunk_entities[(1, 0)] == {enemy}
+
+    world.destroy_entity(enemy)
+    manager.unload_chunk(1, 0)
+    manager.create_chunk(0, 0)
+    manager.create_chunk(1, 0)
+    assert enemies(world) == set()
+    assert world.get_entities_with(KinematicState) == set()
+
+
+def test_snapshot_load_restores_ownership_and_dormant_records():
+    from panda3d.core import LVector3f
+    from engine.ecs.snapshot import load_snapshot, save_snapshot
+
+    world, manager = make_manager()
+    world.add_system(manager)
+    manager.create_chunk(0, 0)
+    (enemy,) = enemies(world)
+    world.get_component(enemy, Transform).position = LVector3f(4, 6, 1)
+    world.get_component(enemy, Health).current = 12
+    data = save_snapshot(world)
+
+    # Frozen since the save: the load brings it back once, into its unloaded chunk
+    manager.unload_chunk(0, 0)
+    load_snapshot(world, data)
+    assert enemies(world) == set()
+    assert len(manager.dormant_entities[(0, 0)]) == 1
+    manager.create_chunk(0, 0)
+    (restored,) = enemies(world)
+    assert world.get_component(restored, Health).current == 12
+
+    # Chunk loaded at load time: it owns the restored entity again
+    load_snapshot(world, data)
+    assert manager.chunk_entities[(0, 0)] == {enemy}
+    assert manager.dormant_entities == {}
+    manager.unload_chunk(0, 0)
+    manager.create_chunk(0, 0)
+    assert len(enemies(world)) == 1
@@ -48,8 +48,7 @@ class TestCombatWiring(unittest.TestCase):
         
         # Create Player (Attacker)
         player_id = world.create_entity()
-        transform = Transform(position=StubVec3(0, 0, 0))
-        transform.node = MagicMock() # Mock the NodePath
+        transform = Transform(position=StubVec3(0, 0, 0), rotation=StubVec3(0, 0, 0))
         world.add_component(player_id, transform)
         
         # Create Enemy (Target)
@@ -0,0 +1,113 @@
+"""Tests for decoration instancing (hardware and software placement)."""
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.rendering import instancing
+from engine.rendering.instancing import (
+    InstancedManager,
+    apply_instance_transforms,
+    compute_instance_transforms,
+    partition_by_region,
+)
+
+
+POSITIONS = [(0, 0, 1), (5, 3, 2), (40, 2, 0), (41, 70, 3), (-10, -5, 1)]
+
+
+def make_base():
+    base = MagicMock()
+    base.render.attachNewNode.side_effect = lambda name: MagicMock(name=name)
+    return base
+
+
+def test_transforms_are_deterministic():
+    a = compute_instance_transforms(POSITIONS)
+    b = compute_instance_transforms(list(reversed(POSITIONS)))[::-1]
+    assert a.shape == (len(POSITIONS), 4)
+    assert np.array_equal(a, b)
+    assert np.all((a[:, 3] >= 0) & (a[:, 3] < 2 * math.pi))
+
+
+def test_empty_positions():
+    assert compute_instance_transforms([]).shape == (0, 4)
+    assert partition_by_region(compute_instance_transforms([]), 32.0) == {}
+
+
+def test_shader_reference_matches_node_transform():
+    """CPU shader reference places the local +X axis like setPos + setH would."""
+    transforms = compute_instance_transforms(POSITIONS)
+    placed = apply_instance_transforms(np.array([[0, 0, 0], [1, 0, 0]]), transforms)
+
+    for (x, y, z, heading), (origin, tip) in zip(transforms, placed):
+        assert np.allclose(origin, (x, y, z))
+        expected_tip = (x + math.cos(heading), y + math.sin(heading), z)
+        assert np.allclose(tip, expected_tip, atol=1e-5)
+
+
+def test_partition_keeps_every_instance_once():
+    transforms = compute_instance_transforms(POSITIONS)
+    regions = partition_by_region(transforms, 32.0)
+
+    assert set(regions) == {(0, 0), (1, 0), (1, 2), (-1, -1)}
+    assert sum(len(r) for r in regions.values()) == len(POSITIONS)
+
+
+def test_software_path_places_from_transform_array():
+    base = make_base()
+    manager = InstancedManager(base, use_hardware=False)
+    manager.create_prototype("grass", MagicMock())
+
+    proto = manager.prototypes["grass"]
+    placed = []
+
+    def instance_to(root):
+        inst = MagicMock()
+        inst.setPos.side_effect = lambda *p: placed.append(("pos", p))
+        inst.setH.side_effect = lambda h: placed.append(("h", h))
+        return inst
+
+    proto.instanceTo.side_effect = instance_to
+    root = manager.spawn_instances("grass", POSITIONS)
+
+    assert root is not None
+    transforms = compute_instance_transforms(POSITIONS)
+    expected = []
+    for x, y, z, heading in transforms.tolist():
+        expected.append(("pos", (x, y, z)))
+        expected.append(("h", math.degrees(heading)))
+    assert placed == expected
+
+
+def test_hardware_path_one_draw_per_region(monkeypatch):
+    base = make_base()
+    manager = InstancedManager(base, region_size=32.0, use_hardware=True)
+    manager.create_prototype("rock", MagicMock())
+
+    batches = []
+    mesh_np = MagicMock()
+
+    def copy_to(region_np):
+        batch = MagicMock()
+        batches.append(batch)
+        return batch
+
+    mesh_np.copyTo.side_effect = copy_to
+    monkeypatch.setattr(instancing, "NodePath", lambda node: mesh_np)
+    monkeypatch.setattr(InstancedManager, "_make_instance_texture", staticmethod(lambda name, t: t))
+
+    manager.spawn_instances("rock", POSITIONS)
+
+    assert len(batches) == 4
+    counts = [b.setInstanceCount.call_args[0][0] for b in batches]
+    assert sum(counts) == len(POSITIONS)
+    for batch in batches:
+        batch.node().setFinal.assert_called_with(True)
+
+
+def test_unknown_prototype_returns_none():
+    manager = InstancedManager(make_base(), use_hardware=False)
+    assert manager.spawn_instances("missing", POSITIONS) is None
@@ -0,0 +1,119 @@
+"""Tests for the content-hashed chunk mesh cache."""
+import pytest
+
+from engine.rendering import mesh_cache as mesh_cache_module
+from engine.rendering.mesh_cache import MeshCache
+
+
+class FakeGeomNode:
+    """Stand-in for GeomNode that round-trips through a fake BAM stream."""
+
+    def __init__(self, payload: str):
+        self.payload = payload
+
+    def encodeToBamStream(self):
+        return self.payload.encode()
+
+
+class FakePandaNode:
+    decode_calls = 0
+
+    @classmethod
+    def decodeFromBamStream(cls, data):
+        cls.decode_calls += 1
+        return FakeGeomNode(data.decode())
+
+
+@pytest.fixture(autouse=True)
+def fake_bam(monkeypatch):
+    FakePandaNode.decode_calls = 0
+    monkeypatch.setattr(mesh_cache_module, "PandaNode", FakePandaNode)
+
+
+def test_key_ignores_insertion_order():
+    a = {(0, 0, 0): "grass", (1, 0, 0): "dirt"}
+    b = {(1, 0, 0): "dirt", (0, 0, 0): "grass"}
+    assert MeshCache.make_key(a, 16) == MeshCache.make_key(b, 16)
+
+
+def test_key_changes_with_content_border_and_salt():
+    grid = {(0, 0, 0): "sand"}
+    base = MeshCache.make_key(grid, 16)
+
+    assert MeshCache.make_key({(0, 0, 0): "stone"}, 16) != base
+    assert MeshCache.make_key(grid, 8) != base
+    assert MeshCache.make_key(grid, 16, salt="atlas.png") != base
+    assert MeshCache.make_key(grid, 16, border={"east": {(16, 0, 0): "sand"}}) != base
+    assert MeshCache.make_key({(1, 0, 0): "sand"}, 16) != base
+    assert MeshCache.make_key({(0, 0, 0): "sand", (0, 2, 0): "sand"}, 16) != MeshCache.make_key(
+        {(0, 0, 0): "sand", (0, 1, 0): "sand", (0, 2, 0): "sand"}, 16
+    )
+
+
+def test_key_changes_with_cache_version(monkeypatch):
+    grid = {(0, 0, 0): "sand"}
+    before = MeshCache.make_key(grid, 16)
+    monkeypatch.setattr(mesh_cache_module, "MESH_CACHE_VERSION", mesh_cache_module.MESH_CACHE_VERSION + 1)
+    assert MeshCache.make_key(grid, 16) != before
+
+
+def test_get_or_build_only_builds_once():
+    cache = MeshCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return FakeGeomNode("mesh")
+
+    key = MeshCache.make_key({(0, 0, 0): "sand"}, 16)
+    first = cache.get_or_build(key, build)
+    second = cache.get_or_build(key, build)
+
+    assert len(builds) == 1
+    assert first.payload == second.payload == "mesh"
+    assert second is not first  # Each hit gets its own decoded node
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = MeshCache(max_entries=2)
+    cache.put("a", FakeGeomNode("a"))
+    cache.put("b", FakeGeomNode("b"))
+    cache.get("a")  # Touch a so b is oldest
+    cache.put("c", FakeGeomNode("c"))
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    key = MeshCache.make_key({(0, 0, 0): "water"}, 16)
+    MeshCache(cache_dir=tmp_path).put(key, FakeGeomNode("ocean"))
+
+    fresh = MeshCache(cache_dir=tmp_path)
+    node = fresh.get(key)
+
+    assert node is not None
+    assert node.payload == "ocean"
+    assert fresh.disk_hits == 1
+    assert key in fresh  # Promoted to memory tier
+
+
+def test_undecodable_entry_is_a_miss(monkeypatch):
+    cache = MeshCache()
+    cache.put("k", FakeGeomNode("x"))
+    monkeypatch.setattr(MeshCache, "_decode", staticmethod(lambda data: None))
+
+    assert cache.get("k") is None
+    assert "k" not in cache
+
+
+def test_undecodable_disk_entry_is_deleted(tmp_path, monkeypatch):
+    MeshCache(cache_dir=tmp_path).put("k", FakeGeomNode("x"))
+    monkeypatch.setattr(MeshCache, "_decode", staticmethod(lambda data: None))
+
+    assert MeshCache(cache_dir=tmp_path).get("k") is None
+    assert not (tmp_path / "k.bam").exists()
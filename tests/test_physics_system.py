@@ -0,0 +1,107 @@
+"""Tests for the fixed-timestep batch PhysicsSystem."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.components.core import Transform
+from engine.ecs.world import World
+from engine.physics import KinematicState
+from engine.systems.physics import PhysicsSystem
+from engine.world.chunk_manager import ChunkManager
+
+
+class Registry:
+    @staticmethod
+    def get_block(name):
+        return SimpleNamespace(solid=True)
+
+
+def make_world(blocks):
+    world = World()
+    generator = MagicMock()
+    generator.get_block_registry.return_value = Registry
+    manager = ChunkManager(world, world.event_bus, MagicMock(), generator, chunk_size=16)
+    manager.chunk_blocks[(0, 0)] = blocks
+    manager.chunk_heightmaps[(0, 0)] = manager._build_heightmap(blocks)
+    world.add_system(manager)
+    physics = PhysicsSystem(world, world.event_bus)
+    world.add_system(physics)
+    return world, physics
+
+
+def flat(height=1):
+    return {(x, y, z): "stone" for x in range(16) for z in range(16) for y in range(height)}
+
+
+def spawn(world, position, **velocity):
+    entity = world.create_entity()
+    world.add_component(entity, Transform(position=SimpleNamespace(x=position[0], y=position[1], z=position[2])))
+    world.add_component(entity, KinematicState(grounded=False, **velocity))
+    return entity
+
+
+def run(world, physics, dt, seconds):
+    for _ in range(round(seconds / dt)):
+        physics.update(dt)
+
+
+def test_falls_and_lands_independent_of_frame_rate():
+    results = []
+    for dt in (1 / 30, 1 / 144):
+        world, physics = make_world(flat())
+        entity = spawn(world, (4.5, 4.5, 10.0))
+        run(world, physics, dt, 2.0)
+        p = world.get_component(entity, Transform).position
+        results.append((p.x, p.y, p.z))
+
+        state = world.get_component(entity, KinematicState)
+        assert p.z == pytest.approx(1.0)
+        assert state.grounded and state.velocity_z == 0.0
+
+    assert results[0] == results[1]
+
+
+def test_walls_stop_entities_and_friction_slows_them():
+    blocks = flat()
+    blocks.update({(8, y, z): "stone" for y in (1, 2, 3) for z in range(16)})
+    world, physics = make_world(blocks)
+    walker = spawn(world, (4.5, 4.5, 1.0), velocity_x=6.0)
+    world.get_component(walker, KinematicState).grounded = True
+
+    run(world, physics, 1 / 60, 1.0)
+
+    p = world.get_component(walker, Transform).position
+    assert p.x <= 8.0 - 0.3 + 1e-6  # Against the wall, not through it
+    assert p.z == pytest.approx(1.0)
+
+    slider = spawn(world, (2.5, 10.5, 1.0), velocity_y=3.0)
+    world.get_component(slider, KinematicState).grounded = True
+    run(world, physics, 1 / 60, 1.0)
+    assert world.get_component(slider, KinematicState).velocity_y == 0.0
+
+
+def test_skips_player_and_unloaded_chunks():
+    world, physics = make_world(flat())
+    player = spawn(world, (4.5, 4.5, 10.0))
+    world.register_tag(player, "player")
+    far = spawn(world, (100.5, 4.5, 10.0))
+
+    run(world, physics, 1 / 60, 0.5)
+
+    assert world.get_component(player, Transform).position.z == 10.0
+    assert world.get_component(far, Transform).position.z == 10.0
+
+
+def test_render_position_interpolates_between_steps():
+    world, physics = make_world(flat())
+    entity = spawn(world, (4.5, 4.5, 1.0), velocity_x=6.0)
+
+    physics.update(1 / 60 * 1.5)
+
+    assert physics.alpha == pytest.approx(0.5)
+    x = physics.get_render_position(entity)[0]
+    assert 4.5 < x < world.get_component(entity, Transform).position.x
+    assert physics.get_render_position("unknown") is None
@@ -160,8 +160,7 @@ class TestJumpMechanics(unittest.TestCase):
         
         state = KinematicState()
         state.grounded = False
-        state.coyote_time = 0.05  # Just left ground
-        state.jump_buffered = False
+        state.time_since_grounded = 0.05  # Just left ground
         
         # Press jump
         register_jump_press(state)
@@ -175,9 +174,7 @@ class TestJumpMechanics(unittest.TestCase):
         
         state = KinematicState()
         state.grounded = True
-        state.coyote_time = 0
-        state.jump_buffered = False
-        state.jump_buffer_time = 0
+        state.time_since_grounded = 0
         
         # Press jump
         register_jump_press(state)
@@ -0,0 +1,140 @@
+"""Tests for the pooled, chunk-scoped raycast service."""
+from types import SimpleNamespace
+
+from engine.physics import raycast_service as raycast_module
+from engine.physics.raycast_service import RaycastService, chunks_along_segment
+
+
+class FakeNodePath:
+    def __init__(self, node=None):
+        self._node = node
+        self.children = []
+        self.removed = False
+        self.stashed = False
+
+    def attachNewNode(self, node):
+        child = FakeNodePath(node)
+        self.children.append(child)
+        return child
+
+    def node(self):
+        return self._node
+
+    def stash(self):
+        self.stashed = True
+
+    def removeNode(self):
+        self.removed = True
+
+
+class FakeSegment:
+    def setPointA(self, *p):
+        self.a = p
+
+    def setPointB(self, *p):
+        self.b = p
+
+
+class FakeCollisionNode:
+    def __init__(self, name):
+        self.solids = []
+
+    def addSolid(self, solid):
+        self.solids.append(solid)
+
+    def setFromCollideMask(self, mask): pass
+    def setIntoCollideMask(self, mask): pass
+
+
+class FakeHandler:
+    def __init__(self):
+        self.entries = []
+
+    def getNumEntries(self):
+        return len(self.entries)
+
+    def sortEntries(self): pass
+
+    def getEntry(self, i):
+        return self.entries[i]
+
+
+class FakeTraverser:
+    """Hits a flat floor at z=0 for every downward segment."""
+
+    def __init__(self, name):
+        self.colliders = []
+        self.roots = []
+
+    def clearColliders(self):
+        self.colliders = []
+
+    def addCollider(self, ray_np, handler):
+        self.colliders.append((ray_np, handler))
+
+    def traverse(self, root):
+        self.roots.append(root)
+        for ray_np, handler in self.colliders:
+            segment = ray_np.node().solids[0]
+            handler.entries = []
+            if segment.a[2] > 0 >= segment.b[2]:
+                point = SimpleNamespace(x=segment.a[0], y=segment.a[1], z=0.0)
+                normal = SimpleNamespace(x=0.0, y=0.0, z=1.0)
+                handler.entries.append(SimpleNamespace(
+                    getSurfacePoint=lambda _np, p=point: p,
+                    getSurfaceNormal=lambda _np, n=normal: n,
+                ))
+
+
+def make_service(monkeypatch, chunk_manager=None):
+    monkeypatch.setattr(raycast_module, "CollisionSegment", FakeSegment)
+    monkeypatch.setattr(raycast_module, "CollisionNode", FakeCollisionNode)
+    monkeypatch.setattr(raycast_module, "CollisionHandlerQueue", FakeHandler)
+    monkeypatch.setattr(raycast_module, "CollisionTraverser", FakeTraverser)
+    return RaycastService(FakeNodePath(), chunk_manager=chunk_manager)
+
+
+def test_chunks_along_segment():
+    assert chunks_along_segment((5, 5, 50), (5, 5, -50), 16) == {(0, 0)}
+    assert chunks_along_segment((-1, 2, 0), (1, 2, 0), 16) == {(-1, 0), (0, 0)}
+    assert chunks_along_segment((8, 2, 0), (40, 22, 0), 16) == {(0, 0), (1, 0), (1, 1), (2, 1)}
+
+
+def test_batched_rays_reuse_pool(monkeypatch):
+    service = make_service(monkeypatch)
+
+    down = service.queue((1.0, 2.0, 3.0), (0, 0, -1), 5.0)
+    up = service.queue((1.0, 2.0, 3.0), (0, 0, 1), 5.0)
+    results = service.traverse()
+
+    assert results[up] is None
+    assert results[down].point == (1.0, 2.0, 0.0)
+    assert abs(results[down].distance - 3.0) < 1e-9
+    assert len(service.traverser.roots) == 1  # One traversal for both rays
+
+    assert service.ground_height(SimpleNamespace(x=4.0, y=4.0, z=1.0)) == 0.2
+    assert len(service._rays) == 2  # Pool didn't grow for the single ray
+
+
+def test_scope_only_instances_chunks_under_rays(monkeypatch):
+    collision_nodes = {key: FakeNodePath(f"cnode{key}") for key in [(0, 0), (1, 0), (5, 5)]}
+    manager = SimpleNamespace(chunk_size=16, collision_nodes=collision_nodes)
+    service = make_service(monkeypatch, manager)
+
+    service.cast((4.0, 4.0, 10.0), (0, 0, -1), 20.0)
+    assert service.traverser.roots[-1] is service._scope
+    assert service._scope.stashed
+    assert set(service._scoped) == {(0, 0)}
+    first = service._scoped[(0, 0)][1]
+
+    # Moving to the next chunk drops the old instance
+    service.cast((20.0, 4.0, 10.0), (0, 0, -1), 20.0)
+    assert set(service._scoped) == {(1, 0)}
+    assert first.removed
+
+    # A rebuilt chunk collision node is re-instanced
+    old = service._scoped[(1, 0)][1]
+    collision_nodes[(1, 0)] = FakeNodePath("rebuilt")
+    service.cast((20.0, 4.0, 10.0), (0, 0, -1), 20.0)
+    assert old.removed
+    assert service._scoped[(1, 0)][1].node() == "rebuilt"
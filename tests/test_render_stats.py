@@ -0,0 +1,103 @@
+"""Tests for the render statistics collector."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from engine.rendering import render_stats as render_stats_module
+from engine.rendering.render_stats import RenderStatsCollector
+
+
+class FakeAnalyzer:
+    """SceneGraphAnalyzer stand-in: each added node contributes node.geoms."""
+
+    instances = 0
+
+    added = 0
+
+    def __init__(self):
+        FakeAnalyzer.instances += 1
+        self.geoms = 0
+
+    def addNode(self, node):
+        FakeAnalyzer.added += 1
+        self.geoms += node.geoms
+
+    def getNumNodes(self): return 10 * self.geoms
+    def getNumGeoms(self): return self.geoms
+    def getNumVertices(self): return 24 * self.geoms
+    def getNumTris(self): return 12 * self.geoms
+    def getTextureBytes(self): return 4096
+
+
+def make_chunk(geoms, hidden):
+    chunk = MagicMock()
+    chunk.isEmpty.return_value = False
+    chunk.isHidden.return_value = hidden
+    chunk.node.return_value = MagicMock(geoms=geoms)
+    return chunk
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    FakeAnalyzer.instances = 0
+    FakeAnalyzer.added = 0
+    monkeypatch.setattr(render_stats_module, "SceneGraphAnalyzer", FakeAnalyzer)
+    calls = []
+    monkeypatch.setattr(render_stats_module, "log_metric", lambda name, value, labels=None: calls.append((name, value)))
+    return calls
+
+
+def make_collector(**kwargs):
+    chunks = {(0, 0): make_chunk(5, False), (1, 0): make_chunk(3, True), (2, 0): make_chunk(2, False)}
+    base = MagicMock()
+    base.render.getChildren.return_value = [*chunks.values(), make_chunk(10, False)]  # Chunks + player
+    chunk_manager = MagicMock()
+    chunk_manager.chunks = chunks
+    world = MagicMock()
+    world.get_system_by_type.return_value = chunk_manager
+    return RenderStatsCollector(base, world=world, **kwargs)
+
+
+def test_disabled_collector_does_nothing(metrics):
+    collector = make_collector()
+    for _ in range(100):
+        assert collector.update(0.1) is None
+    assert FakeAnalyzer.instances == 0
+    assert metrics == []
+
+
+def test_sample_counts_chunks_and_estimates_draws(metrics):
+    stats = make_collector().sample()
+
+    assert stats.geoms == 20
+    assert stats.triangles == 240
+    assert stats.loaded_chunks == 3
+    assert stats.visible_chunks == 2
+    assert stats.draw_calls == 17  # Hidden chunk's geoms are culled
+    assert "Chunks: 2/3" in stats.format_text()
+
+
+def test_sampling_and_metrics_run_at_fixed_rates(metrics):
+    collector = make_collector(sample_interval=1.0, metric_interval=5.0, enabled=True)
+
+    samples = [collector.update(0.25) for _ in range(40)]  # 10 seconds
+
+    assert sum(1 for s in samples if s is not None) == 10
+    emitted = [name for name, _ in metrics if name == "render_draw_calls"]
+    assert len(emitted) == 2
+    assert collector.latest is not None
+
+
+def test_each_sample_is_spread_over_frames(metrics):
+    collector = make_collector(enabled=True)
+
+    results = []
+    for _ in range(4):  # One child of render per frame
+        FakeAnalyzer.added = 0
+        results.append(collector.update(0.01))
+        assert FakeAnalyzer.added <= 2  # The child, plus the hidden-geom analyzer
+
+    assert results[:3] == [None, None, None]
+    assert results[3].geoms == 20
+    assert results[3].draw_calls == 17
+    assert [name for name, _ in metrics if name == "render_geoms"] == ["render_geoms"]
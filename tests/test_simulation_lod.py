@@ -0,0 +1,115 @@
+"""Tests for distance-based simulation tiers."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.components.core import Transform
+from engine.ecs.world import World
+from engine.physics import KinematicState
+from engine.systems.physics import PhysicsSystem
+from engine.systems.simulation_lod import SimLODSettings, SimTier, SimulationLODSystem, select_tier
+from engine.world.chunk_manager import ChunkManager
+
+SETTINGS = SimLODSettings(full_distance=20.0, reduced_distance=60.0, hysteresis=2.0, reduced_rate=5.0)
+
+
+def make_world():
+    world = World()
+    lod = SimulationLODSystem(world, world.event_bus, SETTINGS)
+    world.add_system(lod)
+    player = spawn(world, 0.0, 0.0, 0.0)
+    world.register_tag(player, "player")
+    return world, lod, player
+
+
+def spawn(world, x, y, z):
+    entity = world.create_entity()
+    world.add_component(entity, Transform(position=SimpleNamespace(x=x, y=y, z=z)))
+    world.add_component(entity, KinematicState())
+    return entity
+
+
+def test_tiers_by_distance_with_hysteresis():
+    assert select_tier(SimTier.FULL, 21.0, SETTINGS) == SimTier.FULL
+    assert select_tier(SimTier.FULL, 23.0, SETTINGS) == SimTier.REDUCED
+    assert select_tier(SimTier.FULL, 100.0, SETTINGS) == SimTier.FROZEN
+    assert select_tier(SimTier.REDUCED, 19.0, SETTINGS) == SimTier.REDUCED
+    assert select_tier(SimTier.FROZEN, 10.0, SETTINGS) == SimTier.FULL
+
+    world, lod, player = make_world()
+    near, mid, far = spawn(world, 5, 0, 0), spawn(world, 40, 0, 0), spawn(world, 0, 200, 0)
+    lod.update(1 / 60)
+
+    assert lod.tiers == {near: SimTier.FULL, mid: SimTier.REDUCED, far: SimTier.FROZEN}
+    assert lod.frozen == {far}
+    assert player not in lod.tiers
+
+
+def test_reduced_tier_ticks_at_rate_and_is_staggered():
+    world, lod, _player = make_world()
+    mids = [spawn(world, 40, i, 0) for i in range(30)]
+    near = spawn(world, 1, 0, 0)
+
+    per_frame = []
+    for _ in range(60):
+        lod.update(1 / 60)
+        assert lod.tick(near, 1 / 60) == pytest.approx(1 / 60)
+        due = [entity for entity in mids if lod.tick(entity, 1 / 60) is not None]
+        per_frame.append(len(due))
+
+    # First frame hands every new entity one step; afterwards ~5 Hz each
+    for entity in mids:
+        assert lod._last_tick[entity] > 0.7
+    assert sum(per_frame[1:]) == pytest.approx(30 * 5, abs=30)
+    assert max(per_frame[1:]) < 30  # Spread over frames, not all at once
+
+
+def test_frozen_entities_catch_up_on_wake():
+    world, lod, player = make_world()
+    far = spawn(world, 200, 0, 0)
+    lod.update(1 / 60)
+    assert lod.tick(far, 1 / 60) is None
+
+    for _ in range(300):
+        lod.update(1 / 60)
+    world.get_component(player, Transform).position.x = 195.0
+    for _ in range(20):
+        lod.update(1 / 60)
+
+    assert lod.get_tier(far) == SimTier.FULL
+    assert lod.tick(far, 1 / 60) == SETTINGS.max_catch_up
+    assert lod.tick(far, 1 / 60) == pytest.approx(0.0)
+
+
+def test_physics_skips_frozen_and_strides_reduced_entities():
+    world, lod, _player = make_world()
+    generator = MagicMock()
+    generator.get_block_registry.return_value = SimpleNamespace(get_block=lambda name: SimpleNamespace(solid=True))
+    manager = ChunkManager(world, world.event_bus, MagicMock(), generator, chunk_size=16)
+    for key in ((0, 0), (2, 0), (6, 0)):
+        manager.chunk_blocks[key] = {}
+        manager.chunk_heightmaps[key] = manager._build_heightmap({})
+    world.add_system(manager)
+    physics = PhysicsSystem(world, world.event_bus)
+    world.add_system(physics)
+
+    near, mid, far = spawn(world, 4.5, 4.5, 10.0), spawn(world, 40.5, 4.5, 10.0), spawn(world, 100.5, 4.5, 10.0)
+    for _ in range(6):
+        lod.update(1 / 60)
+        physics.update(1 / 60)
+
+    assert world.get_component(near, Transform).position.z < 10.0
+    assert world.get_component(far, Transform).position.z == 10.0
+    assert physics.get_render_position(far) is None
+
+    # Over whole strides the reduced entity falls as far as a full-rate one would, to first order
+    for _ in range(54):
+        lod.update(1 / 60)
+        physics.update(1 / 60)
+    near_drop = 10.0 - world.get_component(near, Transform).position.z
+    mid_drop = 10.0 - world.get_component(mid, Transform).position.z
+    assert 0.0 < mid_drop
+    assert mid_drop == pytest.approx(near_drop, rel=0.25)
@@ -0,0 +1,103 @@
+"""Tests for single-geom skinned voxel avatars (CPU skinning path)."""
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.animation.skeleton import HumanoidSkeleton
+from engine.animation.skinning import (
+    build_voxel_skin,
+    compose_local_matrices,
+    forward_kinematics,
+    hpr_to_matrices,
+    skin_vertices,
+)
+from engine.animation.skinned_avatar import SkinnedVoxelAvatar
+from engine.animation.voxel_avatar import VoxelAvatar
+
+
+def make_avatar(**kwargs):
+    return SkinnedVoxelAvatar(MagicMock(), use_shader=False, **kwargs)
+
+
+def test_hpr_matches_panda_axes():
+    # Heading turns +X toward +Y, pitch turns +Y toward +Z, roll turns +Z toward +X
+    h, p, r = hpr_to_matrices([[90, 0, 0], [0, 90, 0], [0, 0, 90]])
+    assert np.allclose(np.array([1, 0, 0]) @ h, [0, 1, 0], atol=1e-6)
+    assert np.allclose(np.array([0, 1, 0]) @ p, [0, 0, 1], atol=1e-6)
+    assert np.allclose(np.array([0, 0, 1]) @ r, [1, 0, 0], atol=1e-6)
+
+
+def test_forward_kinematics_chains_parent_transforms():
+    local = compose_local_matrices([[0, 0, 1], [0, 2, 0]], [[90, 0, 0], [0, 0, 0]])
+    world = forward_kinematics(local, np.array([-1, 0]))
+    # Child sits 2 units along the parent's +Y, which the parent turned to -X
+    assert np.allclose(world[1, 3, :3], [-2, 0, 1], atol=1e-6)
+
+
+def test_skin_has_one_box_per_bone_with_joint_indices():
+    skeleton = HumanoidSkeleton()
+    mesh = build_voxel_skin(skeleton, VoxelAvatar.BONE_THICKNESS_MAP)
+    boxed = [b for b in mesh.bone_names if skeleton.bones[b].length > 0.01]
+
+    assert mesh.num_vertices == 24 * len(boxed)
+    assert len(mesh.indices) == 36 * len(boxed)
+    assert set(mesh.joints.tolist()) == {mesh.bone_names.index(b) for b in boxed}
+    # Parents always precede children so FK is a single forward pass
+    assert all(p < i for i, p in enumerate(mesh.parents.tolist()))
+
+
+def test_rest_pose_box_spans_bone_length():
+    avatar = make_avatar()
+    joint = avatar.bone_names.index("spine")
+    local = avatar.mesh.positions[avatar.mesh.joints == joint]
+    length = avatar.skeleton.bones["spine"].length
+    thickness = VoxelAvatar.BONE_THICKNESS_MAP["spine"]
+
+    assert np.isclose(local[:, 1].min(), 0.0) and np.isclose(local[:, 1].max(), length)
+    assert np.isclose(np.ptp(local[:, 0]), thickness)
+
+
+def test_pose_change_moves_only_affected_vertices():
+    avatar = make_avatar()
+    before = avatar.skinned_positions().copy()
+
+    rot = avatar.skeleton.bones["forearm_left"].local_transform.rotation
+    rot.y = rot.y + 45
+    avatar.update_pose()
+    after = avatar.skinned_positions()
+
+    moved = np.any(~np.isclose(before, after, atol=1e-5), axis=1)
+    affected = {avatar.bone_names.index(n) for n in ("forearm_left", "hand_left")}
+    assert moved.any()
+    assert set(avatar.mesh.joints[moved].tolist()) <= affected
+
+
+def test_cpu_skinning_matches_joint_transforms():
+    avatar = make_avatar()
+    mats = avatar.update_pose()
+    joint = avatar.bone_names.index("head")
+    mask = avatar.mesh.joints == joint
+    local = avatar.mesh.positions[mask]
+
+    expected = np.c_[local, np.ones(len(local))] @ mats[joint]
+    assert np.allclose(avatar.skinned_positions()[mask], expected[:, :3], atol=1e-5)
+    assert np.allclose(skin_vertices(local, np.zeros(len(local), dtype=int), mats[joint:joint + 1]),
+                       expected[:, :3], atol=1e-5)
+
+
+def test_color_api_matches_voxel_avatar():
+    avatar = make_avatar(body_color=(1, 0, 0, 1))
+    avatar.set_bone_color("head", (0, 0, 1, 1))
+    avatar.set_body_color((0, 1, 0, 1))
+
+    assert avatar.get_effective_color("head") == (0, 0, 1, 1)
+    assert avatar.get_effective_color("spine") == (0, 1, 0, 1)
+    head = avatar.bone_names.index("head")
+    assert np.allclose(avatar._vertex_buffer[avatar.mesh.joints == head, 6:10], (0, 0, 1, 1))
+
+    avatar.clear_bone_colors()
+    assert avatar.get_effective_color("head") == (0, 1, 0, 1)
+    with pytest.raises(ValueError):
+        avatar.set_bone_color("tail", (1, 1, 1, 1))
@@ -0,0 +1,31 @@
+"""Tests for SpawnManager terrain height queries."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from engine.spawn_manager import SpawnManager
+from engine.world.chunk_manager import ChunkManager
+
+
+class Registry:
+    @staticmethod
+    def get_block(name):
+        return SimpleNamespace(solid=name != "water")
+
+
+def make_manager(height):
+    generator = MagicMock()
+    generator.get_block_registry.return_value = Registry
+    generator.get_height.side_effect = lambda x, z: height
+    return ChunkManager(MagicMock(), MagicMock(), MagicMock(), generator, chunk_size=16)
+
+
+def test_loaded_and_generator_heights_agree():
+    manager = make_manager(7)
+    unloaded = SpawnManager._terrain_height(manager, 3.5, 4.5)
+
+    # Same column as the generator lays it out: surface block at its height, subsurface below
+    grid = {(x, y, z): "grass" if y == 7 else "dirt" for x in range(16) for z in range(16) for y in (5, 6, 7)}
+    manager.chunk_heightmaps[(0, 0)] = manager._build_heightmap(grid)
+    loaded = SpawnManager._terrain_height(manager, 3.5, 4.5)
+
+    assert loaded == unloaded == 8.0
@@ -0,0 +1,95 @@
+"""Tests for ChunkManager column-top heightmap queries."""
+import math
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.world.chunk_manager import ChunkManager
+
+
+class Registry:
+    @staticmethod
+    def get_block(name):
+        return SimpleNamespace(solid=name != "water")
+
+
+def make_manager(chunks):
+    """ChunkManager with block data for {(chunk_x, chunk_z): {(lx, y, lz): block}}."""
+    generator = MagicMock()
+    generator.get_block_registry.return_value = Registry
+    manager = ChunkManager(MagicMock(), MagicMock(), MagicMock(), generator, chunk_size=16)
+    for key, blocks in chunks.items():
+        manager.chunk_blocks[key] = blocks
+        manager.chunk_heightmaps[key] = manager._build_heightmap(blocks)
+    return manager
+
+
+def flat(height, block="stone"):
+    return {(x, y, z): block for x in range(16) for z in range(16) for y in range(height)}
+
+
+def test_surface_height_and_normal():
+    blocks = flat(3)
+    for z in range(16):
+        blocks[(9, 3, z)] = "stone"  # One-block ridge along x=9
+    manager = make_manager({(0, 0): blocks})
+
+    assert manager.get_surface_height(4.5, 4.5) == 3.0
+    assert manager.get_surface_height(9.2, 4.5) == 4.0
+    assert manager.get_surface_height(40.0, 4.5) is None  # Unloaded chunk
+
+    height, normal = manager.get_surface_height(4.5, 4.5, return_normal=True)
+    assert normal == (0.0, 0.0, 1.0)
+    _, normal = manager.get_surface_height(8.5, 4.5, return_normal=True)
+    assert normal[0] < 0 and normal[2] > 0  # Tilts away from the ridge
+    assert abs(math.sqrt(sum(c * c for c in normal)) - 1.0) < 1e-6
+
+
+def test_block_edits_keep_heightmap_current():
+    manager = make_manager({(0, 0): flat(3)})
+
+    assert manager.set_block(2, 5, 7, "stone")
+    assert manager.get_surface_height(2.5, 5.5) == 8.0
+
+    manager.set_block(2, 5, 7, None)
+    assert manager.get_surface_height(2.5, 5.5) == 3.0
+
+    manager.set_block(2, 5, 3, "water")  # Non-solid blocks don't raise the surface
+    assert manager.get_surface_height(2.5, 5.5) == 3.0
+
+    for y in range(3):
+        manager.set_block(2, 5, y, None)
+    assert manager.get_surface_height(2.5, 5.5) is None
+
+    assert not manager.set_block(100, 100, 0, "stone")  # Chunk not loaded
+    manager.event_bus.publish.assert_called()
+
+
+def test_batched_heights_match_single_queries():
+    manager = make_manager({(0, 0): flat(3), (-1, 0): flat(6), (0, 1): flat(1)})
+    points = [(1.5, 1.5), (-0.5, 2.0), (3.0, 17.0), (-20.0, 2.0), (15.9, 15.9)]
+
+    heights = manager.get_surface_heights(points)
+
+    for (x, y), h in zip(points, heights):
+        expected = manager.get_surface_height(x, y)
+        assert (math.isnan(h) and expected is None) or h == expected
+    assert heights.tolist()[:3] == [3.0, 6.0, 1.0]
+
+
+def test_ground_height_falls_back_under_overhang():
+    blocks = flat(3)
+    blocks[(4, 8, 4)] = "stone"  # Overhang well above the player
+    manager = make_manager({(0, 0): blocks})
+
+    player = SimpleNamespace(x=4.5, y=4.5, z=3.0)
+    assert manager.ground_height(player) == pytest.approx(3.2)  # Ray from z=5 hits the floor
+
+    on_top = SimpleNamespace(x=4.5, y=4.5, z=9.0)
+    assert manager.ground_height(on_top) == pytest.approx(9.2)
+
+    falling = SimpleNamespace(x=1.5, y=1.5, z=20.0)
+    assert manager.ground_height(falling) is None  # Surface beyond max_distance
@@ -0,0 +1,114 @@
+"""Tests for voxel-native collision queries."""
+from types import SimpleNamespace
+
+import pytest
+
+from engine.physics.voxel_collision import VoxelCollider, voxel_ground_height, voxel_wall_check
+
+
+class Registry:
+    """Minimal block registry: everything but water is solid."""
+
+    @staticmethod
+    def get_block(name):
+        if name == "mystery":
+            raise KeyError(name)
+        return SimpleNamespace(solid=name != "water")
+
+
+def make_collider(cells):
+    lookups = []
+
+    def get_block(x, y, z):
+        lookups.append((x, y, z))
+        return cells.get((x, y, z))
+
+    collider = VoxelCollider(get_block, Registry)
+    collider.lookups = lookups
+    return collider
+
+
+def flat_floor(top=0, size=8):
+    """Solid floor whose top face is at z = top + 1."""
+    return {(x, y, top): "stone" for x in range(-size, size) for y in range(-size, size)}
+
+
+def test_ground_height_matches_top_face():
+    collider = make_collider(flat_floor(top=3))
+    entity = SimpleNamespace(x=0.5, y=0.5, z=4.0)
+
+    assert voxel_ground_height(entity, collider) == pytest.approx(4.0 + 0.2)
+    height, normal = voxel_ground_height(entity, collider, return_normal=True)
+    assert normal == (0.0, 0.0, 1.0)
+
+
+def test_ground_height_ignores_water_and_unknown_blocks():
+    cells = flat_floor(top=0)
+    cells[(0, 0, 1)] = "water"
+    cells[(0, 0, 2)] = "mystery"
+    collider = make_collider(cells)
+
+    assert voxel_ground_height(SimpleNamespace(x=0.5, y=0.5, z=3.0), collider, foot_offset=0.0) == pytest.approx(1.0)
+
+
+def test_ray_starting_inside_terrain_hits_next_exposed_face():
+    cells = flat_floor(top=0)
+    cells.update({(0, 0, 4): "stone", (0, 0, 5): "stone"})  # Overhang the ray starts in
+    collider = make_collider(cells)
+
+    hit = collider.raycast((0.5, 0.5, 5.5), (0, 0, -1), 10.0)
+    assert hit.cell == (0, 0, 0)
+    assert hit.point[2] == pytest.approx(1.0)
+
+
+def test_no_ground_beyond_range():
+    collider = make_collider(flat_floor(top=-20))
+    assert voxel_ground_height(SimpleNamespace(x=0.5, y=0.5, z=0.0), collider) is None
+
+
+def test_wall_check_respects_distance_and_buffer():
+    cells = flat_floor(top=0)
+    cells[(3, 0, 1)] = "stone"  # Wall block at mid-height (z + 0.9 = 1.9)
+    collider = make_collider(cells)
+    entity = SimpleNamespace(x=0.5, y=0.5, z=1.0)
+
+    assert voxel_wall_check(entity, (2.2, 0, 0), collider)  # 2.2 + 0.5 reaches x=3
+    assert not voxel_wall_check(entity, (1.0, 0, 0), collider)
+    assert not voxel_wall_check(entity, (0, 0, 0), collider)
+
+
+def test_diagonal_ray_normal_and_cell_cost():
+    collider = make_collider({(5, 5, 0): "stone"})
+    hit = collider.raycast((0.5, 0.5, 0.5), (1, 1, 0), 20.0)
+
+    assert hit is not None and hit.cell == (5, 5, 0)
+    assert hit.normal in ((-1, 0, 0), (0, -1, 0))
+    assert len(collider.lookups) < 20  # Only cells along the ray were visited
+
+
+def test_aabb_overlap_and_sweep():
+    collider = make_collider({(2, 0, 0): "stone"})
+
+    assert collider.overlaps_aabb((1.5, 0.2, 0.2), (2.1, 0.8, 0.8))
+    assert not collider.overlaps_aabb((1.0, 0.2, 0.2), (2.0, 0.8, 0.8))  # Touching only
+
+    hit = collider.sweep_aabb((0.0, 0.2, 0.2), (1.0, 0.8, 0.8), (2.0, 0.0, 0.0))
+    assert hit.distance == pytest.approx(0.5)
+    assert hit.normal == (-1, 0, 0)
+    assert collider.sweep_aabb((0.0, 0.2, 0.2), (1.0, 0.8, 0.8), (0.0, 2.0, 0.0)) is None
+
+
+def test_chunk_manager_maps_world_cells_to_chunk_blocks():
+    from unittest.mock import MagicMock
+    from engine.world.chunk_manager import ChunkManager
+
+    generator = MagicMock()
+    generator.get_block_registry.return_value = Registry
+    manager = ChunkManager(MagicMock(), MagicMock(), MagicMock(), generator, chunk_size=16)
+    # Chunk (-1, 2): local (x, height, z) = (15, 4, 3) -> world cell (-1, 35, 4)
+    manager.chunk_blocks[(-1, 2)] = {(15, 4, 3): "stone"}
+
+    assert manager.get_block(-1, 35, 4) == "stone"
+    assert manager.get_block(-1, 35, 5) is None
+    assert manager.get_block(100, 100, 4) is None  # Unloaded chunk
+    assert manager.collider.raycast((-0.5, 35.5, 10.0), (0, 0, -1), 10.0).point[2] == pytest.approx(5.0)
@@ -0,0 +1,80 @@
+"""Tests for WaterPhysicsSystem's filtered updates and transition events."""
+from types import SimpleNamespace
+
+from engine.components.core import Transform
+from engine.ecs.world import World
+from engine.physics import KinematicState
+from engine.systems.water_physics import WaterPhysicsSystem
+
+
+def make_world():
+    world = World()
+    water = WaterPhysicsSystem(world, world.event_bus, chunk_size=16)
+    water.register_chunk_water(0, 0, [(x, y, z) for x in range(4) for z in range(4) for y in range(0, 3)])
+    world.add_system(water)
+
+    events = []
+    for name in ("entity_entered_water", "entity_exited_water", "entity_in_water"):
+        world.event_bus.subscribe(name, lambda event, name=name: events.append((name, event.entity_id)))
+    return world, water, events
+
+
+def spawn(world, x, y, z, kinematic=True):
+    entity = world.create_entity()
+    world.add_component(entity, Transform(position=SimpleNamespace(x=x, y=y, z=z)))
+    if kinematic:
+        world.add_component(entity, KinematicState())
+    return entity
+
+
+def test_enter_and_exit_fire_once_per_transition():
+    world, water, events = make_world()
+    entity = spawn(world, 1.5, 1.5, 1.0)
+    state = world.get_component(entity, KinematicState)
+
+    for _ in range(5):
+        water.update(1 / 60)
+    assert events == [("entity_entered_water", entity)]
+    assert state.in_water and state.submersion_level > 0
+
+    world.get_component(entity, Transform).position.x = 8.5
+    for _ in range(5):
+        water.update(1 / 60)
+    assert events == [("entity_entered_water", entity), ("entity_exited_water", entity)]
+    assert not state.in_water and state.submersion_level == 0.0
+
+
+def test_only_kinematic_entities_are_processed():
+    world, water, events = make_world()
+    spawn(world, 1.5, 1.5, 1.0, kinematic=False)
+
+    water.update(1 / 60)
+
+    assert events == []
+    assert water._water_cache == {}
+
+
+def test_spans_are_reused_within_a_column_and_refreshed_on_water_changes():
+    world, water, _events = make_world()
+    entity = spawn(world, 1.5, 1.5, 1.0)
+    state = world.get_component(entity, KinematicState)
+    calls = []
+    original = water.get_water_spans
+    water.get_water_spans = lambda position: calls.append(position) or original(position)
+
+    levels = []
+    for z in (1.0, 1.25, 1.5, 2.5):  # Rising inside one column (and one cell at first)
+        world.get_component(entity, Transform).position.z = z
+        water.update(1 / 60)
+        levels.append(state.submersion_level)
+    assert len(calls) == 1
+    assert levels == sorted(levels, reverse=True) and len(set(levels)) == 4  # Follows the exact height
+
+    water.unregister_chunk_water(0, 0)
+    water.update(1 / 60)
+    assert len(calls) == 2
+    assert not world.get_component(entity, KinematicState).in_water
+
+    world.destroy_entity(entity)
+    water.update(1 / 60)
+    assert water._water_cache == {}
@@ -0,0 +1,55 @@
+"""Tests for WaterPhysicsSystem's chunk-indexed water spans."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from engine.systems.water_physics import WaterPhysicsSystem
+
+
+def pos(x, y, z):
+    return SimpleNamespace(x=x, y=y, z=z)
+
+
+def make_system():
+    return WaterPhysicsSystem(MagicMock(), MagicMock(), chunk_size=16)
+
+
+def test_chunk_water_is_stored_as_spans_and_freed_with_chunk():
+    system = make_system()
+    blocks = [(x, y, z) for x in range(16) for z in range(16) for y in range(-3, 2)]
+    system.register_chunk_water(-1, 0, blocks + [(0, 5, 0)])
+
+    assert system.water_chunks[(-1, 0)][(3, 4)] == [(-3, 2)]
+    assert system.water_chunks[(-1, 0)][(0, 0)] == [(-3, 2), (5, 6)]
+    assert system.is_position_in_water(pos(-12.5, 4.5, 0.0))
+    assert not system.is_position_in_water(pos(-12.5, 4.5, 2.0))
+    assert not system.is_position_in_water(pos(3.5, 4.5, 0.0))  # Other chunk
+
+    system.unregister_chunk_water(-1, 0)
+    assert system.water_chunks == {}
+
+
+def test_submersion_is_fractional():
+    system = make_system()
+    system.register_chunk_water(0, 0, [(2, y, 2) for y in range(0, 4)])
+
+    assert system.get_submersion_level(pos(2.5, 2.5, 3.1), 1.8) == pytest.approx(0.5)
+    assert system.get_submersion_level(pos(2.5, 2.5, 1.0), 1.8) == 1.0
+    assert system.get_submersion_level(pos(2.5, 2.5, 4.0), 1.8) == 0.0
+    assert system.get_submersion_level(pos(6.5, 2.5, 1.0), 1.8) == 0.0
+
+
+def test_single_block_edits_merge_and_split_spans():
+    system = make_system()
+    for y in (0, 1, 3):
+        system.register_water_block(5, y, 7)
+    system.register_water_block(5, 2, 7)
+    assert system.water_chunks[(0, 0)][(5, 7)] == [(0, 4)]
+
+    system.unregister_water_block(5, 1, 7)
+    assert system.water_chunks[(0, 0)][(5, 7)] == [(0, 1), (2, 4)]
+
+    for y in (0, 2, 3):
+        system.unregister_water_block(5, y, 7)
+    assert system.water_chunks == {}